@@ -0,0 +1,251 @@
+"""Compressed on-disk LRU cache for immutable Fathom recording payloads."""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Default location and size cap (override with FATHOM_CACHE_DIR / FATHOM_CACHE_MAX_MB)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "fathom"
+DEFAULT_MAX_MB = 256
+
+CACHE_SUFFIX = ".json.gz"
+
+
+def api_key_namespace(api_key: str) -> str:
+    """
+    Derive a cache namespace from an API key without storing the key itself.
+
+    Args:
+        api_key: Fathom API key
+
+    Returns:
+        Short hex digest identifying the key
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class FathomCache:
+    """
+    Content-addressed, gzip-compressed cache keyed by recording ID.
+
+    Transcripts and summaries never change once Fathom has produced them, so
+    entries are kept until the total size on disk exceeds ``max_bytes``, at
+    which point the least recently used entries are evicted. Entries are
+    namespaced per API key so one tenant can never read another tenant's
+    recordings out of the cache.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """
+        Initialize the cache and index any entries already on disk.
+
+        Args:
+            cache_dir: Directory to store compressed entries in
+            max_bytes: Maximum total size of all entries on disk
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[Path, int]" = OrderedDict()  # path -> size, LRU first
+        self._digests: Dict[Path, str] = {}  # path -> content digest of last write
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from files on disk (oldest access first)."""
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(entries):
+            self._index[path] = size
+            self._total_bytes += size
+
+        if entries:
+            logger.info(
+                "Fathom cache: indexed %d entries (%.1f MB) in %s",
+                len(entries), self._total_bytes / (1024 * 1024), self.cache_dir
+            )
+
+    def _path_for(self, namespace: str, kind: str, recording_id: Any) -> Path:
+        """Map (namespace, kind, recording_id) to its content-addressed file path."""
+        digest = hashlib.sha256(f"{namespace}:{kind}:{recording_id}".encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}{CACHE_SUFFIX}"
+
+    def get(self, namespace: str, kind: str, recording_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached payload.
+
+        Args:
+            namespace: API key namespace (see api_key_namespace)
+            kind: Payload kind ("transcript", "summary", "meeting")
+            recording_id: Fathom recording ID
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        path = self._path_for(namespace, kind, recording_id)
+
+        with self._lock:
+            if path not in self._index:
+                self.misses += 1
+                return None
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Dropping unreadable Fathom cache entry %s: %s", path.name, e)
+            self._discard(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if path in self._index:
+                self._index.move_to_end(path)
+            self.hits += 1
+
+        # Persist recency so the LRU order survives restarts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return payload
+
+    def put(self, namespace: str, kind: str, recording_id: Any, payload: Dict[str, Any]):
+        """
+        Store a payload, evicting least recently used entries if over the size cap.
+
+        Writes are skipped when the stored content is already identical.
+
+        Args:
+            namespace: API key namespace (see api_key_namespace)
+            kind: Payload kind ("transcript", "summary", "meeting")
+            recording_id: Fathom recording ID
+            payload: JSON-serializable API response
+        """
+        path = self._path_for(namespace, kind, recording_id)
+        raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        content_digest = hashlib.sha256(raw).hexdigest()
+
+        with self._lock:
+            if path in self._index and self._digests.get(path) == content_digest:
+                self._index.move_to_end(path)
+                return
+
+        data = gzip.compress(raw)
+        if len(data) > self.max_bytes:
+            logger.warning(
+                "Fathom %s for recording %s is larger than the cache (%d bytes), not caching",
+                kind, recording_id, len(data)
+            )
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write Fathom cache entry for recording %s: %s", recording_id, e)
+            return
+
+        with self._lock:
+            self._total_bytes -= self._index.pop(path, 0)
+            self._index[path] = len(data)
+            self._digests[path] = content_digest
+            self._total_bytes += len(data)
+            self._evict_locked()
+
+    def _evict_locked(self):
+        """Evict least recently used entries until under the size cap (lock held)."""
+        while self._total_bytes > self.max_bytes and self._index:
+            path, size = self._index.popitem(last=False)
+            self._digests.pop(path, None)
+            self._total_bytes -= size
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            logger.debug("Evicted Fathom cache entry %s (%d bytes)", path.name, size)
+
+    def _discard(self, path: Path):
+        """Remove a single entry from the index and disk."""
+        with self._lock:
+            self._total_bytes -= self._index.pop(path, 0)
+            self._digests.pop(path, None)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size on disk, and hit/miss counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+_shared_cache: Optional[FathomCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> Optional[FathomCache]:
+    """
+    Get the process-wide Fathom cache, creating it on first use.
+
+    Configured via FATHOM_CACHE_DIR and FATHOM_CACHE_MAX_MB. Set
+    FATHOM_CACHE_MAX_MB=0 to disable caching.
+
+    Returns:
+        Shared FathomCache, or None if caching is disabled or unavailable
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is not None:
+            return _shared_cache
+
+        max_mb = int(os.getenv("FATHOM_CACHE_MAX_MB", str(DEFAULT_MAX_MB)))
+        if max_mb <= 0:
+            return None
+
+        cache_dir = Path(os.path.expanduser(os.getenv("FATHOM_CACHE_DIR", str(DEFAULT_CACHE_DIR))))
+        try:
+            _shared_cache = FathomCache(cache_dir, max_bytes=max_mb * 1024 * 1024)
+        except OSError as e:
+            logger.warning("Fathom cache disabled, could not create %s: %s", cache_dir, e)
+            return None
+
+        return _shared_cache
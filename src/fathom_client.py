@@ -2,9 +2,14 @@
 
 import time
 import logging
+import threading
 import requests
 from typing import List, Dict, Any, Optional
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from fathom_cache import FathomCache, api_key_namespace, get_shared_cache
+from fathom_search import FathomSearchIndex, get_search_index
 
 
 logger = logging.getLogger(__name__)
@@ -23,9 +28,15 @@ class RateLimiter:
         self.max_requests = max_requests_per_minute
         self.window = 60.0  # seconds
         self.requests = deque()
+        self._lock = threading.Lock()
 
     def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
+        """Wait if rate limit would be exceeded (safe to call from multiple threads)."""
+        with self._lock:
+            self._acquire_slot()
+
+    def _acquire_slot(self):
+        """Reserve a request slot, sleeping until one frees up (lock held)."""
         now = time.time()
 
         # Remove requests outside the window
@@ -59,16 +70,29 @@ class FathomClient:
 
     BASE_URL = "https://api.fathom.ai/external/v1"
 
-    def __init__(self, api_key: str, max_requests_per_minute: int = 60):
+    def __init__(
+        self,
+        api_key: str,
+        max_requests_per_minute: int = 60,
+        cache: Optional[FathomCache] = None,
+        use_cache: bool = True,
+        search_index: Optional[FathomSearchIndex] = None
+    ):
         """
         Initialize Fathom API client.
 
         Args:
             api_key: Fathom API key
             max_requests_per_minute: Maximum API requests per minute
+            cache: On-disk cache for transcripts/summaries (default: process-wide cache)
+            use_cache: Set to False to always hit the API (also disables the search index)
+            search_index: Transcript search index (default: this API key's shared index)
         """
         self.api_key = api_key
         self.rate_limiter = RateLimiter(max_requests_per_minute)
+        self.cache = (cache or get_shared_cache()) if use_cache else None
+        self.cache_namespace = api_key_namespace(api_key)
+        self.search_index = (search_index or get_search_index(self.cache_namespace)) if use_cache else None
         self.session = requests.Session()
         self.session.headers.update({
             'X-Api-Key': api_key,
@@ -233,6 +257,17 @@ class FathomClient:
         items = response.get('items', [])
         logger.info("Retrieved %d meetings", len(items))
 
+        # Keep the latest copy of each meeting record (carries action items).
+        # Records listed before Fathom produced their action items are not
+        # final, so they are left for the next listing.
+        if self.cache:
+            for meeting in items:
+                if meeting.get('recording_id') is not None and meeting.get('action_items'):
+                    self.cache.put(self.cache_namespace, 'meeting', meeting['recording_id'], meeting)
+
+        if self.search_index:
+            self.search_index.upsert_meetings(items)
+
         return response
 
     def get_meeting_transcript(self, recording_id: int) -> Dict[str, Any]:
@@ -248,12 +283,28 @@ class FathomClient:
         Raises:
             requests.HTTPError: If API request fails or recording not found
         """
+        if self.cache:
+            cached = self.cache.get(self.cache_namespace, 'transcript', recording_id)
+            if cached is not None:
+                logger.info("Transcript for recording %d served from cache", recording_id)
+                if self.search_index and not self.search_index.is_indexed(recording_id):
+                    self.search_index.index_transcript(recording_id, cached.get('transcript', []))
+                return cached
+
         response = self._execute_with_retry(
             'GET',
             f'recordings/{recording_id}/transcript'
         )
 
         logger.info("Retrieved transcript for recording %d", recording_id)
+
+        # Transcripts are immutable once produced; don't cache empty (still processing) ones
+        if self.cache and response.get('transcript'):
+            self.cache.put(self.cache_namespace, 'transcript', recording_id, response)
+
+        if self.search_index:
+            self.search_index.index_transcript(recording_id, response.get('transcript', []))
+
         return response
 
     def get_meeting_summary(self, recording_id: int) -> Dict[str, Any]:
@@ -269,14 +320,42 @@ class FathomClient:
         Raises:
             requests.HTTPError: If API request fails or recording not found
         """
+        if self.cache:
+            cached = self.cache.get(self.cache_namespace, 'summary', recording_id)
+            if cached is not None:
+                logger.info("Summary for recording %d served from cache", recording_id)
+                return cached
+
         response = self._execute_with_retry(
             'GET',
             f'recordings/{recording_id}/summary'
         )
 
         logger.info("Retrieved summary for recording %d", recording_id)
+
+        if self.cache and (response.get('summary') or {}).get('markdown_formatted'):
+            self.cache.put(self.cache_namespace, 'summary', recording_id, response)
+
         return response
 
+    def get_cached_meeting(self, recording_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the last meeting record seen for a recording, without an API call.
+
+        Meeting records are cached when they come back from list_meetings with
+        action items, so those are available locally for any meeting listed
+        after Fathom produced them.
+
+        Args:
+            recording_id: Fathom recording ID
+
+        Returns:
+            Meeting dictionary (including 'action_items'), or None if not cached
+        """
+        if not self.cache:
+            return None
+        return self.cache.get(self.cache_namespace, 'meeting', recording_id)
+
     def search_meetings_by_title(
         self,
         search_term: str,
@@ -410,3 +489,240 @@ class FathomClient:
 
         logger.info("Fetched %d total meetings", len(all_meetings))
         return all_meetings
+
+    def sync_search_index(
+        self,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        max_meetings: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Bring the transcript search index up to date with recent meetings.
+
+        Lists meetings in the date range and fetches transcripts only for those
+        not yet indexed (served from the transcript cache where possible).
+
+        Args:
+            created_after: Only sync meetings created after this timestamp (ISO 8601)
+            created_before: Only sync meetings created before this timestamp (ISO 8601)
+            max_meetings: Maximum meetings to consider
+
+        Returns:
+            Dictionary with 'checked', 'newly_indexed' and 'failed' counts
+
+        Raises:
+            requests.HTTPError: If listing meetings fails
+        """
+        if not self.search_index:
+            return {"checked": 0, "newly_indexed": 0, "failed": 0}
+
+        meetings = self.get_all_meetings(
+            max_meetings=max_meetings,
+            created_after=created_after,
+            created_before=created_before
+        )
+        missing = [
+            m['recording_id'] for m in meetings
+            if m.get('recording_id') is not None and not self.search_index.is_indexed(m['recording_id'])
+        ]
+
+        failed = 0
+        if missing:
+            result = self.get_recordings_bulk(
+                recording_ids=missing,
+                include_summary=False,
+                include_transcript=True
+            )
+            failed = result["failed"]
+
+        # Transcripts still being processed by Fathom come back empty and aren't indexed yet
+        newly_indexed = sum(1 for recording_id in missing if self.search_index.is_indexed(recording_id))
+
+        logger.info(
+            "Search index sync: %d meetings checked, %d newly indexed",
+            len(meetings), newly_indexed
+        )
+        return {"checked": len(meetings), "newly_indexed": newly_indexed, "failed": failed}
+
+    def get_recordings_bulk(
+        self,
+        recording_ids: Optional[List[int]] = None,
+        search_term: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        max_meetings: int = 50,
+        include_summary: bool = True,
+        include_transcript: bool = True,
+        max_transcript_chars: Optional[int] = None,
+        max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Fetch summaries and transcripts for many recordings concurrently.
+
+        Recordings are either given explicitly or selected with a meeting query
+        (date range and optional title search). Requests run on a thread pool and
+        share this client's rate limiter, so throughput stays within the Fathom
+        limit. A failure on one recording is reported on that item and does not
+        abort the batch.
+
+        Args:
+            recording_ids: Recording IDs to fetch (takes precedence over the query)
+            search_term: Only include meetings whose title contains this term
+            created_after: Only include meetings created after this timestamp (ISO 8601)
+            created_before: Only include meetings created before this timestamp (ISO 8601)
+            max_meetings: Maximum meetings to select when using a query
+            include_summary: Fetch each recording's summary
+            include_transcript: Fetch each recording's transcript
+            max_transcript_chars: Total character budget shared across all transcripts;
+                longer transcripts are truncated so the batch fits (None = no limit)
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Dictionary with 'recordings' (one compact entry per recording, in input
+            order), 'fetched', 'failed' and 'truncated' counts
+
+        Raises:
+            requests.HTTPError: If the meeting query itself fails
+        """
+        meetings_by_id: Dict[int, Dict[str, Any]] = {}
+
+        if recording_ids is None:
+            meetings = self.get_all_meetings(
+                max_meetings=max_meetings,
+                created_after=created_after,
+                created_before=created_before
+            )
+            if search_term:
+                term = search_term.lower()
+                meetings = [
+                    m for m in meetings
+                    if term in (m.get('title') or '').lower()
+                    or term in (m.get('meeting_title') or '').lower()
+                ]
+            recording_ids = [m['recording_id'] for m in meetings if m.get('recording_id') is not None]
+            meetings_by_id = {m['recording_id']: m for m in meetings if m.get('recording_id') is not None}
+
+        # De-duplicate while keeping the caller's order
+        recording_ids = list(dict.fromkeys(recording_ids))
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for recording_id in recording_ids:
+            meeting = meetings_by_id.get(recording_id) or self.get_cached_meeting(recording_id) or {}
+            results[recording_id] = {
+                "recording_id": recording_id,
+                "title": meeting.get('title') or meeting.get('meeting_title'),
+                "scheduled_start": meeting.get('scheduled_start_time'),
+                "errors": {}
+            }
+
+        jobs = []
+        if include_summary:
+            jobs.extend((recording_id, 'summary') for recording_id in recording_ids)
+        if include_transcript:
+            jobs.extend((recording_id, 'transcript') for recording_id in recording_ids)
+
+        fetchers = {
+            'summary': self.get_meeting_summary,
+            'transcript': self.get_meeting_transcript
+        }
+
+        if jobs:
+            workers = max(1, min(max_workers, len(jobs), self.rate_limiter.max_requests))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(fetchers[kind], recording_id): (recording_id, kind)
+                    for recording_id, kind in jobs
+                }
+                for future in as_completed(futures):
+                    recording_id, kind = futures[future]
+                    entry = results[recording_id]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logger.warning("Bulk fetch: %s for recording %s failed: %s", kind, recording_id, e)
+                        entry["errors"][kind] = str(e)
+                        continue
+
+                    if kind == 'summary':
+                        entry["summary"] = (response.get('summary') or {}).get('markdown_formatted')
+                    else:
+                        entry["transcript"] = _compact_transcript(response.get('transcript', []))
+
+        truncated = 0
+        if include_transcript and max_transcript_chars is not None:
+            truncated = _apply_transcript_budget(list(results.values()), max_transcript_chars)
+
+        recordings = []
+        failed = 0
+        for recording_id in recording_ids:
+            entry = results[recording_id]
+            if entry["errors"]:
+                failed += 1
+            else:
+                del entry["errors"]
+            recordings.append(entry)
+
+        logger.info(
+            "Bulk fetched %d recordings (%d with errors, %d transcripts truncated)",
+            len(recordings), failed, truncated
+        )
+
+        return {
+            "recordings": recordings,
+            "fetched": len(recordings) - failed,
+            "failed": failed,
+            "truncated": truncated
+        }
+
+
+def _compact_transcript(transcript: List[Dict[str, Any]]) -> str:
+    """
+    Flatten transcript segments into "[timestamp] Speaker: text" lines.
+
+    Args:
+        transcript: Transcript segments from the Fathom API
+
+    Returns:
+        Transcript as a single newline-separated string
+    """
+    lines = []
+    for entry in transcript:
+        speaker = (entry.get('speaker') or {}).get('display_name') or 'Unknown'
+        timestamp = entry.get('timestamp')
+        prefix = f"[{timestamp}] " if timestamp else ""
+        lines.append(f"{prefix}{speaker}: {entry.get('text', '')}")
+    return "\n".join(lines)
+
+
+def _apply_transcript_budget(entries: List[Dict[str, Any]], max_chars: int) -> int:
+    """
+    Truncate transcripts in place so their combined length fits the budget.
+
+    The budget is shared fairly: short transcripts are kept whole and the
+    characters they leave unused go to the longer ones.
+
+    Args:
+        entries: Bulk result entries, some with a 'transcript' string
+        max_chars: Total character budget across all transcripts
+
+    Returns:
+        Number of transcripts that were truncated
+    """
+    with_transcript = sorted(
+        (e for e in entries if e.get('transcript')),
+        key=lambda e: len(e['transcript'])
+    )
+
+    remaining = max(0, max_chars)
+    truncated = 0
+    for position, entry in enumerate(with_transcript):
+        share = remaining // (len(with_transcript) - position)
+        text = entry['transcript']
+        if len(text) > share:
+            entry['transcript'] = text[:share]
+            entry['transcript_truncated'] = True
+            entry['transcript_length'] = len(text)
+            truncated += 1
+        remaining -= len(entry['transcript'])
+
+    return truncated
@@ -0,0 +1,370 @@
+"""Local full-text search index (SQLite FTS5) over Fathom meeting transcripts."""
+
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Default location and per-key size cap (override with FATHOM_SEARCH_DIR / FATHOM_SEARCH_MAX_RECORDINGS)
+DEFAULT_SEARCH_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "fathom-search"
+DEFAULT_MAX_RECORDINGS = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    recording_id INTEGER PRIMARY KEY,
+    title TEXT,
+    url TEXT,
+    share_url TEXT,
+    scheduled_start TEXT,
+    transcript_digest TEXT,
+    indexed_at TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments USING fts5(
+    text,
+    speaker,
+    recording_id UNINDEXED,
+    timestamp UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def _to_match_query(query: str, match_any: bool = False) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Each word is quoted so punctuation in the user's query can't produce an
+    FTS5 syntax error. A trailing '*' on a word is kept as a prefix match.
+
+    Args:
+        query: Free-text search query
+        match_any: Match any word (OR) instead of all words (AND)
+
+    Returns:
+        FTS5 MATCH expression, or empty string if the query has no words
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return (' OR ' if match_any else ' ').join(terms)
+
+
+class FathomSearchIndex:
+    """
+    Full-text index of one API key's Fathom transcripts.
+
+    Each transcript segment is a row in an FTS5 table carrying its speaker and
+    timestamp, so matches can be ranked (bm25), filtered by speaker and linked
+    back to the moment in the recording. Indexing is incremental: a transcript
+    whose content hasn't changed is skipped. Once more than ``max_recordings``
+    are indexed, the oldest meetings are dropped.
+    """
+
+    def __init__(self, db_path: Path, max_recordings: int = DEFAULT_MAX_RECORDINGS):
+        """
+        Open (or create) the index database.
+
+        Args:
+            db_path: SQLite database file for this API key
+            max_recordings: Maximum number of recordings kept in the index
+        """
+        self.db_path = Path(db_path)
+        self.max_recordings = max_recordings
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def is_indexed(self, recording_id: int) -> bool:
+        """
+        Check whether a recording's transcript is already in the index.
+
+        Args:
+            recording_id: Fathom recording ID
+
+        Returns:
+            True if the transcript has been indexed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT transcript_digest FROM recordings WHERE recording_id = ?",
+                (recording_id,)
+            ).fetchone()
+        return bool(row and row["transcript_digest"])
+
+    def upsert_meetings(self, meetings: List[Dict[str, Any]]):
+        """
+        Store meeting metadata (title, links, start time) from a meeting listing.
+
+        Args:
+            meetings: Meeting records from the Fathom meetings endpoint
+        """
+        rows = [
+            (
+                m['recording_id'],
+                m.get('title') or m.get('meeting_title'),
+                m.get('url'),
+                m.get('share_url'),
+                m.get('scheduled_start_time') or m.get('recording_start_time')
+            )
+            for m in meetings if m.get('recording_id') is not None
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO recordings (recording_id, title, url, share_url, scheduled_start)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(recording_id) DO UPDATE SET
+                    title = excluded.title,
+                    url = excluded.url,
+                    share_url = excluded.share_url,
+                    scheduled_start = excluded.scheduled_start
+                """,
+                rows
+            )
+            self._conn.commit()
+
+    def index_transcript(self, recording_id: int, transcript: List[Dict[str, Any]]) -> bool:
+        """
+        Add or replace a recording's transcript segments.
+
+        Args:
+            recording_id: Fathom recording ID
+            transcript: Transcript segments from the Fathom API
+
+        Returns:
+            True if the index changed, False if the transcript was already indexed
+        """
+        if not transcript:
+            return False
+
+        digest = hashlib.sha256(
+            json.dumps(transcript, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+        rows = [
+            (
+                entry.get('text') or '',
+                (entry.get('speaker') or {}).get('display_name'),
+                recording_id,
+                entry.get('timestamp')
+            )
+            for entry in transcript
+        ]
+
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT transcript_digest FROM recordings WHERE recording_id = ?",
+                (recording_id,)
+            ).fetchone()
+            if existing and existing["transcript_digest"] == digest:
+                return False
+
+            with self._conn:
+                self._conn.execute("DELETE FROM segments WHERE recording_id = ?", (recording_id,))
+                self._conn.executemany(
+                    "INSERT INTO segments (text, speaker, recording_id, timestamp) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO recordings (recording_id, transcript_digest, indexed_at)
+                    VALUES (?, ?, datetime('now'))
+                    ON CONFLICT(recording_id) DO UPDATE SET
+                        transcript_digest = excluded.transcript_digest,
+                        indexed_at = excluded.indexed_at
+                    """,
+                    (recording_id, digest)
+                )
+                self._evict_locked()
+
+        logger.info("Indexed %d transcript segments for recording %d", len(rows), recording_id)
+        return True
+
+    def _evict_locked(self):
+        """Drop the oldest indexed recordings beyond max_recordings (lock held)."""
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM recordings WHERE transcript_digest IS NOT NULL"
+        ).fetchone()[0]
+        excess = count - self.max_recordings
+        if excess <= 0:
+            return
+
+        stale = [
+            row["recording_id"] for row in self._conn.execute(
+                """
+                SELECT recording_id FROM recordings
+                WHERE transcript_digest IS NOT NULL
+                ORDER BY COALESCE(scheduled_start, indexed_at) ASC
+                LIMIT ?
+                """,
+                (excess,)
+            )
+        ]
+        for recording_id in stale:
+            self._conn.execute("DELETE FROM segments WHERE recording_id = ?", (recording_id,))
+            self._conn.execute("DELETE FROM recordings WHERE recording_id = ?", (recording_id,))
+        logger.info("Evicted %d old recordings from the transcript index", len(stale))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        speaker: Optional[str] = None,
+        match_any: bool = False,
+        snippets_per_recording: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Search transcripts and rank matching recordings.
+
+        Args:
+            query: Free-text search query (e.g. "pricing discount")
+            limit: Maximum number of recordings to return
+            speaker: Only match segments spoken by this speaker (substring, case-insensitive)
+            match_any: Match segments containing any word instead of all words
+            snippets_per_recording: Maximum matching segments returned per recording
+
+        Returns:
+            Recordings ordered by relevance, each with metadata, match count and
+            the best-matching segments (speaker, timestamp, highlighted snippet)
+        """
+        match = _to_match_query(query, match_any)
+        if not match:
+            return []
+
+        sql = """
+            SELECT s.recording_id, s.speaker, s.timestamp,
+                   snippet(segments, 0, '**', '**', '...', 16) AS snippet,
+                   bm25(segments) AS score
+            FROM segments s
+            WHERE segments MATCH ?
+        """
+        params: List[Any] = [match]
+        if speaker:
+            sql += " AND s.speaker LIKE ?"
+            params.append(f"%{speaker}%")
+        sql += " ORDER BY score"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            recording_ids = list(dict.fromkeys(row["recording_id"] for row in rows))[:limit]
+            meta = {}
+            if recording_ids:
+                placeholders = ",".join("?" * len(recording_ids))
+                meta = {
+                    row["recording_id"]: row for row in self._conn.execute(
+                        f"SELECT * FROM recordings WHERE recording_id IN ({placeholders})",
+                        recording_ids
+                    )
+                }
+
+        # bm25 scores are negative; lower is better, rows are already best-first
+        results: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            recording_id = row["recording_id"]
+            if recording_id not in meta:
+                continue
+            if recording_id not in results:
+                info = meta[recording_id]
+                results[recording_id] = {
+                    "recording_id": recording_id,
+                    "title": info["title"],
+                    "url": info["url"],
+                    "share_url": info["share_url"],
+                    "scheduled_start": info["scheduled_start"],
+                    "score": round(-row["score"], 4),
+                    "match_count": 0,
+                    "matches": []
+                }
+            result = results[recording_id]
+            result["match_count"] += 1
+            if len(result["matches"]) < snippets_per_recording:
+                result["matches"].append({
+                    "speaker": row["speaker"],
+                    "timestamp": row["timestamp"],
+                    "snippet": row["snippet"]
+                })
+
+        return [results[recording_id] for recording_id in recording_ids if recording_id in results]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with indexed recording and segment counts and database size
+        """
+        with self._lock:
+            recordings = self._conn.execute(
+                "SELECT COUNT(*) FROM recordings WHERE transcript_digest IS NOT NULL"
+            ).fetchone()[0]
+            segments = self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "recordings": recordings,
+            "segments": segments,
+            "max_recordings": self.max_recordings,
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_indexes: Dict[str, FathomSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(namespace: str) -> Optional[FathomSearchIndex]:
+    """
+    Get the process-wide search index for an API key namespace.
+
+    Each API key gets its own database file, so tenants never see each other's
+    transcripts. Configured via FATHOM_SEARCH_DIR and FATHOM_SEARCH_MAX_RECORDINGS
+    (per key). Set FATHOM_SEARCH_MAX_RECORDINGS=0 to disable the index.
+
+    Args:
+        namespace: API key namespace (see fathom_cache.api_key_namespace)
+
+    Returns:
+        FathomSearchIndex for the namespace, or None if disabled or unavailable
+    """
+    with _indexes_lock:
+        if namespace in _indexes:
+            return _indexes[namespace]
+
+        max_recordings = int(os.getenv("FATHOM_SEARCH_MAX_RECORDINGS", str(DEFAULT_MAX_RECORDINGS)))
+        if max_recordings <= 0:
+            return None
+
+        search_dir = Path(os.path.expanduser(os.getenv("FATHOM_SEARCH_DIR", str(DEFAULT_SEARCH_DIR))))
+        try:
+            index = FathomSearchIndex(search_dir / f"{namespace}.db", max_recordings=max_recordings)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Fathom transcript search disabled, could not open index in %s: %s", search_dir, e)
+            return None
+
+        _indexes[namespace] = index
+        return index
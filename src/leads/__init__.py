@@ -27,6 +27,11 @@ from .lead_functions import (
     get_bison_sender_replies,
     get_all_mailbox_health,
     get_unhealthy_mailboxes,
+    get_mailbox_capacity,
+    # Metrics history
+    get_client_metric_trends,
+    get_week_over_week_movers,
+    refresh_metrics_history,
 )
 
 __all__ = [
@@ -52,4 +57,9 @@ __all__ = [
     "get_bison_sender_replies",
     "get_all_mailbox_health",
     "get_unhealthy_mailboxes",
+    "get_mailbox_capacity",
+    # Metrics history
+    "get_client_metric_trends",
+    "get_week_over_week_movers",
+    "refresh_metrics_history",
 ]
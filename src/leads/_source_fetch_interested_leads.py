@@ -2,14 +2,28 @@
 Simple function to fetch interested leads from Instantly API.
 """
 
+import asyncio
 import logging
 import requests
-import time
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import timedelta
+from typing import List, Dict, Optional, Tuple
+
+from . import http_pool
+from .date_utils import parse_api_timestamp as _parse_timestamp, format_api_timestamp as _format_timestamp
+from .reply_store import get_reply_store, workspace_key
 
 logger = logging.getLogger(__name__)
 
+INSTANTLY_EMAILS_URL = "https://api.instantly.ai/api/v2/emails"
+
+# Reply windows are split into sub-windows of this many days, paginated concurrently
+SHARD_DAYS = 7
+MAX_INITIAL_SHARDS = 16
+# A sub-window that returns a full page is split into SPLIT_WAYS parts, down to this width
+SPLIT_WAYS = 4
+MIN_SHARD_SECONDS = 3600
+MAX_SPLIT_DEPTH = 3
+
 
 def get_lead_by_email(api_key: str, lead_email: str) -> Optional[Dict]:
     """
@@ -153,48 +167,6 @@ def verify_lead_exists_in_instantly(api_key: str, lead_email: str) -> Dict:
         }
 
 
-def _make_request_with_retry(url: str, headers: Dict, params: Dict, max_retries: int = 3, timeout: int = 60):
-    """
-    Make HTTP GET request with retry logic and exponential backoff.
-
-    Args:
-        url: API endpoint URL
-        headers: Request headers
-        params: Query parameters
-        max_retries: Maximum number of retry attempts (default: 3)
-        timeout: Request timeout in seconds (default: 60)
-
-    Returns:
-        Response object
-
-    Raises:
-        Exception: If all retries fail
-    """
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=timeout)
-            return response
-
-        except requests.exceptions.Timeout as e:
-            if attempt < max_retries - 1:
-                wait_time = 30 * (2 ** attempt)  # 30s, 60s
-                logger.warning(
-                    f"   ⚠️  Timeout on attempt {attempt + 1}/{max_retries}, "
-                    f"retrying in {wait_time}s... ({str(e)})"
-                )
-                time.sleep(wait_time)
-            else:
-                logger.error(
-                    f"   ❌ Failed after {max_retries} attempts: {str(e)}"
-                )
-                raise
-
-        except Exception as e:
-            # For non-timeout errors, don't retry
-            logger.error(f"   ❌ Request failed: {str(e)}")
-            raise
-
-
 def mark_instantly_lead_as_interested(
     api_key: str,
     lead_email: str,
@@ -361,6 +333,249 @@ def mark_instantly_lead_as_interested(
         return result
 
 
+def _email_timestamp(email: Dict) -> Optional[str]:
+    """Timestamp the emails endpoint filters on (falls back to the email date)."""
+    return email.get("timestamp_created") or email.get("timestamp_email")
+
+
+def _email_key(email: Dict) -> str:
+    """Unique identifier for an email (id field or combination of lead + timestamp)."""
+    return email.get("id") or email.get("ue_id") or f"{email.get('lead')}_{email.get('timestamp_email')}"
+
+
+def _shard_window(start_date: str, end_date: str, shard_days: int = SHARD_DAYS) -> List[Tuple[str, str]]:
+    """
+    Split [start_date, end_date] into consecutive sub-windows.
+
+    The outer bounds are passed through unchanged so the overall window means
+    exactly what it did before sharding.
+
+    Args:
+        start_date: Window start (ISO timestamp or YYYY-MM-DD)
+        end_date: Window end (ISO timestamp or YYYY-MM-DD)
+        shard_days: Target sub-window length in days
+
+    Returns:
+        List of (min_timestamp_created, max_timestamp_created) pairs
+    """
+    try:
+        start, end = _parse_timestamp(start_date), _parse_timestamp(end_date)
+    except ValueError:
+        return [(start_date, end_date)]
+
+    count = min(MAX_INITIAL_SHARDS, int((end - start) / timedelta(days=shard_days)) + 1)
+    if count <= 1:
+        return [(start_date, end_date)]
+
+    step = (end - start) / count
+    bounds = [start_date] + [_format_timestamp(start + step * i) for i in range(1, count)] + [end_date]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+async def _fetch_received_emails(
+    api_key: str,
+    start_date: str,
+    end_date: str,
+    filters: Dict,
+    limit: int = 100,
+    use_cursor: bool = True
+) -> Tuple[List[Dict], bool]:
+    """
+    Fetch every received email in a window, paginating sub-windows concurrently.
+
+    The window is split into SHARD_DAYS sub-windows that are walked in
+    parallel on the shared HTTP pool. Whenever a sub-window returns a full
+    page, the rest of it is split into SPLIT_WAYS parts that are walked
+    concurrently, so busy periods fan out further while quiet ones cost a
+    single request.
+
+    Args:
+        api_key: Instantly API key
+        start_date: Start date in ISO format
+        end_date: End date in ISO format
+        filters: Extra query parameters (e.g. {"i_status": 1})
+        limit: Max emails per page
+        use_cursor: Page within a sub-window with next_starting_after
+            (otherwise continue from the last email's timestamp)
+
+    Returns:
+        (emails with duplicates (shard overlaps) removed, oldest first,
+        False if any sub-window stopped early on an API error)
+    """
+    headers = {"Authorization": f"Bearer {api_key}"}
+    pages = 0
+    complete = True
+
+    async def fetch_page(window_start: str, window_end: str, starting_after: Optional[str]) -> Optional[Dict]:
+        nonlocal pages
+        params = {
+            **filters,
+            "min_timestamp_created": window_start,
+            "max_timestamp_created": window_end,
+            "limit": limit,
+            "sort_order": "asc",  # Ascending order for pagination
+            "email_type": "received"  # Only fetch received emails (replies)
+        }
+        if starting_after:
+            params["starting_after"] = starting_after
+
+        response = await http_pool.get_async(INSTANTLY_EMAILS_URL, headers=headers, params=params, timeout=60)
+        pages += 1
+        if not response.ok:
+            logger.warning(f"   API returned status {response.status_code}, stopping pagination for {window_start}..{window_end}")
+            return None
+        return response.json()
+
+    async def walk(window_start: str, window_end: str, depth: int) -> List[Dict]:
+        nonlocal complete
+        emails = []
+        seen = set()
+        starting_after = None
+
+        while True:
+            try:
+                data = await fetch_page(window_start, window_end, starting_after)
+            except Exception as e:
+                logger.error(f"   Error fetching emails for {window_start}..{window_end}: {e}")
+                complete = False
+                break
+            if data is None:
+                complete = False
+                break
+
+            items = data.get("items", [])
+            new_items = [email for email in items if _email_key(email) not in seen]
+            seen.update(_email_key(email) for email in new_items)
+            emails.extend(new_items)
+
+            # Fewer items than limit means this was the last page
+            if len(items) < limit:
+                break
+
+            # SAFETY CHECK: a page of already-seen emails means pagination is stuck
+            if not new_items:
+                logger.warning(f"   All emails on this page were already seen, stopping pagination")
+                break
+
+            last_timestamp = _email_timestamp(items[-1])
+            if not last_timestamp:
+                logger.warning(f"   No timestamp on last item, stopping pagination")
+                break
+
+            # Busy sub-window: split the remainder and walk the parts concurrently
+            try:
+                rest_start, rest_end = _parse_timestamp(last_timestamp), _parse_timestamp(window_end)
+            except ValueError:
+                rest_start = rest_end = None
+            if (
+                rest_start is not None
+                and depth < MAX_SPLIT_DEPTH
+                and (rest_end - rest_start).total_seconds() >= SPLIT_WAYS * MIN_SHARD_SECONDS
+            ):
+                step = (rest_end - rest_start) / SPLIT_WAYS
+                bounds = (
+                    [last_timestamp]
+                    + [_format_timestamp(rest_start + step * i) for i in range(1, SPLIT_WAYS)]
+                    + [window_end]
+                )
+                parts = await asyncio.gather(*(
+                    walk(part_start, part_end, depth + 1)
+                    for part_start, part_end in zip(bounds[:-1], bounds[1:])
+                ))
+                for part in parts:
+                    emails.extend(part)
+                break
+
+            if use_cursor:
+                starting_after = data.get("next_starting_after")
+                if not starting_after:
+                    break
+            else:
+                # Timestamp-based pagination: continue from the last item's timestamp
+                window_start = last_timestamp
+
+        return emails
+
+    shards = _shard_window(start_date, end_date)
+    results = await asyncio.gather(*(walk(shard_start, shard_end, 0) for shard_start, shard_end in shards))
+
+    # Merge shards, dropping emails fetched twice at sub-window boundaries
+    merged = {}
+    for shard_emails in results:
+        for email in shard_emails:
+            merged.setdefault(_email_key(email), email)
+
+    logger.info(f"   Fetched {len(merged)} emails in {pages} pages across {len(shards)} sub-windows")
+    return sorted(merged.values(), key=lambda email: _email_timestamp(email) or ""), complete
+
+
+def _load_received_emails(
+    api_key: str,
+    start_date: str,
+    end_date: str,
+    i_status: Optional[int] = None,
+    limit: int = 100,
+    use_cursor: bool = True
+) -> List[Dict]:
+    """
+    Get received emails in a window, syncing the local reply store first.
+
+    The store holds every received email of the workspace (all interest
+    statuses), so only the parts of the window it has not synced yet, plus
+    the overlap window behind its high-water mark, are fetched from the API.
+    Without a store (disabled, or dates it cannot place) the whole window is
+    fetched with the status filter applied server-side.
+
+    Args:
+        api_key: Instantly API key
+        start_date: Start date in ISO format
+        end_date: End date in ISO format
+        i_status: Optional interest status filter
+        limit: Max emails per page
+        use_cursor: Cursor pagination for direct fetches (see _fetch_received_emails)
+
+    Returns:
+        Emails in the window, oldest first
+    """
+    store = get_reply_store()
+    try:
+        ranges = store.missing_ranges("instantly", workspace_key(api_key), "received", start_date, end_date) if store else None
+    except ValueError:
+        ranges = None
+
+    if ranges is None:
+        emails, _ = http_pool.run(_fetch_received_emails(
+            api_key,
+            start_date,
+            end_date,
+            filters={} if i_status is None else {"i_status": i_status},
+            limit=limit,
+            use_cursor=use_cursor
+        ))
+        return emails
+
+    if ranges:
+        async def fetch_ranges():
+            # Timestamp pagination: cursors are unreliable without a status filter
+            return await asyncio.gather(*(
+                _fetch_received_emails(api_key, range_start, range_end, filters={}, limit=limit, use_cursor=False)
+                for range_start, range_end in ranges
+            ))
+
+        fetched = http_pool.run(fetch_ranges())
+        for (range_start, range_end), (emails, complete) in zip(ranges, fetched):
+            store.save(
+                "instantly",
+                workspace_key(api_key),
+                "received",
+                ((_email_key(e), _email_timestamp(e), e.get("i_status"), e) for e in emails),
+                covered=(range_start, range_end) if complete else None
+            )
+        logger.info(f"   Synced {sum(len(emails) for emails, _ in fetched)} emails over {len(ranges)} missing ranges")
+
+    return store.query("instantly", workspace_key(api_key), "received", start_date, end_date, i_status=i_status)
+
+
 def fetch_interested_leads(
     api_key: str,
     start_date: str,
@@ -391,83 +606,42 @@ def fetch_interested_leads(
             ]
         }
     """
-    url = "https://api.instantly.ai/api/v2/emails"
-    headers = {"Authorization": f"Bearer {api_key}"}
+    # Served from the reply store; missing sub-windows are paginated concurrently
+    emails = _load_received_emails(api_key, start_date, end_date, i_status=1, limit=limit)  # Interested
 
     all_leads = []
-    starting_after = None
-
-    # Progress logging removed for MCP compatibility
 
-    while True:
-        # Build params
-        params = {
-            "i_status": 1,  # Interested
-            "min_timestamp_created": start_date,
-            "max_timestamp_created": end_date,
-            "limit": limit,
-            "sort_order": "asc",  # Ascending order for pagination
-            "email_type": "received"  # Only fetch received emails (replies)
+    # Process each email
+    for email in emails:
+        # Safety check: Only process received emails (should already be filtered by API)
+        # ue_type: 1=Sent, 2=Received, 3=Manual, 4=Scheduled
+        if email.get("ue_type") != 2:
+            continue
+
+        # Skip auto-replies detected by Instantly API (is_auto_reply: 0=false, 1=true)
+        if email.get("is_auto_reply") == 1:
+            continue
+
+        from_email = email.get("from_address_email", "").lower()
+
+        # Skip emails FROM your team (prism, leadgenjay, etc.)
+        if any(keyword in from_email for keyword in ["prism", "leadgenjay", "pendrick"]):
+            continue
+
+        # Skip system/auto emails
+        if "noreply" in from_email or "no-reply" in from_email or "paypal" in from_email:
+            continue
+
+        lead_data = {
+            "email": email.get("from_address_email", "Unknown"),
+            "reply_body": email.get("body", {}).get("text", ""),
+            "reply_summary": _summarize_reply(email.get("body", {}).get("text", "")),
+            "subject": email.get("subject", ""),
+            "timestamp": email.get("timestamp_email", ""),
+            "lead_id": email.get("lead"),
+            "thread_id": email.get("thread_id")
         }
-
-        if starting_after:
-            params["starting_after"] = starting_after
-
-        # Make request with retry logic
-        try:
-            response = _make_request_with_retry(url, headers, params, max_retries=3, timeout=60)
-
-            if not response.ok:
-                # Error logging removed for MCP compatibility
-                break
-
-            data = response.json()
-            items = data.get("items", [])
-
-            # Progress logging removed for MCP compatibility
-
-            # Process each email
-            for email in items:
-                # Safety check: Only process received emails (should already be filtered by API)
-                # ue_type: 1=Sent, 2=Received, 3=Manual, 4=Scheduled
-                if email.get("ue_type") != 2:
-                    continue
-
-                # Skip auto-replies detected by Instantly API (is_auto_reply: 0=false, 1=true)
-                if email.get("is_auto_reply") == 1:
-                    continue
-
-                from_email = email.get("from_address_email", "").lower()
-
-                # Skip emails FROM your team (prism, leadgenjay, etc.)
-                if any(keyword in from_email for keyword in ["prism", "leadgenjay", "pendrick"]):
-                    continue
-
-                # Skip system/auto emails
-                if "noreply" in from_email or "no-reply" in from_email or "paypal" in from_email:
-                    continue
-
-                lead_data = {
-                    "email": email.get("from_address_email", "Unknown"),
-                    "reply_body": email.get("body", {}).get("text", ""),
-                    "reply_summary": _summarize_reply(email.get("body", {}).get("text", "")),
-                    "subject": email.get("subject", ""),
-                    "timestamp": email.get("timestamp_email", ""),
-                    "lead_id": email.get("lead"),
-                    "thread_id": email.get("thread_id")
-                }
-                all_leads.append(lead_data)
-
-            # Check for next page
-            starting_after = data.get("next_starting_after")
-
-            # Break if no more pages OR if we got fewer items than limit (last page)
-            if not starting_after or len(items) < limit:
-                break
-
-        except Exception as e:
-            # Exception logging removed for MCP compatibility
-            break
+        all_leads.append(lead_data)
 
     # De-duplicate by email (keep most recent)
     unique_leads = _deduplicate_leads(all_leads)
@@ -591,128 +765,49 @@ def fetch_all_campaign_replies(
             "i_status_filter": int | None
         }
     """
-    url = "https://api.instantly.ai/api/v2/emails"
-    headers = {"Authorization": f"Bearer {api_key}"}
+    logger.info(f"   Fetching replies {start_date} to {end_date} (i_status={i_status})...")
 
-    all_leads = []
-    page_num = 0
-    seen_emails = set()  # Track email addresses to detect duplicate pages
-    seen_email_ids = set()  # Track email IDs to avoid processing duplicates
-    current_min_timestamp = start_date  # Start with the original start_date
+    # NOTE: Not using starting_after cursor due to API bug with email_type filter
+    # Using timestamp-based pagination within each sub-window instead
+    emails = _load_received_emails(api_key, start_date, end_date, i_status=i_status, limit=limit, use_cursor=False)
 
-    while True:
-        page_num += 1
-        logger.info(f"   Fetching page {page_num} (i_status={i_status})...")
+    all_leads = []
 
-        # Build params - use timestamp-based pagination instead of cursor
-        params = {
-            "min_timestamp_created": current_min_timestamp,
-            "max_timestamp_created": end_date,
-            "limit": limit,
-            "sort_order": "asc",  # Ascending order for pagination
-            "email_type": "received"  # Only fetch received emails (replies)
+    # Process each email (already unique by email ID)
+    for email in emails:
+        # Safety check: Only process received emails (should already be filtered by API)
+        # ue_type: 1=Sent, 2=Received, 3=Manual, 4=Scheduled
+        if email.get("ue_type") != 2:
+            continue
+
+        # Skip auto-replies detected by Instantly API (is_auto_reply: 0=false, 1=true)
+        if email.get("is_auto_reply") == 1:
+            continue
+
+        from_email = email.get("from_address_email", "").lower()
+
+        # Skip emails FROM your team (prism, leadgenjay, etc.)
+        if any(keyword in from_email for keyword in ["prism", "leadgenjay", "pendrick"]):
+            continue
+
+        # Skip system/auto emails
+        if "noreply" in from_email or "no-reply" in from_email or "paypal" in from_email:
+            continue
+
+        lead_data = {
+            "email": email.get("from_address_email", "Unknown"),
+            "reply_body": email.get("body", {}).get("text", ""),
+            "reply_summary": _summarize_reply(email.get("body", {}).get("text", "")),
+            "subject": email.get("subject", ""),
+            "timestamp": email.get("timestamp_email", ""),
+            "lead_id": email.get("lead"),
+            "thread_id": email.get("thread_id"),
+            "campaign_id": email.get("campaign"),  # Include campaign for context
+            "i_status": email.get("i_status")  # Include the status
         }
+        all_leads.append(lead_data)
 
-        # Add i_status filter if specified
-        if i_status is not None:
-            params["i_status"] = i_status
-
-        # NOTE: Not using starting_after cursor due to API bug with email_type filter
-        # Using timestamp-based pagination instead
-
-        # Make request with retry logic
-        try:
-            response = _make_request_with_retry(url, headers, params, max_retries=3, timeout=60)
-
-            if not response.ok:
-                logger.warning(f"   API returned status {response.status_code}, stopping pagination")
-                break
-
-            data = response.json()
-            items = data.get("items", [])
-            logger.info(f"   Received {len(items)} items on page {page_num}")
-
-            # Process each email
-            processed = 0
-            page_emails = set()  # Track emails on this specific page
-
-            for email in items:
-                # Create unique identifier for this email (id field or combination of lead + timestamp)
-                email_id = email.get("id") or email.get("ue_id") or f"{email.get('lead')}_{email.get('timestamp_email')}"
-
-                # Skip if we've already processed this exact email
-                if email_id in seen_email_ids:
-                    continue
-
-                seen_email_ids.add(email_id)
-
-                # Safety check: Only process received emails (should already be filtered by API)
-                # ue_type: 1=Sent, 2=Received, 3=Manual, 4=Scheduled
-                if email.get("ue_type") != 2:
-                    continue
-
-                # Skip auto-replies detected by Instantly API (is_auto_reply: 0=false, 1=true)
-                if email.get("is_auto_reply") == 1:
-                    continue
-
-                from_email = email.get("from_address_email", "").lower()
-
-                # Skip emails FROM your team (prism, leadgenjay, etc.)
-                if any(keyword in from_email for keyword in ["prism", "leadgenjay", "pendrick"]):
-                    continue
-
-                # Skip system/auto emails
-                if "noreply" in from_email or "no-reply" in from_email or "paypal" in from_email:
-                    continue
-
-                lead_data = {
-                    "email": email.get("from_address_email", "Unknown"),
-                    "reply_body": email.get("body", {}).get("text", ""),
-                    "reply_summary": _summarize_reply(email.get("body", {}).get("text", "")),
-                    "subject": email.get("subject", ""),
-                    "timestamp": email.get("timestamp_email", ""),
-                    "lead_id": email.get("lead"),
-                    "thread_id": email.get("thread_id"),
-                    "campaign_id": email.get("campaign"),  # Include campaign for context
-                    "i_status": email.get("i_status")  # Include the status
-                }
-                all_leads.append(lead_data)
-                page_emails.add(from_email)
-                processed += 1
-
-            logger.info(f"   Processed {processed} valid replies from page {page_num}")
-
-            # SAFETY CHECK: Detect if we're seeing the exact same emails as before
-            if page_num > 1 and page_emails and page_emails.issubset(seen_emails):
-                logger.warning(f"   ⚠️  All {len(page_emails)} emails on this page were already seen!")
-                logger.warning(f"   Infinite loop detected - breaking pagination")
-                break
-
-            seen_emails.update(page_emails)
-
-            # Break if we got fewer items than limit (last page)
-            if len(items) < limit:
-                logger.info(f"   Pagination complete after {page_num} pages (received {len(items)} < {limit})")
-                break
-
-            # Timestamp-based pagination: Use the last item's timestamp for next page
-            if items:
-                last_timestamp = items[-1].get("timestamp_email")
-                if last_timestamp:
-                    # Add 1ms to avoid getting the same email again
-                    # (timestamps are in ISO format, so we can use string comparison safely)
-                    current_min_timestamp = last_timestamp
-                    logger.info(f"   Next page will start from timestamp: {current_min_timestamp}")
-                else:
-                    logger.warning(f"   No timestamp on last item, stopping pagination")
-                    break
-            else:
-                logger.info(f"   No items returned, pagination complete")
-                break
-
-        except Exception as e:
-            logger.error(f"   Error fetching page {page_num}: {e}")
-            break
+    logger.info(f"   Processed {len(all_leads)} valid replies")
 
     # De-duplicate by email (keep most recent)
     unique_leads = _deduplicate_leads(all_leads)
@@ -0,0 +1,249 @@
+"""
+Persistent per-workspace store of reply analyses (SQLite).
+
+find_missed_opportunities is typically run every day over the same window
+for the same client, and each run used to re-analyse every reply in it.
+The store keeps, per platform and workspace, the final analysis of every
+reply it has seen (category, confidence, reason, method), keyed by the
+reply's ID. The analysis is stored with a fingerprint of the reply's subject
+and body and the analysis mode (Claude model and prompt version, or
+keywords only). A later run reuses a stored analysis only while the
+fingerprint matches, so new and edited replies, and all replies after a
+model or prompt change, are analysed again.
+
+Analyses that fell back to keywords while Claude was requested are not
+stored, so an API outage is retried on the next run instead of being
+remembered. Rows not refreshed within the retention period are pruned on
+open. Workspaces are keyed by a hash of their API key (see workspace_key).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default location and retention (override with LEAD_ANALYSIS_STORE_DIR / LEAD_ANALYSIS_STORE_RETENTION_DAYS)
+DEFAULT_STORE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "analyses"
+DEFAULT_RETENTION_DAYS = 90
+
+# Lead fields that make up a stored analysis (the last two only on timing downgrades)
+ANALYSIS_FIELDS = ("ai_category", "ai_confidence", "ai_reason", "ai_method", "original_category", "original_method")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    reply_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    analysed_at REAL NOT NULL,
+    PRIMARY KEY (platform, workspace, reply_key)
+);
+CREATE INDEX IF NOT EXISTS analyses_by_age ON analyses (analysed_at);
+"""
+
+
+def reply_key(reply: Dict[str, Any]) -> str:
+    """
+    Stable identifier of a reply within its workspace.
+
+    Args:
+        reply: Reply dict (Bison replies carry "id"; Instantly replies are
+            identified by sender and timestamp)
+
+    Returns:
+        Key string
+    """
+    if reply.get("id") is not None:
+        return f"id:{reply['id']}"
+    return f"{(reply.get('email') or '').lower()}|{reply.get('timestamp') or ''}"
+
+
+def reply_fingerprint(reply: Dict[str, Any], mode: str) -> str:
+    """
+    Fingerprint of a reply's content under an analysis mode.
+
+    Args:
+        reply: Reply dict with "reply_body" and "subject"
+        mode: Analysis mode (e.g. model and prompt version, or "keywords")
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (mode, reply.get("subject") or "", reply.get("reply_body") or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class AnalysisStore:
+    """Reply analyses keyed by (platform, workspace, reply key), valid while the fingerprint matches."""
+
+    def __init__(self, db_path: Path, retention_seconds: float = DEFAULT_RETENTION_DAYS * 86400):
+        """
+        Open (or create) the store database.
+
+        Args:
+            db_path: SQLite database file
+            retention_seconds: How long an analysis is kept after it was last stored
+        """
+        self.db_path = Path(db_path)
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.prune()
+
+    def get_many(self, platform: str, workspace: str, fingerprints: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up stored analyses.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            fingerprints: {reply_key: current fingerprint}
+
+        Returns:
+            {reply_key: analysis} for replies whose stored fingerprint matches
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        keys = list(fingerprints)
+        with self._lock:
+            # Stay under SQLite's host-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT reply_key, fingerprint, payload FROM analyses "
+                    f"WHERE platform = ? AND workspace = ? AND reply_key IN ({', '.join('?' for _ in chunk)})",
+                    [platform, workspace, *chunk]
+                ).fetchall()
+                found.update(
+                    (key, json.loads(payload)) for key, fingerprint, payload in rows
+                    if fingerprints[key] == fingerprint
+                )
+        return found
+
+    def put_many(self, platform: str, workspace: str, records: Iterable[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """
+        Store analyses, replacing earlier ones for the same replies.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            records: (reply_key, fingerprint, analysis) tuples
+
+        Returns:
+            Number of analyses written
+        """
+        now = time.time()
+        rows = [
+            (platform, workspace, key, fingerprint, json.dumps(analysis), now)
+            for key, fingerprint, analysis in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analyses (platform, workspace, reply_key, fingerprint, payload, analysed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def prune(self) -> int:
+        """
+        Delete analyses older than the retention period.
+
+        Returns:
+            Number of analyses deleted
+        """
+        cutoff = time.time() - self.retention_seconds
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM analyses WHERE analysed_at < ?", (cutoff,)).rowcount
+
+    def clear(self, platform: Optional[str] = None, workspace: Optional[str] = None):
+        """
+        Delete stored analyses.
+
+        Args:
+            platform: Only this platform (optional)
+            workspace: Only this workspace (optional, with platform)
+        """
+        sql, params = "DELETE FROM analyses", []
+        if platform:
+            sql += " WHERE platform = ?"
+            params.append(platform)
+            if workspace:
+                sql += " AND workspace = ?"
+                params.append(workspace)
+        with self._lock, self._conn:
+            self._conn.execute(sql, params)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with analysis and workspace counts, retention and database size
+        """
+        with self._lock:
+            analyses = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+            workspaces = self._conn.execute(
+                "SELECT COUNT(*) FROM (SELECT DISTINCT platform, workspace FROM analyses)"
+            ).fetchone()[0]
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "analyses": analyses,
+            "workspaces": workspaces,
+            "retention_days": round(self.retention_seconds / 86400, 2),
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[AnalysisStore] = None
+_store_lock = threading.Lock()
+_store_failed = False
+
+
+def get_analysis_store() -> Optional[AnalysisStore]:
+    """
+    Get the process-wide analysis store, creating it on first use.
+
+    Configured via LEAD_ANALYSIS_STORE_DIR and LEAD_ANALYSIS_STORE_RETENTION_DAYS;
+    set LEAD_ANALYSIS_STORE_ENABLED=false to analyse every reply on every run.
+
+    Returns:
+        Shared AnalysisStore, or None if disabled or unavailable
+    """
+    global _store, _store_failed
+
+    if os.getenv("LEAD_ANALYSIS_STORE_ENABLED", "true").lower() == "false":
+        return None
+
+    with _store_lock:
+        if _store is None and not _store_failed:
+            store_dir = Path(os.path.expanduser(os.getenv("LEAD_ANALYSIS_STORE_DIR", str(DEFAULT_STORE_DIR))))
+            retention_days = float(os.getenv("LEAD_ANALYSIS_STORE_RETENTION_DAYS", str(DEFAULT_RETENTION_DAYS)))
+            try:
+                _store = AnalysisStore(store_dir / "analyses.db", retention_seconds=retention_days * 86400)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Analysis store disabled, could not open database in %s: %s", store_dir, e)
+                _store_failed = True
+        return _store
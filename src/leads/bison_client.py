@@ -3,14 +3,17 @@ Bison/LeadGenJay API wrapper functions.
 """
 
 import logging
-import requests
 from datetime import datetime
 from typing import Optional, List
 
+from . import http_pool
+from .campaign_stats_cache import get_stats_cache
+from .reply_store import get_reply_store, workspace_key
+
 logger = logging.getLogger(__name__)
 
 
-def get_bison_lead_replies(api_key: str, status: str = "interested", folder: str = "all"):
+def get_bison_lead_replies(api_key: str, status: str = "interested", folder: str = "all", page: Optional[int] = None):
     """
     Fetch lead replies from Bison API.
 
@@ -18,6 +21,7 @@ def get_bison_lead_replies(api_key: str, status: str = "interested", folder: str
         api_key: Bison API key
         status: Filter by status (e.g., "interested"), or None for all statuses
         folder: Filter by folder (e.g., "inbox", "all")
+        page: Page number (newest replies first), or None for the first page
 
     Returns:
         {
@@ -34,9 +38,15 @@ def get_bison_lead_replies(api_key: str, status: str = "interested", folder: str
                     "lead_id": int,
                     "read": bool
                 }
-            ]
+            ],
+            "meta": {"current_page": int, "last_page": int}
         }
     """
+    return http_pool.run(get_bison_lead_replies_async(api_key, status=status, folder=folder, page=page))
+
+
+async def get_bison_lead_replies_async(api_key: str, status: str = "interested", folder: str = "all", page: Optional[int] = None):
+    """Async get_bison_lead_replies for fan-outs on the shared HTTP pool."""
     url = "https://send.leadgenjay.com/api/replies"
     headers = {"Authorization": f"Bearer {api_key}"}
     params = {"folder": folder}
@@ -44,8 +54,10 @@ def get_bison_lead_replies(api_key: str, status: str = "interested", folder: str
     # Only add status filter if provided
     if status is not None:
         params["status"] = status
+    if page is not None:
+        params["page"] = page
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = await http_pool.get_async(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -83,10 +95,16 @@ def mark_bison_reply_as_interested(api_key: str, reply_id: int, skip_webhooks: b
 
     payload = {"skip_webhooks": skip_webhooks}
 
-    response = requests.patch(url, headers=headers, json=payload, timeout=30)
+    response = http_pool.patch(url, headers=headers, json=payload, timeout=30)
     response.raise_for_status()
+    result = response.json()
 
-    return response.json()
+    # The reply store only refetches recent replies; record the change directly
+    store = get_reply_store()
+    if store:
+        store.update_status("bison", workspace_key(api_key), "received", str(reply_id), 1, {"interested": True})
+
+    return result
 
 
 def get_bison_conversation_thread(api_key: str, reply_id: int):
@@ -106,10 +124,15 @@ def get_bison_conversation_thread(api_key: str, reply_id: int):
             }
         }
     """
+    return http_pool.run(get_bison_conversation_thread_async(api_key, reply_id))
+
+
+async def get_bison_conversation_thread_async(api_key: str, reply_id: int):
+    """Async get_bison_conversation_thread for fan-outs on the shared HTTP pool."""
     url = f"https://send.leadgenjay.com/api/replies/{reply_id}/conversation-thread"
     headers = {"Authorization": f"Bearer {api_key}"}
 
-    response = requests.get(url, headers=headers, timeout=30)
+    response = await http_pool.get_async(url, headers=headers, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -119,6 +142,9 @@ def get_bison_campaign_stats_api(api_key: str, start_date: str, end_date: str):
     """
     Fetch campaign statistics from Bison API.
 
+    Ranges are composed from cached daily buckets (see campaign_stats_cache),
+    with percentages recomputed from the summed counts.
+
     Args:
         api_key: Bison API key
         start_date: Start date in YYYY-MM-DD format
@@ -142,6 +168,11 @@ def get_bison_campaign_stats_api(api_key: str, start_date: str, end_date: str):
             }
         }
     """
+    return http_pool.run(get_bison_campaign_stats_api_async(api_key, start_date, end_date))
+
+
+async def _fetch_bison_campaign_stats_async(api_key: str, start_date: str, end_date: str):
+    """Fetch one date range from the workspace stats endpoint."""
     url = "https://send.leadgenjay.com/api/workspaces/v1.1/stats"
     headers = {"Authorization": f"Bearer {api_key}"}
     params = {
@@ -149,12 +180,24 @@ def get_bison_campaign_stats_api(api_key: str, start_date: str, end_date: str):
         "end_date": end_date
     }
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = await http_pool.get_async(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     return response.json()
 
 
+async def get_bison_campaign_stats_api_async(api_key: str, start_date: str, end_date: str):
+    """Async get_bison_campaign_stats_api for fan-outs on the shared HTTP pool."""
+    cache = get_stats_cache()
+    if cache is None:
+        return await _fetch_bison_campaign_stats_async(api_key, start_date, end_date)
+    try:
+        return await cache.range_stats("bison", api_key, start_date, end_date, _fetch_bison_campaign_stats_async)
+    except ValueError:
+        # Not plain YYYY-MM-DD dates, so the range can't be split into days
+        return await _fetch_bison_campaign_stats_async(api_key, start_date, end_date)
+
+
 def create_bison_campaign_api(api_key: str, name: str, campaign_type: str = "outbound"):
     """
     Create a new campaign in Bison API.
@@ -187,7 +230,7 @@ def create_bison_campaign_api(api_key: str, name: str, campaign_type: str = "out
         "type": campaign_type
     }
 
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = http_pool.post(url, headers=headers, json=payload, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -366,7 +409,7 @@ def create_bison_sequence_api(api_key: str, campaign_id: int, title: str, sequen
 
     # Debug logging removed for MCP compatibility
 
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = http_pool.post(url, headers=headers, json=payload, timeout=30)
 
     # Error logging removed for MCP compatibility
     if not response.ok:
@@ -430,7 +473,7 @@ def list_bison_campaigns(
         params["tag_ids"] = tag_ids
 
     # Use GET to list campaigns
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = http_pool.get(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -467,7 +510,7 @@ def get_bison_campaign_sequences(api_key: str, campaign_id: int):
     url = f"https://send.leadgenjay.com/api/campaigns/v1.1/{campaign_id}/sequence-steps"
     headers = {"Authorization": f"Bearer {api_key}"}
 
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_pool.get(url, headers=headers, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -505,7 +548,8 @@ def create_bison_campaign_with_sequences(
             "sequence": {...}   # Sequence creation response
         }
     """
-    from .sheets_client import load_bison_workspaces_from_sheet, DEFAULT_SHEET_URL, SHEET_GID_BISON
+    from .sheets_client import DEFAULT_SHEET_URL, SHEET_GID_BISON
+    from .workspace_registry import get_workspace_registry
 
     # Use defaults if not provided
     if sheet_url is None:
@@ -513,15 +557,8 @@ def create_bison_campaign_with_sequences(
     if gid is None:
         gid = SHEET_GID_BISON
 
-    # Load client configurations from sheet
-    workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=gid)
-
-    # Find the client
-    client = None
-    for workspace in workspaces:
-        if workspace["client_name"].lower() == client_name.lower():
-            client = workspace
-            break
+    # Find the client in the sheet
+    client = get_workspace_registry().get_bison_resolver(sheet_url, gid=gid).resolve(client_name)
 
     if not client:
         raise ValueError(f"Client '{client_name}' not found in Bison clients sheet")
@@ -590,7 +627,7 @@ def get_bison_sender_emails(api_key: str):
         params = {"page": page}
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = http_pool.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
         except Exception as e:
             logger.warning(f"Error fetching page {page}: {e}")
@@ -0,0 +1,395 @@
+"""
+Daily-bucket cache for Instantly and Bison campaign analytics (SQLite).
+
+The analytics endpoints are queried with arbitrary start/end dates, so 7-,
+14- and 30-day views of the same client never shared work. Instead, each
+day is fetched as its own one-day range and stored per workspace. Days
+older than the settle window (today and yesterday by default) no longer
+change and are kept permanently; recent days are always refetched.
+
+Only counts that add up across days (sent, opened, bounced, interested, ...)
+are summed from the buckets, with the rates built on them recomputed from
+the totals. Counts the APIs report as unique within a range (unique
+replies, leads contacted) and the rates built on them are taken from one
+request for the real range, stored once the whole range is settled, so
+every figure matches what the API returns for the same range.
+
+Every bucket a range uses is also recorded in the metrics store (see
+metrics_store), which keeps the per-day time series behind the trend tools.
+"""
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Callable, Awaitable
+
+from .reply_store import workspace_key
+from .metrics_store import MetricsStore, get_metrics_store
+
+logger = logging.getLogger(__name__)
+
+# Default location and settle window (override with LEAD_STATS_CACHE_DIR / LEAD_STATS_SETTLE_DAYS)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "stats"
+DEFAULT_SETTLE_DAYS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_stats (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    day TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (platform, workspace, day)
+);
+CREATE TABLE IF NOT EXISTS range_stats (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (platform, workspace, start_date, end_date)
+);
+"""
+
+# Counts that add up across days; every other field is unique within a range
+INSTANTLY_ADDITIVE = (
+    "emails_sent_count", "open_count", "link_click_count", "reply_count", "bounced_count",
+    "unsubscribed_count", "completed_count", "new_leads_contacted_count", "total_opportunities",
+    "total_opportunity_value", "total_interested", "total_meeting_booked", "total_meeting_completed",
+    "total_closed"
+)
+BISON_ADDITIVE = ("emails_sent", "opened", "bounced", "unsubscribed", "interested")
+
+# Rates over additive counts, recomputed from the sums: rate -> (numerator, denominator).
+# Rates over unique counts (reply_rate, opened/interested per lead contacted) come from the range.
+INSTANTLY_RATES: Dict[str, tuple] = {}
+BISON_RATES = {
+    "bounced_percentage": ("bounced", "emails_sent"),
+    "unsubscribed_percentage": ("unsubscribed", "emails_sent"),
+}
+
+DayFetcher = Callable[[str, str, str], Awaitable[Dict[str, Any]]]
+
+
+def _number(value: Any) -> Optional[float]:
+    """Numeric value of a count field (Bison sends some counts as strings)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def sum_counts(buckets: List[Dict[str, Any]], fields: Sequence[str], rates: Dict[str, tuple]) -> Dict[str, Any]:
+    """
+    Add up daily count fields and recompute rates from the totals.
+
+    Args:
+        buckets: Per-day stats dictionaries
+        fields: Count fields that add up across days; others are ignored
+        rates: Rate fields to recompute, as {rate: (numerator, denominator)}
+
+    Returns:
+        Summed counts present in any bucket plus recomputed rates (percentages, 2 decimals)
+    """
+    totals: Dict[str, Any] = {}
+    for bucket in buckets:
+        for key in fields:
+            number = _number(bucket.get(key))
+            if number is not None:
+                totals[key] = totals.get(key, 0) + number
+
+    totals = {key: int(value) if float(value).is_integer() else value for key, value in totals.items()}
+    for rate, (numerator, denominator) in rates.items():
+        total = totals.get(denominator, 0)
+        totals[rate] = round(totals.get(numerator, 0) / total * 100, 2) if total else 0
+    return totals
+
+
+def range_only(platform: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the fields served from daily buckets, leaving what only a range request gives."""
+    fields, rates, _ = PLATFORMS[platform]
+    summed = set(fields) | set(rates)
+    if platform == "bison":
+        return {**response, "data": {k: v for k, v in response.get("data", {}).items() if k not in summed}}
+    return {k: v for k, v in response.items() if k not in summed}
+
+
+def combine_instantly(range_response: Dict[str, Any], buckets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine a range's unique counts with daily /campaigns/analytics/overview sums."""
+    return {**range_response, **sum_counts(buckets, INSTANTLY_ADDITIVE, INSTANTLY_RATES)}
+
+
+def combine_bison(range_response: Dict[str, Any], buckets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine a range's unique counts with daily /workspaces/v1.1/stats sums."""
+    summed = sum_counts([bucket.get("data", {}) for bucket in buckets], BISON_ADDITIVE, BISON_RATES)
+    return {**range_response, "data": {**range_response.get("data", {}), **summed}}
+
+
+# platform -> (additive fields, rates over them, combiner)
+PLATFORMS = {
+    "instantly": (INSTANTLY_ADDITIVE, INSTANTLY_RATES, combine_instantly),
+    "bison": (BISON_ADDITIVE, BISON_RATES, combine_bison),
+}
+
+
+def _days(start_date: str, end_date: str) -> List[date]:
+    """Every day in [start_date, end_date] (YYYY-MM-DD), raising ValueError otherwise."""
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+class DailyStatsCache:
+    """
+    Settled per-day analytics, keyed by (platform, workspace, day).
+
+    Only days before the settle window are stored; newer days are fetched
+    on every call.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        settle_days: int = DEFAULT_SETTLE_DAYS,
+        metrics: Optional[MetricsStore] = None
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file
+            settle_days: Days (counting today) that are always refetched
+            metrics: Store that records each day's metrics for trend queries (optional)
+        """
+        self.db_path = Path(db_path)
+        self.settle_days = settle_days
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def is_settled(self, day: date, today: Optional[date] = None) -> bool:
+        """Whether a day is old enough that its stats no longer change."""
+        today = today or date.today()
+        return day <= today - timedelta(days=self.settle_days)
+
+    def get_days(self, platform: str, workspace: str, days: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get stored buckets.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            days: Days (YYYY-MM-DD) to look up
+
+        Returns:
+            {day: stats} for the days that are stored
+        """
+        if not days:
+            return {}
+        placeholders = ", ".join("?" for _ in days)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT day, payload FROM daily_stats WHERE platform = ? AND workspace = ? AND day IN ({placeholders})",
+                [platform, workspace, *days]
+            ).fetchall()
+        return {row["day"]: json.loads(row["payload"]) for row in rows}
+
+    def put_days(self, platform: str, workspace: str, buckets: Dict[str, Dict[str, Any]]):
+        """
+        Store settled buckets.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            buckets: {day: stats}
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_stats (platform, workspace, day, payload, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                [(platform, workspace, day, json.dumps(stats), now) for day, stats in buckets.items()]
+            )
+
+    def get_range(self, platform: str, workspace: str, start_date: str, end_date: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored range-only fields of a settled range.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Returns:
+            Stats response without the summed fields, or None if not stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM range_stats WHERE platform = ? AND workspace = ? AND start_date = ? AND end_date = ?",
+                (platform, workspace, start_date, end_date)
+            ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def put_range(self, platform: str, workspace: str, start_date: str, end_date: str, stats: Dict[str, Any]):
+        """
+        Store the range-only fields of a settled range.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            stats: Stats response for the range
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO range_stats (platform, workspace, start_date, end_date, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, workspace, start_date, end_date, json.dumps(range_only(platform, stats)), time.time())
+            )
+
+    async def range_stats(
+        self,
+        platform: str,
+        api_key: str,
+        start_date: str,
+        end_date: str,
+        fetch: DayFetcher
+    ) -> Dict[str, Any]:
+        """
+        Get stats for a date range from daily buckets and the range's unique counts.
+
+        Missing and unsettled days are fetched concurrently as one-day ranges,
+        together with the whole range unless it is settled and stored.
+
+        Args:
+            platform: "instantly" or "bison"
+            api_key: Workspace API key
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            fetch: Coroutine function (api_key, start_date, end_date) returning one range's stats
+
+        Returns:
+            The platform's stats response shape, for the whole range
+
+        Raises:
+            ValueError: If the dates are not YYYY-MM-DD
+        """
+        today = date.today()
+        all_days = _days(start_date, end_date)
+        days = [d for d in all_days if d <= today]
+        workspace = workspace_key(api_key)
+
+        settled = [d.isoformat() for d in days if self.is_settled(d, today)]
+        range_settled = self.is_settled(all_days[-1], today) if all_days else False
+        buckets = self.get_days(platform, workspace, settled)
+        range_response = self.get_range(platform, workspace, start_date, end_date) if range_settled else None
+        missing = [d.isoformat() for d in days if d.isoformat() not in buckets]
+        with self._lock:
+            self.hits += len(buckets)
+            self.misses += len(missing)
+
+        requests = [fetch(api_key, day, day) for day in missing]
+        if range_response is None:
+            requests.append(fetch(api_key, start_date, end_date))
+        fetched = await asyncio.gather(*requests)
+
+        if range_response is None:
+            range_response = fetched.pop()
+            if range_settled:
+                self.put_range(platform, workspace, start_date, end_date, range_response)
+        if missing:
+            new_buckets = dict(zip(missing, fetched))
+            buckets.update(new_buckets)
+            self.put_days(platform, workspace, {day: stats for day, stats in new_buckets.items() if day in settled})
+
+        if self.metrics is not None:
+            try:
+                self.metrics.record(platform, workspace, buckets)
+            except sqlite3.Error as e:
+                logger.warning("Could not record daily metrics: %s", e)
+
+        combine = PLATFORMS[platform][2]
+        return combine(range_only(platform, range_response), [buckets[d.isoformat()] for d in days])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with stored bucket and range counts, hit/miss counters and database size
+        """
+        with self._lock:
+            buckets = self._conn.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0]
+            ranges = self._conn.execute("SELECT COUNT(*) FROM range_stats").fetchone()[0]
+            hits, misses = self.hits, self.misses
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "buckets": buckets,
+            "ranges": ranges,
+            "hits": hits,
+            "misses": misses,
+            "settle_days": self.settle_days,
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[DailyStatsCache] = None
+_cache_lock = threading.Lock()
+_cache_failed = False
+
+
+def get_stats_cache() -> Optional[DailyStatsCache]:
+    """
+    Get the process-wide daily stats cache, creating it on first use.
+
+    Configured via LEAD_STATS_CACHE_DIR and LEAD_STATS_SETTLE_DAYS; set
+    LEAD_STATS_CACHE_ENABLED=false to query each range directly.
+
+    Returns:
+        Shared DailyStatsCache, or None if disabled or unavailable
+    """
+    global _cache, _cache_failed
+
+    if os.getenv("LEAD_STATS_CACHE_ENABLED", "true").lower() == "false":
+        return None
+
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            cache_dir = Path(os.path.expanduser(os.getenv("LEAD_STATS_CACHE_DIR", str(DEFAULT_CACHE_DIR))))
+            settle_days = int(os.getenv("LEAD_STATS_SETTLE_DAYS", str(DEFAULT_SETTLE_DAYS)))
+            try:
+                _cache = DailyStatsCache(cache_dir / "stats.db", settle_days=settle_days, metrics=get_metrics_store())
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Stats cache disabled, could not open database in %s: %s", cache_dir, e)
+                _cache_failed = True
+        return _cache
@@ -0,0 +1,232 @@
+"""
+Indexed client lookup over workspace records from the lead-management sheet.
+
+Every tool that takes a client name used to scan the whole workspace list:
+exact match, then substring match over the name columns, sometimes a
+rapidfuzz pass on top. ClientResolver builds hash maps, an n-gram index and
+the rapidfuzz choice list once per sheet load so lookups cost O(1) for exact
+matches and O(k) in the number of candidates for substring matches; only a
+query that matches nothing else pays for the typo-tolerant pass. Every tool
+resolves clients with
+resolve() (or WorkspaceRegistry.resolve_client across both platforms), so
+the match rules are the same everywhere.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+# Substring candidates come from n-grams up to this length
+NGRAM_SIZE = 3
+# Minimum rapidfuzz WRatio (0-100) for a typo-tolerant match
+FUZZY_SCORE_CUTOFF = 60
+
+
+def _ngrams(text: str, n: int) -> Set[str]:
+    """All distinct substrings of length n."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class _SubstringIndex:
+    """Maps n-grams (1..NGRAM_SIZE chars) to the records whose values contain them."""
+
+    def __init__(self, values_per_record: List[List[str]]):
+        self._values = values_per_record
+        self._postings: Dict[str, Set[int]] = {}
+        for idx, values in enumerate(values_per_record):
+            for value in values:
+                for n in range(1, NGRAM_SIZE + 1):
+                    for gram in _ngrams(value, n):
+                        self._postings.setdefault(gram, set()).add(idx)
+
+    def search(self, term: str) -> List[int]:
+        """Indexes of records with a value containing term, in record order."""
+        if not term:
+            return []
+
+        n = min(len(term), NGRAM_SIZE)
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _ngrams(term, n)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+
+        # n-grams narrow the candidates; confirm the full substring
+        return sorted(
+            idx for idx in candidates
+            if any(term in value for value in self._values[idx])
+        )
+
+
+class ClientResolver:
+    """
+    Resolve a client name or workspace ID to a workspace record.
+
+    Match order (first rule that matches wins):
+        1. Exact ID (Instantly workspace_id)
+        2. Exact name in any name column; must be unique, otherwise ValueError
+        3. Substring of any name column; must be unique, otherwise ValueError
+        4. Substring of the ID (first match)
+        5. Closest client_name by rapidfuzz WRatio, if at least FUZZY_SCORE_CUTOFF
+
+    All comparisons are case-insensitive.
+    """
+
+    def __init__(
+        self,
+        workspaces: Sequence[Dict[str, Any]],
+        id_field: Optional[str] = None,
+        name_fields: Sequence[str] = ("client_name",)
+    ):
+        """
+        Build the lookup indexes.
+
+        Args:
+            workspaces: Workspace records (from the registry)
+            id_field: Field holding a unique ID, e.g. "workspace_id" (None for Bison)
+            name_fields: Fields searched by name, in priority order
+        """
+        self.workspaces = list(workspaces)
+        self.id_field = id_field
+        self.name_fields = tuple(name_fields)
+
+        self._by_id: Dict[str, int] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        names_per_record: List[List[str]] = []
+        ids_per_record: List[List[str]] = []
+
+        for idx, w in enumerate(self.workspaces):
+            if id_field:
+                wid = (w.get(id_field) or "").lower()
+                self._by_id.setdefault(wid, idx)
+                ids_per_record.append([wid] if wid else [])
+
+            names = []
+            for field in self.name_fields:
+                value = (w.get(field) or "").lower()
+                if value:
+                    names.append(value)
+                    indexes = self._by_name.setdefault(value, [])
+                    if idx not in indexes:
+                        indexes.append(idx)
+            names_per_record.append(names)
+
+        self._name_index = _SubstringIndex(names_per_record)
+        self._id_index = _SubstringIndex(ids_per_record) if id_field else None
+        # rapidfuzz choice list, built once instead of on every fuzzy lookup
+        self._fuzzy_choices = [w.get("client_name", "") for w in self.workspaces]
+
+    def __len__(self) -> int:
+        return len(self.workspaces)
+
+    def _label(self, w: Dict[str, Any]) -> str:
+        """Display label used in ambiguity errors."""
+        if self.id_field:
+            return f"{w['client_name']} ({w[self.id_field]})"
+        return w["client_name"]
+
+    def _ambiguous(self, query: str, matches: List[Dict[str, Any]]) -> ValueError:
+        """Error listing the clients a query matched."""
+        hint = "Please use the exact workspace_id or be more specific." if self.id_field else "Please be more specific."
+        return ValueError(
+            f"Multiple matches found for '{query}':\n" +
+            "\n".join(f"  - {self._label(w)}" for w in matches) +
+            f"\n\n{hint}"
+        )
+
+    def exact(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a workspace by exact ID or exact name.
+
+        Args:
+            query: Client name or workspace ID
+
+        Returns:
+            Workspace record, or None
+
+        Raises:
+            ValueError: If several clients have exactly this name
+        """
+        term = (query or "").strip().lower()
+        if self.id_field and term in self._by_id:
+            return self.workspaces[self._by_id[term]]
+        indexes = self._by_name.get(term)
+        if not indexes:
+            return None
+        if len(indexes) > 1:
+            raise self._ambiguous(query, [self.workspaces[idx] for idx in indexes])
+        return self.workspaces[indexes[0]]
+
+    def candidates(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Find all workspaces whose name columns contain the query.
+
+        Args:
+            query: Partial client name
+
+        Returns:
+            Matching workspace records in sheet order
+        """
+        term = (query or "").strip().lower()
+        return [self.workspaces[idx] for idx in self._name_index.search(term)]
+
+    def closest(self, query: str, score_cutoff: float = FUZZY_SCORE_CUTOFF) -> Optional[Dict[str, Any]]:
+        """
+        Find the most similar client name with rapidfuzz (tolerates typos).
+
+        Args:
+            query: Client name as typed by the user
+            score_cutoff: Minimum WRatio similarity (0-100)
+
+        Returns:
+            Workspace record, or None if nothing is similar enough
+        """
+        if not query or not self._fuzzy_choices:
+            return None
+
+        from rapidfuzz import process, fuzz
+
+        result = process.extractOne(query, self._fuzzy_choices, scorer=fuzz.WRatio, score_cutoff=score_cutoff)
+        if not result:
+            return None
+
+        matched_name, score, index = result
+        logger.info(f"Fuzzy matched '{query}' to '{matched_name}' (score: {score:.0f})")
+        return self.workspaces[index]
+
+    def resolve(self, query: str, fuzzy: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a client using the match order described on the class.
+
+        Args:
+            query: Client name, partial name or workspace ID
+            fuzzy: Fall back to the closest name when nothing else matches
+
+        Returns:
+            Workspace record, or None if nothing matches
+
+        Raises:
+            ValueError: If the name or partial name matches more than one client
+        """
+        workspace = self.exact(query)
+        if workspace:
+            return workspace
+
+        term = (query or "").strip().lower()
+        matches = self.candidates(term)
+        if len(matches) == 1:
+            return matches[0]
+        if len(matches) > 1:
+            raise self._ambiguous(query, matches)
+
+        if self._id_index:
+            id_matches = self._id_index.search(term)
+            if id_matches:
+                return self.workspaces[id_matches[0]]
+
+        return self.closest(query) if fuzzy else None
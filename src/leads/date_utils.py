@@ -2,7 +2,7 @@
 Date validation and utility functions for lead management.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 
 def validate_and_parse_dates(start_date: str = None, end_date: str = None, days: int = 7):
@@ -95,3 +95,36 @@ def validate_and_parse_dates(start_date: str = None, end_date: str = None, days:
 
     # Return dates in YYYY-MM-DD format
     return start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d"), warnings
+
+
+def parse_api_timestamp(value: str) -> datetime:
+    """
+    Parse an API timestamp or YYYY-MM-DD date as an aware UTC datetime.
+
+    Args:
+        value: ISO timestamp (e.g. "2024-12-01T10:00:00.000Z") or YYYY-MM-DD
+
+    Returns:
+        Timezone-aware datetime (naive values are taken as UTC)
+
+    Raises:
+        ValueError: If the value is not a date or ISO timestamp
+    """
+    if 'T' not in value:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_api_timestamp(value: datetime) -> str:
+    """
+    Format a datetime the way the Instantly API returns timestamps.
+
+    Args:
+        value: Timezone-aware datetime
+
+    Returns:
+        UTC timestamp with millisecond precision (e.g. "2024-12-01T10:00:00.000Z")
+    """
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
@@ -4,6 +4,8 @@ EmailGuard API wrapper for spam checking.
 
 import requests
 
+from . import http_pool
+
 
 def check_content_spam(api_key: str, content: str):
     """
@@ -36,7 +38,7 @@ def check_content_spam(api_key: str, content: str):
         "content": content
     }
 
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = http_pool.post(url, headers=headers, json=payload, timeout=30)
 
     # Capture error details before raising
     if not response.ok:
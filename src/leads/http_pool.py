@@ -0,0 +1,479 @@
+"""
+Pooled HTTP transport for the Instantly, Bison and EmailGuard APIs.
+
+Each call used to be a bare requests.get/post with its own TCP+TLS handshake,
+and portfolio fan-outs stacked 15 threads on top. This module keeps one
+httpx.AsyncClient per upstream host (keep-alive, HTTP/2 where the h2 package
+is installed) on a background event loop shared by the whole process, and
+bounds in-flight requests per host to that host's pool size.
+
+Every thread pool, coroutine fan-out and MCP session in the process goes
+through the same loop, so the per-host limit is global. Requests waiting for
+a slot are queued per tenant (the API key in the Authorization header) and
+served round-robin: a client with thousands of pages queued can't starve a
+small client's single lookup, and a burst queues instead of reaching the
+upstream as a wall of requests that all come back 429.
+
+Synchronous callers use get/post/patch, which mirror the requests signatures
+and return a requests-compatible Response, so existing error handling
+(raise_for_status, requests.exceptions.*) keeps working. Coroutines use the
+*_async variants, and run() executes a whole fan-out on the pool's loop.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Coroutine, AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive connections (and concurrent requests) per upstream host
+HOST_LIMITS = {
+    "api.instantly.ai": 15,
+    "send.leadgenjay.com": 15,
+    "app.emailguard.io": 10,
+}
+DEFAULT_HOST_LIMIT = 10
+
+# Retries after the first attempt (override with LEADS_HTTP_MAX_RETRIES)
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class Response:
+    """requests-compatible view of an httpx response."""
+
+    def __init__(self, response: httpx.Response):
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.content = response.content
+        self.url = str(response.url)
+        self.encoding = response.encoding
+        self.http_version = response.http_version
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise requests.exceptions.HTTPError for 4xx/5xx responses."""
+        if self.status_code >= 500:
+            kind = "Server Error"
+        elif self.status_code >= 400:
+            kind = "Client Error"
+        else:
+            return
+        raise requests.exceptions.HTTPError(
+            f"{self.status_code} {kind}: {self.reason} for url: {self.url}",
+            response=self
+        )
+
+
+def _clean_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Encode query parameters the way requests does (drop None, str() booleans)."""
+    if not params:
+        return params
+    cleaned = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        cleaned[key] = str(value) if isinstance(value, bool) else value
+    return cleaned
+
+
+def _tenant_of(headers: Optional[Dict[str, str]]) -> str:
+    """Tenant key for fair queueing: a fingerprint of the request's credential."""
+    credential = None
+    for name, value in (headers or {}).items():
+        if name.lower() == "authorization":
+            credential = value
+            break
+    if not credential:
+        return "anonymous"
+    return hashlib.sha256(credential.encode()).hexdigest()[:12]
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class FairLimiter:
+    """
+    Bounded concurrency for one upstream host with per-tenant fair queueing.
+
+    Up to limit requests run at once. Beyond that, waiters queue per tenant
+    and a freed slot goes to the next tenant in round-robin order, so each
+    tenant with queued work gets an equal share of the host. Not thread-safe:
+    used only on the pool loop.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()
+        self.queued = 0
+        self.max_queued = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self, tenant: str) -> AsyncIterator[None]:
+        """Hold one of the host's slots for the duration of the block."""
+        await self.acquire(tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, tenant: str):
+        """Wait for a slot; tenants are served round-robin once the host is saturated."""
+        if self.in_flight < self.limit and not self.queued:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(tenant, deque()).append(waiter)
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as we were cancelled; pass it on
+                self.release()
+            else:
+                self._discard(tenant, waiter)
+            raise
+        self.waits += 1
+        self.wait_seconds += time.monotonic() - started
+
+    def release(self):
+        """Hand the slot to the next tenant in line, or free it."""
+        while self._queues:
+            tenant, queue = self._queues.popitem(last=False)
+            waiter = queue.popleft()
+            self.queued -= 1
+            if queue:
+                self._queues[tenant] = queue  # back of the rotation
+            if not waiter.done():
+                waiter.set_result(None)  # slot moves to the waiter; in_flight unchanged
+                return
+        self.in_flight -= 1
+
+    def _discard(self, tenant: str, waiter: asyncio.Future):
+        """Drop a cancelled waiter from its tenant's queue."""
+        queue = self._queues.get(tenant)
+        if queue and waiter in queue:
+            queue.remove(waiter)
+            self.queued -= 1
+            if not queue:
+                del self._queues[tenant]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue metrics.
+
+        Returns:
+            Dictionary with the limit, in-flight and queued requests (total and
+            per tenant), peak queue depth and average wait
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "queued_by_tenant": {tenant: len(queue) for tenant, queue in list(self._queues.items())},
+            "max_queued": self.max_queued,
+            "waits": self.waits,
+            "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 1) if self.waits else 0.0
+        }
+
+
+class HTTPPool:
+    """
+    Per-host httpx.AsyncClient pools running on a dedicated event loop.
+
+    The loop lives in a daemon thread so synchronous code on any thread (MCP
+    tools call lead functions via asyncio.to_thread) can share the same
+    keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        host_limits: Optional[Dict[str, int]] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE_SECONDS,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the pool (connections and the loop are created on first use).
+
+        Args:
+            host_limits: Max connections / in-flight requests per host
+            max_retries: Retries for 429, 5xx and transport errors
+            backoff_base: First backoff delay in seconds (doubles per retry, with jitter)
+            http2: Negotiate HTTP/2 when the h2 package is installed
+            transport: Custom httpx transport (tests)
+        """
+        self.host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._transport = transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._limiters: Dict[str, FairLimiter] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread if it isn't running."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="leads-http-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _limit_for(self, host: str) -> int:
+        return self.host_limits.get(host, DEFAULT_HOST_LIMIT)
+
+    def _client_for(self, host: str) -> httpx.AsyncClient:
+        """Get (or create) the keep-alive client for a host. Runs on the pool loop."""
+        client = self._clients.get(host)
+        if client is None:
+            limit = self._limit_for(host)
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+                transport=self._transport
+            )
+            self._clients[host] = client
+            self._limiters[host] = FairLimiter(limit)
+        return client
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        timeout: float = 30
+    ) -> Response:
+        """Send a request with retry/backoff. Runs on the pool loop."""
+        method = method.upper()
+        host = urlsplit(url).hostname or ""
+        client = self._client_for(host)
+        limiter = self._limiters[host]
+        tenant = _tenant_of(headers)
+        params = _clean_params(params)
+
+        attempt = 0
+        while True:
+            delay = None
+            try:
+                async with limiter.slot(tenant):
+                    self.requests += 1
+                    response = await client.request(
+                        method, url, headers=headers, params=params, json=json,
+                        timeout=httpx.Timeout(timeout, pool=None)
+                    )
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return Response(response)
+                if response.status_code != 429 and method not in IDEMPOTENT_METHODS:
+                    return Response(response)
+                delay = _retry_after_seconds(response)
+                logger.info("%s %s returned %d, retrying", method, url, response.status_code)
+            except httpx.TransportError as e:
+                # A failed connect never reached the server, so any method may retry it
+                retryable = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) or method in IDEMPOTENT_METHODS
+                if attempt >= self.max_retries or not retryable:
+                    if isinstance(e, httpx.TimeoutException):
+                        raise requests.exceptions.Timeout(str(e) or "Request timed out") from e
+                    raise requests.exceptions.ConnectionError(str(e) or type(e).__name__) from e
+                logger.info("%s %s failed (%s), retrying", method, url, type(e).__name__)
+            except httpx.HTTPError as e:
+                raise requests.exceptions.RequestException(str(e)) from e
+
+            if delay is None:
+                delay = self.backoff_base * (2 ** attempt) * (0.5 + random.random())
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(min(delay, BACKOFF_MAX_SECONDS))
+
+    async def request_async(self, method: str, url: str, **kwargs) -> Response:
+        """
+        Send a request from any event loop.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            **kwargs: headers, params, json, timeout (as in requests)
+
+        Returns:
+            requests-compatible Response
+
+        Raises:
+            requests.exceptions.RequestException: On transport errors after retries
+        """
+        loop = self._ensure_loop()
+        coro = self._send(method, url, **kwargs)
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        Run a coroutine on the pool loop and wait for its result.
+
+        Args:
+            coro: Coroutine (e.g. an asyncio.gather over *_async calls)
+
+        Returns:
+            The coroutine's result
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("HTTPPool.run() called from the pool's own loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Blocking request_async (see request_async for arguments)."""
+        return self.run(self.request_async(method, url, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with pooled hosts, per-host queue metrics, request/retry
+            counters and HTTP/2 status
+        """
+        return {
+            "hosts": {host: self._limit_for(host) for host in self._clients},
+            "queues": {host: limiter.stats() for host, limiter in list(self._limiters.items())},
+            "requests": self.requests,
+            "retries": self.retries,
+            "http2": self.http2
+        }
+
+    def close(self):
+        """Close all connections and stop the background loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _close_clients():
+            for client in self._clients.values():
+                await client.aclose()
+            self._clients.clear()
+            self._limiters.clear()
+
+        asyncio.run_coroutine_threadsafe(_close_clients(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_pool: Optional[HTTPPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> HTTPPool:
+    """
+    Get the process-wide HTTP pool, creating it on first use.
+
+    Retries are configured via LEADS_HTTP_MAX_RETRIES; set LEADS_HTTP2=false
+    to force HTTP/1.1.
+
+    Returns:
+        Shared HTTPPool
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = HTTPPool(
+                max_retries=int(os.getenv("LEADS_HTTP_MAX_RETRIES", str(DEFAULT_MAX_RETRIES))),
+                http2=os.getenv("LEADS_HTTP2", "true").lower() != "false"
+            )
+        return _pool
+
+
+def run(coro: Coroutine) -> Any:
+    """Run a coroutine on the shared pool's loop (see HTTPPool.run)."""
+    return get_pool().run(coro)
+
+
+def get(url: str, **kwargs) -> Response:
+    """Pooled equivalent of requests.get."""
+    return get_pool().request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> Response:
+    """Pooled equivalent of requests.post."""
+    return get_pool().request("POST", url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> Response:
+    """Pooled equivalent of requests.patch."""
+    return get_pool().request("PATCH", url, **kwargs)
+
+
+async def get_async(url: str, **kwargs) -> Response:
+    """Async pooled GET (same arguments as get)."""
+    return await get_pool().request_async("GET", url, **kwargs)
+
+
+async def post_async(url: str, **kwargs) -> Response:
+    """Async pooled POST (same arguments as post)."""
+    return await get_pool().request_async("POST", url, **kwargs)
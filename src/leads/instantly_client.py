@@ -2,7 +2,8 @@
 Instantly API wrapper functions.
 """
 
-import requests
+from . import http_pool
+from .campaign_stats_cache import get_stats_cache
 from ._source_fetch_interested_leads import fetch_interested_leads
 
 # Valid timezones for Instantly API (complete list from API docs)
@@ -66,7 +67,7 @@ def fetch_workspace_details(api_key: str):
     headers = {"Authorization": f"Bearer {api_key}"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_pool.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -78,6 +79,9 @@ def get_instantly_campaign_stats(api_key: str, start_date: str, end_date: str):
     """
     Fetch campaign statistics from Instantly API.
 
+    Ranges are composed from cached daily buckets (see campaign_stats_cache),
+    with reply_rate recomputed from the summed counts.
+
     Args:
         api_key: Instantly API key
         start_date: Start date in YYYY-MM-DD format
@@ -91,6 +95,11 @@ def get_instantly_campaign_stats(api_key: str, start_date: str, end_date: str):
             "reply_rate": float
         }
     """
+    return http_pool.run(get_instantly_campaign_stats_async(api_key, start_date, end_date))
+
+
+async def _fetch_instantly_campaign_stats_async(api_key: str, start_date: str, end_date: str):
+    """Fetch one date range from the analytics overview endpoint."""
     url = "https://api.instantly.ai/api/v2/campaigns/analytics/overview"
     headers = {"Authorization": f"Bearer {api_key}"}
     params = {
@@ -98,12 +107,24 @@ def get_instantly_campaign_stats(api_key: str, start_date: str, end_date: str):
         "end_date": end_date
     }
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = await http_pool.get_async(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     return response.json()
 
 
+async def get_instantly_campaign_stats_async(api_key: str, start_date: str, end_date: str):
+    """Async get_instantly_campaign_stats for fan-outs on the shared HTTP pool."""
+    cache = get_stats_cache()
+    if cache is None:
+        return await _fetch_instantly_campaign_stats_async(api_key, start_date, end_date)
+    try:
+        return await cache.range_stats("instantly", api_key, start_date, end_date, _fetch_instantly_campaign_stats_async)
+    except ValueError:
+        # Not plain YYYY-MM-DD dates, so the range can't be split into days
+        return await _fetch_instantly_campaign_stats_async(api_key, start_date, end_date)
+
+
 def get_instantly_lead_responses(api_key: str, start_date: str, end_date: str):
     """
     Fetch interested lead responses from Instantly API.
@@ -310,7 +331,7 @@ def create_instantly_campaign_api(
 
     # Debug logging removed for MCP compatibility
 
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = http_pool.post(url, headers=headers, json=payload, timeout=30)
 
     # Error logging removed for MCP compatibility
     if not response.ok:
@@ -356,7 +377,7 @@ def list_instantly_campaigns(api_key: str, status: int = None):
     if status is not None:
         params["status"] = status
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = http_pool.get(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -409,7 +430,7 @@ def get_instantly_campaign_details(api_key: str, campaign_id: str):
     url = f"https://api.instantly.ai/api/v2/campaigns/{campaign_id}"
     headers = {"Authorization": f"Bearer {api_key}"}
 
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_pool.get(url, headers=headers, timeout=30)
     response.raise_for_status()
 
     return response.json()
@@ -436,7 +457,7 @@ def get_thread_emails(thread_id: str, api_key: str):
         "limit": 100  # Should be enough for most threads
     }
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = http_pool.get(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -461,6 +482,11 @@ def get_lead_emails(lead_email: str, api_key: str, campaign_id: str = None, sort
         List of email dicts with timestamp_email and ue_type fields
         ue_type: 1 = Sent from campaign, 2 = Received, 3 = Sent (manual), 4 = Scheduled
     """
+    return http_pool.run(get_lead_emails_async(lead_email, api_key, campaign_id=campaign_id, sort_order=sort_order))
+
+
+async def get_lead_emails_async(lead_email: str, api_key: str, campaign_id: str = None, sort_order: str = "asc"):
+    """Async get_lead_emails for fan-outs on the shared HTTP pool."""
     url = "https://api.instantly.ai/api/v2/emails"
     headers = {"Authorization": f"Bearer {api_key}"}
 
@@ -473,7 +499,7 @@ def get_lead_emails(lead_email: str, api_key: str, campaign_id: str = None, sort
     if campaign_id:
         params["campaign_id"] = campaign_id
 
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = await http_pool.get_async(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -550,7 +576,7 @@ def add_leads_to_campaign(api_key: str, campaign_id: str, leads: list, skip_if_i
         "skip_if_in_workspace": skip_if_in_workspace
     }
 
-    response = requests.post(url, headers=headers, json=payload, timeout=60)
+    response = http_pool.post(url, headers=headers, json=payload, timeout=60)
     response.raise_for_status()
 
     return response.json()
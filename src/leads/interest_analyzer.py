@@ -8,17 +8,25 @@ This module uses a hybrid approach:
 
 import re
 import os
+import json
+import asyncio
 import logging
 import time
-from typing import Dict, List, Optional
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from anthropic import Anthropic
 from datetime import datetime
 
-logger = logging.getLogger(__name__)
+from .thread_cache import ThreadCache, get_thread_cache
+from .keyword_matcher import KeywordMatcher
+from .verdict_cache import get_verdict_cache, verdict_key
+from .llm_client import get_llm_manager, INTERACTIVE, BULK
+from .reply_normalizer import normalize_reply, normalization_savings
+from .reply_clusters import cluster_replies, cluster_stats, CLUSTER_THRESHOLD
+from .reply_store import workspace_key
+from .analysis_store import get_analysis_store, reply_key, reply_fingerprint, ANALYSIS_FIELDS
 
-# Global cache for thread emails to avoid duplicate API calls
-_thread_cache = {}
+logger = logging.getLogger(__name__)
 
 
 def is_instant_auto_reply(
@@ -48,9 +56,11 @@ def is_instant_auto_reply(
 
         logger.info(f"DEBUG is_instant_auto_reply: lead_email={lead_email}, reply_timestamp={reply_timestamp}")
 
-        # Check cache first to avoid duplicate API calls
-        if lead_email in _thread_cache:
-            thread_emails = _thread_cache[lead_email]
+        # Check cache first to avoid duplicate API calls (filled in bulk by prefetch_timing_data)
+        cache = get_thread_cache()
+        cache_key = ThreadCache.key("instantly", api_key, lead_email)
+        thread_emails = cache.get(cache_key)
+        if thread_emails is not None:
             logger.info(f"DEBUG: Using cached lead emails ({len(thread_emails)} emails)")
         else:
             # Fetch lead emails (no retries - let circuit breaker handle failures)
@@ -58,7 +68,7 @@ def is_instant_auto_reply(
             thread_emails = get_lead_emails(lead_email, api_key, sort_order="asc")
             logger.info(f"DEBUG: Got {len(thread_emails)} emails from API")
             # Cache successful result
-            _thread_cache[lead_email] = thread_emails
+            cache.put(cache_key, thread_emails)
 
         if not thread_emails:
             logger.info(f"DEBUG: No thread emails found, returning False")
@@ -150,15 +160,15 @@ def is_bison_instant_auto_reply(
         import requests
 
         # Check cache first (use reply_id as key)
-        cache_key = f"bison_{reply_id}"
-        if cache_key in _thread_cache:
-            thread_data = _thread_cache[cache_key]
-        else:
+        cache = get_thread_cache()
+        cache_key = ThreadCache.key("bison", api_key, reply_id)
+        thread_data = cache.get(cache_key)
+        if thread_data is None:
             # Fetch conversation thread (no retries - let circuit breaker handle failures)
             thread_response = get_bison_conversation_thread(api_key, reply_id)
             thread_data = thread_response.get("data", {})
             # Cache successful result
-            _thread_cache[cache_key] = thread_data
+            cache.put(cache_key, thread_data)
 
         if not thread_data:
             return False
@@ -204,6 +214,64 @@ def is_bison_instant_auto_reply(
         return False  # Don't filter if we can't determine
 
 
+def prefetch_timing_data(leads: List[Dict], api_key: str) -> int:
+    """
+    Fetch the threads timing validation needs for many leads at once.
+
+    Threads that are not cached yet are fetched concurrently on the shared
+    HTTP pool and stored in the thread cache, so the per-lead checks that
+    follow are cache hits. Failed fetches are left uncached; the per-lead
+    check retries them.
+
+    Args:
+        leads: Lead dicts with "platform", "timestamp" and "email" (Instantly) or "id" (Bison)
+        api_key: Instantly/Bison API key
+
+    Returns:
+        Number of threads fetched
+    """
+    from . import http_pool
+    from .instantly_client import get_lead_emails_async
+    from .bison_client import get_bison_conversation_thread_async
+
+    cache = get_thread_cache()
+    targets = {}
+    for lead in leads:
+        if not lead.get("timestamp"):
+            continue
+        platform = lead.get("platform", "").lower()
+        if platform == "instantly" and lead.get("email"):
+            key = ThreadCache.key("instantly", api_key, lead["email"])
+            fetch = (get_lead_emails_async, (lead["email"], api_key), lambda emails: emails)
+        elif platform == "bison" and lead.get("id"):
+            key = ThreadCache.key("bison", api_key, lead["id"])
+            fetch = (get_bison_conversation_thread_async, (api_key, lead["id"]), lambda response: response.get("data", {}))
+        else:
+            continue
+        if key not in targets and not cache.contains(key):
+            targets[key] = fetch
+
+    if not targets:
+        return 0
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *(fn(*args) for fn, args, _ in targets.values()),
+            return_exceptions=True
+        )
+
+    fetched = 0
+    for (key, (_, _, extract)), result in zip(targets.items(), http_pool.run(fetch_all())):
+        if isinstance(result, Exception):
+            logger.warning("Could not prefetch thread for timing check: %s", result)
+            continue
+        cache.put(key, extract(result))
+        fetched += 1
+
+    logger.info("Prefetched %d/%d threads for timing validation", fetched, len(targets))
+    return fetched
+
+
 # Interest signal keywords (strong positive indicators)
 STRONG_INTEREST_KEYWORDS = [
     r'\bpricing\b',
@@ -319,6 +387,15 @@ TEST_EMAIL_PATTERNS = [
 ]
 
 
+_KEYWORD_MATCHER = KeywordMatcher({
+    "test": (TEST_EMAIL_PATTERNS, re.IGNORECASE),
+    "auto_reply": (AUTO_REPLY_KEYWORDS, re.IGNORECASE),
+    "negative": (NEGATIVE_KEYWORDS, re.IGNORECASE | re.MULTILINE),
+    "strong": (STRONG_INTEREST_KEYWORDS, re.IGNORECASE),
+    "moderate": (MODERATE_INTEREST_KEYWORDS, re.IGNORECASE),
+})
+
+
 def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
     """
     Fast keyword-based analysis to categorize email replies.
@@ -346,15 +423,21 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
     text_lower = reply_text.lower()
     subject_lower = subject.lower() if subject else ""
 
+    # Every category's hits from one scan of the body
+    hits = _KEYWORD_MATCHER.match(text_lower)
+
     # Check for test/setup emails FIRST (Bison connection tests, etc.)
-    for pattern in TEST_EMAIL_PATTERNS:
-        if re.search(pattern, subject_lower, re.IGNORECASE) or re.search(pattern, text_lower, re.IGNORECASE):
-            return {
-                "category": "auto_reply",  # Categorize as auto_reply to filter out
-                "confidence": 100,
-                "matched_keywords": [pattern],
-                "reason": "Test/setup email (Bison connection test or similar)"
-            }
+    test_matches = hits["test"]
+    if subject_lower:
+        subject_matches = _KEYWORD_MATCHER.match(subject_lower, categories=("test",))["test"]
+        test_matches = [p for p in TEST_EMAIL_PATTERNS if p in subject_matches or p in test_matches]
+    if test_matches:
+        return {
+            "category": "auto_reply",  # Categorize as auto_reply to filter out
+            "confidence": 100,
+            "matched_keywords": test_matches[:1],
+            "reason": "Test/setup email (Bison connection test or similar)"
+        }
 
     # Check for auto-replies next (highest priority)
     # Check BOTH subject line and body
@@ -364,10 +447,7 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
     if subject_lower and ("automatic reply" in subject_lower or "auto reply" in subject_lower or "out of office" in subject_lower):
         auto_matches.append("subject:automatic_reply")
 
-    # Check body for auto-reply patterns
-    for pattern in AUTO_REPLY_KEYWORDS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            auto_matches.append(pattern)
+    auto_matches.extend(hits["auto_reply"])
 
     if auto_matches:
         return {
@@ -384,10 +464,7 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
     if subject_lower and "unsubscribe" in subject_lower:
         negative_matches.append("subject:unsubscribe")
 
-    # Check body for negative patterns
-    for pattern in NEGATIVE_KEYWORDS:
-        if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
-            negative_matches.append(pattern)
+    negative_matches.extend(hits["negative"])
 
     if negative_matches:
         return {
@@ -398,10 +475,7 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
         }
 
     # Check for strong interest signals
-    strong_matches = []
-    for pattern in STRONG_INTEREST_KEYWORDS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            strong_matches.append(pattern)
+    strong_matches = hits["strong"]
 
     if len(strong_matches) >= 2:
         return {
@@ -419,10 +493,7 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
         }
 
     # Check for moderate interest signals
-    moderate_matches = []
-    for pattern in MODERATE_INTEREST_KEYWORDS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            moderate_matches.append(pattern)
+    moderate_matches = hits["moderate"]
 
     if moderate_matches:
         return {
@@ -450,13 +521,100 @@ def analyze_reply_with_keywords(reply_text: str, subject: str = "") -> Dict:
     }
 
 
-def analyze_reply_with_claude(reply_text: str, subject: str = "") -> Dict:
+def analyze_replies(texts: Iterable[str], subjects: Optional[Iterable[str]] = None) -> List[Dict]:
+    """
+    Keyword-analyze many replies at once.
+
+    Identical (reply, subject) pairs, common with auto-replies and templated
+    rejections, are analyzed once; every reply still gets its own result dict.
+
+    Args:
+        texts: Reply body texts
+        subjects: Subject lines, in the same order as texts (optional)
+
+    Returns:
+        analyze_reply_with_keywords results, in input order
+    """
+    texts = list(texts)
+    subjects = list(subjects) if subjects is not None else [""] * len(texts)
+    if len(subjects) != len(texts):
+        raise ValueError(f"Got {len(texts)} replies but {len(subjects)} subjects")
+
+    seen: Dict[tuple, Dict] = {}
+    results = []
+    for text, subject in zip(texts, subjects):
+        key = (text, subject)
+        result = seen.get(key)
+        if result is None:
+            result = seen[key] = analyze_reply_with_keywords(text, subject=subject)
+            results.append(result)
+        else:
+            results.append({**result, "matched_keywords": list(result["matched_keywords"])})
+    return results
+
+
+# Model used for reply categorization, and the version of its prompts.
+# Bump CLAUDE_PROMPT_VERSION whenever the single or batch prompt, the reply
+# normalization or the categories change so cached verdicts from the old
+# prompt are no longer served.
+CLAUDE_MODEL = "claude-3-5-haiku-20241022"  # Fast and cheap model
+CLAUDE_PROMPT_VERSION = "2"
+
+VERDICT_CATEGORIES = ("hot", "warm", "cold", "auto_reply", "unclear")
+
+# Batch classification: replies per request, total reply characters per
+# request, and the longest reply packed into a batch (longer ones go alone)
+CLAUDE_BATCH_SIZE = int(os.getenv("LEAD_CLAUDE_BATCH_SIZE", "25"))
+CLAUDE_BATCH_MAX_CHARS = 24000
+CLAUDE_BATCH_ITEM_MAX_CHARS = 2000
+
+
+def _cache_verdict(key: str, verdict: Dict):
+    """Store a parsed verdict in the verdict cache, if enabled and well-formed."""
+    cache = get_verdict_cache()
+    if cache is None:
+        return
+    if verdict.get("category") not in VERDICT_CATEGORIES or not isinstance(verdict.get("confidence"), (int, float)):
+        return
+    try:
+        cache.put(key, verdict, CLAUDE_MODEL, CLAUDE_PROMPT_VERSION)
+    except sqlite3.Error as e:
+        logger.warning("Could not cache verdict: %s", e)
+
+
+def _create_message(api_key: str, prompt: str, max_tokens: int, priority: str):
+    """Send one categorization prompt through the shared client and budget."""
+    return get_llm_manager().create_message(
+        api_key,
+        prompt,
+        max_tokens,
+        priority=priority,
+        model=CLAUDE_MODEL,
+        # Deterministic; sent in the body because newer SDKs dropped the argument
+        extra_body={"temperature": 0}
+    )
+
+
+def analyze_reply_with_claude(
+    reply_text: str,
+    subject: str = "",
+    check_cache: bool = True,
+    priority: str = INTERACTIVE
+) -> Dict:
     """
     Use Claude API to analyze nuanced/unclear replies.
 
+    The reply is normalized first (quoted history, signature and disclaimers
+    removed; see reply_normalizer). Verdicts are cached persistently per
+    normalized reply, model and prompt version; a cached verdict is returned
+    without calling the API.
+
     Args:
-        reply_text: The email reply body text
+        reply_text: The email reply body text (raw or already normalized)
         subject: The email subject line (optional, provides context)
+        check_cache: Look the reply up in the verdict cache first (default: True);
+            new verdicts are stored either way
+        priority: INTERACTIVE (default) or BULK for the shared request budget
 
     Returns:
         {
@@ -465,6 +623,18 @@ def analyze_reply_with_claude(reply_text: str, subject: str = "") -> Dict:
             "reason": str
         }
     """
+    reply_text = normalize_reply(reply_text)
+    key = verdict_key(reply_text, subject, CLAUDE_MODEL, CLAUDE_PROMPT_VERSION)
+    cache = get_verdict_cache() if check_cache else None
+    if cache is not None:
+        try:
+            cached = cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning("Verdict cache lookup failed: %s", e)
+            cached = None
+        if cached is not None:
+            return cached
+
     api_key = os.getenv("ANTHROPIC_API_KEY")
 
     if not api_key:
@@ -476,8 +646,6 @@ def analyze_reply_with_claude(reply_text: str, subject: str = "") -> Dict:
         }
 
     try:
-        client = Anthropic(api_key=api_key)
-
         prompt = f"""Analyze this email reply from a cold outreach campaign and categorize the lead's interest level.
 
 Subject: {subject}
@@ -499,15 +667,7 @@ Respond in JSON format:
     "reason": "brief explanation"
 }}"""
 
-        response = client.messages.create(
-            model="claude-3-5-haiku-20241022",  # Fast and cheap model
-            max_tokens=200,
-            temperature=0,  # Deterministic
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
+        response = _create_message(api_key, prompt, 200, priority)
 
         # Parse Claude's response
         response_text = response.content[0].text.strip()
@@ -531,6 +691,7 @@ Respond in JSON format:
 
         logger.debug("Claude analysis: %s (confidence: %d%%)", result["category"], result["confidence"])
 
+        _cache_verdict(key, result)
         return result
 
     except Exception as e:
@@ -542,6 +703,158 @@ Respond in JSON format:
         }
 
 
+_BATCH_PROMPT = """Categorize each email reply below from a cold outreach campaign by the lead's interest level.
+
+{replies}
+
+Categories:
+- hot: Strong buying signals, wants to talk/meet/get pricing
+- warm: Shows interest, asking questions, wants more info
+- cold: Not interested, unsubscribe, already have solution
+- auto_reply: Out of office, vacation, automated response
+- unclear: Cannot determine intent from the message
+
+Respond with only a JSON array holding exactly one object per reply:
+[{{"id": "<reply id>", "category": "hot|warm|cold|auto_reply|unclear", "confidence": 0-100, "reason": "brief explanation"}}]"""
+
+
+def _format_batch_item(item_id: str, reply_text: str, subject: str) -> str:
+    # Keep reply text from closing its own tag
+    body = (reply_text or "").replace("</reply", "</ reply")
+    return f'<reply id="{item_id}">\nSubject: {subject or ""}\n\n{body}\n</reply>'
+
+
+def parse_batch_verdicts(response_text: str, ids: List[str]) -> Dict[str, Dict]:
+    """
+    Strictly parse a batch response into verdicts.
+
+    Args:
+        response_text: Model output, expected to be a JSON array
+        ids: Item IDs that were sent
+
+    Returns:
+        {id: {"category", "confidence", "reason"}} for the items with a valid
+        verdict; unknown, duplicated and malformed items are left out
+
+    Raises:
+        ValueError: If the response is not a JSON array
+    """
+    text = response_text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        raise ValueError("Batch response has no JSON array")
+    items = json.loads(text[start:end + 1])
+    if not isinstance(items, list):
+        raise ValueError("Batch response is not a JSON array")
+
+    wanted = set(ids)
+    verdicts: Dict[str, Dict] = {}
+    duplicated = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id = str(item.get("id", ""))
+        category = item.get("category")
+        confidence = item.get("confidence")
+        reason = item.get("reason", "")
+        if (
+            item_id not in wanted
+            or category not in VERDICT_CATEGORIES
+            or isinstance(confidence, bool) or not isinstance(confidence, (int, float))
+            or not 0 <= confidence <= 100
+            or not isinstance(reason, str)
+        ):
+            continue
+        if item_id in verdicts:
+            duplicated.add(item_id)
+        verdicts[item_id] = {"category": category, "confidence": confidence, "reason": reason}
+    for item_id in duplicated:
+        del verdicts[item_id]
+    return verdicts
+
+
+def _pack_batches(replies: List[Dict], batch_size: int = CLAUDE_BATCH_SIZE) -> List[List[Dict]]:
+    """Split replies into batches by count and size; long replies get a batch of their own."""
+    batches, batch, chars = [], [], 0
+    for reply in replies:
+        size = len(reply.get("reply_text") or "") + len(reply.get("subject") or "")
+        if size > CLAUDE_BATCH_ITEM_MAX_CHARS:
+            batches.append([reply])
+            continue
+        if batch and (len(batch) >= batch_size or chars + size > CLAUDE_BATCH_MAX_CHARS):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append(reply)
+        chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def analyze_reply_batch_with_claude(replies: List[Dict], priority: str = BULK) -> Tuple[Dict[str, Dict], int]:
+    """
+    Categorize several replies with one Claude request.
+
+    The batch is sent as one prompt asking for a JSON array of verdicts keyed
+    by item ID. Replies whose verdict is missing or invalid, or the whole
+    batch if the array can't be parsed, fall back to analyze_reply_with_claude.
+    Replies are normalized before sending and parsed verdicts are stored in
+    the verdict cache.
+
+    Args:
+        replies: [{"id": str, "reply_text": str, "subject": str}, ...]
+        priority: BULK (default) or INTERACTIVE for the shared request budget
+
+    Returns:
+        ({id: verdict}, number of Claude requests made)
+    """
+    replies = [{**reply, "reply_text": normalize_reply(reply["reply_text"])} for reply in replies]
+    if len(replies) == 1:
+        reply = replies[0]
+        return {reply["id"]: analyze_reply_with_claude(
+            reply["reply_text"], reply.get("subject", ""), check_cache=False, priority=priority
+        )}, 1
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        logger.warning("ANTHROPIC_API_KEY not set. Falling back to keyword analysis only.")
+        return {r["id"]: {"category": "unclear", "confidence": 0, "reason": "Claude API not configured"} for r in replies}, 0
+
+    # Short positional IDs keep the response small; map back afterwards
+    by_position = {str(n): reply for n, reply in enumerate(replies, 1)}
+    verdicts: Dict[str, Dict] = {}
+    requests_made = 1
+    try:
+        prompt = _BATCH_PROMPT.format(replies="\n\n".join(
+            _format_batch_item(position, reply["reply_text"], reply.get("subject", ""))
+            for position, reply in by_position.items()
+        ))
+        response = _create_message(api_key, prompt, 100 + 80 * len(replies), priority)
+        parsed = parse_batch_verdicts(response.content[0].text, list(by_position))
+        for position, verdict in parsed.items():
+            reply = by_position[position]
+            _cache_verdict(
+                verdict_key(reply["reply_text"], reply.get("subject", ""), CLAUDE_MODEL, CLAUDE_PROMPT_VERSION),
+                verdict
+            )
+            verdicts[reply["id"]] = verdict
+    except Exception as e:
+        logger.warning("Batch Claude analysis of %d replies failed, falling back to single calls: %s", len(replies), e)
+
+    missing = [reply for reply in replies if reply["id"] not in verdicts]
+    if missing and len(missing) < len(replies):
+        logger.warning("Batch response had no valid verdict for %d of %d replies", len(missing), len(replies))
+    for reply in missing:
+        verdicts[reply["id"]] = analyze_reply_with_claude(
+            reply["reply_text"], reply.get("subject", ""), check_cache=False, priority=priority
+        )
+        requests_made += 1
+    return verdicts, requests_made
+
+
 def analyze_reply_hybrid(reply_text: str, subject: str = "") -> Dict:
     """
     Hybrid approach: Use keywords first, then Claude for unclear cases.
@@ -594,14 +907,17 @@ def categorize_leads(
     leads: List[Dict],
     use_claude: bool = True,
     max_workers: int = 20,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    batch_size: int = CLAUDE_BATCH_SIZE,
+    cluster_threshold: Optional[float] = CLUSTER_THRESHOLD
 ) -> Dict:
     """
     Categorize a list of leads into hot/warm/cold/auto/unclear buckets.
 
     Three-phase detection system:
     1. Keyword analysis: Fast filter for obvious auto-replies and rejections
-    2. Claude API: Context-aware analysis (parallel processing, 20 workers)
+    2. Claude API: Context-aware analysis (batched requests, parallel processing, 20 workers).
+       Near-duplicate replies are clustered first and only one per cluster is sent.
     3. Timing validation: Double-checks HOT/WARM opportunities for instant auto-replies
 
     Args:
@@ -609,6 +925,11 @@ def categorize_leads(
         use_claude: Whether to use Claude API for analysis (default: True)
         max_workers: Max parallel Claude API calls (default: 20, well under 4K RPM limit)
         api_key: Optional Instantly/Bison API key for timing validation (Phase 3)
+        batch_size: Replies per Claude request (default: LEAD_CLAUDE_BATCH_SIZE or 25;
+            1 sends every reply on its own)
+        cluster_threshold: Similarity at which a near-duplicate reply takes its cluster
+            representative's verdict (default: LEAD_REPLY_CLUSTER_THRESHOLD or 0.97;
+            None analyses every reply)
 
     Returns:
         {
@@ -623,7 +944,12 @@ def categorize_leads(
                 "warm_count": int,
                 "cold_count": int,
                 "auto_reply_count": int,
-                "unclear_count": int
+                "unclear_count": int,
+                "timing_cache": {...},  # Thread cache stats (when api_key is given)
+                "verdict_cache": {"hits", "misses", "stored_verdicts"},  # When Claude ran with the cache enabled
+                "claude_requests": int,  # When Claude ran
+                "reply_normalization": {"replies", "tokens_before", "tokens_after", "saved_pct"},  # When Claude ran
+                "reply_clusters": {"replies", "clusters", "clustered_replies", "largest_cluster", "threshold"}  # When Claude ran
             }
         }
     """
@@ -639,12 +965,13 @@ def categorize_leads(
     keyword_analyzed = []
     needs_claude = []
 
-    for lead in leads:
-        reply_text = lead.get("reply_body", "")
-        subject = lead.get("subject", "")
+    # Try keyword analysis first (pass subject to detect auto-replies)
+    keyword_results = analyze_replies(
+        [lead.get("reply_body", "") for lead in leads],
+        [lead.get("subject", "") for lead in leads]
+    )
 
-        # Try keyword analysis first (pass subject to detect auto-replies)
-        keyword_result = analyze_reply_with_keywords(reply_text, subject=subject)
+    for lead, keyword_result in zip(leads, keyword_results):
 
         # Only skip Claude for HIGH CONFIDENCE auto-replies and rejections
         # This avoids false positives on interest signals
@@ -693,19 +1020,87 @@ def categorize_leads(
 
     # Phase 2: Parallel Claude API calls for ALL remaining leads (not just unclear)
     # This gives much better accuracy on interest detection vs keyword matching
+    verdict_cache = None
+    verdict_hits = 0
+    claude_requests = 0
     if needs_claude and use_claude:
-        logger.info("Starting parallel Claude analysis for %d leads (max_workers=%d, rate-limited)...",
-                   len(needs_claude), max_workers)
+        # Claude sees (and the cache is keyed by) only what the lead wrote
+        for item in needs_claude:
+            item["reply_text"] = normalize_reply(item["lead"].get("reply_body", ""))
+        normalization = normalization_savings(
+            (item["lead"].get("reply_body", "") for item in needs_claude),
+            (item["reply_text"] for item in needs_claude)
+        )
+        logger.info("Reply normalization: ~%d -> ~%d input tokens (%.1f%% saved)",
+                    normalization["tokens_before"], normalization["tokens_after"], normalization["saved_pct"])
+
+        # Near-duplicates with the same keyword category share one representative's verdict
+        if cluster_threshold is None:
+            clusters = [(n, 1.0) for n in range(len(needs_claude))]
+        else:
+            clusters = cluster_replies(
+                [item["reply_text"] for item in needs_claude],
+                [item["keyword_result"]["category"] for item in needs_claude],
+                cluster_threshold
+            )
+        clustering = cluster_stats(clusters, cluster_threshold)
+        representatives = [item for n, item in enumerate(needs_claude) if clusters[n][0] == n]
+        logger.info("Reply clustering: %d replies in %d clusters", clustering["replies"], clustering["clusters"])
+
+        # Replies analysed on an earlier run are answered from the verdict cache in one lookup
+        verdict_cache = get_verdict_cache()
+        if verdict_cache is not None:
+            keys = [
+                verdict_key(item["reply_text"], item["lead"].get("subject", ""), CLAUDE_MODEL, CLAUDE_PROMPT_VERSION)
+                for item in representatives
+            ]
+            try:
+                cached = verdict_cache.get_many(keys)
+            except sqlite3.Error as e:
+                logger.warning("Verdict cache lookup failed: %s", e)
+                cached = {}
+            for item, key in zip(representatives, keys):
+                item["verdict"] = cached.get(key)
+
+        pending = [item for item in representatives if not item.get("verdict")]
+        verdict_hits = len(representatives) - len(pending)
+        logger.info("Starting parallel Claude analysis for %d leads (%d verdicts cached, max_workers=%d, rate-limited)...",
+                   len(pending), verdict_hits, max_workers)
+
+        # Pack the remaining replies into batched requests; anything a batch
+        # couldn't answer is sent on its own below
+        if batch_size > 1 and len(pending) > 1:
+            replies = [
+                {"id": str(n), "reply_text": item["reply_text"], "subject": item["lead"].get("subject", "")}
+                for n, item in enumerate(pending)
+            ]
+            batches = _pack_batches(replies, batch_size)
+            logger.info("Sending %d replies to Claude in %d batches", len(replies), len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(analyze_reply_batch_with_claude, batch) for batch in batches]
+                for future in as_completed(futures):
+                    try:
+                        verdicts, requests_made = future.result()
+                    except Exception as e:
+                        logger.error("Error processing Claude batch: %s", str(e))
+                        continue
+                    claude_requests += requests_made
+                    for reply_id, verdict in verdicts.items():
+                        pending[int(reply_id)]["verdict"] = verdict
+            pending = [item for item in pending if not item.get("verdict")]
+        claude_requests += len(pending)
 
         def analyze_with_claude(item):
             """Helper function for parallel processing"""
             lead = item["lead"]
             keyword_result = item["keyword_result"]
-            reply_text = lead.get("reply_body", "")
+            reply_text = item["reply_text"]
             subject = lead.get("subject", "")
 
             try:
-                claude_result = analyze_reply_with_claude(reply_text, subject)
+                claude_result = item.get("verdict") or analyze_reply_with_claude(
+                    reply_text, subject, check_cache=verdict_cache is None, priority=BULK
+                )
 
                 # Use Claude if confident, otherwise fallback to keywords
                 if claude_result["confidence"] >= 50:
@@ -738,18 +1133,23 @@ def categorize_leads(
                     "ai_method": "keyword_fallback_error"
                 }
 
+        for item in representatives:
+            if item.get("verdict"):
+                lead_with_analysis = item["analysis"] = analyze_with_claude(item)
+                categorized[lead_with_analysis["ai_category"]].append(lead_with_analysis)
+
         # Process in parallel
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_item = {
                 executor.submit(analyze_with_claude, item): item
-                for item in needs_claude
+                for item in pending
             }
 
             # Collect results as they complete
             for future in as_completed(future_to_item):
                 try:
-                    lead_with_analysis = future.result()
+                    lead_with_analysis = future_to_item[future]["analysis"] = future.result()
                     categorized[lead_with_analysis["ai_category"]].append(lead_with_analysis)
                 except Exception as e:
                     logger.error("Error processing future: %s", str(e))
@@ -765,8 +1165,24 @@ def categorize_leads(
                         "ai_reason": f"Processing error: {str(e)}",
                         "ai_method": "keyword_fallback_error"
                     }
+                    item["analysis"] = lead_with_analysis
                     categorized[lead_with_analysis["ai_category"]].append(lead_with_analysis)
 
+        # Cluster members take their representative's result
+        for n, (rep, similarity) in enumerate(clusters):
+            if rep == n:
+                continue
+            analysis = needs_claude[rep]["analysis"]
+            lead_with_analysis = {
+                **needs_claude[n]["lead"],
+                "ai_category": analysis["ai_category"],
+                "ai_confidence": analysis["ai_confidence"],
+                "ai_reason": analysis["ai_reason"],
+                "ai_method": analysis["ai_method"],
+                "ai_cluster": {"representative": needs_claude[rep]["lead"].get("email"), "similarity": similarity}
+            }
+            categorized[lead_with_analysis["ai_category"]].append(lead_with_analysis)
+
         logger.info("Parallel Claude analysis complete")
 
     # Phase 3: TIMING VALIDATION - Double-check HOT/WARM leads for instant auto-replies
@@ -777,9 +1193,8 @@ def categorize_leads(
         if opportunities:
             logger.info(f"Phase 3: Validating {len(opportunities)} opportunities with timing check...")
 
-            # Clear cache for fresh validation
-            global _thread_cache
-            _thread_cache = {}
+            # Fetch every lead's thread concurrently (cached per workspace with a TTL)
+            prefetch_timing_data(opportunities, api_key)
 
             downgraded_count = 0
             validated_hot = []
@@ -859,7 +1274,97 @@ def categorize_leads(
         "auto_reply_count": len(categorized["auto_reply"]),
         "unclear_count": len(categorized["unclear"])
     }
+    if api_key:
+        summary["timing_cache"] = get_thread_cache().stats()
+    if needs_claude and use_claude:
+        summary["claude_requests"] = claude_requests
+        summary["reply_normalization"] = normalization
+        summary["reply_clusters"] = clustering
+    if verdict_cache is not None:
+        summary["verdict_cache"] = {
+            "hits": verdict_hits,
+            "misses": len(representatives) - verdict_hits,
+            "stored_verdicts": verdict_cache.stats()["verdicts"]
+        }
 
     categorized["summary"] = summary
 
     return categorized
+
+
+def categorize_leads_incremental(
+    leads: List[Dict],
+    platform: str,
+    use_claude: bool = True,
+    api_key: Optional[str] = None,
+    full_rescan: bool = False,
+    **kwargs
+) -> Dict:
+    """
+    Categorize leads, reusing stored analyses of replies seen on earlier runs.
+
+    Replies whose subject, body and analysis mode are unchanged since they
+    were last analysed for this workspace take their stored analysis; only
+    new or changed replies go through categorize_leads. Fresh analyses are
+    stored for the next run (see analysis_store).
+
+    Args:
+        leads: Lead dicts as for categorize_leads
+        platform: "instantly" or "bison"
+        use_claude: Whether to use Claude API for analysis (default: True)
+        api_key: Instantly/Bison API key; identifies the workspace and enables
+            timing validation (nothing is stored without it)
+        full_rescan: Analyse every reply again, ignoring stored analyses
+            (the results still replace them)
+        **kwargs: Passed to categorize_leads (max_workers, batch_size, cluster_threshold)
+
+    Returns:
+        categorize_leads result covering every lead; the summary also has
+        "incremental": {"reused", "analyzed", "full_rescan"}
+    """
+    store = get_analysis_store() if api_key else None
+    workspace = workspace_key(api_key) if api_key else ""
+    mode = f"claude:{CLAUDE_MODEL}:{CLAUDE_PROMPT_VERSION}" if use_claude else "keywords"
+    keys = [reply_key(lead) for lead in leads]
+    fingerprints = {key: reply_fingerprint(lead, mode) for key, lead in zip(keys, leads)}
+
+    stored: Dict[str, Dict] = {}
+    if store is not None and not full_rescan:
+        try:
+            stored = store.get_many(platform, workspace, fingerprints)
+        except sqlite3.Error as e:
+            logger.warning("Analysis store lookup failed: %s", e)
+
+    new_leads = [lead for lead, key in zip(leads, keys) if key not in stored]
+    logger.info("Incremental analysis: %d stored analyses reused, %d replies to analyse (full_rescan=%s)",
+                len(leads) - len(new_leads), len(new_leads), full_rescan)
+    categorized = categorize_leads(new_leads, use_claude=use_claude, api_key=api_key, **kwargs)
+
+    if store is not None:
+        # Keyword fallbacks of a Claude run may be API failures: leave them for the next run
+        persisted = ("claude", "keyword", "timing_validation") if use_claude else ("keyword", "timing_validation")
+        records = []
+        for key in VERDICT_CATEGORIES:
+            for lead in categorized[key]:
+                if lead.get("ai_method") in persisted:
+                    lead_key = reply_key(lead)
+                    analysis = {field: lead[field] for field in ANALYSIS_FIELDS if field in lead}
+                    records.append((lead_key, fingerprints[lead_key], analysis))
+        try:
+            store.put_many(platform, workspace, records)
+        except sqlite3.Error as e:
+            logger.warning("Could not store analyses: %s", e)
+
+    reused = 0
+    for lead, key in zip(leads, keys):
+        analysis = stored.get(key)
+        if analysis is not None:
+            categorized[analysis["ai_category"]].append({**lead, **analysis})
+            reused += 1
+
+    summary = categorized["summary"]
+    summary["total_analyzed"] = len(leads)
+    for key in VERDICT_CATEGORIES:
+        summary[f"{key}_count"] = len(categorized[key])
+    summary["incremental"] = {"reused": reused, "analyzed": len(new_leads), "full_rescan": full_rescan}
+    return categorized
@@ -0,0 +1,126 @@
+"""
+Compiled keyword matcher for reply categorization.
+
+The keyword categories in interest_analyzer are lists of regex patterns,
+and most replies match only a handful of them. Running every pattern over
+every reply means about 90 regex searches per reply. This matcher compiles
+the patterns once and finds their hits in one scan of the text.
+
+Each pattern needs at least one literal run that every match must contain
+("not interested", "left", "out of office"). For each pattern the longest
+such run is taken from the parsed pattern. Runs that contain a shorter
+run are folded into it, and the rest are joined into one lookahead
+alternation. A single finditer over the text reports every position where a
+run occurs. Only patterns whose run was seen are confirmed with their own
+compiled regex, so results are exactly those of re.search per pattern.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Non-ASCII characters that match ASCII letters under re.IGNORECASE and that
+# str.lower() keeps non-ASCII (dotted/dotless i, long s); texts containing
+# them skip the prefilter. The Kelvin sign also matches "k" but lowers to it.
+_FOLD_CHARS = re.compile("[\u0130\u0131\u017f]")
+
+
+def required_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """
+    Longest literal run that every match of a pattern contains.
+
+    Only top-level literals count; anything optional, repeated or alternated
+    ends a run.
+
+    Args:
+        pattern: Regex pattern
+        flags: Flags the pattern is compiled with
+
+    Returns:
+        Lowercased literal, or None if the pattern has none
+    """
+    runs, run = [], []
+    for op, value in sre_parse.parse(pattern, flags):
+        if op is sre_parse.LITERAL:
+            run.append(chr(value))
+        elif run:
+            runs.append("".join(run))
+            run = []
+    if run:
+        runs.append("".join(run))
+    return max(runs, key=len).lower() if runs else None
+
+
+class KeywordMatcher:
+    """Finds every matching pattern of several categories in one scan."""
+
+    def __init__(self, categories: Dict[str, Tuple[Sequence[str], int]]):
+        """
+        Compile the categories.
+
+        Args:
+            categories: {category: (patterns, flags)}; patterns are matched
+                against lowercased text with their category's flags
+        """
+        self.categories = list(categories)
+        # (category, pattern, compiled) in category and pattern order
+        self._patterns = []
+        literals: Dict[int, str] = {}
+        for category, (patterns, flags) in categories.items():
+            for pattern in patterns:
+                index = len(self._patterns)
+                self._patterns.append((category, pattern, re.compile(pattern, flags)))
+                literal = required_literal(pattern, flags)
+                if literal:
+                    literals[index] = literal
+
+        # Fold every run into the shortest run it contains: wherever the long
+        # one occurs, the short one occurs too, so scanning for it is enough
+        anchors = sorted(set(literals.values()), key=len)
+        minimal: List[str] = []
+        for literal in anchors:
+            if not any(short in literal for short in minimal):
+                minimal.append(literal)
+        self._by_anchor: Dict[str, List[int]] = {anchor: [] for anchor in minimal}
+        for index, literal in literals.items():
+            anchor = next(short for short in minimal if short in literal)
+            self._by_anchor[anchor].append(index)
+        self._always = [i for i in range(len(self._patterns)) if i not in literals]
+
+        # No minimal run is a prefix of another, so at most one can start at
+        # any position and the zero-width lookahead reports each occurrence
+        alternation = "|".join(re.escape(anchor) for anchor in sorted(minimal, key=len, reverse=True))
+        self._scanner = re.compile(f"(?=({alternation}))") if minimal else None
+
+    def _candidates(self, text: str) -> List[int]:
+        if self._scanner is None or _FOLD_CHARS.search(text):
+            return list(range(len(self._patterns)))
+        found = {match.group(1) for match in self._scanner.finditer(text)}
+        candidates = list(self._always)
+        for anchor in found:
+            candidates.extend(self._by_anchor[anchor])
+        candidates.sort()
+        return candidates
+
+    def match(self, text: str, categories: Optional[Sequence[str]] = None) -> Dict[str, List[str]]:
+        """
+        Find every matching pattern in a text.
+
+        Args:
+            text: Lowercased text
+            categories: Categories to report (default: all)
+
+        Returns:
+            {category: [matching patterns in declaration order]} for every requested category
+        """
+        wanted = self.categories if categories is None else categories
+        hits: Dict[str, List[str]] = {category: [] for category in wanted}
+        for index in self._candidates(text):
+            category, pattern, compiled = self._patterns[index]
+            if category in hits and compiled.search(text):
+                hits[category].append(pattern)
+        return hits
@@ -3,33 +3,40 @@ MCP-ready functions that combine Google Sheets + Instantly API + Bison API.
 These will be the tools exposed to Claude via MCP.
 """
 
+import asyncio
 import logging
-import requests
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Import from our modular files
 from .date_utils import validate_and_parse_dates
+from .reply_store import get_reply_store, workspace_key, normalize_timestamp
 from .sheets_client import (
-    load_workspaces_from_sheet,
-    load_bison_workspaces_from_sheet,
     DEFAULT_SHEET_URL,
     SHEET_GID_INSTANTLY,
     SHEET_GID_BISON
 )
+from .workspace_registry import get_workspace_registry
+from . import http_pool, progress
 from .instantly_client import (
     fetch_workspace_details,
-    get_instantly_campaign_stats,
+    get_instantly_campaign_stats_async,
     get_instantly_lead_responses
 )
 from .bison_client import (
     get_bison_lead_replies,
-    get_bison_conversation_thread,
-    get_bison_campaign_stats_api
+    get_bison_lead_replies_async,
+    get_bison_conversation_thread_async,
+    get_bison_campaign_stats_api_async
 )
+from .thread_cache import ThreadCache, get_thread_cache
+from .portfolio_snapshot import PortfolioSnapshot, get_snapshot_engine
+from .mailbox_snapshot import MailboxSnapshot, client_summary, get_mailbox_snapshot_engine
+from .metrics_store import MetricsStore, get_metrics_store
+from .campaign_stats_cache import get_stats_cache
 
 
 # ============================================================================
@@ -58,7 +65,7 @@ def get_client_list(sheet_url: str = DEFAULT_SHEET_URL, include_details: bool =
             ]
         }
     """
-    workspaces = load_workspaces_from_sheet(sheet_url)
+    workspaces = get_workspace_registry().get_instantly_workspaces(sheet_url)
 
     clients = []
     for w in workspaces:
@@ -121,46 +128,10 @@ def get_lead_responses(
             ]
         }
     """
-    # Load workspaces from sheet
-    workspaces = load_workspaces_from_sheet(sheet_url, gid=gid)
-
-    # Find the workspace by ID or name
-    # Try exact match on workspace_id first
-    workspace = None
-    search_term = workspace_id.lower()
-
-    # 1. Try exact workspace_id match
-    for w in workspaces:
-        if w["workspace_id"].lower() == search_term:
-            workspace = w
-            break
-
-    # 2. Try fuzzy match on client_name, workspace_name, or person_name
-    if not workspace:
-        matches = []
-        for w in workspaces:
-            # Search in client_name (display), workspace_name (Column C), and person_name (Column D)
-            if (search_term in w["client_name"].lower() or
-                search_term in w.get("workspace_name", "").lower() or
-                search_term in w.get("person_name", "").lower()):
-                matches.append(w)
-
-        if len(matches) == 1:
-            workspace = matches[0]
-        elif len(matches) > 1:
-            match_list = [f"{w['client_name']} ({w['workspace_id']})" for w in matches]
-            raise ValueError(
-                f"Multiple matches found for '{workspace_id}':\n" +
-                "\n".join(f"  - {m}" for m in match_list) +
-                "\n\nPlease use the exact workspace_id or be more specific."
-            )
-
-    # 3. Try fuzzy match on workspace_id
-    if not workspace:
-        for w in workspaces:
-            if search_term in w["workspace_id"].lower():
-                workspace = w
-                break
+    # Find the workspace by ID or name (exact ID, exact name, unique partial name, partial ID)
+    resolver = get_workspace_registry().get_instantly_resolver(sheet_url, gid=gid)
+    workspaces = resolver.workspaces
+    workspace = resolver.resolve(workspace_id)
 
     if not workspace:
         # Show first 10 available clients
@@ -235,45 +206,10 @@ def get_campaign_stats(
             "reply_rate": float
         }
     """
-    # Load workspaces
-    workspaces = load_workspaces_from_sheet(sheet_url, gid=gid)
-
     # Find the workspace by ID or name (same logic as get_lead_responses)
-    workspace = None
-    search_term = workspace_id.lower()
-
-    # 1. Try exact workspace_id match
-    for w in workspaces:
-        if w["workspace_id"].lower() == search_term:
-            workspace = w
-            break
-
-    # 2. Try fuzzy match on client_name, workspace_name, or person_name
-    if not workspace:
-        matches = []
-        for w in workspaces:
-            # Search in client_name (display), workspace_name (Column C), and person_name (Column D)
-            if (search_term in w["client_name"].lower() or
-                search_term in w.get("workspace_name", "").lower() or
-                search_term in w.get("person_name", "").lower()):
-                matches.append(w)
-
-        if len(matches) == 1:
-            workspace = matches[0]
-        elif len(matches) > 1:
-            match_list = [f"{w['client_name']} ({w['workspace_id']})" for w in matches]
-            raise ValueError(
-                f"Multiple matches found for '{workspace_id}':\n" +
-                "\n".join(f"  - {m}" for m in match_list) +
-                "\n\nPlease use the exact workspace_id or be more specific."
-            )
-
-    # 3. Try fuzzy match on workspace_id
-    if not workspace:
-        for w in workspaces:
-            if search_term in w["workspace_id"].lower():
-                workspace = w
-                break
+    resolver = get_workspace_registry().get_instantly_resolver(sheet_url, gid=gid)
+    workspaces = resolver.workspaces
+    workspace = resolver.resolve(workspace_id)
 
     if not workspace:
         # Show first 10 available clients
@@ -285,12 +221,43 @@ def get_campaign_stats(
             f"Use get_client_list() to see all {len(workspaces)} clients."
         )
 
+    return _instantly_stats_for_workspace(workspace, start_date, end_date, days)
+
+
+def _instantly_stats_for_workspace(
+    workspace: Dict[str, str],
+    start_date: str = None,
+    end_date: str = None,
+    days: int = 7
+) -> Dict[str, Any]:
+    """
+    Fetch campaign statistics for an already-resolved Instantly workspace.
+
+    Args:
+        workspace: Workspace record from the registry (needs workspace_id, api_key)
+        start_date: Start date in ISO format (optional)
+        end_date: End date in ISO format (optional)
+        days: Number of days to look back (default: 7)
+
+    Returns:
+        Same dictionary as get_campaign_stats
+    """
+    return http_pool.run(_instantly_stats_for_workspace_async(workspace, start_date, end_date, days))
+
+
+async def _instantly_stats_for_workspace_async(
+    workspace: Dict[str, str],
+    start_date: str = None,
+    end_date: str = None,
+    days: int = 7
+) -> Dict[str, Any]:
+    """Async _instantly_stats_for_workspace, used by the portfolio fan-outs."""
     # Validate and parse dates with safeguards
     start_date, end_date, warnings = validate_and_parse_dates(start_date, end_date, days)
 
     # Call Instantly analytics API
 
-    data = get_instantly_campaign_stats(
+    data = await get_instantly_campaign_stats_async(
         api_key=workspace["api_key"],
         start_date=start_date,
         end_date=end_date
@@ -337,45 +304,8 @@ def get_workspace_info(
             "timestamp_updated": str
         }
     """
-    # Load workspaces
-    workspaces = load_workspaces_from_sheet(sheet_url)
-
     # Find the workspace (same lookup logic as other functions)
-    workspace = None
-    search_term = workspace_id.lower()
-
-    # 1. Try exact workspace_id match
-    for w in workspaces:
-        if w["workspace_id"].lower() == search_term:
-            workspace = w
-            break
-
-    # 2. Try fuzzy match on client_name, workspace_name, or person_name
-    if not workspace:
-        matches = []
-        for w in workspaces:
-            # Search in client_name (display), workspace_name (Column C), and person_name (Column D)
-            if (search_term in w["client_name"].lower() or
-                search_term in w.get("workspace_name", "").lower() or
-                search_term in w.get("person_name", "").lower()):
-                matches.append(w)
-
-        if len(matches) == 1:
-            workspace = matches[0]
-        elif len(matches) > 1:
-            match_list = [f"{w['client_name']} ({w['workspace_id']})" for w in matches]
-            raise ValueError(
-                f"Multiple matches found for '{workspace_id}':\n" +
-                "\n".join(f"  - {m}" for m in match_list) +
-                "\n\nPlease use the exact workspace_id or be more specific."
-            )
-
-    # 3. Try fuzzy match on workspace_id
-    if not workspace:
-        for w in workspaces:
-            if search_term in w["workspace_id"].lower():
-                workspace = w
-                break
+    workspace = get_workspace_registry().get_instantly_resolver(sheet_url).resolve(workspace_id)
 
     if not workspace:
         raise ValueError(f"Workspace '{workspace_id}' not found.")
@@ -409,6 +339,137 @@ def get_workspace_info(
 # BISON FUNCTIONS
 # ============================================================================
 
+# Safety cap on Bison reply pages walked per sync
+MAX_BISON_REPLY_PAGES = 200
+# Reply pages requested at once once a sync needs more than the first page
+BISON_REPLY_PAGE_CONCURRENCY = 5
+# Conversation threads fetched at once by get_bison_lead_responses
+BISON_THREAD_CONCURRENCY = 10
+
+
+async def _walk_bison_reply_pages(api_key: str, first_page: int, stop_at: str, max_pages: int) -> Dict[str, Any]:
+    """
+    Fetch /api/replies pages from ``first_page`` until one reaches back past ``stop_at``.
+
+    The first page is fetched alone (a routine refresh rarely needs more);
+    after that pages are requested BISON_REPLY_PAGE_CONCURRENCY at a time and
+    read in page order, so the walk stops at the first failed page and the
+    returned records are always a contiguous run of the listing.
+
+    Args:
+        api_key: Bison API key
+        first_page: Page to start from
+        stop_at: Normalized timestamp to walk back to ("" walks to the end)
+        max_pages: Most pages to fetch
+
+    Returns:
+        Dictionary with records (store tuples), newest and oldest received_at,
+        pages fetched, per_page, and complete (the walk reached stop_at or the end)
+    """
+    walk = {"records": [], "newest": None, "oldest": None, "pages": 0, "per_page": 0, "complete": False}
+    cap = first_page + max_pages - 1
+    last_page = cap
+    page = first_page
+    while page <= last_page:
+        batch = list(range(page, min(page + (1 if page == first_page else BISON_REPLY_PAGE_CONCURRENCY), last_page + 1)))
+        results = await asyncio.gather(
+            *(get_bison_lead_replies_async(api_key=api_key, status=None, folder="all", page=p) for p in batch),
+            return_exceptions=True
+        )
+        for current, data in zip(batch, results):
+            if isinstance(data, Exception):
+                if current == first_page:
+                    raise data
+                logger.warning(f"Error fetching Bison replies page {current}, keeping partial sync: {data}")
+                return walk
+
+            walk["pages"] += 1
+            walk["per_page"] = walk["per_page"] or len(data.get("data", []))
+            replies = [r for r in data.get("data", []) if r.get("date_received")]
+            for reply in replies:
+                received_at = normalize_timestamp(reply["date_received"])
+                walk["records"].append((str(reply.get("id")), received_at, 1 if reply.get("interested") else 0, reply))
+                walk["newest"] = max(walk["newest"] or received_at, received_at)
+                walk["oldest"] = min(walk["oldest"] or received_at, received_at)
+
+            meta = data.get("meta", {})
+            if not replies or (walk["oldest"] is not None and walk["oldest"] < stop_at) or current >= meta.get("last_page", current):
+                walk["complete"] = True
+                return walk
+            last_page = min(cap, meta["last_page"])
+        page = batch[-1] + 1
+
+    logger.warning(f"Stopped Bison reply sync after {max_pages} pages")
+    return walk
+
+
+def _load_bison_replies(api_key: str, status: Optional[str], since: str) -> List[Dict[str, Any]]:
+    """
+    Get Bison replies received since a date, syncing the local reply store first.
+
+    /api/replies has no date filter and lists the newest replies first, so the
+    sync walks pages until it passes the point the store already has (its
+    high-water mark minus the overlap window), or ``since`` on the first sync.
+    A walk stopped by the page cap or an error still records the range it
+    fetched, and when ``since`` is older than the synced range the walk
+    resumes at the page estimated from the stored count instead of page 1.
+    Every reply is synced into one scope with its interested flag as the
+    status column, so a reply marked or un-marked within the overlap window
+    is updated in place and the interested view is a query on that column.
+
+    Args:
+        api_key: Bison API key
+        status: "interested", or None for all replies
+        since: Earliest date needed (YYYY-MM-DD)
+
+    Returns:
+        Replies received since ``since``, newest first (the API's order)
+    """
+    store = get_reply_store()
+    if store is None:
+        return get_bison_lead_replies(api_key=api_key, status=status, folder="all").get("data", [])
+
+    workspace = workspace_key(api_key)
+    since_ts = normalize_timestamp(since)
+    covered = store.coverage("bison", workspace, "received")
+    stop_at = store.refresh_from("bison", workspace, "received") if covered else since_ts
+
+    synced_at = normalize_timestamp(datetime.now(timezone.utc).isoformat())
+    top = http_pool.run(_walk_bison_reply_pages(api_key, 1, stop_at, MAX_BISON_REPLY_PAGES))
+    if top["complete"]:
+        top_range = (min(stop_at, top["oldest"] or stop_at), synced_at)
+    elif covered is None and top["oldest"]:
+        # Pages from the top are contiguous, so the next sync resumes below them
+        top_range = (top["oldest"], synced_at)
+    else:
+        top_range = None
+    store.save("bison", workspace, "received", top["records"], covered=top_range)
+
+    covered = store.coverage("bison", workspace, "received")
+    budget = MAX_BISON_REPLY_PAGES - top["pages"]
+    if top_range and covered and covered[0] > since_ts and top["per_page"] and budget > 0:
+        # Everything from covered_from up is stored, so its count locates the
+        # page where it ends; start one page earlier to overlap the synced range
+        first_page = max(1, store.count("bison", workspace, "received", start=covered[0]) // top["per_page"])
+        try:
+            deep = http_pool.run(_walk_bison_reply_pages(api_key, first_page, since_ts, budget))
+        except Exception as e:
+            logger.warning(f"Error resuming Bison reply sync at page {first_page}: {e}")
+            deep = None
+        if deep and deep["oldest"]:
+            reaches_synced = deep["newest"] >= covered[0]
+            deep_from = min(since_ts, deep["oldest"]) if deep["complete"] else deep["oldest"]
+            store.save(
+                "bison", workspace, "received", deep["records"],
+                covered=(deep_from, covered[0]) if reaches_synced else None
+            )
+            if not reaches_synced:
+                logger.warning("Resumed Bison reply pages did not overlap the synced range; not extending it")
+
+    i_status = 1 if status == "interested" else None
+    return list(reversed(store.query("bison", workspace, "received", start=since, i_status=i_status)))
+
+
 def get_bison_client_list(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SHEET_GID_BISON):
     """
     MCP Tool: Get list of all Bison clients.
@@ -426,7 +487,7 @@ def get_bison_client_list(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SHEET_G
             ]
         }
     """
-    workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=gid)
+    workspaces = get_workspace_registry().get_bison_workspaces(sheet_url, gid=gid)
 
     clients = [{"client_name": w["client_name"]} for w in workspaces]
 
@@ -436,6 +497,69 @@ def get_bison_client_list(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SHEET_G
     }
 
 
+def _thread_message(msg: Dict[str, Any]) -> Dict[str, Any]:
+    """Conversation-thread entry as returned by get_bison_lead_responses."""
+    return {
+        "date_received": msg.get("date_received"),
+        "from_name": msg.get("from_name"),
+        "from_email": msg.get("from_email_address"),
+        "subject": msg.get("subject"),
+        "body": msg.get("text_body") or msg.get("html_body", ""),
+        "type": msg.get("type"),
+        "reply_id": msg.get("id")
+    }
+
+
+async def _fetch_bison_threads(api_key: str, reply_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Fetch the conversation threads of many replies concurrently.
+
+    At most BISON_THREAD_CONCURRENCY requests run at once. Reply IDs that
+    appear in a thread already fetched (several leads in one conversation)
+    reuse it, and fetched threads are shared with the timing-check cache.
+
+    Args:
+        api_key: Bison API key
+        reply_ids: Reply IDs to fetch threads for
+
+    Returns:
+        {reply_id: chronological thread (older -> current -> newer)}; failed
+        fetches are missing
+    """
+    cache = get_thread_cache()
+    semaphore = asyncio.Semaphore(BISON_THREAD_CONCURRENCY)
+    threads: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def build(thread_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        current = thread_data.get("current_reply") or {}
+        messages = thread_data.get("older_messages", []) + ([current] if current else []) + thread_data.get("newer_messages", [])
+        thread = [_thread_message(msg) for msg in messages]
+        # Every message in the thread maps to the same conversation
+        for msg in messages:
+            if msg.get("id") is not None:
+                threads.setdefault(msg["id"], thread)
+        return thread
+
+    async def fetch(reply_id):
+        async with semaphore:
+            if reply_id in threads:
+                return
+            key = ThreadCache.key("bison", api_key, reply_id)
+            thread_data = cache.get(key)
+            if thread_data is None:
+                try:
+                    response = await get_bison_conversation_thread_async(api_key, reply_id)
+                except Exception as e:
+                    logger.warning(f"Could not fetch Bison thread for reply {reply_id}: {e}")
+                    return
+                thread_data = response.get("data", {})
+                cache.put(key, thread_data)
+            threads[reply_id] = build(thread_data)
+
+    await asyncio.gather(*(fetch(reply_id) for reply_id in dict.fromkeys(reply_ids)))
+    return {reply_id: threads[reply_id] for reply_id in reply_ids if reply_id in threads}
+
+
 def get_bison_lead_responses(
     client_name: str,
     start_date: str = None,
@@ -500,35 +624,10 @@ def get_bison_lead_responses(
             ]
         }
     """
-    # Load workspaces
-    workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=gid)
-
-    # Find the workspace by name (fuzzy matching)
-    workspace = None
-    search_term = client_name.lower()
-
-    # Try exact match first
-    for w in workspaces:
-        if w["client_name"].lower() == search_term:
-            workspace = w
-            break
-
-    # Try fuzzy match
-    if not workspace:
-        matches = []
-        for w in workspaces:
-            if search_term in w["client_name"].lower():
-                matches.append(w)
-
-        if len(matches) == 1:
-            workspace = matches[0]
-        elif len(matches) > 1:
-            match_list = [w["client_name"] for w in matches]
-            raise ValueError(
-                f"Multiple matches found for '{client_name}':\n" +
-                "\n".join(f"  - {m}" for m in match_list) +
-                "\n\nPlease be more specific."
-            )
+    # Find the workspace by name (exact, then unique partial match)
+    resolver = get_workspace_registry().get_bison_resolver(sheet_url, gid=gid)
+    workspaces = resolver.workspaces
+    workspace = resolver.resolve(client_name)
 
     if not workspace:
         available = [w["client_name"] for w in workspaces[:10]]
@@ -542,147 +641,69 @@ def get_bison_lead_responses(
 
     # Validate and parse dates with safeguards
     start_date, end_date, warnings = validate_and_parse_dates(start_date, end_date, days)
+    api_key = workspace["api_key"]
 
-    # Call Bison API to get replies
-    # Use folder='all' to get both unreplied and replied-to interested leads
-
-    data = get_bison_lead_replies(
-        api_key=workspace["api_key"],
-        status="interested",
-        folder="all"
-    )
+    # Interested replies from the reply store (folder='all': unreplied and replied-to leads)
+    interested_replies = _load_bison_replies(api_key, status="interested", since=start_date)
 
-    # Group all interested replies by lead_id
-    # The data already contains all interested messages (incoming and outgoing) from folder='all'
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
     end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
 
-    # Collect all interested replies within date range, grouped by lead_id
+    # Single pass: group interested replies in the date range by lead_id, keeping the
+    # first incoming "Tracked Reply" of each lead for contact info
     replies_by_lead = {}
-    for reply in data.get("data", []):
+    best_reply_by_lead = {}
+    for reply in interested_replies:
         date_received = reply.get("date_received")
-        if date_received:
-            reply_dt = datetime.fromisoformat(date_received.replace("Z", "+00:00"))
-            if start_dt <= reply_dt.replace(tzinfo=None) <= end_dt:
-                lead_id = reply.get("lead_id")
-                if lead_id not in replies_by_lead:
-                    replies_by_lead[lead_id] = []
-                replies_by_lead[lead_id].append(reply)
-
-    # For leads with only outgoing emails, fetch their incoming replies separately
-    leads_needing_contact_info = []
-    for lead_id, replies in replies_by_lead.items():
-        has_incoming = any(r.get("type") == "Tracked Reply" for r in replies)
-        if not has_incoming:
-            leads_needing_contact_info.append(lead_id)
-
-    # Fetch additional replies for leads without incoming interested replies
-    additional_replies = {}
-    if leads_needing_contact_info:
-        all_data = get_bison_lead_replies(
-            api_key=workspace["api_key"],
-            status=None,  # No status filter to get all replies
-            folder="all"
-        )
-
-        for lead_id in leads_needing_contact_info:
-            lead_all_replies = [r for r in all_data.get("data", [])
-                              if r.get("lead_id") == lead_id and r.get("type") == "Tracked Reply"]
-            if lead_all_replies:
-                # Get most recent incoming reply
-                lead_all_replies.sort(key=lambda x: x.get("date_received", ""), reverse=True)
-                additional_replies[lead_id] = lead_all_replies[0]
-
-    # Build final leads list with proper contact info
+        if not date_received:
+            continue
+        reply_dt = datetime.fromisoformat(date_received.replace("Z", "+00:00"))
+        if not start_dt <= reply_dt.replace(tzinfo=None) <= end_dt:
+            continue
+        lead_id = reply.get("lead_id")
+        replies_by_lead.setdefault(lead_id, []).append(reply)
+        if lead_id not in best_reply_by_lead and reply.get("type") == "Tracked Reply":
+            best_reply_by_lead[lead_id] = reply
+
+    # Build final leads list with proper contact info (fallback to any reply)
     leads_by_id = {}
     for lead_id, replies in replies_by_lead.items():
-        # Find the first incoming "Tracked Reply" for contact info
-        best_reply = None
-        for reply in replies:
-            if reply.get("type") == "Tracked Reply":
-                best_reply = reply
-                break
-
-        # If no incoming reply in interested set, use the one we fetched separately
-        if not best_reply and lead_id in additional_replies:
-            best_reply = additional_replies[lead_id]
-
-        # Fallback to any reply if still nothing found
-        if not best_reply and replies:
-            best_reply = replies[0]
-
-        if best_reply:
-            leads_by_id[lead_id] = {
-                "email": best_reply.get("from_email_address"),
-                "from_name": best_reply.get("from_name"),
-                "reply_body": best_reply.get("text_body") or best_reply.get("html_body", ""),
-                "subject": best_reply.get("subject"),
-                "date_received": best_reply.get("date_received"),
-                "interested": True,
-                "read": best_reply.get("read", False),
-                "reply_id": best_reply.get("id"),
-                "lead_id": lead_id
-            }
+        best_reply = best_reply_by_lead.get(lead_id) or replies[0]
+        leads_by_id[lead_id] = {
+            "email": best_reply.get("from_email_address"),
+            "from_name": best_reply.get("from_name"),
+            "reply_body": best_reply.get("text_body") or best_reply.get("html_body", ""),
+            "subject": best_reply.get("subject"),
+            "date_received": best_reply.get("date_received"),
+            "interested": True,
+            "read": best_reply.get("read", False),
+            "reply_id": best_reply.get("id"),
+            "lead_id": lead_id
+        }
 
-    # Fetch conversation threads for each lead
+    # Fetch conversation threads concurrently (deduplicated when leads share a thread)
+    threads = http_pool.run(_fetch_bison_threads(api_key, [lead["reply_id"] for lead in leads_by_id.values()]))
     for lead_id, lead_data in leads_by_id.items():
-        reply_id = lead_data["reply_id"]
-
-        try:
-            thread_response = get_bison_conversation_thread(
-                api_key=workspace["api_key"],
-                reply_id=reply_id
-            )
-            thread_data = thread_response.get("data", {})
-
-            # Build chronological thread: older -> current -> newer
-            thread = []
-
-            # Add older messages (already in chronological order)
-            for msg in thread_data.get("older_messages", []):
-                thread.append({
-                    "date_received": msg.get("date_received"),
-                    "from_name": msg.get("from_name"),
-                    "from_email": msg.get("from_email_address"),
-                    "subject": msg.get("subject"),
-                    "body": msg.get("text_body") or msg.get("html_body", ""),
-                    "type": msg.get("type"),
-                    "reply_id": msg.get("id")
-                })
-
-            # Add current reply
-            current = thread_data.get("current_reply", {})
-            if current:
-                thread.append({
-                    "date_received": current.get("date_received"),
-                    "from_name": current.get("from_name"),
-                    "from_email": current.get("from_email_address"),
-                    "subject": current.get("subject"),
-                    "body": current.get("text_body") or current.get("html_body", ""),
-                    "type": current.get("type"),
-                    "reply_id": current.get("id")
-                })
-
-            # Add newer messages
-            for msg in thread_data.get("newer_messages", []):
-                thread.append({
-                    "date_received": msg.get("date_received"),
-                    "from_name": msg.get("from_name"),
-                    "from_email": msg.get("from_email_address"),
-                    "subject": msg.get("subject"),
-                    "body": msg.get("text_body") or msg.get("html_body", ""),
-                    "type": msg.get("type"),
-                    "reply_id": msg.get("id")
+        thread = threads.get(lead_data["reply_id"]) or []
+        lead_data["conversation_thread"] = thread
+        lead_data["thread_message_count"] = len(thread)
+
+        # Leads with only outgoing interested emails: take contact info from the
+        # lead's most recent incoming reply in their own thread, which may
+        # predate the window
+        if lead_id not in best_reply_by_lead:
+            incoming = [msg for msg in thread if msg.get("type") == "Tracked Reply"]
+            if incoming:
+                latest = max(incoming, key=lambda msg: msg.get("date_received") or "")
+                lead_data.update({
+                    "email": latest["from_email"],
+                    "from_name": latest["from_name"],
+                    "reply_body": latest["body"],
+                    "subject": latest["subject"],
+                    "date_received": latest["date_received"],
+                    "reply_id": latest["reply_id"]
                 })
 
-            # Add thread to lead data
-            lead_data["conversation_thread"] = thread
-            lead_data["thread_message_count"] = len(thread)
-
-        except Exception as e:
-            lead_data["conversation_thread"] = []
-            lead_data["thread_message_count"] = 0
-
     # Convert to list, sorted by date (most recent first)
     leads = sorted(leads_by_id.values(), key=lambda x: x["date_received"], reverse=True)
 
@@ -739,45 +760,49 @@ def get_bison_campaign_stats(
             "interested_percentage": float
         }
     """
-    # Load workspaces
-    workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=gid)
-
     # Find the workspace (same logic as get_bison_lead_responses)
-    workspace = None
-    search_term = client_name.lower()
-
-    # Try exact match first
-    for w in workspaces:
-        if w["client_name"].lower() == search_term:
-            workspace = w
-            break
-
-    # Try fuzzy match
-    if not workspace:
-        matches = []
-        for w in workspaces:
-            if search_term in w["client_name"].lower():
-                matches.append(w)
-
-        if len(matches) == 1:
-            workspace = matches[0]
-        elif len(matches) > 1:
-            match_list = [w["client_name"] for w in matches]
-            raise ValueError(
-                f"Multiple matches found for '{client_name}':\n" +
-                "\n".join(f"  - {m}" for m in match_list) +
-                "\n\nPlease be more specific."
-            )
+    workspace = get_workspace_registry().get_bison_resolver(sheet_url, gid=gid).resolve(client_name)
 
     if not workspace:
         raise ValueError(f"Client '{client_name}' not found.")
 
+    return _bison_stats_for_workspace(workspace, start_date, end_date, days)
+
+
+def _bison_stats_for_workspace(
+    workspace: Dict[str, str],
+    start_date: str = None,
+    end_date: str = None,
+    days: int = 7
+) -> Dict[str, Any]:
+    """
+    Fetch campaign statistics for an already-resolved Bison workspace.
+
+    Args:
+        workspace: Workspace record from the registry (needs client_name, api_key)
+        start_date: Start date in YYYY-MM-DD format (optional)
+        end_date: End date in YYYY-MM-DD format (optional)
+        days: Number of days to look back (default: 7)
+
+    Returns:
+        Same dictionary as get_bison_campaign_stats
+    """
+    return http_pool.run(_bison_stats_for_workspace_async(workspace, start_date, end_date, days))
+
+
+async def _bison_stats_for_workspace_async(
+    workspace: Dict[str, str],
+    start_date: str = None,
+    end_date: str = None,
+    days: int = 7
+) -> Dict[str, Any]:
+    """Async _bison_stats_for_workspace, used by the portfolio fan-outs."""
     # Validate and parse dates with safeguards
     start_date, end_date, warnings = validate_and_parse_dates(start_date, end_date, days)
 
     # Call Bison stats API
 
-    response = get_bison_campaign_stats_api(
+    response = await get_bison_campaign_stats_api_async(
         api_key=workspace["api_key"],
         start_date=start_date,
         end_date=end_date
@@ -869,10 +894,87 @@ def get_all_clients(sheet_url: str = DEFAULT_SHEET_URL):
 # AGGREGATED ANALYTICS TOOLS
 # ============================================================================
 
+def _fetch_portfolio_stats(
+    instantly_workspaces: List[Dict[str, str]],
+    bison_workspaces: List[Dict[str, str]],
+    days: int
+) -> Tuple[List[Tuple[Dict[str, str], Dict[str, Any]]], List[Tuple[Dict[str, str], Dict[str, Any]]]]:
+    """
+    Fetch stats for every Instantly and Bison workspace concurrently.
+
+    The requests run as coroutines on the shared HTTP pool, which caps
+    in-flight requests per host. Workspaces whose fetch fails are skipped.
+
+    Args:
+        instantly_workspaces: Instantly workspace records
+        bison_workspaces: Bison workspace records
+        days: Number of days to look back
+
+    Returns:
+        (instantly_results, bison_results), each a list of (workspace, stats) in sheet order
+    """
+    async def fetch_all():
+        return await asyncio.gather(
+            asyncio.gather(
+                *(_instantly_stats_for_workspace_async(ws, days=days) for ws in instantly_workspaces),
+                return_exceptions=True
+            ),
+            asyncio.gather(
+                *(_bison_stats_for_workspace_async(ws, days=days) for ws in bison_workspaces),
+                return_exceptions=True
+            )
+        )
+
+    instantly_stats, bison_stats = http_pool.run(fetch_all())
+
+    def succeeded(workspaces, results, platform):
+        pairs = []
+        for workspace, stats in zip(workspaces, results):
+            if isinstance(stats, BaseException):
+                logger.warning("Error fetching %s stats for %s: %s", platform, workspace.get("client_name"), stats)
+                continue
+            pairs.append((workspace, stats))
+        return pairs
+
+    return (
+        succeeded(instantly_workspaces, instantly_stats, "Instantly"),
+        succeeded(bison_workspaces, bison_stats, "Bison")
+    )
+
+
+def _portfolio_snapshot(days: int, sheet_url: str) -> PortfolioSnapshot:
+    """
+    Get per-client stats for every workspace from the shared snapshot engine.
+
+    Only platforms without a fresh snapshot for this date range are fetched,
+    in a single fan-out.
+
+    Args:
+        days: Number of days to look back
+        sheet_url: Google Sheet URL
+
+    Returns:
+        PortfolioSnapshot over both platforms
+    """
+    start_date, end_date, _ = validate_and_parse_dates(None, None, days)
+    workspaces = {
+        "instantly": get_workspace_registry().get_instantly_workspaces(sheet_url),
+        "bison": get_workspace_registry().get_bison_workspaces(sheet_url)
+    }
+
+    def fetch(missing):
+        instantly_results, bison_results = _fetch_portfolio_stats(
+            missing.get("instantly", []), missing.get("bison", []), days
+        )
+        return {"instantly": instantly_results, "bison": bison_results}
+
+    return get_snapshot_engine().get(start_date, end_date, workspaces, fetch)
+
+
 def get_all_platform_stats(days: int = 7, sheet_url: str = DEFAULT_SHEET_URL):
     """
     MCP Tool: Get aggregated statistics from BOTH Instantly and Bison platforms.
-    OPTIMIZED: Uses parallel processing to fetch stats from all clients simultaneously.
+    OPTIMIZED: Served from the shared portfolio snapshot (one fan-out per date range).
 
     Args:
         days: Number of days to look back (default: 7)
@@ -893,79 +995,17 @@ def get_all_platform_stats(days: int = 7, sheet_url: str = DEFAULT_SHEET_URL):
                     "instantly": {...},
                     "bison": {...}
                 }
-            }
+            },
+            "data_as_of": str
         }
     """
-    # Progress logging removed for MCP compatibility
-
     # Calculate date range
     end = datetime.now()
     start = end - timedelta(days=days)
     start_date = start.strftime("%Y-%m-%d")
     end_date = end.strftime("%Y-%m-%d")
 
-    # Get all clients
-    instantly_workspaces = load_workspaces_from_sheet(sheet_url)
-    bison_workspaces = load_bison_workspaces_from_sheet(sheet_url)
-
-    # Instantly aggregated stats
-    instantly_total_emails = 0
-    instantly_total_replies = 0
-    instantly_total_opportunities = 0
-    instantly_clients_processed = 0
-
-    # PARALLEL PROCESSING: Fetch Instantly stats for all clients simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        # Submit all Instantly client fetches
-        future_to_workspace = {
-            executor.submit(get_campaign_stats, workspace["workspace_id"], days=days, sheet_url=sheet_url): workspace
-            for workspace in instantly_workspaces
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_workspace):
-            workspace = future_to_workspace[future]
-            try:
-                stats = future.result()
-                instantly_total_emails += stats.get("emails_sent", 0)
-                instantly_total_replies += stats.get("replies", 0)
-                instantly_total_opportunities += stats.get("opportunities", 0)
-                instantly_clients_processed += 1
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    # Bison aggregated stats
-    bison_total_emails = 0
-    bison_total_replies = 0
-    bison_total_interested = 0
-    bison_clients_processed = 0
-
-    # PARALLEL PROCESSING: Fetch Bison stats for all clients simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        # Submit all Bison client fetches
-        future_to_workspace = {
-            executor.submit(get_bison_campaign_stats, workspace["client_name"], days=days, sheet_url=sheet_url): workspace
-            for workspace in bison_workspaces
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_workspace):
-            workspace = future_to_workspace[future]
-            try:
-                stats = future.result()
-                bison_total_emails += stats.get("emails_sent", 0)
-                bison_total_replies += stats.get("unique_replies_per_contact", 0)
-                bison_total_interested += stats.get("interested", 0)
-                bison_clients_processed += 1
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    # Calculate combined totals
-    total_emails_sent = instantly_total_emails + bison_total_emails
-    total_replies = instantly_total_replies + bison_total_replies
-    total_interested = instantly_total_opportunities + bison_total_interested
+    snapshot = _portfolio_snapshot(days, sheet_url)
 
     return {
         "date_range": {
@@ -973,29 +1013,8 @@ def get_all_platform_stats(days: int = 7, sheet_url: str = DEFAULT_SHEET_URL):
             "start_date": start_date,
             "end_date": end_date
         },
-        "total_stats": {
-            "total_emails_sent": total_emails_sent,
-            "total_replies": total_replies,
-            "total_interested_leads": total_interested,
-            "reply_rate": round((total_replies / total_emails_sent * 100), 2) if total_emails_sent > 0 else 0,
-            "clients_processed": instantly_clients_processed + bison_clients_processed
-        },
-        "platform_breakdown": {
-            "instantly": {
-                "clients": instantly_clients_processed,
-                "emails_sent": instantly_total_emails,
-                "replies": instantly_total_replies,
-                "opportunities": instantly_total_opportunities,
-                "reply_rate": round((instantly_total_replies / instantly_total_emails * 100), 2) if instantly_total_emails > 0 else 0
-            },
-            "bison": {
-                "clients": bison_clients_processed,
-                "emails_sent": bison_total_emails,
-                "replies": bison_total_replies,
-                "interested": bison_total_interested,
-                "reply_rate": round((bison_total_replies / bison_total_emails * 100), 2) if bison_total_emails > 0 else 0
-            }
-        }
+        **snapshot.totals(),
+        "data_as_of": snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
     }
 
 
@@ -1007,7 +1026,7 @@ def get_top_performing_clients(
 ):
     """
     MCP Tool: Get top performing clients across both platforms.
-    OPTIMIZED: Uses parallel processing to fetch all client stats simultaneously.
+    OPTIMIZED: Served from the shared portfolio snapshot (one fan-out per date range).
 
     Args:
         limit: Number of top clients to return (default: 10)
@@ -1027,90 +1046,18 @@ def get_top_performing_clients(
                     "metric_value": int/float,
                     "stats": {...}
                 }
-            ]
+            ],
+            "data_as_of": str
         }
     """
-    # Progress logging removed for MCP compatibility
-
-    # Get all clients
-    instantly_workspaces = load_workspaces_from_sheet(sheet_url)
-    bison_workspaces = load_bison_workspaces_from_sheet(sheet_url)
-
-    all_client_stats = []
-
-    # Helper function to fetch and parse Instantly stats
-    def fetch_instantly_stats(workspace):
-        stats = get_campaign_stats(workspace_id=workspace["workspace_id"], days=days, sheet_url=sheet_url)
-        metric_value = 0
-        if metric == "interested_leads":
-            metric_value = stats.get("opportunities", 0)
-        elif metric == "emails_sent":
-            metric_value = stats.get("emails_sent", 0)
-        elif metric == "replies":
-            metric_value = stats.get("replies", 0)
-        elif metric == "reply_rate":
-            metric_value = stats.get("reply_rate", 0)
-        return {
-            "client_name": workspace["client_name"],
-            "platform": "instantly",
-            "metric_value": metric_value,
-            "stats": stats
-        }
-
-    # Helper function to fetch and parse Bison stats
-    def fetch_bison_stats(workspace):
-        stats = get_bison_campaign_stats(client_name=workspace["client_name"], days=days, sheet_url=sheet_url)
-        metric_value = 0
-        if metric == "interested_leads":
-            metric_value = stats.get("interested", 0)
-        elif metric == "emails_sent":
-            metric_value = stats.get("emails_sent", 0)
-        elif metric == "replies":
-            metric_value = stats.get("unique_replies_per_contact", 0)
-        elif metric == "reply_rate":
-            metric_value = stats.get("unique_replies_per_contact_percentage", 0)
-        return {
-            "client_name": workspace["client_name"],
-            "platform": "bison",
-            "metric_value": metric_value,
-            "stats": stats
-        }
-
-    # PARALLEL PROCESSING: Fetch ALL client stats simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        # Submit all tasks
-        futures = []
-        futures.extend([executor.submit(fetch_instantly_stats, ws) for ws in instantly_workspaces])
-        futures.extend([executor.submit(fetch_bison_stats, ws) for ws in bison_workspaces])
-
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                client_stat = future.result()
-                all_client_stats.append(client_stat)
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    # Sort by metric value (descending)
-    all_client_stats.sort(key=lambda x: x["metric_value"], reverse=True)
-
-    # Get top N
-    top_clients = []
-    for idx, client in enumerate(all_client_stats[:limit], start=1):
-        top_clients.append({
-            "rank": idx,
-            "client_name": client["client_name"],
-            "platform": client["platform"],
-            "metric_value": client["metric_value"],
-            "stats": client["stats"]
-        })
+    snapshot = _portfolio_snapshot(days, sheet_url)
 
     return {
         "metric": metric,
         "days": days,
         "limit": limit,
-        "top_clients": top_clients
+        "top_clients": snapshot.top(metric, limit),
+        "data_as_of": snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
     }
 
 
@@ -1122,7 +1069,7 @@ def get_underperforming_clients(
 ):
     """
     MCP Tool: Get underperforming clients across both platforms.
-    OPTIMIZED: Uses parallel processing to fetch all client stats simultaneously.
+    OPTIMIZED: Served from the shared portfolio snapshot (one fan-out per date range).
 
     Args:
         threshold: Minimum value for the metric - clients below this are considered underperforming (default: 5)
@@ -1142,94 +1089,27 @@ def get_underperforming_clients(
                     "metric_value": int/float,
                     "stats": {...}
                 }
-            ]
+            ],
+            "data_as_of": str
         }
     """
-    # Progress logging removed for MCP compatibility
-
-    # Get all clients
-    instantly_workspaces = load_workspaces_from_sheet(sheet_url)
-    bison_workspaces = load_bison_workspaces_from_sheet(sheet_url)
-
-    underperforming = []
-
-    # Helper function to check Instantly client
-    def check_instantly_client(workspace):
-        stats = get_campaign_stats(workspace_id=workspace["workspace_id"], days=days, sheet_url=sheet_url)
-        metric_value = 0
-        if metric == "interested_leads":
-            metric_value = stats.get("opportunities", 0)
-        elif metric == "emails_sent":
-            metric_value = stats.get("emails_sent", 0)
-        elif metric == "replies":
-            metric_value = stats.get("replies", 0)
-        elif metric == "reply_rate":
-            metric_value = stats.get("reply_rate", 0)
-
-        if metric_value < threshold:
-            return {
-                "client_name": workspace["client_name"],
-                "platform": "instantly",
-                "metric_value": metric_value,
-                "stats": stats
-            }
-        return None
-
-    # Helper function to check Bison client
-    def check_bison_client(workspace):
-        stats = get_bison_campaign_stats(client_name=workspace["client_name"], days=days, sheet_url=sheet_url)
-        metric_value = 0
-        if metric == "interested_leads":
-            metric_value = stats.get("interested", 0)
-        elif metric == "emails_sent":
-            metric_value = stats.get("emails_sent", 0)
-        elif metric == "replies":
-            metric_value = stats.get("unique_replies_per_contact", 0)
-        elif metric == "reply_rate":
-            metric_value = stats.get("unique_replies_per_contact_percentage", 0)
-
-        if metric_value < threshold:
-            return {
-                "client_name": workspace["client_name"],
-                "platform": "bison",
-                "metric_value": metric_value,
-                "stats": stats
-            }
-        return None
-
-    # PARALLEL PROCESSING: Check ALL clients simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        # Submit all tasks
-        futures = []
-        futures.extend([executor.submit(check_instantly_client, ws) for ws in instantly_workspaces])
-        futures.extend([executor.submit(check_bison_client, ws) for ws in bison_workspaces])
-
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result:  # Only add if client is underperforming
-                    underperforming.append(result)
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    # Sort by metric value (ascending - worst performers first)
-    underperforming.sort(key=lambda x: x["metric_value"])
+    snapshot = _portfolio_snapshot(days, sheet_url)
+    underperforming = snapshot.below(metric, threshold)
 
     return {
         "metric": metric,
         "threshold": threshold,
         "days": days,
         "total_underperforming": len(underperforming),
-        "underperforming_clients": underperforming
+        "underperforming_clients": underperforming,
+        "data_as_of": snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
     }
 
 
 def get_weekly_summary(sheet_url: str = DEFAULT_SHEET_URL):
     """
     MCP Tool: Generate a comprehensive weekly summary across all clients and platforms.
-    OPTIMIZED: Fetches stats once and reuses data instead of making 240+ API calls.
+    OPTIMIZED: Served from the same 7-day portfolio snapshot as the other portfolio tools.
 
     Args:
         sheet_url: Google Sheet URL (optional)
@@ -1243,144 +1123,15 @@ def get_weekly_summary(sheet_url: str = DEFAULT_SHEET_URL):
             "insights": [...]
         }
     """
-    # Progress logging removed for MCP compatibility
-
     days = 7
 
-    # Calculate date range
-    end = datetime.now()
-    start = end - timedelta(days=days)
-    start_date = start.strftime("%Y-%m-%d")
-    end_date = end.strftime("%Y-%m-%d")
-
-    # Get all clients
-    instantly_workspaces = load_workspaces_from_sheet(sheet_url)
-    bison_workspaces = load_bison_workspaces_from_sheet(sheet_url)
-
-    # FETCH ALL STATS ONCE (instead of 3 times) - NOW WITH PARALLEL PROCESSING
-    all_client_stats = []
+    snapshot = _portfolio_snapshot(days, sheet_url)
+    overall = snapshot.totals()
 
-    instantly_total_emails = 0
-    instantly_total_replies = 0
-    instantly_total_opportunities = 0
-    instantly_clients_processed = 0
+    top_clients = snapshot.top("interested_leads", 5)
 
-    # Helper function to fetch Instantly stats
-    def fetch_instantly_stats_for_summary(workspace):
-        stats = get_campaign_stats(workspace_id=workspace["workspace_id"], days=days, sheet_url=sheet_url)
-        return {
-            "client_name": workspace["client_name"],
-            "platform": "instantly",
-            "interested_leads": stats.get("opportunities", 0),
-            "emails_sent": stats.get("emails_sent", 0),
-            "replies": stats.get("replies", 0),
-            "stats": stats
-        }
-
-    # PARALLEL PROCESSING: Fetch all Instantly stats simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        futures = [executor.submit(fetch_instantly_stats_for_summary, ws) for ws in instantly_workspaces]
-
-        for future in as_completed(futures):
-            try:
-                client_data = future.result()
-                instantly_total_emails += client_data["emails_sent"]
-                instantly_total_replies += client_data["replies"]
-                instantly_total_opportunities += client_data["interested_leads"]
-                instantly_clients_processed += 1
-                all_client_stats.append(client_data)
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    bison_total_emails = 0
-    bison_total_replies = 0
-    bison_total_interested = 0
-    bison_clients_processed = 0
-
-    # Helper function to fetch Bison stats
-    def fetch_bison_stats_for_summary(workspace):
-        stats = get_bison_campaign_stats(client_name=workspace["client_name"], days=days, sheet_url=sheet_url)
-        return {
-            "client_name": workspace["client_name"],
-            "platform": "bison",
-            "interested_leads": stats.get("interested", 0),
-            "emails_sent": stats.get("emails_sent", 0),
-            "replies": stats.get("unique_replies_per_contact", 0),
-            "stats": stats
-        }
-
-    # PARALLEL PROCESSING: Fetch all Bison stats simultaneously
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        futures = [executor.submit(fetch_bison_stats_for_summary, ws) for ws in bison_workspaces]
-
-        for future in as_completed(futures):
-            try:
-                client_data = future.result()
-                bison_total_emails += client_data["emails_sent"]
-                bison_total_replies += client_data["replies"]
-                bison_total_interested += client_data["interested_leads"]
-                bison_clients_processed += 1
-                all_client_stats.append(client_data)
-            except Exception as e:
-                # Error logging removed for MCP compatibility
-                continue
-
-    # Calculate combined totals
-    total_emails_sent = instantly_total_emails + bison_total_emails
-    total_replies = instantly_total_replies + bison_total_replies
-    total_interested = instantly_total_opportunities + bison_total_interested
-
-    overall = {
-        "total_stats": {
-            "total_emails_sent": total_emails_sent,
-            "total_replies": total_replies,
-            "total_interested_leads": total_interested,
-            "reply_rate": round((total_replies / total_emails_sent * 100), 2) if total_emails_sent > 0 else 0,
-            "clients_processed": instantly_clients_processed + bison_clients_processed
-        },
-        "platform_breakdown": {
-            "instantly": {
-                "clients": instantly_clients_processed,
-                "emails_sent": instantly_total_emails,
-                "replies": instantly_total_replies,
-                "opportunities": instantly_total_opportunities,
-                "reply_rate": round((instantly_total_replies / instantly_total_emails * 100), 2) if instantly_total_emails > 0 else 0
-            },
-            "bison": {
-                "clients": bison_clients_processed,
-                "emails_sent": bison_total_emails,
-                "replies": bison_total_replies,
-                "interested": bison_total_interested,
-                "reply_rate": round((bison_total_replies / bison_total_emails * 100), 2) if bison_total_emails > 0 else 0
-            }
-        }
-    }
-
-    # Sort and get top 5 performers (reusing fetched data)
-    all_client_stats.sort(key=lambda x: x["interested_leads"], reverse=True)
-    top_clients = []
-    for idx, client in enumerate(all_client_stats[:5], start=1):
-        top_clients.append({
-            "rank": idx,
-            "client_name": client["client_name"],
-            "platform": client["platform"],
-            "metric_value": client["interested_leads"],
-            "stats": client["stats"]
-        })
-
-    # Get underperformers (less than 3 interested leads)
-    underperforming = [
-        {
-            "client_name": client["client_name"],
-            "platform": client["platform"],
-            "metric_value": client["interested_leads"],
-            "stats": client["stats"]
-        }
-        for client in all_client_stats
-        if client["interested_leads"] < 3
-    ]
-    underperforming.sort(key=lambda x: x["metric_value"])
+    # Underperformers: less than 3 interested leads
+    underperforming = snapshot.below("interested_leads", 3)
 
     # Generate insights
     insights = []
@@ -1411,6 +1162,7 @@ def get_weekly_summary(sheet_url: str = DEFAULT_SHEET_URL):
     return {
         "period": f"Last {days} days",
         "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "data_as_of": snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S"),
         "overall_stats": overall["total_stats"],
         "platform_breakdown": overall["platform_breakdown"],
         "top_5_performers": top_clients,
@@ -1422,6 +1174,148 @@ def get_weekly_summary(sheet_url: str = DEFAULT_SHEET_URL):
     }
 
 
+def _metrics_store() -> MetricsStore:
+    """Get the metrics store, raising if it is disabled or nothing can feed it."""
+    store = get_metrics_store()
+    if store is None:
+        raise ValueError("Metrics history is disabled (LEAD_METRICS_ENABLED=false or the store could not be opened)")
+    # Daily rows are only recorded by the daily stats cache
+    if get_stats_cache() is None:
+        raise ValueError(
+            "Metrics history is not being recorded: it is fed by the daily stats cache, which is disabled "
+            "(LEAD_STATS_CACHE_ENABLED=false or the cache could not be opened)"
+        )
+    return store
+
+
+def refresh_metrics_history(days: int = 56, sheet_url: str = DEFAULT_SHEET_URL) -> Dict[str, Any]:
+    """
+    Record daily metrics for every client over the last `days` days.
+
+    Runs the portfolio fan-out over the window; the daily stats cache records
+    each day it uses in the metrics store. Settled days are cached, so after
+    the first run only the most recent days are fetched again.
+
+    Args:
+        days: Number of days to cover
+        sheet_url: Google Sheet URL (optional)
+
+    Returns:
+        {"days": int, "clients": int, "store": {...}}
+    """
+    store = _metrics_store()
+    snapshot = _portfolio_snapshot(days, sheet_url)
+    return {
+        "days": days,
+        "clients": len(snapshot.clients),
+        "store": store.stats()
+    }
+
+
+def get_client_metric_trends(
+    client_name: str,
+    weeks: int = 8,
+    rolling_weeks: int = 4,
+    sheet_url: str = DEFAULT_SHEET_URL
+) -> Dict[str, Any]:
+    """
+    MCP Tool: Weekly metric trend for one client from the local metrics history.
+
+    No upstream calls: reads the daily rows recorded by the stats layer.
+
+    Args:
+        client_name: Client name, partial name or Instantly workspace ID
+        weeks: Number of 7-day windows ending yesterday (default: 8)
+        rolling_weeks: Rolling average window over the weekly values (default: 4)
+        sheet_url: Google Sheet URL (optional)
+
+    Returns:
+        {
+            "client_name": str,
+            "platform": "instantly" | "bison",
+            "weeks": [{"week_start", "week_end", "days_with_data", <metrics>, "rolling_avg": {...}}],
+            "week_over_week": {metric: {"current", "previous", "change", "change_pct"}},
+            "coverage": {...}
+        }
+
+    Raises:
+        ValueError: If the client is not found or the store is disabled
+    """
+    store = _metrics_store()
+    registry = get_workspace_registry()
+
+    platform, workspace = registry.resolve_client(client_name, sheet_url)
+    if workspace is None:
+        raise ValueError(f"Client '{client_name}' not found in Instantly or Bison workspaces")
+
+    trends = store.trends(platform, workspace_key(workspace["api_key"]), weeks=weeks, rolling_weeks=rolling_weeks)
+    return {
+        "client_name": workspace.get("client_name") or workspace.get("workspace_id"),
+        "platform": platform,
+        **trends
+    }
+
+
+def get_week_over_week_movers(
+    metric: str = "reply_rate",
+    platform: str = "all",
+    limit: int = 10,
+    sheet_url: str = DEFAULT_SHEET_URL
+) -> Dict[str, Any]:
+    """
+    MCP Tool: Clients whose metric moved most between the last two weeks.
+
+    No upstream calls: all clients are compared in one vectorized pass over
+    the local metrics history.
+
+    Args:
+        metric: "emails_sent", "replies", "interested", "opportunities",
+            "reply_rate" or "interest_rate" (default: "reply_rate")
+        platform: "instantly", "bison" or "all" (default: "all")
+        limit: Clients per list (default: 10)
+        sheet_url: Google Sheet URL (optional)
+
+    Returns:
+        {
+            "metric": str,
+            "clients_compared": int,
+            "risers": [{"client_name", "platform", "current", "previous", "change", "change_pct"}],
+            "fallers": [...]
+        }
+
+    Raises:
+        ValueError: If the metric is unknown or the store is disabled
+    """
+    store = _metrics_store()
+    registry = get_workspace_registry()
+
+    workspaces = []
+    if platform in ("all", "instantly"):
+        workspaces += [("instantly", ws) for ws in registry.get_instantly_workspaces(sheet_url)]
+    if platform in ("all", "bison"):
+        workspaces += [("bison", ws) for ws in registry.get_bison_workspaces(sheet_url)]
+
+    keys = [(name, workspace_key(ws["api_key"])) for name, ws in workspaces]
+    movers = store.movers(keys, metric)
+    for mover in movers:
+        name, ws = workspaces[mover.pop("index")]
+        mover["client_name"] = ws.get("client_name") or ws.get("workspace_id")
+        mover["platform"] = name
+
+    risers = sorted((m for m in movers if m["change"] > 0), key=lambda m: m["change"], reverse=True)
+    fallers = sorted((m for m in movers if m["change"] < 0), key=lambda m: m["change"])
+    end = date.today() - timedelta(days=1)
+    return {
+        "metric": metric,
+        "current_week": {"start_date": (end - timedelta(days=6)).isoformat(), "end_date": end.isoformat()},
+        "previous_week": {"start_date": (end - timedelta(days=13)).isoformat(), "end_date": (end - timedelta(days=7)).isoformat()},
+        "clients_compared": len(movers),
+        "clients_without_history": len(keys) - len(movers),
+        "risers": risers[:limit],
+        "fallers": fallers[:limit]
+    }
+
+
 # Test the functions
 if __name__ == "__main__":
     print("TESTING MCP FUNCTIONS")
@@ -1465,6 +1359,11 @@ INSTANTLY_WORKSPACE_URL = "https://api.instantly.ai/api/v2/workspaces/current"
 EMAIL_BISON_ACCOUNTS_URL = "https://send.leadgenjay.com/api/sender-emails"
 EMAIL_BISON_REPLIES_URL = "https://send.leadgenjay.com/api/sender-emails/{sender_id}/replies"
 
+# Bison list endpoints return 15 records per page; pages after the first are
+# fetched in parallel, and a failed page is retried on its own
+BISON_PAGE_CONCURRENCY = 5
+BISON_PAGE_RETRIES = 2
+
 
 def _fetch_workspace_info(api_key: str) -> Dict[str, str]:
     """
@@ -1479,7 +1378,7 @@ def _fetch_workspace_info(api_key: str) -> Dict[str, str]:
     headers = {"Authorization": f"Bearer {api_key}"}
 
     try:
-        resp = requests.get(INSTANTLY_WORKSPACE_URL, headers=headers, timeout=30)
+        resp = http_pool.get(INSTANTLY_WORKSPACE_URL, headers=headers, timeout=30)
         if not resp.ok:
             logger.warning(f"Error fetching workspace info: {resp.status_code}")
             resp.raise_for_status()
@@ -1515,7 +1414,7 @@ def _fetch_instantly_accounts(api_key: str, limit: int = 100) -> List[Dict[str,
             if starting_after:
                 params["starting_after"] = starting_after
 
-            resp = requests.get(
+            resp = http_pool.get(
                 INSTANTLY_ACCOUNTS_URL,
                 headers=headers,
                 params=params,
@@ -1543,6 +1442,88 @@ def _fetch_instantly_accounts(api_key: str, limit: int = 100) -> List[Dict[str,
         return []
 
 
+async def _fetch_bison_page(
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Any],
+    page: int
+) -> Dict[str, Any]:
+    """Fetch one page of a Bison list endpoint and return its JSON body."""
+    resp = await http_pool.get_async(url, headers=headers, params={**params, "page": page}, timeout=30)
+    if not resp.ok:
+        logger.warning(f"Error fetching {url} page {page}: {resp.status_code}")
+        resp.raise_for_status()
+    return resp.json()
+
+
+async def _fetch_bison_pages(
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Any],
+    max_results: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every page of a Bison list endpoint (15 records per page).
+
+    The first page's meta.last_page tells how many pages there are; the rest
+    are fetched concurrently, at most BISON_PAGE_CONCURRENCY at a time on top
+    of the pool's per-host limit. Pages that fail are retried one by one up to
+    BISON_PAGE_RETRIES times. Records are returned in page order, stopping at
+    the first empty page.
+
+    Args:
+        url: Endpoint URL
+        headers: Request headers
+        params: Query parameters (without page)
+        max_results: Stop after this many records (optional)
+
+    Returns:
+        List of records
+
+    Raises:
+        requests.exceptions.RequestException: If a page still fails after retries
+    """
+    first = await _fetch_bison_page(url, headers, params, 1)
+    pages = {1: first.get("data", [])}
+
+    meta = first.get("meta", {})
+    last_page = meta.get("last_page", 1) if pages[1] else 1
+    if max_results:
+        last_page = min(last_page, -(-max_results // params.get("per_page", 15)))
+
+    semaphore = asyncio.Semaphore(BISON_PAGE_CONCURRENCY)
+
+    async def fetch(page):
+        async with semaphore:
+            return await _fetch_bison_page(url, headers, params, page)
+
+    remaining = list(range(2, last_page + 1))
+    results = await asyncio.gather(*(fetch(page) for page in remaining), return_exceptions=True)
+
+    for page, result in zip(remaining, results):
+        attempt = 0
+        while isinstance(result, Exception):
+            if attempt >= BISON_PAGE_RETRIES:
+                raise result
+            attempt += 1
+            logger.info(f"Retrying {url} page {page} ({result})")
+            try:
+                result = await _fetch_bison_page(url, headers, params, page)
+            except Exception as e:
+                result = e
+        pages[page] = result.get("data", [])
+
+    records = []
+    for page in range(1, last_page + 1):
+        if not pages[page]:
+            break
+        records.extend(pages[page])
+
+    if max_results:
+        records = records[:max_results]
+    return records
+
+
 def _fetch_emailbison_accounts(api_key: str, per_page: int = 15) -> List[Dict[str, Any]]:
     """
     Fetch ALL sender emails from LeadGenJay API with pagination.
@@ -1555,47 +1536,10 @@ def _fetch_emailbison_accounts(api_key: str, per_page: int = 15) -> List[Dict[st
         List of all sender email dictionaries
     """
     headers = {"Authorization": f"Bearer {api_key}"}
-    all_accounts = []
-    page = 1
+    params = {"per_page": min(per_page, 15)}  # Bison max is 15
 
     try:
-        while True:
-            params = {
-                "page": page,
-                "per_page": min(per_page, 15)  # Bison max is 15
-            }
-
-            resp = requests.get(
-                EMAIL_BISON_ACCOUNTS_URL,
-                headers=headers,
-                params=params,
-                timeout=30
-            )
-
-            if not resp.ok:
-                logger.warning(f"Error fetching LeadGenJay sender emails: {resp.status_code}")
-                resp.raise_for_status()
-
-            data = resp.json()
-            accounts = data.get("data", [])
-
-            if not accounts:
-                # No more results
-                break
-
-            all_accounts.extend(accounts)
-            logger.info(f"Fetched page {page} with {len(accounts)} sender emails")
-
-            # Check if there are more pages
-            meta = data.get("meta", {})
-            current_page = meta.get("current_page", page)
-            last_page = meta.get("last_page", page)
-
-            if current_page >= last_page:
-                break
-
-            page += 1
-
+        all_accounts = http_pool.run(_fetch_bison_pages(EMAIL_BISON_ACCOUNTS_URL, headers, params))
         logger.info(f"Fetched total of {len(all_accounts)} LeadGenJay sender emails")
         return all_accounts
 
@@ -1631,9 +1575,6 @@ def _fetch_emailbison_sender_replies(
     headers = {"Authorization": f"Bearer {api_key}"}
     url = EMAIL_BISON_REPLIES_URL.format(sender_id=sender_id)
 
-    all_replies = []
-    page = 1
-
     # Build base query parameters
     params = {"per_page": min(per_page, 15)}  # Bison max is 15
     if search:
@@ -1644,41 +1585,7 @@ def _fetch_emailbison_sender_replies(
         params["status"] = status
 
     try:
-        while True:
-            # Add page number
-            params["page"] = page
-
-            resp = requests.get(url, headers=headers, params=params, timeout=30)
-
-            if not resp.ok:
-                logger.warning(f"Error fetching sender replies: {resp.status_code}")
-                resp.raise_for_status()
-
-            data = resp.json()
-            replies = data.get("data", [])
-
-            if not replies:
-                # No more results
-                break
-
-            all_replies.extend(replies)
-            logger.info(f"Fetched page {page} with {len(replies)} replies for sender {sender_id}")
-
-            # Check if we've reached max_results
-            if max_results and len(all_replies) >= max_results:
-                all_replies = all_replies[:max_results]
-                break
-
-            # Check if there are more pages
-            meta = data.get("meta", {})
-            current_page = meta.get("current_page", page)
-            last_page = meta.get("last_page", page)
-
-            if current_page >= last_page:
-                break
-
-            page += 1
-
+        all_replies = http_pool.run(_fetch_bison_pages(url, headers, params, max_results=max_results))
         logger.info(f"Fetched total of {len(all_replies)} replies for sender {sender_id}")
         return all_replies
 
@@ -1704,11 +1611,8 @@ def get_instantly_mailboxes(
         Dictionary with mailbox data and health status
     """
     try:
-        # Load clients
-        workspaces = load_workspaces_from_sheet(sheet_url, gid=instantly_gid)
-
         # Find the workspace
-        workspace = next((ws for ws in workspaces if ws['workspace_id'] == workspace_id), None)
+        workspace = get_workspace_registry().get_instantly_resolver(sheet_url, gid=instantly_gid).resolve(workspace_id)
         if not workspace:
             raise ValueError(f"Workspace {workspace_id} not found")
 
@@ -1806,11 +1710,8 @@ def get_bison_mailboxes(
         Dictionary with mailbox data and health status
     """
     try:
-        # Load clients
-        workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=bison_gid)
-
         # Find the client
-        workspace = next((ws for ws in workspaces if ws['client_name'].lower() == client_name.lower()), None)
+        workspace = get_workspace_registry().get_bison_resolver(sheet_url, gid=bison_gid).resolve(client_name)
         if not workspace:
             raise ValueError(f"Client {client_name} not found")
 
@@ -1904,11 +1805,8 @@ def get_bison_sender_replies(
         Dictionary with reply data for sender email(s)
     """
     try:
-        # Load clients
-        workspaces = load_bison_workspaces_from_sheet(sheet_url, gid=bison_gid)
-
         # Find the client
-        workspace = next((ws for ws in workspaces if ws['client_name'].lower() == client_name.lower()), None)
+        workspace = get_workspace_registry().get_bison_resolver(sheet_url, gid=bison_gid).resolve(client_name)
         if not workspace:
             raise ValueError(f"Client {client_name} not found")
 
@@ -2005,136 +1903,126 @@ def get_bison_sender_replies(
         raise
 
 
-def get_all_mailbox_health(
+def _fetch_client_mailboxes(
+    clients: List[Dict[str, Any]],
     sheet_url: str,
     instantly_gid: str,
     bison_gid: str
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
-    Get aggregated mailbox health across all clients and platforms.
-    Uses parallel processing to fetch mailboxes from multiple clients simultaneously.
+    Fetch every client's mailboxes concurrently (one accounts fetch per client).
+
+    Each finished client is reported to the caller's progress reporter.
 
     Args:
+        clients: Client records from get_all_clients
         sheet_url: Google Sheets URL
         instantly_gid: Instantly sheet GID
         bison_gid: Bison sheet GID
 
     Returns:
-        Dictionary with aggregated mailbox health data
+        [{"client_name", "platform", "mailboxes"}, ...] in sheet order, failed clients omitted
     """
-    try:
-        # Get all clients
-        all_clients = get_all_clients(sheet_url)
+    # Helper function to process a single client
+    def process_client_mailboxes(client):
+        """Fetch and process mailboxes for a single client."""
+        try:
+            if client['platform'] == 'instantly':
+                mailboxes = get_instantly_mailboxes(
+                    sheet_url, instantly_gid,
+                    client['workspace_id']
+                )
+            elif client['platform'] == 'bison':
+                mailboxes = get_bison_mailboxes(
+                    sheet_url, bison_gid,
+                    client['client_name']
+                )
+            else:
+                return None
 
-        total_accounts = 0
-        total_healthy = 0
-        total_at_risk = 0
-        total_early = 0
+            # Return mailboxes with client info
+            return {
+                'client_name': client.get('client_name') or client.get('workspace_name'),
+                'platform': client['platform'],
+                'mailboxes': mailboxes
+            }
 
-        instantly_totals = {"accounts": 0, "healthy": 0, "at_risk": 0, "early": 0}
-        bison_totals = {"accounts": 0, "healthy": 0, "at_risk": 0}
+        except Exception as e:
+            logger.warning(f"Error getting mailboxes for {client}: {e}")
+            return None
 
-        client_summaries = []
+    if not clients:
+        return []
 
-        # Helper function to process a single client
-        def process_client_mailboxes(client):
-            """Fetch and process mailboxes for a single client."""
-            try:
-                if client['platform'] == 'instantly':
-                    mailboxes = get_instantly_mailboxes(
-                        sheet_url, instantly_gid,
-                        client['workspace_id']
-                    )
-                elif client['platform'] == 'bison':
-                    mailboxes = get_bison_mailboxes(
-                        sheet_url, bison_gid,
-                        client['client_name']
-                    )
-                else:
-                    return None
-
-                # Return mailboxes with client info
-                return {
-                    'client_name': client.get('client_name') or client.get('workspace_name'),
-                    'platform': client['platform'],
-                    'mailboxes': mailboxes
-                }
+    # Use ThreadPoolExecutor for parallel fetching (up to 20 workers)
+    max_workers = min(20, len(clients))
+    logger.info(f"Fetching mailboxes for {len(clients)} clients with {max_workers} parallel workers")
 
-            except Exception as e:
-                logger.warning(f"Error getting mailboxes for {client}: {e}")
-                return None
+    results = [None] * len(clients)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit all fetch tasks
+        future_to_index = {
+            executor.submit(process_client_mailboxes, client): index
+            for index, client in enumerate(clients)
+        }
 
-        # Use ThreadPoolExecutor for parallel fetching (up to 20 workers)
-        max_workers = min(20, len(all_clients['clients']))
-        logger.info(f"Fetching mailboxes for {len(all_clients['clients'])} clients with {max_workers} parallel workers")
+        # Collect results as they complete, streaming each client to the caller
+        counter = progress.progress_counter(len(future_to_index))
+        for future in as_completed(future_to_index):
+            result = future.result()
+            results[future_to_index[future]] = result
+            if result is None:
+                counter.advance()
+            else:
+                counter.advance(message=result['client_name'], partial=client_summary(result))
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all fetch tasks
-            future_to_client = {
-                executor.submit(process_client_mailboxes, client): client
-                for client in all_clients['clients']
-            }
+    fetched = [result for result in results if result is not None]
+    logger.info(f"Processed mailboxes for {len(fetched)} clients successfully")
+    return fetched
 
-            # Collect results as they complete
-            for future in as_completed(future_to_client):
-                try:
-                    result = future.result()
-                    if result is None:
-                        continue
-
-                    mailboxes = result['mailboxes']
-                    platform = result['platform']
-
-                    # Update platform-specific totals
-                    if platform == 'instantly':
-                        instantly_totals['accounts'] += mailboxes['total_accounts']
-                        instantly_totals['healthy'] += mailboxes['healthy_count']
-                        instantly_totals['at_risk'] += mailboxes['at_risk_count']
-                        instantly_totals['early'] += mailboxes['early_count']
-
-                        total_accounts += mailboxes['total_accounts']
-                        total_healthy += mailboxes['healthy_count']
-                        total_at_risk += mailboxes['at_risk_count']
-                        total_early += mailboxes['early_count']
-
-                    elif platform == 'bison':
-                        bison_totals['accounts'] += mailboxes['total_accounts']
-                        bison_totals['healthy'] += mailboxes['healthy_count']
-                        bison_totals['at_risk'] += mailboxes['at_risk_count']
-
-                        total_accounts += mailboxes['total_accounts']
-                        total_healthy += mailboxes['healthy_count']
-                        total_at_risk += mailboxes['at_risk_count']
-
-                    # Add to summaries
-                    client_summaries.append({
-                        'client_name': result['client_name'],
-                        'platform': platform,
-                        'total_accounts': mailboxes['total_accounts'],
-                        'healthy': mailboxes['healthy_count'],
-                        'at_risk': mailboxes['at_risk_count'],
-                        'early': mailboxes.get('early_count', 0)
-                    })
 
-                except Exception as e:
-                    client = future_to_client[future]
-                    logger.error(f"Error processing mailboxes for client {client}: {e}")
+def _mailbox_snapshot(sheet_url: str, instantly_gid: str, bison_gid: str) -> MailboxSnapshot:
+    """
+    Get every client's mailboxes from the shared snapshot engine.
+
+    Args:
+        sheet_url: Google Sheets URL
+        instantly_gid: Instantly sheet GID
+        bison_gid: Bison sheet GID
+
+    Returns:
+        MailboxSnapshot (fetched concurrently if missing or stale)
+    """
+    clients = get_all_clients(sheet_url)['clients']
+
+    def fetch(records):
+        return _fetch_client_mailboxes(records, sheet_url, instantly_gid, bison_gid)
+
+    return get_mailbox_snapshot_engine().get(sheet_url, instantly_gid, bison_gid, clients, fetch)
+
 
-        logger.info(f"Processed mailboxes for {len(client_summaries)} clients successfully")
+def get_all_mailbox_health(
+    sheet_url: str,
+    instantly_gid: str,
+    bison_gid: str
+) -> Dict[str, Any]:
+    """
+    Get aggregated mailbox health across all clients and platforms.
+    Served from the shared mailbox snapshot (one concurrent accounts fetch per client).
 
-        # Calculate health percentage
-        health_percentage = round((total_healthy / total_accounts * 100), 2) if total_accounts > 0 else 0
+    Args:
+        sheet_url: Google Sheets URL
+        instantly_gid: Instantly sheet GID
+        bison_gid: Bison sheet GID
 
+    Returns:
+        Dictionary with aggregated mailbox health data
+    """
+    try:
+        snapshot = _mailbox_snapshot(sheet_url, instantly_gid, bison_gid)
         return {
-            'total_accounts': total_accounts,
-            'healthy_count': total_healthy,
-            'at_risk_count': total_at_risk,
-            'early_count': total_early,
-            'health_percentage': health_percentage,
-            'instantly_totals': instantly_totals,
-            'bison_totals': bison_totals,
-            'client_summaries': client_summaries,
-            'total_clients': all_clients['total_clients']
+            **snapshot.health_summary(),
+            'data_as_of': snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
         }
 
     except Exception as e:
@@ -2149,7 +2037,7 @@ def get_unhealthy_mailboxes(
 ) -> Dict[str, Any]:
     """
     Get all unhealthy (at_risk) mailboxes across all platforms.
-    Uses parallel processing to check mailboxes from multiple clients simultaneously.
+    Served from the shared mailbox snapshot.
 
     Args:
         sheet_url: Google Sheets URL
@@ -2160,75 +2048,44 @@ def get_unhealthy_mailboxes(
         Dictionary with unhealthy mailboxes needing attention
     """
     try:
-        # Get all clients
-        all_clients = get_all_clients(sheet_url)
+        snapshot = _mailbox_snapshot(sheet_url, instantly_gid, bison_gid)
+        result = snapshot.unhealthy()
+        logger.info(f"Found {result['count']} unhealthy mailboxes across all platforms")
 
-        unhealthy_mailboxes = []
-
-        # Helper function to process a single client
-        def process_client_unhealthy(client):
-            """Check for unhealthy mailboxes for a single client."""
-            try:
-                if client['platform'] == 'instantly':
-                    mailboxes = get_instantly_mailboxes(
-                        sheet_url, instantly_gid,
-                        client['workspace_id']
-                    )
-                elif client['platform'] == 'bison':
-                    mailboxes = get_bison_mailboxes(
-                        sheet_url, bison_gid,
-                        client['client_name']
-                    )
-                else:
-                    return []
-
-                # Filter for unhealthy accounts
-                client_unhealthy = []
-                for account in mailboxes['accounts']:
-                    if account['health'] == 'at_risk':
-                        client_unhealthy.append({
-                            'client_name': client.get('client_name') or client.get('workspace_name'),
-                            'platform': client['platform'],
-                            'email': account['email'],
-                            'status': account['status'],
-                            'daily_limit': account.get('daily_limit', 0),
-                            'issue': account.get('status')
-                        })
-
-                return client_unhealthy
-
-            except Exception as e:
-                logger.warning(f"Error checking mailboxes for {client}: {e}")
-                return []
-
-        # Use ThreadPoolExecutor for parallel fetching (up to 20 workers)
-        max_workers = min(20, len(all_clients['clients']))
-        logger.info(f"Checking mailboxes for {len(all_clients['clients'])} clients with {max_workers} parallel workers")
+        return {
+            **result,
+            'data_as_of': snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
+        }
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all fetch tasks
-            future_to_client = {
-                executor.submit(process_client_unhealthy, client): client
-                for client in all_clients['clients']
-            }
+    except Exception as e:
+        logger.error(f"Error getting unhealthy mailboxes: {e}")
+        raise
 
-            # Collect results as they complete
-            for future in as_completed(future_to_client):
-                try:
-                    client_unhealthy = future.result()
-                    unhealthy_mailboxes.extend(client_unhealthy)
 
-                except Exception as e:
-                    client = future_to_client[future]
-                    logger.error(f"Error processing client {client}: {e}")
+def get_mailbox_capacity(
+    sheet_url: str,
+    instantly_gid: str,
+    bison_gid: str
+) -> Dict[str, Any]:
+    """
+    Get total daily sending capacity across all connected mailboxes.
+    Served from the shared mailbox snapshot.
 
-        logger.info(f"Found {len(unhealthy_mailboxes)} unhealthy mailboxes across all platforms")
+    Args:
+        sheet_url: Google Sheets URL
+        instantly_gid: Instantly sheet GID
+        bison_gid: Bison sheet GID
 
+    Returns:
+        Dictionary with total, healthy-only and per-platform daily capacity
+    """
+    try:
+        snapshot = _mailbox_snapshot(sheet_url, instantly_gid, bison_gid)
         return {
-            'count': len(unhealthy_mailboxes),
-            'mailboxes': unhealthy_mailboxes
+            **snapshot.capacity(),
+            'data_as_of': snapshot.taken_at.strftime("%Y-%m-%d %H:%M:%S")
         }
 
     except Exception as e:
-        logger.error(f"Error getting unhealthy mailboxes: {e}")
+        logger.error(f"Error getting mailbox capacity: {e}")
         raise
@@ -0,0 +1,306 @@
+"""
+Process-wide Anthropic client manager with request and token budgets.
+
+Reply analysis used to build a new Anthropic client for every reply, so no
+connection was ever reused. Its only throttle was the 20 worker threads in
+categorize_leads, unrelated to the account's rate limits. The manager keeps
+one client (and so one keep-alive connection pool) per API key and endpoint.
+Every request goes through a shared budget of requests, input tokens and
+output tokens per minute.
+
+Each budget is a token bucket refilled continuously at its per-minute rate.
+Before a request is sent its input tokens are estimated from the prompt
+length and its output tokens are charged at max_tokens. The actual usage
+reported in the response then settles the difference. Interactive callers
+(a single reply analysed for a tool call) go ahead of bulk callers
+(categorize_leads over a whole window): while an interactive request is
+waiting, no bulk request is admitted.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Tuple
+
+from anthropic import Anthropic
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+# Per-minute limits (override with LEAD_CLAUDE_RPM / LEAD_CLAUDE_INPUT_TPM / LEAD_CLAUDE_OUTPUT_TPM)
+DEFAULT_RPM = 4000
+DEFAULT_INPUT_TPM = 400000
+DEFAULT_OUTPUT_TPM = 80000
+
+# Rough characters per token, for estimating a prompt's input tokens before sending it
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the tokens in a text from its length."""
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+class TokenBucket:
+    """Capacity refilled continuously at a per-minute rate. Not thread-safe."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until amount is available (0 if it is now)."""
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate) if self.rate > 0 else 0.0
+
+
+class LLMBudget:
+    """Requests, input tokens and output tokens per minute, with interactive priority."""
+
+    def __init__(self, rpm: float, input_tpm: float, output_tpm: float):
+        """
+        Args:
+            rpm: Requests per minute
+            input_tpm: Input tokens per minute
+            output_tpm: Output tokens per minute
+        """
+        self.buckets = {
+            "requests": TokenBucket(rpm),
+            "input_tokens": TokenBucket(input_tpm),
+            "output_tokens": TokenBucket(output_tpm)
+        }
+        self.waiting = {priority: 0 for priority in PRIORITIES}
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self._cond = threading.Condition()
+
+    def _wait_time(self, costs: Dict[str, float]) -> float:
+        now = time.monotonic()
+        for bucket in self.buckets.values():
+            bucket.refill(now)
+        return max(self.buckets[name].wait_for(amount) for name, amount in costs.items())
+
+    def acquire(self, costs: Dict[str, float], priority: str = INTERACTIVE) -> float:
+        """
+        Block until the request fits the budget, then charge it.
+
+        Args:
+            costs: {"requests": 1, "input_tokens": n, "output_tokens": n}
+            priority: INTERACTIVE or BULK
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._cond:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    blocked = priority == BULK and self.waiting[INTERACTIVE] > 0
+                    wait = self._wait_time(costs)
+                    if not blocked and wait <= 0:
+                        break
+                    # Re-check at least every second; settle() and interactive admissions notify
+                    self._cond.wait(timeout=min(wait, 1.0) if wait > 0 else 1.0)
+                for name, amount in costs.items():
+                    bucket = self.buckets[name]
+                    bucket.tokens -= min(amount, bucket.capacity)
+            finally:
+                self.waiting[priority] -= 1
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            if waited > 0.001:
+                self.throttled += 1
+                self.wait_seconds += waited
+            return waited
+
+    def settle(self, charged: Dict[str, float], actual: Dict[str, float]):
+        """
+        Correct a charge with the usage the response reported.
+
+        Args:
+            charged: Amounts charged by acquire
+            actual: Amounts actually used (same keys)
+        """
+        with self._cond:
+            for name, amount in actual.items():
+                bucket = self.buckets[name]
+                bucket.tokens = min(bucket.capacity, bucket.tokens + min(charged[name], bucket.capacity) - amount)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get budget metrics.
+
+        Returns:
+            Per-minute limits, currently available amounts, waiting callers and throttling totals
+        """
+        with self._cond:
+            self._wait_time({"requests": 0})
+            return {
+                "limits_per_minute": {name: bucket.capacity for name, bucket in self.buckets.items()},
+                "available": {name: round(bucket.tokens, 1) for name, bucket in self.buckets.items()},
+                "waiting": dict(self.waiting),
+                "throttled": self.throttled,
+                "avg_wait_ms": round(self.wait_seconds / self.throttled * 1000, 1) if self.throttled else 0.0
+            }
+
+
+class LLMClientManager:
+    """Pooled Anthropic clients sharing one request/token budget."""
+
+    def __init__(
+        self,
+        rpm: float = DEFAULT_RPM,
+        input_tpm: float = DEFAULT_INPUT_TPM,
+        output_tpm: float = DEFAULT_OUTPUT_TPM,
+        client_factory: Callable[..., Any] = Anthropic
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            rpm: Requests per minute
+            input_tpm: Input tokens per minute
+            output_tpm: Output tokens per minute
+            client_factory: Builds a client from api_key (and base_url, when set)
+        """
+        self.budget = LLMBudget(rpm, input_tpm, output_tpm)
+        self._client_factory = client_factory
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._lock = threading.Lock()
+        self.requests = {priority: 0 for priority in PRIORITIES}
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def client(self, api_key: str) -> Any:
+        """
+        Get the shared client for an API key (and the configured ANTHROPIC_BASE_URL).
+
+        Args:
+            api_key: Anthropic API key
+
+        Returns:
+            Anthropic client
+        """
+        base_url = os.getenv("ANTHROPIC_BASE_URL") or None
+        key = (api_key, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                kwargs = {"api_key": api_key}
+                if base_url:
+                    kwargs["base_url"] = base_url
+                client = self._clients[key] = self._client_factory(**kwargs)
+            return client
+
+    def create_message(
+        self,
+        api_key: str,
+        prompt: str,
+        max_tokens: int,
+        priority: str = INTERACTIVE,
+        **params
+    ) -> Any:
+        """
+        Send one user prompt within the budget.
+
+        Args:
+            api_key: Anthropic API key
+            prompt: User message
+            max_tokens: Output token limit (charged up front, settled from usage)
+            priority: INTERACTIVE or BULK
+            **params: Extra messages.create arguments (model, extra_body, ...)
+
+        Returns:
+            The SDK's Message response
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Use one of: {', '.join(PRIORITIES)}")
+
+        charged = {"requests": 1, "input_tokens": estimate_tokens(prompt), "output_tokens": max_tokens}
+        self.budget.acquire(charged, priority)
+        client = self.client(api_key)
+        try:
+            response = client.messages.create(
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                **params
+            )
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", None)
+        output_tokens = getattr(usage, "output_tokens", None)
+        actual = {}
+        if isinstance(input_tokens, int):
+            actual["input_tokens"] = input_tokens
+        if isinstance(output_tokens, int):
+            actual["output_tokens"] = output_tokens
+        if actual:
+            self.budget.settle(charged, actual)
+
+        with self._lock:
+            self.requests[priority] += 1
+            self.input_tokens += actual.get("input_tokens", charged["input_tokens"])
+            self.output_tokens += actual.get("output_tokens", 0)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get manager statistics.
+
+        Returns:
+            Dictionary with pooled clients, requests by priority, token totals,
+            errors and budget metrics
+        """
+        with self._lock:
+            counters = {
+                "clients": len(self._clients),
+                "requests": dict(self.requests),
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "errors": self.errors
+            }
+        return {**counters, "budget": self.budget.stats()}
+
+
+_manager: Optional[LLMClientManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_llm_manager() -> LLMClientManager:
+    """
+    Get the process-wide LLM client manager, creating it on first use.
+
+    Budgets are configured via LEAD_CLAUDE_RPM, LEAD_CLAUDE_INPUT_TPM and
+    LEAD_CLAUDE_OUTPUT_TPM (per minute; set them to the account's limits).
+
+    Returns:
+        Shared LLMClientManager
+    """
+    global _manager
+
+    with _manager_lock:
+        if _manager is None:
+            _manager = LLMClientManager(
+                rpm=float(os.getenv("LEAD_CLAUDE_RPM", str(DEFAULT_RPM))),
+                input_tpm=float(os.getenv("LEAD_CLAUDE_INPUT_TPM", str(DEFAULT_INPUT_TPM))),
+                output_tpm=float(os.getenv("LEAD_CLAUDE_OUTPUT_TPM", str(DEFAULT_OUTPUT_TPM)))
+            )
+        return _manager
@@ -0,0 +1,286 @@
+"""
+Shared mailbox snapshot for the mailbox health, alert and capacity tools.
+
+get_all_mailbox_health_summary, get_unhealthy_mailboxes_alert and
+get_mailbox_capacity_report all need every connected account of every
+client. The engine fetches each client's accounts once, concurrently, and
+keeps the mailbox-level data (daily_limit, health, warmup) with its
+timestamp. Health totals, at-risk alerts and capacity are in-memory queries
+over the snapshot, so the three tools cost one fan-out between them.
+Concurrent callers share the in-flight build.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is served before it is rebuilt (override with LEAD_MAILBOX_SNAPSHOT_TTL)
+DEFAULT_TTL_SECONDS = 300
+
+SnapshotKey = Tuple[str, str, str, str]
+
+
+def clients_fingerprint(clients: List[Dict[str, Any]]) -> str:
+    """
+    Hash a client list so snapshots follow changes to the sheet.
+
+    Args:
+        clients: Client records from get_all_clients (client_name, platform, workspace_id)
+
+    Returns:
+        16-hex-character digest
+    """
+    digest = hashlib.sha256()
+    for client in clients:
+        digest.update(
+            f"{client.get('platform', '')}\t{client.get('client_name', '')}\t{client.get('workspace_id', '')}\n".encode("utf-8")
+        )
+    return digest.hexdigest()[:16]
+
+
+def client_summary(client: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize one client's mailboxes.
+
+    Args:
+        client: Snapshot entry ({"client_name", "platform", "mailboxes"})
+
+    Returns:
+        Per-client health counts as reported by get_all_mailbox_health
+    """
+    mailboxes = client["mailboxes"]
+    return {
+        "client_name": client["client_name"],
+        "platform": client["platform"],
+        "total_accounts": mailboxes["total_accounts"],
+        "healthy": mailboxes["healthy_count"],
+        "at_risk": mailboxes["at_risk_count"],
+        "early": mailboxes.get("early_count", 0)
+    }
+
+
+class MailboxSnapshot:
+    """Every client's mailboxes, taken at one point in time."""
+
+    def __init__(self, clients: List[Dict[str, Any]], total_clients: int):
+        """
+        Initialize a snapshot.
+
+        Args:
+            clients: [{"client_name", "platform", "mailboxes"}, ...] in sheet order,
+                where mailboxes is get_instantly_mailboxes / get_bison_mailboxes output;
+                failed clients omitted
+            total_clients: Number of clients in the sheet (including failed ones)
+        """
+        self.clients = clients
+        self.total_clients = total_clients
+        self.taken_at = datetime.now()
+        self.created = time.monotonic()
+
+    def _accounts(self):
+        for client in self.clients:
+            for account in client["mailboxes"]["accounts"]:
+                yield client, account
+
+    def health_summary(self) -> Dict[str, Any]:
+        """
+        Aggregate health counts across all clients and platforms.
+
+        Returns:
+            Health totals, per-platform totals and per-client summaries
+        """
+        totals = {
+            "instantly": {"accounts": 0, "healthy": 0, "at_risk": 0, "early": 0},
+            "bison": {"accounts": 0, "healthy": 0, "at_risk": 0}
+        }
+        for client in self.clients:
+            mailboxes = client["mailboxes"]
+            platform_totals = totals[client["platform"]]
+            platform_totals["accounts"] += mailboxes["total_accounts"]
+            platform_totals["healthy"] += mailboxes["healthy_count"]
+            platform_totals["at_risk"] += mailboxes["at_risk_count"]
+            if "early" in platform_totals:
+                platform_totals["early"] += mailboxes.get("early_count", 0)
+
+        total_accounts = sum(t["accounts"] for t in totals.values())
+        total_healthy = sum(t["healthy"] for t in totals.values())
+        return {
+            "total_accounts": total_accounts,
+            "healthy_count": total_healthy,
+            "at_risk_count": sum(t["at_risk"] for t in totals.values()),
+            "early_count": totals["instantly"]["early"],
+            "health_percentage": round((total_healthy / total_accounts * 100), 2) if total_accounts > 0 else 0,
+            "instantly_totals": totals["instantly"],
+            "bison_totals": totals["bison"],
+            "client_summaries": [client_summary(client) for client in self.clients],
+            "total_clients": self.total_clients
+        }
+
+    def unhealthy(self) -> Dict[str, Any]:
+        """
+        At-risk mailboxes across all clients.
+
+        Returns:
+            {"count": int, "mailboxes": [{"client_name", "platform", "email", "status", "daily_limit", "issue"}, ...]}
+        """
+        mailboxes = [
+            {
+                "client_name": client["client_name"],
+                "platform": client["platform"],
+                "email": account["email"],
+                "status": account["status"],
+                "daily_limit": account.get("daily_limit", 0),
+                "issue": account.get("status")
+            }
+            for client, account in self._accounts()
+            if account["health"] == "at_risk"
+        ]
+        return {"count": len(mailboxes), "mailboxes": mailboxes}
+
+    def capacity(self) -> Dict[str, Any]:
+        """
+        Daily sending capacity from the mailboxes' daily limits.
+
+        Returns:
+            Total, healthy-only and per-platform capacity with account counts
+        """
+        capacity = {"instantly": 0, "bison": 0}
+        healthy_capacity = 0
+        total_accounts = 0
+        healthy_accounts = 0
+        for client, account in self._accounts():
+            limit = account.get("daily_limit", 0) or 0
+            capacity[client["platform"]] += limit
+            total_accounts += 1
+            if account.get("health") == "healthy":
+                healthy_capacity += limit
+                healthy_accounts += 1
+
+        total_capacity = capacity["instantly"] + capacity["bison"]
+        return {
+            "total_daily_capacity": total_capacity,
+            "healthy_daily_capacity": healthy_capacity,
+            "instantly_capacity": capacity["instantly"],
+            "bison_capacity": capacity["bison"],
+            "total_accounts": total_accounts,
+            "healthy_accounts": healthy_accounts,
+            "average_capacity_per_account": round(total_capacity / total_accounts, 2) if total_accounts > 0 else 0,
+            "capacity_utilization_percentage": round((healthy_capacity / total_capacity * 100), 2) if total_capacity > 0 else 0
+        }
+
+
+class MailboxSnapshotEngine:
+    """TTL cache of mailbox snapshots keyed by (sheet, gids, client set)."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the engine.
+
+        Args:
+            ttl_seconds: How long a snapshot is served before being rebuilt
+        """
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[SnapshotKey, MailboxSnapshot] = {}
+        self._build_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def _fresh(self, key: SnapshotKey) -> Optional[MailboxSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and time.monotonic() - snapshot.created < self.ttl_seconds:
+            return snapshot
+        return None
+
+    def get(
+        self,
+        sheet_url: str,
+        instantly_gid: str,
+        bison_gid: str,
+        clients: List[Dict[str, Any]],
+        fetch: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+    ) -> MailboxSnapshot:
+        """
+        Get a snapshot of every client's mailboxes, building it if missing or stale.
+
+        Args:
+            sheet_url: Google Sheet URL
+            instantly_gid: Instantly sheet GID
+            bison_gid: Bison sheet GID
+            clients: Client records from get_all_clients
+            fetch: Called with the client records; returns snapshot entries
+                ({"client_name", "platform", "mailboxes"}) for the clients that succeeded
+
+        Returns:
+            MailboxSnapshot
+        """
+        key = (sheet_url or "", instantly_gid or "", bison_gid or "", clients_fingerprint(clients))
+        with self._lock:
+            snapshot = self._fresh(key)
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+
+        # One build at a time; callers arriving mid-build get its result
+        with self._build_lock:
+            with self._lock:
+                snapshot = self._fresh(key)
+                if snapshot is not None:
+                    self.hits += 1
+                    return snapshot
+
+            snapshot = MailboxSnapshot(fetch(clients), total_clients=len(clients))
+            with self._lock:
+                self._snapshots = {k: s for k, s in self._snapshots.items() if self._fresh(k) is not None}
+                self._snapshots[key] = snapshot
+                self.builds += 1
+            logger.info("Built mailbox snapshot for %d clients", len(snapshot.clients))
+            return snapshot
+
+    def clear(self):
+        """Drop every snapshot so the next request fans out again."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with snapshot count, TTL and hit/build counters
+        """
+        with self._lock:
+            return {
+                "snapshots": len(self._snapshots),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "builds": self.builds
+            }
+
+
+_engine: Optional[MailboxSnapshotEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_mailbox_snapshot_engine() -> MailboxSnapshotEngine:
+    """
+    Get the process-wide mailbox snapshot engine, creating it on first use.
+
+    TTL is configured via LEAD_MAILBOX_SNAPSHOT_TTL (seconds, 0 = always rebuild).
+
+    Returns:
+        Shared MailboxSnapshotEngine
+    """
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            ttl = float(os.getenv("LEAD_MAILBOX_SNAPSHOT_TTL", str(DEFAULT_TTL_SECONDS)))
+            _engine = MailboxSnapshotEngine(ttl_seconds=ttl)
+        return _engine
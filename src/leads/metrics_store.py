@@ -0,0 +1,408 @@
+"""
+Local time series of per-client daily campaign metrics (SQLite + NumPy/pandas).
+
+Trend questions ("how has this client's reply rate moved over 8 weeks") used
+to need one stats call per window, and nothing was kept between calls. The
+store keeps one compact row per (platform, workspace, day) with
+emails_sent, replies, interested and opportunities. It is fed by the daily
+stats cache: every one-day bucket a stats request uses is recorded, so the
+portfolio tools and the warm-cache scheduler fill it as a side effect.
+
+Trend queries read a window of rows into a (workspaces x days x metrics)
+array and compute weekly sums, week-over-week deltas and rolling averages
+with vectorized NumPy/pandas, without any upstream call. Days never fetched
+are missing (NaN), not zero, and each result reports its coverage.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Default location (override with LEAD_METRICS_DIR)
+DEFAULT_METRICS_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "metrics"
+
+METRICS = ("emails_sent", "replies", "interested", "opportunities")
+
+# Raw stats field behind each stored metric, per platform. Days are summed into
+# weeks, so replies use Instantly's total reply count rather than its per-range
+# unique count. Bison reports no total, only unique replies per contact, so a
+# Bison week counts a lead once for each day it replied. Bison has no
+# opportunities; its interested count is the equivalent (as in the portfolio tools).
+DAILY_FIELDS = {
+    "instantly": {
+        "emails_sent": "emails_sent_count",
+        "replies": "reply_count",
+        "interested": "total_interested",
+        "opportunities": "total_opportunities"
+    },
+    "bison": {
+        "emails_sent": "emails_sent",
+        "replies": "unique_replies_per_contact",
+        "interested": "interested",
+        "opportunities": "interested"
+    }
+}
+
+# Rates derived from summed counts: rate -> (numerator, denominator), as percentages
+RATES = {
+    "reply_rate": ("replies", "emails_sent"),
+    "interest_rate": ("interested", "emails_sent")
+}
+
+TREND_FIELDS = METRICS + tuple(RATES)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    day TEXT NOT NULL,
+    emails_sent INTEGER NOT NULL,
+    replies INTEGER NOT NULL,
+    interested INTEGER NOT NULL,
+    opportunities INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (platform, workspace, day)
+);
+"""
+
+
+def _count(value: Any) -> int:
+    """Integer value of a count field (Bison sends some counts as strings)."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def extract_metrics(platform: str, stats: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Pick the stored metrics out of one day's raw stats response.
+
+    Args:
+        platform: "instantly" or "bison"
+        stats: Analytics overview (Instantly) or workspace stats response (Bison)
+
+    Returns:
+        {metric: count} for every metric in METRICS
+    """
+    data = stats.get("data", {}) if platform == "bison" else stats
+    return {metric: _count(data.get(field, 0)) for metric, field in DAILY_FIELDS[platform].items()}
+
+
+def _with_rates(values: np.ndarray) -> np.ndarray:
+    """Append RATES columns to a (..., len(METRICS)) count array."""
+    rates = []
+    for numerator, denominator in RATES.values():
+        num = values[..., METRICS.index(numerator)]
+        den = values[..., METRICS.index(denominator)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.where(den > 0, num / den * 100, np.where(np.isnan(den), np.nan, 0.0))
+        rates.append(rate)
+    return np.concatenate([values, np.stack(rates, axis=-1)], axis=-1)
+
+
+def _clean(value: float, digits: int = 2) -> Optional[float]:
+    """JSON-friendly number (NaN becomes None)."""
+    if value is None or np.isnan(value):
+        return None
+    value = round(float(value), digits)
+    return int(value) if value.is_integer() else value
+
+
+def week_windows(end: date, weeks: int) -> List[Dict[str, str]]:
+    """Consecutive 7-day windows ending on `end`, oldest first."""
+    start = end - timedelta(days=weeks * 7 - 1)
+    return [
+        {
+            "week_start": (start + timedelta(days=7 * n)).isoformat(),
+            "week_end": (start + timedelta(days=7 * n + 6)).isoformat()
+        }
+        for n in range(weeks)
+    ]
+
+
+def weekly_sums(daily: np.ndarray, weeks: int) -> tuple:
+    """
+    Sum daily counts into 7-day windows.
+
+    Args:
+        daily: (workspaces, weeks * 7, len(METRICS)) counts, NaN where a day is missing
+
+    Returns:
+        (sums, days_covered): sums is (workspaces, weeks, len(METRICS)) with NaN
+        for weeks without any data; days_covered is (workspaces, weeks)
+    """
+    by_week = daily.reshape(daily.shape[0], weeks, 7, len(METRICS))
+    present = ~np.isnan(by_week[..., 0])
+    sums = np.nansum(by_week, axis=2)
+    covered = present.sum(axis=2)
+    sums[covered == 0] = np.nan
+    return sums, covered
+
+
+def week_over_week(weekly: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Change between the last two weeks for every workspace and field.
+
+    Args:
+        weekly: (workspaces, weeks, len(TREND_FIELDS)) weekly values
+
+    Returns:
+        {"current", "previous", "change", "change_pct"} arrays of shape (workspaces, fields)
+    """
+    current, previous = weekly[:, -1, :], weekly[:, -2, :]
+    change = current - previous
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(previous != 0, change / np.abs(previous) * 100, np.nan)
+    return {"current": current, "previous": previous, "change": change, "change_pct": change_pct}
+
+
+class MetricsStore:
+    """Daily metrics per (platform, workspace, day), with vectorized trend queries."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the metrics database.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def record(self, platform: str, workspace: str, buckets: Dict[str, Dict[str, Any]]):
+        """
+        Store (or overwrite) daily metrics from raw one-day stats responses.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            buckets: {day (YYYY-MM-DD): raw stats for that day}
+        """
+        if not buckets:
+            return
+        now = time.time()
+        rows = []
+        for day, stats in buckets.items():
+            metrics = extract_metrics(platform, stats)
+            rows.append((platform, workspace, day, *(metrics[m] for m in METRICS), now))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_metrics "
+                "(platform, workspace, day, emails_sent, replies, interested, opportunities, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def window(
+        self,
+        keys: Sequence[tuple],
+        start: date,
+        end: date
+    ) -> np.ndarray:
+        """
+        Load daily metrics for several workspaces as one dense array.
+
+        Args:
+            keys: (platform, workspace) pairs
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            (len(keys), days, len(METRICS)) float array, NaN where a day isn't stored
+        """
+        days = pd.date_range(start, end, freq="D").strftime("%Y-%m-%d")
+        if not keys:
+            return np.empty((0, len(days), len(METRICS)))
+
+        platforms = sorted({platform for platform, _ in keys})
+        placeholders = ", ".join("?" for _ in platforms)
+        with self._lock:
+            frame = pd.read_sql_query(
+                f"SELECT platform, workspace, day, {', '.join(METRICS)} FROM daily_metrics "
+                f"WHERE platform IN ({placeholders}) AND day BETWEEN ? AND ?",
+                self._conn,
+                params=[*platforms, start.isoformat(), end.isoformat()]
+            )
+
+        index = pd.MultiIndex.from_tuples(
+            [(platform, workspace, day) for platform, workspace in keys for day in days],
+            names=["platform", "workspace", "day"]
+        )
+        dense = frame.set_index(["platform", "workspace", "day"]).reindex(index)[list(METRICS)]
+        return dense.to_numpy(dtype=float).reshape(len(keys), len(days), len(METRICS))
+
+    def trends(
+        self,
+        platform: str,
+        workspace: str,
+        weeks: int = 8,
+        rolling_weeks: int = 4,
+        end: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Weekly trend, week-over-week change and rolling averages for one workspace.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            weeks: Number of 7-day windows, ending on `end` (minimum 2)
+            rolling_weeks: Window of the rolling average over weekly values
+            end: Last day (default: yesterday, the last complete day)
+
+        Returns:
+            {"weeks": [...], "week_over_week": {...}, "coverage": {...}}
+        """
+        weeks = max(2, weeks)
+        end = end or date.today() - timedelta(days=1)
+        start = end - timedelta(days=weeks * 7 - 1)
+
+        sums, covered = weekly_sums(self.window([(platform, workspace)], start, end), weeks)
+        weekly = _with_rates(sums)[0]
+        table = pd.DataFrame(weekly, columns=TREND_FIELDS)
+        rolling = table.rolling(rolling_weeks, min_periods=1).mean()
+
+        rows = []
+        for n, window in enumerate(week_windows(end, weeks)):
+            row = {**window, "days_with_data": int(covered[0, n])}
+            row.update({field: _clean(table[field].iloc[n]) for field in TREND_FIELDS})
+            row["rolling_avg"] = {field: _clean(rolling[field].iloc[n]) for field in TREND_FIELDS}
+            rows.append(row)
+
+        wow = week_over_week(weekly[np.newaxis])
+        days_with_data = int(covered.sum())
+        return {
+            "weeks": rows,
+            "week_over_week": {
+                field: {
+                    "current": _clean(wow["current"][0, i]),
+                    "previous": _clean(wow["previous"][0, i]),
+                    "change": _clean(wow["change"][0, i]),
+                    "change_pct": _clean(wow["change_pct"][0, i], 1)
+                }
+                for i, field in enumerate(TREND_FIELDS)
+            },
+            "coverage": {
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "days_with_data": days_with_data,
+                "days_total": weeks * 7
+            }
+        }
+
+    def movers(
+        self,
+        keys: Sequence[tuple],
+        metric: str,
+        end: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Week-over-week change of one metric for many workspaces at once.
+
+        Args:
+            keys: (platform, workspace) pairs
+            metric: One of TREND_FIELDS
+            end: Last day of the current week (default: yesterday)
+
+        Returns:
+            [{"index", "current", "previous", "change", "change_pct"}, ...] for workspaces
+            with data in both weeks; index points into keys
+
+        Raises:
+            ValueError: If metric is not a known field
+        """
+        if metric not in TREND_FIELDS:
+            raise ValueError(f"Unknown metric '{metric}'. Use one of: {', '.join(TREND_FIELDS)}")
+        end = end or date.today() - timedelta(days=1)
+        start = end - timedelta(days=13)
+
+        sums, _ = weekly_sums(self.window(keys, start, end), 2)
+        wow = week_over_week(_with_rates(sums))
+        column = TREND_FIELDS.index(metric)
+        current, previous = wow["current"][:, column], wow["previous"][:, column]
+        comparable = np.flatnonzero(~np.isnan(current) & ~np.isnan(previous))
+
+        return [
+            {
+                "index": int(i),
+                "current": _clean(current[i]),
+                "previous": _clean(previous[i]),
+                "change": _clean(wow["change"][i, column]),
+                "change_pct": _clean(wow["change_pct"][i, column], 1)
+            }
+            for i in comparable
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with row/workspace counts, stored day range and database size
+        """
+        with self._lock:
+            rows, workspaces, first, last = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT platform || workspace), MIN(day), MAX(day) FROM daily_metrics"
+            ).fetchone()
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "rows": rows,
+            "workspaces": workspaces,
+            "first_day": first,
+            "last_day": last,
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+_store_failed = False
+
+
+def get_metrics_store() -> Optional[MetricsStore]:
+    """
+    Get the process-wide metrics store, creating it on first use.
+
+    Configured via LEAD_METRICS_DIR; set LEAD_METRICS_ENABLED=false to stop
+    recording daily metrics.
+
+    Returns:
+        Shared MetricsStore, or None if disabled or unavailable
+    """
+    global _store, _store_failed
+
+    if os.getenv("LEAD_METRICS_ENABLED", "true").lower() == "false":
+        return None
+
+    with _store_lock:
+        if _store is None and not _store_failed:
+            metrics_dir = Path(os.path.expanduser(os.getenv("LEAD_METRICS_DIR", str(DEFAULT_METRICS_DIR))))
+            try:
+                _store = MetricsStore(metrics_dir / "metrics.db")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Metrics store disabled, could not open database in %s: %s", metrics_dir, e)
+                _store_failed = True
+        return _store
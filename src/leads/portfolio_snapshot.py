@@ -0,0 +1,333 @@
+"""
+Shared per-client stats snapshots for the cross-client portfolio tools.
+
+get_all_platform_stats, get_top_performing_clients, get_underperforming_clients
+and get_weekly_summary all need campaign stats for every client over the same
+date range. The engine fans out once per (platform, date range, workspace set)
+and keeps the result with its timestamp. Rankings, thresholds and totals are
+in-memory queries over the snapshot, so "top clients" followed by
+"underperformers" costs one fan-out. Concurrent callers for the same key share
+the in-flight build.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is served before it is rebuilt (override with LEAD_PORTFOLIO_SNAPSHOT_TTL)
+DEFAULT_TTL_SECONDS = 300
+
+PLATFORMS = ("instantly", "bison")
+
+SnapshotKey = Tuple[str, str, str, str]
+WorkspaceStats = List[Tuple[Dict[str, str], Dict[str, Any]]]
+
+# Stats field behind each ranking metric, per platform
+METRIC_FIELDS = {
+    "instantly": {
+        "interested_leads": "opportunities",
+        "emails_sent": "emails_sent",
+        "replies": "replies",
+        "reply_rate": "reply_rate"
+    },
+    "bison": {
+        "interested_leads": "interested",
+        "emails_sent": "emails_sent",
+        "replies": "unique_replies_per_contact",
+        "reply_rate": "unique_replies_per_contact_percentage"
+    }
+}
+
+
+def workspaces_fingerprint(workspaces: List[Dict[str, str]]) -> str:
+    """
+    Hash a workspace list so snapshots follow changes to the sheet.
+
+    Args:
+        workspaces: Workspace records (client_name, api_key)
+
+    Returns:
+        16-hex-character digest (API keys are never stored)
+    """
+    digest = hashlib.sha256()
+    for workspace in workspaces:
+        digest.update(f"{workspace.get('client_name', '')}\t{workspace.get('api_key', '')}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _rate(part: int, whole: int) -> float:
+    return round((part / whole * 100), 2) if whole > 0 else 0
+
+
+class PlatformSnapshot:
+    """Per-client stats for one platform and date range, taken at one point in time."""
+
+    def __init__(self, platform: str, start_date: str, end_date: str, results: WorkspaceStats):
+        """
+        Initialize a snapshot.
+
+        Args:
+            platform: "instantly" or "bison"
+            start_date: Range start (YYYY-MM-DD)
+            end_date: Range end (YYYY-MM-DD)
+            results: (workspace, stats) pairs in sheet order, failed clients omitted
+        """
+        self.platform = platform
+        self.start_date = start_date
+        self.end_date = end_date
+        self.results = results
+        self.taken_at = datetime.now()
+        self.created = time.monotonic()
+        self.clients = [self._client(workspace, stats) for workspace, stats in results]
+
+    def _client(self, workspace: Dict[str, str], stats: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "client_name": workspace["client_name"],
+            "platform": self.platform,
+            "metrics": {metric: stats.get(field, 0) for metric, field in METRIC_FIELDS[self.platform].items()},
+            "stats": stats
+        }
+
+    def totals(self) -> Dict[str, Any]:
+        """
+        Sum the platform's clients.
+
+        Returns:
+            Platform breakdown as reported by get_all_platform_stats
+        """
+        emails = sum(client["metrics"]["emails_sent"] for client in self.clients)
+        replies = sum(client["metrics"]["replies"] for client in self.clients)
+        interested = sum(client["metrics"]["interested_leads"] for client in self.clients)
+        return {
+            "clients": len(self.clients),
+            "emails_sent": emails,
+            "replies": replies,
+            "opportunities" if self.platform == "instantly" else "interested": interested,
+            "reply_rate": _rate(replies, emails)
+        }
+
+
+class PortfolioSnapshot:
+    """Both platforms' snapshots for one date range, with ranking queries."""
+
+    def __init__(self, platforms: Dict[str, PlatformSnapshot]):
+        """
+        Initialize the view.
+
+        Args:
+            platforms: {"instantly": PlatformSnapshot, "bison": PlatformSnapshot}
+        """
+        self.platforms = platforms
+        # Instantly clients first, then Bison, each in sheet order
+        self.clients = [client for platform in PLATFORMS for client in platforms[platform].clients]
+
+    @property
+    def taken_at(self) -> datetime:
+        """When the oldest platform snapshot was taken."""
+        return min(snapshot.taken_at for snapshot in self.platforms.values())
+
+    def top(self, metric: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Rank clients by a metric, highest first.
+
+        Args:
+            metric: "interested_leads", "emails_sent", "replies" or "reply_rate"
+            limit: Number of clients to return
+
+        Returns:
+            [{"rank", "client_name", "platform", "metric_value", "stats"}, ...]
+        """
+        ranked = sorted(self.clients, key=lambda client: client["metrics"].get(metric, 0), reverse=True)
+        return [
+            {
+                "rank": rank,
+                "client_name": client["client_name"],
+                "platform": client["platform"],
+                "metric_value": client["metrics"].get(metric, 0),
+                "stats": client["stats"]
+            }
+            for rank, client in enumerate(ranked[:limit], start=1)
+        ]
+
+    def below(self, metric: str, threshold: float) -> List[Dict[str, Any]]:
+        """
+        Clients whose metric is under a threshold, worst first.
+
+        Args:
+            metric: "interested_leads", "emails_sent", "replies" or "reply_rate"
+            threshold: Clients strictly below this value are returned
+
+        Returns:
+            [{"client_name", "platform", "metric_value", "stats"}, ...]
+        """
+        under = [
+            {
+                "client_name": client["client_name"],
+                "platform": client["platform"],
+                "metric_value": client["metrics"].get(metric, 0),
+                "stats": client["stats"]
+            }
+            for client in self.clients
+            if client["metrics"].get(metric, 0) < threshold
+        ]
+        under.sort(key=lambda client: client["metric_value"])
+        return under
+
+    def totals(self) -> Dict[str, Any]:
+        """
+        Portfolio totals and per-platform breakdown.
+
+        Returns:
+            {"total_stats": {...}, "platform_breakdown": {"instantly": {...}, "bison": {...}}}
+        """
+        breakdown = {platform: self.platforms[platform].totals() for platform in PLATFORMS}
+        emails = sum(totals["emails_sent"] for totals in breakdown.values())
+        replies = sum(totals["replies"] for totals in breakdown.values())
+        interested = breakdown["instantly"]["opportunities"] + breakdown["bison"]["interested"]
+        return {
+            "total_stats": {
+                "total_emails_sent": emails,
+                "total_replies": replies,
+                "total_interested_leads": interested,
+                "reply_rate": _rate(replies, emails),
+                "clients_processed": sum(totals["clients"] for totals in breakdown.values())
+            },
+            "platform_breakdown": breakdown
+        }
+
+
+class SnapshotEngine:
+    """TTL cache of platform snapshots keyed by (platform, date range, workspace set)."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the engine.
+
+        Args:
+            ttl_seconds: How long a snapshot is served before being rebuilt
+        """
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[SnapshotKey, PlatformSnapshot] = {}
+        self._locks: Dict[SnapshotKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def _fresh(self, key: SnapshotKey) -> Optional[PlatformSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and time.monotonic() - snapshot.created < self.ttl_seconds:
+            return snapshot
+        return None
+
+    def get(
+        self,
+        start_date: str,
+        end_date: str,
+        workspaces: Dict[str, List[Dict[str, str]]],
+        fetch: Callable[[Dict[str, List[Dict[str, str]]]], Dict[str, WorkspaceStats]]
+    ) -> PortfolioSnapshot:
+        """
+        Get a snapshot of every platform, building missing or stale ones in one fan-out.
+
+        Args:
+            start_date: Range start (YYYY-MM-DD)
+            end_date: Range end (YYYY-MM-DD)
+            workspaces: {platform: workspace records}
+            fetch: Called with {platform: workspaces} for the platforms to build;
+                returns {platform: [(workspace, stats), ...]}
+
+        Returns:
+            PortfolioSnapshot over all platforms in `workspaces`
+        """
+        keys = {
+            platform: (platform, start_date, end_date, workspaces_fingerprint(records))
+            for platform, records in workspaces.items()
+        }
+        with self._lock:
+            # Acquire per-key locks in a fixed order so overlapping requests can't deadlock
+            locks = [self._locks.setdefault(key, threading.Lock()) for key in sorted(keys.values())]
+
+        for lock in locks:
+            lock.acquire()
+        try:
+            snapshots = {}
+            missing = {}
+            with self._lock:
+                for platform, key in keys.items():
+                    snapshot = self._fresh(key)
+                    if snapshot is None:
+                        missing[platform] = workspaces[platform]
+                    else:
+                        snapshots[platform] = snapshot
+                        self.hits += 1
+
+            if missing:
+                results = fetch(missing)
+                with self._lock:
+                    for platform in missing:
+                        snapshot = PlatformSnapshot(platform, start_date, end_date, results[platform])
+                        self._snapshots[keys[platform]] = snapshot
+                        snapshots[platform] = snapshot
+                        self.builds += 1
+                    self._evict_expired()
+                logger.info("Built portfolio snapshot for %s (%s to %s)", ", ".join(missing), start_date, end_date)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+        return PortfolioSnapshot(snapshots)
+
+    def _evict_expired(self):
+        """Drop stale snapshots (caller holds self._lock)."""
+        for key in [key for key in self._snapshots if self._fresh(key) is None]:
+            del self._snapshots[key]
+            if not self._locks[key].locked():
+                del self._locks[key]
+
+    def clear(self):
+        """Drop every snapshot so the next request fans out again."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with snapshot count, TTL and hit/build counters
+        """
+        with self._lock:
+            return {
+                "snapshots": len(self._snapshots),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "builds": self.builds
+            }
+
+
+_engine: Optional[SnapshotEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_snapshot_engine() -> SnapshotEngine:
+    """
+    Get the process-wide snapshot engine, creating it on first use.
+
+    TTL is configured via LEAD_PORTFOLIO_SNAPSHOT_TTL (seconds, 0 = always rebuild).
+
+    Returns:
+        Shared SnapshotEngine
+    """
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            ttl = float(os.getenv("LEAD_PORTFOLIO_SNAPSHOT_TTL", str(DEFAULT_TTL_SECONDS)))
+            _engine = SnapshotEngine(ttl_seconds=ttl)
+        return _engine
@@ -0,0 +1,156 @@
+"""
+Progress notifications for long fan-out tools.
+
+Tools that fan out across every client (positive replies, spam checks,
+mailbox health) only return once the slowest client finishes. When a
+tools/call request carries a progressToken, the transport installs a
+ProgressReporter for the duration of the call; the tool's collection loop
+reports each finished client, which is sent to the caller as an MCP
+notifications/progress message plus a notifications/message carrying that
+client's partial result. Without a reporter every call here is a no-op.
+
+The reporter is held in a context variable, so it follows the tool into
+asyncio.to_thread workers. Reports may come from any thread; they are
+handed to the event loop with call_soon_threadsafe.
+"""
+
+import asyncio
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_current: contextvars.ContextVar[Optional["ProgressReporter"]] = contextvars.ContextVar(
+    "progress_reporter", default=None
+)
+
+
+class ProgressReporter:
+    """Sends progress and partial-result notifications for one tool call."""
+
+    def __init__(
+        self,
+        token: Any,
+        sink: Callable[[Dict[str, Any]], Any],
+        tool: str = "",
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Args:
+            token: progressToken from the request's params._meta
+            sink: Callable taking a JSON-RPC notification dict (e.g. queue.put_nowait)
+            tool: Tool name, used as the logger of partial-result messages
+            loop: Event loop the sink belongs to (default: the running loop)
+        """
+        self.token = token
+        self.sink = sink
+        self.tool = tool
+        self.loop = loop or asyncio.get_running_loop()
+        self.sent = 0
+        self._progress = 0.0
+        self._lock = threading.Lock()
+
+    def report(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+        partial: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Report progress, optionally with a partial result. Safe from any thread.
+
+        Progress must increase between notifications, so stale reports
+        (e.g. from a slower thread) are dropped.
+
+        Args:
+            progress: Units completed so far
+            total: Total units, if known
+            message: Short human-readable status
+            partial: Result for the unit that just completed
+        """
+        with self._lock:
+            if progress <= self._progress and self.sent:
+                return
+            self._progress = progress
+
+            notifications = []
+            if partial is not None:
+                notifications.append({
+                    "jsonrpc": "2.0",
+                    "method": "notifications/message",
+                    "params": {
+                        "level": "info",
+                        "logger": self.tool,
+                        "data": {"progressToken": self.token, "partial_result": partial}
+                    }
+                })
+
+            params = {"progressToken": self.token, "progress": progress}
+            if total is not None:
+                params["total"] = total
+            if message:
+                params["message"] = message
+            notifications.append({"jsonrpc": "2.0", "method": "notifications/progress", "params": params})
+
+            for notification in notifications:
+                try:
+                    self.loop.call_soon_threadsafe(self.sink, notification)
+                except RuntimeError:
+                    # Loop closed: the caller has gone away
+                    logger.debug("Dropping progress notification for %s", self.tool)
+                    return
+            self.sent += len(notifications)
+
+
+class ProgressCounter:
+    """Counts finished units of a fan-out and reports each one."""
+
+    def __init__(self, total: int, reporter: Optional[ProgressReporter] = None):
+        self.total = total
+        self.completed = 0
+        self.reporter = reporter
+        self._lock = threading.Lock()
+
+    def advance(self, message: Optional[str] = None, partial: Optional[Dict[str, Any]] = None) -> None:
+        """Mark one unit finished."""
+        with self._lock:
+            self.completed += 1
+            completed = self.completed
+            if self.reporter:
+                self.reporter.report(completed, self.total, message=message, partial=partial)
+
+
+def current() -> Optional[ProgressReporter]:
+    """Return the reporter for the tool call in progress, if the caller asked for progress."""
+    return _current.get()
+
+
+@contextmanager
+def reporting(reporter: Optional[ProgressReporter]) -> Iterator[Optional[ProgressReporter]]:
+    """Install reporter for the duration of a tool call."""
+    token = _current.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current.reset(token)
+
+
+def progress_counter(total: int) -> ProgressCounter:
+    """
+    Create a counter bound to the current reporter.
+
+    The reporter is captured here, so the counter can be advanced from
+    threads that don't inherit the caller's context.
+    """
+    return ProgressCounter(total, current())
+
+
+def report_step(step: int, total: int, message: str) -> None:
+    """Report a step of a multi-step tool (no-op without a reporter)."""
+    reporter = current()
+    if reporter:
+        reporter.report(step, total, message=message)
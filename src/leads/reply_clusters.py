@@ -0,0 +1,182 @@
+"""
+Near-duplicate clustering of replies (MinHash + LSH).
+
+A large share of campaign replies are templates: auto-responders, ticket
+system acknowledgements and "please remove me" variants that differ only in
+a name, a date or a ticket number. categorize_leads used to send every one
+of them to Claude. Clustering lets it classify one representative per
+cluster and give the same verdict to the rest.
+
+Each normalized reply becomes a set of character 5-grams (with digits and
+mid-sentence capitalized words masked, so ticket numbers, dates and the
+names of contacts or companies don't count), summarized by a
+128-value MinHash signature whose agreement rate estimates the Jaccard
+similarity of two replies. Signatures are split into 32 bands of 4 values;
+replies sharing a band are candidates, and a reply joins the most similar
+candidate representative at or above the threshold. Clusters are not
+chained: every member is compared directly with its representative.
+
+Short replies carry too few shingles for a reliable estimate ("Yes,
+interested" vs "Not interested"), so below CLUSTER_MIN_CHARS only identical
+text is clustered. A single negation barely moves the similarity of a long
+reply ("this looks like a fit" vs "this does not look like a fit"), so
+replies are also only clustered when they contain the same negations.
+Callers can pass a group per reply (e.g. its keyword category) and only
+replies in the same group are clustered together.
+"""
+
+import os
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Estimated Jaccard similarity for sharing a verdict (override with LEAD_REPLY_CLUSTER_THRESHOLD)
+CLUSTER_THRESHOLD = float(os.getenv("LEAD_REPLY_CLUSTER_THRESHOLD", "0.97"))
+# Shorter replies are only clustered when identical
+CLUSTER_MIN_CHARS = 60
+
+SHINGLE_CHARS = 5
+NUM_PERM = 128
+BANDS = 32
+
+# Multiply-shift hash functions (odd multipliers; uint64 arithmetic wraps)
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(0, np.iinfo(np.uint64).max, size=NUM_PERM, dtype=np.uint64, endpoint=True) | np.uint64(1)
+_B = _rng.integers(0, np.iinfo(np.uint64).max, size=NUM_PERM, dtype=np.uint64, endpoint=True)
+
+
+_DIGITS = re.compile(r"\d")
+# Capitalized words that don't start a sentence: names of people, companies, days
+_PROPER_NOUNS = re.compile(r"(?<=[^.!?\s] )[A-Z][a-z][\w'-]*")
+_NEGATIONS = re.compile(r"\b(?:not|no|never|none|nothing|neither|nor|without|cannot|\w+n't)\b")
+
+
+def _canonical(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _polarity(canonical: str) -> Tuple[str, ...]:
+    """Negations in a reply ("don't", "cannot" and "not" count as the same word)."""
+    words = _NEGATIONS.findall(canonical.replace("\u2019", "'"))
+    return tuple(sorted("not" if word == "cannot" or word.endswith("n't") else word for word in words))
+
+
+def _shingle_text(text: str) -> str:
+    """Canonical text with proper nouns and digits masked."""
+    return _DIGITS.sub("0", _canonical(_PROPER_NOUNS.sub("N", " ".join((text or "").split()))))
+
+
+def _shingle_hashes(canonical: str) -> List[int]:
+    shingles = {canonical[i:i + SHINGLE_CHARS] for i in range(max(1, len(canonical) - SHINGLE_CHARS + 1))}
+    return [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+
+
+def minhash_signatures(texts: Sequence[str]) -> np.ndarray:
+    """
+    MinHash signatures of texts' character shingles.
+
+    Args:
+        texts: Reply texts
+
+    Returns:
+        uint64 array of shape (len(texts), NUM_PERM)
+    """
+    signatures = np.empty((len(texts), NUM_PERM), dtype=np.uint64)
+    hashes: List[int] = []
+    starts: List[int] = []
+    done = 0
+    for index, text in enumerate(texts):
+        starts.append(len(hashes))
+        hashes.extend(_shingle_hashes(_shingle_text(text)))
+        # Hash in chunks of whole texts to bound the (shingles x NUM_PERM) matrix
+        if len(hashes) >= 20000 or index == len(texts) - 1:
+            values = (np.array(hashes, dtype=np.uint64)[:, None] * _A + _B) >> np.uint64(32)
+            signatures[done:index + 1] = np.minimum.reduceat(values, starts, axis=0)
+            hashes, starts, done = [], [], index + 1
+    return signatures
+
+
+def cluster_replies(
+    texts: Sequence[str],
+    groups: Optional[Sequence[Hashable]] = None,
+    threshold: float = CLUSTER_THRESHOLD
+) -> List[Tuple[int, float]]:
+    """
+    Assign each reply to a cluster representative.
+
+    Args:
+        texts: Normalized reply texts
+        groups: Optional group per reply; replies are only clustered within a group
+            (and only with replies containing the same negations)
+        threshold: Minimum estimated similarity to the representative
+
+    Returns:
+        (representative index, estimated similarity) per reply; a
+        representative is its own index with similarity 1.0
+
+    Raises:
+        ValueError: If groups and texts differ in length
+    """
+    if groups is None:
+        groups = [None] * len(texts)
+    elif len(groups) != len(texts):
+        raise ValueError(f"Got {len(groups)} groups for {len(texts)} texts")
+
+    rows = NUM_PERM // BANDS
+    canonical = [_canonical(text) for text in texts]
+    groups = [(group, _polarity(text)) for group, text in zip(groups, canonical)]
+    long_replies = [index for index, text in enumerate(canonical) if len(text) >= CLUSTER_MIN_CHARS]
+    signatures = np.zeros((len(texts), NUM_PERM), dtype=np.uint64)
+    if long_replies:
+        signatures[long_replies] = minhash_signatures([texts[index] for index in long_replies])
+
+    # Replies already seen verbatim reuse the earlier assignment
+    seen: Dict[Tuple[Hashable, str], Tuple[int, float]] = {}
+    buckets: Dict[Tuple[Hashable, int, bytes], List[int]] = {}
+    assignments: List[Tuple[int, float]] = []
+
+    for index, (text, group) in enumerate(zip(canonical, groups)):
+        assignment = seen.get((group, text))
+        if assignment is None:
+            assignment = (index, 1.0)
+            if len(text) >= CLUSTER_MIN_CHARS:
+                signature = signatures[index]
+                band_keys = [(group, band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(BANDS)]
+                candidates = sorted({rep for key in band_keys for rep in buckets.get(key, ())})
+                if candidates:
+                    similarity = (signatures[candidates] == signature).mean(axis=1)
+                    best = int(similarity.argmax())
+                    if similarity[best] >= threshold:
+                        assignment = (candidates[best], round(float(similarity[best]), 3))
+                if assignment[0] == index:
+                    for key in band_keys:
+                        buckets.setdefault(key, []).append(index)
+            seen[(group, text)] = assignment
+        assignments.append(assignment)
+
+    return assignments
+
+
+def cluster_stats(assignments: Sequence[Tuple[int, float]], threshold: float = CLUSTER_THRESHOLD) -> Dict:
+    """
+    Summarize cluster assignments.
+
+    Args:
+        assignments: Output of cluster_replies
+        threshold: Threshold the assignments were made with
+
+    Returns:
+        {"replies", "clusters", "clustered_replies", "largest_cluster", "threshold"}
+    """
+    sizes: Dict[int, int] = {}
+    for rep, _ in assignments:
+        sizes[rep] = sizes.get(rep, 0) + 1
+    return {
+        "replies": len(assignments),
+        "clusters": len(sizes),
+        "clustered_replies": len(assignments) - len(sizes),
+        "largest_cluster": max(sizes.values(), default=0),
+        "threshold": threshold
+    }
@@ -0,0 +1,206 @@
+"""
+Reply normalization before Claude analysis.
+
+Replies used to reach Claude verbatim: the lead's two lines followed by the
+whole quoted thread (usually our own pitch), a signature block, a legal
+disclaimer, tracking URLs and, for HTML-only replies, markup. That is mostly
+tokens the model has to read and ignore, and quoted pitch text ("book a
+call") can even pull the verdict the wrong way.
+
+normalize_reply keeps only what the lead wrote:
+
+1. HTML tags, entities and invisible characters are removed
+2. Quoted history is cut at the first reply header ("On ... wrote:",
+   "-----Original Message-----", an Outlook "From:" block, ...) and
+   ">"-quoted lines are dropped (inline answers between them are kept)
+3. Signatures ("-- ", "Sent from my iPhone", a sign-off followed only by a
+   name, title or contact block) and standard legal disclaimers are cut;
+   text that reads like the lead's own words is never treated as either
+4. Tracking parameters are stripped from URLs and bracketed link targets removed
+5. Whitespace is collapsed and the result capped at REPLY_MAX_CHARS
+
+The normalized text is both the prompt input and the verdict cache key, so
+copies of a reply that differ only in quoted history share one verdict.
+Normalizing is idempotent, and falls back to the cleaned-up full text when
+nothing would be left.
+"""
+
+import re
+import os
+import html
+from typing import Dict, Iterable
+
+from .llm_client import estimate_tokens
+
+# Longest normalized reply sent to Claude (override with LEAD_REPLY_MAX_CHARS)
+REPLY_MAX_CHARS = int(os.getenv("LEAD_REPLY_MAX_CHARS", "1500"))
+TRUNCATION_MARK = " [...]"
+# Lines after a sign-off still treated as a signature ("Thanks,\nJane\nCEO, Acme")
+SIGNATURE_MAX_LINES = 6
+
+_BLOCK_TAGS = re.compile(r"<\s*(?:br|/p|/div|/li|/tr|/h[1-6]|p|div|li|tr)\b[^>]*>", re.IGNORECASE)
+_HIDDEN_BLOCKS = re.compile(r"<\s*(style|script|head)\b.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r"<\s*/?\s*[a-zA-Z][^>]*>|<!--.*?-->", re.DOTALL)
+_INVISIBLE = re.compile("[\u00ad\u034f\u200b-\u200f\u2060\ufeff]")
+
+# Start of the quoted thread: everything from here on was written by someone else
+_QUOTE_HEADERS = re.compile(
+    r"^[ \t]*(?:"
+    r"On\s[\s\S]{0,200}?\bwrote:[ \t]*$"                # Gmail / Apple Mail (may wrap)
+    r"|Le\s[\s\S]{0,200}?\ba\s+écrit\s?:[ \t]*$"       # French
+    r"|Am\s[\s\S]{0,200}?\bschrieb\b.{0,80}:[ \t]*$"    # German
+    r"|El\s[\s\S]{0,200}?\bescribió:[ \t]*$"           # Spanish
+    r"|-{2,}[ \t]*(?:Original|Forwarded)[ \t]+Message[ \t]*-{2,}"
+    r"|_{10,}[ \t]*$"                                   # Outlook separator
+    r"|From:[ \t].*\n(?:[ \t]*(?:Sent|Date|To|Cc|Subject):.*(?:\n|$)){1,4}"  # Outlook header block
+    r")",
+    re.IGNORECASE | re.MULTILINE
+)
+_QUOTED_LINE = re.compile(r"^[ \t]*>.*(?:\n|$)", re.MULTILINE)
+
+# Signatures and disclaimers: cut from here to the end
+_SIGNATURE = re.compile(
+    r"^(?:"
+    r"--[ \t]*$"                                       # RFC 3676 delimiter
+    r"|Sent from (?:my|Mail|Outlook|Yahoo)\b.*$"
+    r"|Get Outlook for\b.*$"
+    r"|(?-i:CONFIDENTIALITY(?: NOTICE)?|DISCLAIMER|IMPORTANT NOTICE|LEGAL NOTICE|Confidentiality Notice)[ \t]*:.*$"
+    # Legal boilerplate only: "This message is intended for whoever handles..." is the lead talking
+    r"|(?:This|The information (?:contained )?in this) (?:e-?mail|message|communication|transmission)"
+    r"(?: and any (?:files|attachments)(?: transmitted with it)?)?,? (?:is|are|may be|contains?|may contain) "
+    r"(?:strictly )?(?:confidential|privileged|proprietary|intended (?:solely|only|exclusively) for the (?:use|addressee|named|intended|individual|person|entity))\b.*$"
+    r"|If you (?:are not the intended recipient|have received this (?:e-?mail|message|communication|transmission) in error)\b.*$"
+    r")",
+    re.IGNORECASE | re.MULTILINE
+)
+_SIGN_OFF = re.compile(
+    r"^[ \t]*(?:best(?: regards| wishes)?|kind regards|warm regards|regards|thanks(?: again)?|"
+    r"thank you|many thanks|cheers|sincerely|all the best|talk soon)[ \t]*[,.!]?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# One line of a signature block: a name, title/company or contact details, e.g.
+# "Jane Doe", "VP Sales | Acme", "Head of Growth at Acme Inc.", "M: +1 555 0100"
+_SIGNATURE_TOKEN = re.compile(
+    r"(?:[A-Z][\w.'&-]*"                                  # capitalized word
+    r"|of|at|and|the|for|&"                               # connectors in titles
+    r"|(?i:m|t|p|e|w|tel|phone|mobile|cell|office|direct|email|web)\.?:"  # contact labels
+    r"|[\w.+-]+@[\w-]+\.[\w.-]+"                          # email address
+    r"|(?:https?://|www\.)\S+|[\w-]+\.(?:com|io|co|net|org)\S*"  # website
+    r"|[+(]?\d[\d().-]*)$"                                # phone number fragment
+)
+_SIGNATURE_SEPARATORS = re.compile(r"[|,\u00b7\u2022/]")
+
+_BRACKETED_LINK = re.compile(r"\s*<(?:https?://|mailto:)[^>\s]*>")
+_TRACKING_PARAMS = re.compile(r"(https?://[^\s?#<>\"]+)\?[^\s<>\"]*")
+_IMAGE_PLACEHOLDER = re.compile(r"\[(?:image|cid):[^\]]*\]", re.IGNORECASE)
+
+
+def _strip_html(text: str) -> str:
+    if "<" not in text and "&" not in text:
+        return text
+    text = _HIDDEN_BLOCKS.sub("", text)
+    text = _BLOCK_TAGS.sub("\n", text)
+    text = _TAGS.sub("", text)
+    return html.unescape(text)
+
+
+def _cut(text: str, pattern: re.Pattern, require_before: bool = False) -> str:
+    """Cut text at the first match; with require_before, only if something precedes it."""
+    for match in pattern.finditer(text):
+        if not require_before or text[:match.start()].strip():
+            return text[:match.start()]
+    return text
+
+
+def _is_signature_line(line: str) -> bool:
+    """Whether a line looks like a name, title/company or contact line."""
+    tokens = _SIGNATURE_SEPARATORS.sub(" ", line).split()
+    return 0 < len(tokens) <= 8 and all(_SIGNATURE_TOKEN.match(token) for token in tokens)
+
+
+def _cut_sign_off(text: str) -> str:
+    """Cut at a sign-off line followed only by a short name/title/contact block."""
+    for match in _SIGN_OFF.finditer(text):
+        if not text[:match.start()].strip():
+            continue
+        rest = [line for line in text[match.end():].split("\n") if line.strip()]
+        if len(rest) <= SIGNATURE_MAX_LINES and all(_is_signature_line(line) for line in rest):
+            return text[:match.start()]
+    return text
+
+
+def _collapse(text: str) -> str:
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _cap(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars - len(TRUNCATION_MARK)]
+    # Prefer a word boundary when one is near the cap
+    space = cut.rfind(" ")
+    if space > len(cut) * 0.8:
+        cut = cut[:space]
+    return cut.rstrip() + TRUNCATION_MARK
+
+
+def normalize_reply(text: str, max_chars: int = REPLY_MAX_CHARS) -> str:
+    """
+    Reduce a reply to what the lead wrote.
+
+    Args:
+        text: Reply body (plain text or HTML)
+        max_chars: Length cap for the result
+
+    Returns:
+        Normalized reply text (empty only if the reply had no text)
+    """
+    if not text or not text.strip():
+        return ""
+
+    cleaned = _INVISIBLE.sub("", _strip_html(text.replace("\r\n", "\n").replace("\r", "\n")))
+    cleaned = _IMAGE_PLACEHOLDER.sub("", _BRACKETED_LINK.sub("", cleaned))
+    cleaned = _TRACKING_PARAMS.sub(r"\1", cleaned)
+
+    # A header at the very top introduces a reply written below the quote
+    body = cleaned
+    match = _QUOTE_HEADERS.search(body)
+    while match and not body[:match.start()].strip():
+        body = body[match.end():]
+        match = _QUOTE_HEADERS.search(body)
+    body = _cut(body, _QUOTE_HEADERS, require_before=True)
+    body = _QUOTED_LINE.sub("", body)
+    body = _cut(body, _SIGNATURE, require_before=True)
+    body = _cut_sign_off(body)
+    body = _collapse(body)
+
+    # Nothing of the lead's own left (e.g. only a signature)
+    if not body:
+        body = _collapse(cleaned)
+    return _cap(body, max_chars)
+
+
+def normalization_savings(originals: Iterable[str], normalized: Iterable[str]) -> Dict:
+    """
+    Estimated tokens before and after normalization.
+
+    Args:
+        originals: Raw reply texts
+        normalized: The same replies normalized
+
+    Returns:
+        {"replies": int, "tokens_before": int, "tokens_after": int, "saved_pct": float}
+    """
+    count = before = after = 0
+    for original, reduced in zip(originals, normalized):
+        count += 1
+        before += estimate_tokens(original)
+        after += estimate_tokens(reduced)
+    return {
+        "replies": count,
+        "tokens_before": before,
+        "tokens_after": after,
+        "saved_pct": round((before - after) / before * 100, 1) if before else 0.0
+    }
@@ -0,0 +1,405 @@
+"""
+Persistent per-workspace store of Instantly and Bison replies (SQLite).
+
+Reply tools used to refetch every reply in the requested window on every
+call, although replies older than a day or two never change. The store
+keeps each workspace's replies locally with the time range already synced,
+so a call only fetches what is missing: anything before the synced range,
+plus everything after the high-water mark minus a short overlap window that
+picks up recent status changes (e.g. a reply marked interested). Queries
+over any synced date range are then answered from the database.
+
+Workspaces are keyed by a hash of their API key, never the key itself.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+
+from .date_utils import parse_api_timestamp, format_api_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Default location and overlap (override with LEAD_REPLY_STORE_DIR / LEAD_REPLY_STORE_OVERLAP_HOURS)
+DEFAULT_STORE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "replies"
+DEFAULT_OVERLAP_HOURS = 48
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS replies (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    reply_key TEXT NOT NULL,
+    received_at TEXT NOT NULL,
+    i_status INTEGER,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (platform, workspace, scope, reply_key)
+);
+CREATE INDEX IF NOT EXISTS replies_by_time ON replies (platform, workspace, scope, received_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    platform TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    covered_from TEXT NOT NULL,
+    covered_to TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (platform, workspace, scope)
+);
+"""
+
+
+def workspace_key(api_key: str) -> str:
+    """Stable, non-reversible identifier for the workspace behind an API key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_timestamp(value: str) -> str:
+    """
+    Convert a date or API timestamp to the store's sortable UTC format.
+
+    Args:
+        value: ISO timestamp or YYYY-MM-DD
+
+    Returns:
+        Timestamp like "2024-12-01T10:00:00.000Z"
+    """
+    return format_api_timestamp(parse_api_timestamp(value))
+
+
+def _now() -> str:
+    return format_api_timestamp(datetime.now(timezone.utc))
+
+
+class ReplyStore:
+    """
+    SQLite table of replies keyed by (platform, workspace, scope, reply key).
+
+    ``scope`` separates reply sets fetched with different server-side filters
+    so a synced range always means "every reply matching this scope's filter
+    in that range". Instantly and Bison both sync every received reply into
+    one scope and keep the interest status in a column, so a status change
+    seen on a later sync updates the reply in place.
+    """
+
+    def __init__(self, db_path: Path, overlap_hours: float = DEFAULT_OVERLAP_HOURS):
+        """
+        Open (or create) the store database.
+
+        Args:
+            db_path: SQLite database file
+            overlap_hours: How far behind the high-water mark each sync refetches
+        """
+        self.db_path = Path(db_path)
+        self.overlap = timedelta(hours=overlap_hours)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def coverage(self, platform: str, workspace: str, scope: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the time range already synced for a scope.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key (see workspace_key)
+            scope: Reply set name
+
+        Returns:
+            (covered_from, covered_to) in store format, or None if never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, covered_to FROM sync_state WHERE platform = ? AND workspace = ? AND scope = ?",
+                (platform, workspace, scope)
+            ).fetchone()
+        return (row["covered_from"], row["covered_to"]) if row else None
+
+    def refresh_from(self, platform: str, workspace: str, scope: str) -> Optional[str]:
+        """
+        Get the point after which synced replies may still change.
+
+        Replies received within the overlap window before the high-water mark
+        was synced could have changed status since, as could anything after it.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+
+        Returns:
+            Timestamp in store format, or None if never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_to, synced_at FROM sync_state WHERE platform = ? AND workspace = ? AND scope = ?",
+                (platform, workspace, scope)
+            ).fetchone()
+        if row is None:
+            return None
+        settled_before = datetime.fromtimestamp(row["synced_at"], tz=timezone.utc) - self.overlap
+        return min(row["covered_to"], format_api_timestamp(settled_before))
+
+    def missing_ranges(
+        self,
+        platform: str,
+        workspace: str,
+        scope: str,
+        start: str,
+        end: str
+    ) -> List[Tuple[str, str]]:
+        """
+        Work out which parts of [start, end] must be fetched from the API.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+            start: Window start (date or ISO timestamp)
+            end: Window end (date or ISO timestamp)
+
+        Returns:
+            Ranges to fetch, in store format (empty if the window is fully synced)
+        """
+        start, end = normalize_timestamp(start), min(normalize_timestamp(end), _now())
+        covered = self.coverage(platform, workspace, scope)
+        if covered is None:
+            return [(start, end)] if start <= end else []
+
+        ranges = []
+        if start < covered[0]:
+            ranges.append((start, covered[0]))
+
+        # Refetch from the overlap window onwards (also fills any gap up to start)
+        refresh_from = self.refresh_from(platform, workspace, scope)
+        if end > refresh_from:
+            ranges.append((refresh_from, end))
+        return ranges
+
+    def save(
+        self,
+        platform: str,
+        workspace: str,
+        scope: str,
+        records: Iterable[Tuple[str, str, Optional[int], Dict[str, Any]]],
+        covered: Optional[Tuple[str, str]] = None
+    ) -> int:
+        """
+        Upsert replies and extend the synced range.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+            records: (reply_key, received_at, i_status, payload) tuples
+            covered: Range the records completely cover, merged into the synced range
+                (omit when the fetch was partial)
+
+        Returns:
+            Number of records written
+        """
+        rows = [
+            (platform, workspace, scope, key, normalize_timestamp(received_at), i_status, json.dumps(payload))
+            for key, received_at, i_status, payload in records
+            if received_at
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO replies (platform, workspace, scope, reply_key, received_at, i_status, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(platform, workspace, scope, reply_key) DO UPDATE SET
+                    received_at = excluded.received_at,
+                    i_status = excluded.i_status,
+                    payload = excluded.payload
+                """,
+                rows
+            )
+            if covered:
+                self._conn.execute(
+                    """
+                    INSERT INTO sync_state (platform, workspace, scope, covered_from, covered_to, synced_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(platform, workspace, scope) DO UPDATE SET
+                        covered_from = MIN(covered_from, excluded.covered_from),
+                        synced_at = CASE WHEN excluded.covered_to >= covered_to
+                                         THEN excluded.synced_at ELSE synced_at END,
+                        covered_to = MAX(covered_to, excluded.covered_to)
+                    """,
+                    (platform, workspace, scope, covered[0], covered[1], time.time())
+                )
+        return len(rows)
+
+    def update_status(
+        self,
+        platform: str,
+        workspace: str,
+        scope: str,
+        reply_key: str,
+        i_status: Optional[int],
+        changes: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Record a status change made through our own tools.
+
+        Synced ranges only refetch the overlap window, so a reply whose status
+        is changed later (e.g. marked interested from a hidden-gems report)
+        would otherwise keep its old status in the store.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+            reply_key: Stored reply key
+            i_status: New interest status
+            changes: Payload fields to overwrite (optional)
+
+        Returns:
+            True if the reply was stored and updated
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload FROM replies WHERE platform = ? AND workspace = ? AND scope = ? AND reply_key = ?",
+                (platform, workspace, scope, reply_key)
+            ).fetchone()
+            if row is None:
+                return False
+            payload = {**json.loads(row["payload"]), **(changes or {})}
+            self._conn.execute(
+                "UPDATE replies SET i_status = ?, payload = ? "
+                "WHERE platform = ? AND workspace = ? AND scope = ? AND reply_key = ?",
+                (i_status, json.dumps(payload), platform, workspace, scope, reply_key)
+            )
+        return True
+
+    def query(
+        self,
+        platform: str,
+        workspace: str,
+        scope: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        i_status: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get stored replies in a time range.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+            start: Inclusive lower bound (optional)
+            end: Inclusive upper bound (optional)
+            i_status: Only replies with this interest status (optional)
+
+        Returns:
+            Reply payloads, oldest first
+        """
+        sql = "SELECT payload FROM replies WHERE platform = ? AND workspace = ? AND scope = ?"
+        params: List[Any] = [platform, workspace, scope]
+        if start:
+            sql += " AND received_at >= ?"
+            params.append(normalize_timestamp(start))
+        if end:
+            sql += " AND received_at <= ?"
+            params.append(normalize_timestamp(end))
+        if i_status is not None:
+            sql += " AND i_status = ?"
+            params.append(i_status)
+        sql += " ORDER BY received_at, reply_key"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+    def count(self, platform: str, workspace: str, scope: str, start: Optional[str] = None) -> int:
+        """
+        Count stored replies received at or after a timestamp.
+
+        Args:
+            platform: "instantly" or "bison"
+            workspace: Workspace key
+            scope: Reply set name
+            start: Inclusive lower bound (optional)
+
+        Returns:
+            Number of stored replies
+        """
+        sql = "SELECT COUNT(*) FROM replies WHERE platform = ? AND workspace = ? AND scope = ?"
+        params: List[Any] = [platform, workspace, scope]
+        if start:
+            sql += " AND received_at >= ?"
+            params.append(normalize_timestamp(start))
+
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with reply and synced-scope counts and database size
+        """
+        with self._lock:
+            replies = self._conn.execute("SELECT COUNT(*) FROM replies").fetchone()[0]
+            scopes = self._conn.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0]
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "replies": replies,
+            "synced_scopes": scopes,
+            "overlap_hours": self.overlap.total_seconds() / 3600,
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[ReplyStore] = None
+_store_lock = threading.Lock()
+_store_failed = False
+
+
+def get_reply_store() -> Optional[ReplyStore]:
+    """
+    Get the process-wide reply store, creating it on first use.
+
+    Configured via LEAD_REPLY_STORE_DIR and LEAD_REPLY_STORE_OVERLAP_HOURS;
+    set LEAD_REPLY_STORE_ENABLED=false to always fetch from the APIs.
+
+    Returns:
+        Shared ReplyStore, or None if disabled or unavailable
+    """
+    global _store, _store_failed
+
+    if os.getenv("LEAD_REPLY_STORE_ENABLED", "true").lower() == "false":
+        return None
+
+    with _store_lock:
+        if _store is None and not _store_failed:
+            store_dir = Path(os.path.expanduser(os.getenv("LEAD_REPLY_STORE_DIR", str(DEFAULT_STORE_DIR))))
+            overlap = float(os.getenv("LEAD_REPLY_STORE_OVERLAP_HOURS", str(DEFAULT_OVERLAP_HOURS)))
+            try:
+                _store = ReplyStore(store_dir / "replies.db", overlap_hours=overlap)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Reply store disabled, could not open database in %s: %s", store_dir, e)
+                _store_failed = True
+        return _store
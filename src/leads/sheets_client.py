@@ -4,6 +4,7 @@ Google Sheets reading logic for workspace configurations.
 
 import csv
 from io import StringIO
+from typing import Dict, Any, List, Optional
 import requests
 
 
@@ -16,6 +17,64 @@ SHEET_GID_INSTANTLY = "928115249"  # Instantly workspaces tab
 SHEET_GID_BISON = "1631680229"  # Bison workspaces tab
 
 
+def sheet_csv_url(sheet_url: str, gid: str) -> str:
+    """
+    Build the CSV export URL for a sheet tab.
+
+    Args:
+        sheet_url: Google Sheet URL (with or without /edit...)
+        gid: Tab GID
+
+    Returns:
+        CSV export URL
+    """
+    # Normalize URL to the "base" without /edit...
+    if "/edit" in sheet_url:
+        base = sheet_url.split("/edit", 1)[0]
+    else:
+        base = sheet_url
+
+    return f"{base}/export?format=csv&gid={gid}"
+
+
+def fetch_sheet_csv(
+    sheet_url: str,
+    gid: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Download a sheet tab as CSV, conditionally if validators are given.
+
+    Args:
+        sheet_url: Google Sheet URL
+        gid: Tab GID
+        etag: ETag from a previous download (sent as If-None-Match)
+        last_modified: Last-Modified from a previous download (sent as If-Modified-Since)
+
+    Returns:
+        {"not_modified": bool, "text": str or None, "etag": str, "last_modified": str}
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    resp = requests.get(sheet_csv_url(sheet_url, gid), headers=headers or None, timeout=30)
+
+    if resp.status_code == 304:
+        return {"not_modified": True, "text": None, "etag": etag, "last_modified": last_modified}
+
+    resp.raise_for_status()
+    return {
+        "not_modified": False,
+        "text": resp.text,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified")
+    }
+
+
 def load_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SHEET_GID_INSTANTLY):
     """
     Reads a public/view-only Google Sheet tab as CSV and returns workspace configs.
@@ -27,19 +86,25 @@ def load_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SH
             ...
         ]
     """
-    # Normalize URL to the "base" without /edit...
-    if "/edit" in sheet_url:
-        base = sheet_url.split("/edit", 1)[0]
-    else:
-        base = sheet_url
-
-    csv_url = f"{base}/export?format=csv&gid={gid}"
+    csv_url = sheet_csv_url(sheet_url, gid)
     # Silently fetch (print removed for MCP compatibility)
 
     resp = requests.get(csv_url, timeout=30)
     resp.raise_for_status()
 
-    text = resp.text
+    return parse_workspaces_csv(resp.text)
+
+
+def parse_workspaces_csv(text: str) -> List[Dict[str, str]]:
+    """
+    Parse the Instantly workspaces tab (see load_workspaces_from_sheet).
+
+    Args:
+        text: CSV export of the tab
+
+    Returns:
+        List of workspace dicts
+    """
     reader = csv.reader(StringIO(text))
     rows = list(reader)
 
@@ -51,6 +116,8 @@ def load_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SH
         raw_key = (row[1] or "").strip()
         raw_workspace_name = (row[2] or "").strip() if len(row) > 2 else ""  # Column C
         raw_client_name = (row[3] or "").strip() if len(row) > 3 else ""  # Column D
+        raw_client_email = (row[4] or "").strip() if len(row) > 4 else ""  # Column E
+        raw_action = (row[5] or "").strip() if len(row) > 5 else ""  # Column F
 
         # Skip empty
         if not raw_wid or not raw_key:
@@ -73,6 +140,8 @@ def load_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid: str = SH
             "client_name": display_name,  # For display (Column D > Column C > ID)
             "workspace_name": raw_workspace_name,  # Column C - for search
             "person_name": raw_client_name,  # Column D - for search
+            "client_email": raw_client_email,  # Column E
+            "action": raw_action,  # Column F
         })
 
     # Silently return (print removed for MCP compatibility)
@@ -94,19 +163,25 @@ def load_bison_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid: st
             ...
         ]
     """
-    # Normalize URL
-    if "/edit" in sheet_url:
-        base = sheet_url.split("/edit", 1)[0]
-    else:
-        base = sheet_url
-
-    csv_url = f"{base}/export?format=csv&gid={gid}"
+    csv_url = sheet_csv_url(sheet_url, gid)
     # Silently fetch (print removed for MCP compatibility)
 
     resp = requests.get(csv_url, timeout=30)
     resp.raise_for_status()
 
-    text = resp.text
+    return parse_bison_workspaces_csv(resp.text)
+
+
+def parse_bison_workspaces_csv(text: str) -> List[Dict[str, str]]:
+    """
+    Parse the Bison workspaces tab (see load_bison_workspaces_from_sheet).
+
+    Args:
+        text: CSV export of the tab
+
+    Returns:
+        List of workspace dicts
+    """
     reader = csv.reader(StringIO(text))
     rows = list(reader)
 
@@ -163,13 +238,7 @@ def load_instantly_workspaces_from_sheet(sheet_url: str = DEFAULT_SHEET_URL, gid
             ...
         ]
     """
-    # Normalize URL
-    if "/edit" in sheet_url:
-        base = sheet_url.split("/edit", 1)[0]
-    else:
-        base = sheet_url
-
-    csv_url = f"{base}/export?format=csv&gid={gid}"
+    csv_url = sheet_csv_url(sheet_url, gid)
     # Silently fetch (print removed for MCP compatibility)
 
     resp = requests.get(csv_url, timeout=30)
@@ -5,7 +5,8 @@ Campaign spam checker - scans Bison and Instantly campaigns for spam content.
 import requests
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from . import bison_client, instantly_client, emailguard_client, sheets_client
+from . import bison_client, instantly_client, emailguard_client, progress
+from .workspace_registry import get_workspace_registry
 
 
 def check_text_spam(
@@ -335,24 +336,21 @@ def check_all_bison_campaigns_spam(
         }
     """
     # Load Bison clients from sheets
-    clients = sheets_client.load_bison_workspaces_from_sheet()
+    resolver = get_workspace_registry().get_bison_resolver()
+    clients = resolver.workspaces
 
     # Filter by client name if specified
     if client_name:
-        from rapidfuzz import process, fuzz
-        client_names = [c["client_name"] for c in clients]
-        result = process.extractOne(
-            client_name,
-            client_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
-        if result:
-            matched_name, score, index = result
-            clients = [clients[index]]
+        try:
+            workspace = resolver.resolve(client_name)
+            error = f"Client '{client_name}' not found"
+        except ValueError as e:
+            workspace, error = None, str(e)
+        if workspace:
+            clients = [workspace]
         else:
             return {
-                "error": f"Client '{client_name}' not found",
+                "error": error,
                 "total_clients": 0,
                 "total_campaigns": 0,
                 "spam_campaigns": 0,
@@ -378,7 +376,8 @@ def check_all_bison_campaigns_spam(
             for client in clients
         }
 
-        # Collect results as they complete
+        # Collect results as they complete, streaming each client to the caller
+        counter = progress.progress_counter(len(future_to_client))
         for future in as_completed(future_to_client):
             client = future_to_client[future]
             try:
@@ -389,14 +388,15 @@ def check_all_bison_campaigns_spam(
                     results["total_campaigns"] += client_result["total_campaigns"]
                     results["spam_campaigns"] += client_result["spam_campaigns"]
 
-                results["clients"].append(client_result)
-
             except Exception as e:
                 # Error logging removed for MCP compatibility
-                results["clients"].append({
+                client_result = {
                     "client_name": client.get("client_name", "unknown"),
                     "error": f"Unexpected error: {str(e)}"
-                })
+                }
+
+            results["clients"].append(client_result)
+            counter.advance(message=client_result.get("client_name"), partial=client_result)
 
     return results
 
@@ -666,24 +666,21 @@ def check_all_instantly_campaigns_spam(
         status_number = 1  # Default to active
 
     # Load Instantly clients from sheets
-    clients = sheets_client.load_instantly_workspaces_from_sheet()
+    resolver = get_workspace_registry().get_instantly_resolver()
+    clients = resolver.workspaces
 
     # Filter by client name if specified
     if client_name:
-        from rapidfuzz import process, fuzz
-        client_names = [c["client_name"] for c in clients]
-        result = process.extractOne(
-            client_name,
-            client_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
-        if result:
-            matched_name, score, index = result
-            clients = [clients[index]]
+        try:
+            workspace = resolver.resolve(client_name)
+            error = f"Client '{client_name}' not found"
+        except ValueError as e:
+            workspace, error = None, str(e)
+        if workspace:
+            clients = [workspace]
         else:
             return {
-                "error": f"Client '{client_name}' not found",
+                "error": error,
                 "total_clients": 0,
                 "total_campaigns": 0,
                 "spam_campaigns": 0,
@@ -709,7 +706,8 @@ def check_all_instantly_campaigns_spam(
             for client in clients
         }
 
-        # Collect results as they complete
+        # Collect results as they complete, streaming each client to the caller
+        counter = progress.progress_counter(len(future_to_client))
         for future in as_completed(future_to_client):
             client = future_to_client[future]
             try:
@@ -720,13 +718,14 @@ def check_all_instantly_campaigns_spam(
                     results["total_campaigns"] += client_result["total_campaigns"]
                     results["spam_campaigns"] += client_result["spam_campaigns"]
 
-                results["clients"].append(client_result)
-
             except Exception as e:
                 # Error logging removed for MCP compatibility
-                results["clients"].append({
+                client_result = {
                     "client_name": client.get("client_name", "unknown"),
                     "error": f"Unexpected error: {str(e)}"
-                })
+                }
+
+            results["clients"].append(client_result)
+            counter.advance(message=client_result.get("client_name"), partial=client_result)
 
     return results
@@ -0,0 +1,181 @@
+"""
+Bounded LRU + TTL cache for the email threads behind instant-auto-reply checks.
+
+Timing validation fetches each hot/warm lead's thread (Instantly lead emails
+or a Bison conversation thread). Entries are keyed by (platform, workspace,
+lead), where the workspace is a hash of the API key, so tenants sharing the
+process never see each other's threads. The cache holds at most
+max_entries threads, each for at most ttl_seconds, and tracks hit rate and
+approximate memory use.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .reply_store import workspace_key
+
+logger = logging.getLogger(__name__)
+
+# Defaults (override with LEAD_THREAD_CACHE_MAX_ENTRIES / LEAD_THREAD_CACHE_TTL)
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 900
+
+CacheKey = Tuple[str, str, str]
+
+_MISSING = object()
+
+
+def _approx_size(value: Any) -> int:
+    """Approximate in-memory footprint of a cached thread (its JSON size)."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class ThreadCache:
+    """Thread-safe LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Least recently used threads are evicted beyond this
+            ttl_seconds: Seconds a thread is reused before it is fetched again
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(platform: str, api_key: str, lead: Any) -> CacheKey:
+        """
+        Build a cache key.
+
+        Args:
+            platform: "instantly" or "bison"
+            api_key: Workspace API key (hashed, never stored)
+            lead: Lead email (Instantly) or reply ID (Bison)
+
+        Returns:
+            (platform, workspace hash, lead) tuple
+        """
+        return (platform, workspace_key(api_key), str(lead).lower())
+
+    def _drop(self, key: CacheKey):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: CacheKey, default: Any = None) -> Any:
+        """
+        Get a cached thread, counting the hit or miss.
+
+        Args:
+            key: Key from ThreadCache.key
+            default: Returned on a miss
+
+        Returns:
+            Cached thread, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def contains(self, key: CacheKey) -> bool:
+        """Whether a fresh entry exists (does not affect stats or LRU order)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds
+
+    def put(self, key: CacheKey, value: Any):
+        """
+        Cache a thread, evicting the least recently used entries if full.
+
+        Args:
+            key: Key from ThreadCache.key
+            value: Thread data
+        """
+        if self.max_entries <= 0:
+            return
+        size = _approx_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic(), size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, approximate bytes, hit rate and eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+_cache: Optional[ThreadCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_thread_cache() -> ThreadCache:
+    """
+    Get the process-wide thread cache, creating it on first use.
+
+    Configured via LEAD_THREAD_CACHE_MAX_ENTRIES and LEAD_THREAD_CACHE_TTL
+    (seconds); LEAD_THREAD_CACHE_MAX_ENTRIES=0 disables caching.
+
+    Returns:
+        Shared ThreadCache
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = ThreadCache(
+                max_entries=int(os.getenv("LEAD_THREAD_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+                ttl_seconds=float(os.getenv("LEAD_THREAD_CACHE_TTL", str(DEFAULT_TTL_SECONDS)))
+            )
+        return _cache
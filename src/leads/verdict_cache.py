@@ -0,0 +1,223 @@
+"""
+Persistent cache of Claude reply verdicts (SQLite).
+
+find_missed_opportunities sends every reply that keywords don't settle to
+Claude, and each run over a 30-day window used to pay again for the replies
+analysed the day before. Verdicts are stored under a hash of the normalized
+reply text, the subject, the model and the prompt version, so a reply is
+analysed once per model and prompt. Changing either one produces new keys
+and the old verdicts are ignored; entries older than the TTL expire the
+same way and are pruned on open.
+
+Only verdicts parsed from a real API response are stored, never error or
+"not configured" fallbacks.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location and TTL (override with LEAD_VERDICT_CACHE_DIR / LEAD_VERDICT_CACHE_TTL_DAYS)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "verdicts"
+DEFAULT_TTL_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    verdict_key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_by_age ON verdicts (created_at);
+"""
+
+
+def normalize_reply_text(text: str) -> str:
+    """Collapse whitespace so re-wrapped copies of a reply share a verdict."""
+    return " ".join((text or "").split())
+
+
+def verdict_key(reply_text: str, subject: str, model: str, prompt_version: str) -> str:
+    """
+    Cache key for one reply under one model and prompt.
+
+    Args:
+        reply_text: Reply body
+        subject: Subject line
+        model: Claude model name
+        prompt_version: Version of the categorization prompt
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (model, str(prompt_version), normalize_reply_text(subject), normalize_reply_text(reply_text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class VerdictCache:
+    """Verdicts keyed by verdict_key, served while younger than the TTL."""
+
+    def __init__(self, db_path: Path, ttl_seconds: float = DEFAULT_TTL_DAYS * 86400):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: How long a verdict is served
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.prune()
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several verdicts.
+
+        Args:
+            keys: verdict_key values
+
+        Returns:
+            {key: verdict} for the keys with a fresh verdict
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        unique = list(dict.fromkeys(keys))
+        cutoff = self._cutoff()
+        with self._lock:
+            # Stay under SQLite's host-parameter limit
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT verdict_key, payload FROM verdicts "
+                    f"WHERE created_at >= ? AND verdict_key IN ({', '.join('?' for _ in chunk)})",
+                    [cutoff, *chunk]
+                ).fetchall()
+                found.update((key, json.loads(payload)) for key, payload in rows)
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return found
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one verdict.
+
+        Args:
+            key: verdict_key value
+
+        Returns:
+            Verdict, or None if missing or expired
+        """
+        return self.get_many([key]).get(key)
+
+    def put(self, key: str, verdict: Dict[str, Any], model: str, prompt_version: str):
+        """
+        Store a verdict.
+
+        Args:
+            key: verdict_key value
+            verdict: Parsed verdict ({"category", "confidence", "reason"})
+            model: Model that produced it
+            prompt_version: Prompt version it answered
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (verdict_key, model, prompt_version, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, str(prompt_version), json.dumps(verdict), time.time())
+            )
+
+    def prune(self) -> int:
+        """
+        Delete expired verdicts.
+
+        Returns:
+            Number of verdicts deleted
+        """
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM verdicts WHERE created_at < ?", (self._cutoff(),)).rowcount
+
+    def clear(self):
+        """Delete every verdict (e.g. after a model or taxonomy change)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM verdicts")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with stored verdict count, hit/miss counters, TTL and database size
+        """
+        with self._lock:
+            verdicts = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        try:
+            size_bytes = self.db_path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "verdicts": verdicts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_days": round(self.ttl_seconds / 86400, 2),
+            "size_bytes": size_bytes
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[VerdictCache] = None
+_cache_lock = threading.Lock()
+_cache_failed = False
+
+
+def get_verdict_cache() -> Optional[VerdictCache]:
+    """
+    Get the process-wide verdict cache, creating it on first use.
+
+    Configured via LEAD_VERDICT_CACHE_DIR and LEAD_VERDICT_CACHE_TTL_DAYS;
+    set LEAD_VERDICT_CACHE_ENABLED=false to send every reply to Claude.
+
+    Returns:
+        Shared VerdictCache, or None if disabled or unavailable
+    """
+    global _cache, _cache_failed
+
+    if os.getenv("LEAD_VERDICT_CACHE_ENABLED", "true").lower() == "false":
+        return None
+
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            cache_dir = Path(os.path.expanduser(os.getenv("LEAD_VERDICT_CACHE_DIR", str(DEFAULT_CACHE_DIR))))
+            ttl_days = float(os.getenv("LEAD_VERDICT_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS)))
+            try:
+                _cache = VerdictCache(cache_dir / "verdicts.db", ttl_seconds=ttl_days * 86400)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Verdict cache disabled, could not open database in %s: %s", cache_dir, e)
+                _cache_failed = True
+        return _cache
@@ -0,0 +1,463 @@
+"""
+Warm cache for the portfolio-wide lead tools, refreshed in the background.
+
+get_all_clients_with_positive_replies, get_all_active_clients,
+get_all_mailbox_health_summary and get_lead_weekly_summary fan out over every
+client and take tens of seconds when nothing is cached. Their results are
+kept in a SQLite store shared by every worker process on the host; a
+scheduler started with the server refreshes the default views on an
+interval, one tool at a time with a pause in between so upstream load is
+spread out. Only one worker refreshes: the scheduler holds a lease row in
+the same database, and the others skip their cycle while it is held.
+
+Every response served through serve() carries a "freshness" block saying
+whether it came from the warm cache and how old it is.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import asyncio
+import inspect
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Defaults (override with LEAD_WARM_CACHE_DIR / LEAD_WARM_INTERVAL / LEAD_WARM_MAX_AGE /
+# LEAD_WARM_STAGGER_SECONDS)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gmail-reply-tracker" / "warm"
+DEFAULT_INTERVAL_SECONDS = 900
+DEFAULT_MAX_AGE_SECONDS = 1800
+DEFAULT_STAGGER_SECONDS = 30
+
+LEASE_NAME = "warm-scheduler"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    tool TEXT NOT NULL,
+    params TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (tool, params)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def _params_key(params: Dict[str, Any]) -> str:
+    return json.dumps(params or {}, sort_keys=True)
+
+
+def freshness(refreshed_at: float, source: str) -> Dict[str, Any]:
+    """
+    Describe how current a tool result is.
+
+    Args:
+        refreshed_at: Epoch seconds when the result was computed
+        source: "warm_cache" or "live"
+
+    Returns:
+        {"source", "refreshed_at" (ISO, UTC), "age_seconds"}
+    """
+    return {
+        "source": source,
+        "refreshed_at": datetime.fromtimestamp(refreshed_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "age_seconds": max(0, int(time.time() - refreshed_at))
+    }
+
+
+class WarmCache:
+    """SQLite store of tool results plus the scheduler's leader lease."""
+
+    def __init__(self, db_path: Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file (shared by all workers on the host)
+            max_age_seconds: Results older than this are recomputed on request
+        """
+        self.db_path = Path(db_path)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def get(self, tool: str, params: Dict[str, Any] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Get a cached result that is younger than max_age_seconds.
+
+        Args:
+            tool: Tool name
+            params: Tool parameters the result was computed for
+
+        Returns:
+            (result, refreshed_at) or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, refreshed_at FROM results WHERE tool = ? AND params = ?",
+                (tool, _params_key(params))
+            ).fetchone()
+            if row is None or time.time() - row[1] >= self.max_age_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def age(self, tool: str, params: Dict[str, Any] = None) -> Optional[float]:
+        """Seconds since a result was refreshed, or None if never (does not count as a lookup)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM results WHERE tool = ? AND params = ?",
+                (tool, _params_key(params))
+            ).fetchone()
+        return None if row is None else time.time() - row[0]
+
+    def put(self, tool: str, params: Dict[str, Any], result: Dict[str, Any], refreshed_at: float = None) -> float:
+        """
+        Store a result.
+
+        Args:
+            tool: Tool name
+            params: Tool parameters
+            result: JSON-serializable result
+            refreshed_at: When it was computed (default: now)
+
+        Returns:
+            refreshed_at
+        """
+        refreshed_at = time.time() if refreshed_at is None else refreshed_at
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (tool, params, payload, refreshed_at) VALUES (?, ?, ?, ?)",
+                (tool, _params_key(params), json.dumps(result, default=str), refreshed_at)
+            )
+        return refreshed_at
+
+    def acquire_lease(self, owner: str, ttl_seconds: float, name: str = LEASE_NAME) -> bool:
+        """
+        Take or renew a lease; only one owner holds it until it expires.
+
+        Args:
+            owner: Unique id of the caller (e.g. host:pid:uuid)
+            ttl_seconds: Lease lifetime; the holder must renew before it lapses
+            name: Lease name
+
+        Returns:
+            True if the caller holds the lease
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+                if row is not None and row[0] != owner and row[1] > now:
+                    self._conn.execute("COMMIT")
+                    return False
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                    (name, owner, now + ttl_seconds)
+                )
+                self._conn.execute("COMMIT")
+                return True
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def release_lease(self, owner: str, name: str = LEASE_NAME):
+        """Give up a lease if the caller holds it."""
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cached result count, max age and hit/miss counters
+        """
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            "results": count,
+            "max_age_seconds": self.max_age_seconds,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+async def _call(compute: Callable, kwargs: Dict[str, Any]) -> Any:
+    """Run an async tool function directly or a sync one in a thread."""
+    if inspect.iscoroutinefunction(compute) or inspect.iscoroutinefunction(getattr(compute, "__call__", None)):
+        return await compute(**kwargs)
+    return await asyncio.to_thread(compute, **kwargs)
+
+
+def _decode(text: Any) -> Dict[str, Any]:
+    return json.loads(text) if isinstance(text, str) else text
+
+
+async def serve(
+    tool: str,
+    compute: Callable,
+    params: Dict[str, Any] = None,
+    cache: Optional[WarmCache] = None
+) -> str:
+    """
+    Answer a tool call from the warm cache, or compute and cache it.
+
+    Args:
+        tool: Tool name
+        compute: Tool implementation returning a JSON string (sync or async)
+        params: Tool parameters (passed to compute and used as the cache key)
+        cache: WarmCache (default: get_warm_cache())
+
+    Returns:
+        The tool's JSON response with a "freshness" block added
+    """
+    params = params or {}
+    cache = cache if cache is not None else get_warm_cache()
+
+    cached = cache.get(tool, params) if cache is not None else None
+    if cached is not None:
+        result, refreshed_at = cached
+        return json.dumps({**result, "freshness": freshness(refreshed_at, "warm_cache")}, indent=2)
+
+    result = _decode(await _call(compute, params))
+    refreshed_at = time.time()
+    if cache is not None and result.get("success"):
+        cache.put(tool, params, result, refreshed_at)
+    return json.dumps({**result, "freshness": freshness(refreshed_at, "live")}, indent=2)
+
+
+class WarmJob:
+    """One tool view the scheduler keeps warm."""
+
+    def __init__(self, tool: str, compute: Callable, params: Dict[str, Any] = None, options: Dict[str, Any] = None):
+        """
+        Initialize a job.
+
+        Args:
+            tool: Tool name (cache key)
+            compute: Tool implementation returning a JSON string (sync or async)
+            params: Tool parameters to warm (cache key)
+            options: Extra keyword arguments for background runs only (e.g. lower concurrency)
+        """
+        self.tool = tool
+        self.compute = compute
+        self.params = params or {}
+        self.options = options or {}
+
+
+class WarmScheduler:
+    """Periodically refreshes registered tool views; one worker per host does the work."""
+
+    def __init__(
+        self,
+        cache: WarmCache,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        stagger_seconds: float = DEFAULT_STAGGER_SECONDS
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            cache: Shared WarmCache
+            interval_seconds: Time between refresh cycles
+            stagger_seconds: Pause between jobs within a cycle
+        """
+        self.cache = cache
+        self.interval_seconds = interval_seconds
+        self.stagger_seconds = stagger_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.jobs: List[WarmJob] = []
+        self.runs = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lease_ttl(self) -> float:
+        """Lease lifetime: long enough to cover a full cycle plus its pauses."""
+        return self.interval_seconds + self.stagger_seconds * (len(self.jobs) + 1)
+
+    def register(self, tool: str, compute: Callable, params: Dict[str, Any] = None, **options):
+        """
+        Keep a tool view warm.
+
+        Args:
+            tool: Tool name
+            compute: Tool implementation returning a JSON string (sync or async)
+            params: Tool parameters to warm
+            **options: Extra keyword arguments for background runs only
+        """
+        self.jobs.append(WarmJob(tool, compute, params, options))
+
+    async def refresh(self, job: WarmJob) -> bool:
+        """
+        Recompute one job and store it.
+
+        Args:
+            job: Job to refresh
+
+        Returns:
+            True if a successful result was stored
+        """
+        started = time.monotonic()
+        try:
+            result = _decode(await _call(job.compute, {**job.params, **job.options}))
+        except Exception as e:
+            self.failures += 1
+            logger.warning("Warm refresh of %s failed: %s", job.tool, e)
+            return False
+        if not result.get("success"):
+            self.failures += 1
+            logger.warning("Warm refresh of %s returned an error: %s", job.tool, result.get("error"))
+            return False
+        self.cache.put(job.tool, job.params, result)
+        logger.info("Warmed %s %s in %.1fs", job.tool, job.params, time.monotonic() - started)
+        return True
+
+    async def run_once(self) -> List[str]:
+        """
+        Run one refresh cycle if this worker holds the lease.
+
+        Jobs refreshed within the last half interval (e.g. by a live call) are
+        skipped. The lease is renewed before each job.
+
+        Returns:
+            Names of the tools refreshed (empty if another worker is the refresher)
+        """
+        if not self.cache.acquire_lease(self.owner, self.lease_ttl):
+            logger.debug("Warm refresh skipped, another worker holds the lease")
+            return []
+
+        self.runs += 1
+        refreshed = []
+        attempted = False
+        for job in self.jobs:
+            age = self.cache.age(job.tool, job.params)
+            if age is not None and age < self.interval_seconds / 2:
+                continue
+            if attempted:
+                await asyncio.sleep(self.stagger_seconds)
+                if not self.cache.acquire_lease(self.owner, self.lease_ttl):
+                    break
+            attempted = True
+            if await self.refresh(job):
+                refreshed.append(job.tool)
+        return refreshed
+
+    async def run_forever(self):
+        """Refresh every interval until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("Warm refresh cycle failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> asyncio.Task:
+        """Start the refresh loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+            logger.info("Warm cache scheduler started (%d jobs, every %ds)", len(self.jobs), self.interval_seconds)
+        return self._task
+
+    async def stop(self):
+        """Cancel the refresh loop and hand the lease to another worker."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.cache.release_lease(self.owner)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with job count, cycles run and failures
+        """
+        return {
+            "jobs": [job.tool for job in self.jobs],
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "running": self._task is not None and not self._task.done()
+        }
+
+
+_cache: Optional[WarmCache] = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_warm_cache() -> Optional[WarmCache]:
+    """
+    Get the process-wide warm cache, creating it on first use.
+
+    Configured via LEAD_WARM_CACHE_DIR and LEAD_WARM_MAX_AGE (seconds); set
+    LEAD_WARM_CACHE_ENABLED=false to always compute tool results live.
+
+    Returns:
+        Shared WarmCache, or None if disabled or unavailable
+    """
+    global _cache, _cache_failed
+
+    if os.getenv("LEAD_WARM_CACHE_ENABLED", "true").lower() == "false":
+        return None
+
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            cache_dir = Path(os.path.expanduser(os.getenv("LEAD_WARM_CACHE_DIR", str(DEFAULT_CACHE_DIR))))
+            max_age = float(os.getenv("LEAD_WARM_MAX_AGE", str(DEFAULT_MAX_AGE_SECONDS)))
+            try:
+                _cache = WarmCache(cache_dir / "warm.db", max_age_seconds=max_age)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Warm cache disabled, could not open database in %s: %s", cache_dir, e)
+                _cache_failed = True
+        return _cache
+
+
+def create_scheduler() -> Optional[WarmScheduler]:
+    """
+    Create a scheduler on the shared warm cache.
+
+    Interval and stagger come from LEAD_WARM_INTERVAL and LEAD_WARM_STAGGER_SECONDS.
+
+    Returns:
+        WarmScheduler (jobs not yet registered), or None if the cache is disabled
+    """
+    cache = get_warm_cache()
+    if cache is None:
+        return None
+    return WarmScheduler(
+        cache,
+        interval_seconds=float(os.getenv("LEAD_WARM_INTERVAL", str(DEFAULT_INTERVAL_SECONDS))),
+        stagger_seconds=float(os.getenv("LEAD_WARM_STAGGER_SECONDS", str(DEFAULT_STAGGER_SECONDS)))
+    )
@@ -0,0 +1,295 @@
+"""
+Process-wide cache of workspace configurations from the lead-management sheet.
+
+Portfolio tools touch every client, and each used to download the sheet once
+per client. The registry downloads each tab at most once per TTL, lets
+concurrent callers share a single in-flight download, revalidates with
+ETag / Last-Modified when the TTL expires, and keeps serving the last good
+copy if a refresh fails.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from .client_resolver import ClientResolver
+from .sheets_client import (
+    fetch_sheet_csv,
+    parse_workspaces_csv,
+    parse_bison_workspaces_csv,
+    DEFAULT_SHEET_URL,
+    SHEET_GID_INSTANTLY,
+    SHEET_GID_BISON
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a tab is revalidated (override with LEAD_SHEETS_CACHE_TTL)
+DEFAULT_TTL_SECONDS = 300
+
+
+class _RegistryEntry:
+    """Parsed workspaces for one sheet tab plus the validators to refresh it."""
+
+    def __init__(self):
+        self.workspaces: Optional[List[Dict[str, str]]] = None
+        self.content_hash: Optional[str] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at = 0.0
+        self.resolver: Optional[ClientResolver] = None
+        self.lock = threading.Lock()
+
+
+class WorkspaceRegistry:
+    """TTL cache of Instantly and Bison workspace lists, keyed by sheet tab."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, fetcher: Callable = fetch_sheet_csv):
+        """
+        Initialize the registry.
+
+        Args:
+            ttl_seconds: How long a downloaded tab is served without revalidating
+            fetcher: Function downloading a tab (see sheets_client.fetch_sheet_csv)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._fetcher = fetcher
+        self._entries: Dict[Tuple[str, str, str], _RegistryEntry] = {}
+        self._entries_lock = threading.Lock()
+        self.downloads = 0
+        self.revalidations = 0
+        self.hits = 0
+
+    def get_instantly_workspaces(
+        self,
+        sheet_url: str = DEFAULT_SHEET_URL,
+        gid: Optional[str] = SHEET_GID_INSTANTLY
+    ) -> List[Dict[str, str]]:
+        """
+        Get Instantly workspaces (same records as load_workspaces_from_sheet).
+
+        Args:
+            sheet_url: Google Sheet URL
+            gid: Instantly tab GID (None = default tab)
+
+        Returns:
+            List of workspace dicts (treat as read-only)
+        """
+        return self._get("instantly", sheet_url, gid or SHEET_GID_INSTANTLY, parse_workspaces_csv)
+
+    def get_bison_workspaces(
+        self,
+        sheet_url: str = DEFAULT_SHEET_URL,
+        gid: Optional[str] = SHEET_GID_BISON
+    ) -> List[Dict[str, str]]:
+        """
+        Get Bison workspaces (same records as load_bison_workspaces_from_sheet).
+
+        Args:
+            sheet_url: Google Sheet URL
+            gid: Bison tab GID (None = default tab)
+
+        Returns:
+            List of workspace dicts (treat as read-only)
+        """
+        return self._get("bison", sheet_url, gid or SHEET_GID_BISON, parse_bison_workspaces_csv)
+
+    def get_instantly_resolver(
+        self,
+        sheet_url: str = DEFAULT_SHEET_URL,
+        gid: Optional[str] = SHEET_GID_INSTANTLY
+    ) -> ClientResolver:
+        """
+        Get the client resolver for the Instantly tab (rebuilt only when the sheet changes).
+
+        Args:
+            sheet_url: Google Sheet URL
+            gid: Instantly tab GID (None = default tab)
+
+        Returns:
+            ClientResolver matching on workspace_id and client/workspace/person names
+        """
+        entry = self._refresh("instantly", sheet_url, gid or SHEET_GID_INSTANTLY, parse_workspaces_csv)
+        return self._resolver_for(
+            entry, id_field="workspace_id", name_fields=("client_name", "workspace_name", "person_name")
+        )
+
+    def get_bison_resolver(
+        self,
+        sheet_url: str = DEFAULT_SHEET_URL,
+        gid: Optional[str] = SHEET_GID_BISON
+    ) -> ClientResolver:
+        """
+        Get the client resolver for the Bison tab (rebuilt only when the sheet changes).
+
+        Args:
+            sheet_url: Google Sheet URL
+            gid: Bison tab GID (None = default tab)
+
+        Returns:
+            ClientResolver matching on client_name
+        """
+        entry = self._refresh("bison", sheet_url, gid or SHEET_GID_BISON, parse_bison_workspaces_csv)
+        return self._resolver_for(entry, id_field=None, name_fields=("client_name",))
+
+    def resolve_client(
+        self,
+        query: str,
+        sheet_url: str = DEFAULT_SHEET_URL,
+        instantly_gid: Optional[str] = SHEET_GID_INSTANTLY,
+        bison_gid: Optional[str] = SHEET_GID_BISON
+    ) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """
+        Resolve a client on whichever platform has it.
+
+        Applies ClientResolver.resolve's match order across both tabs: an exact
+        ID or name on either platform wins over a partial match on Instantly,
+        and a partial match on either wins over a typo-tolerant one.
+
+        Args:
+            query: Client name, partial name or Instantly workspace ID
+            sheet_url: Google Sheet URL
+            instantly_gid: Instantly tab GID
+            bison_gid: Bison tab GID
+
+        Returns:
+            ("instantly" | "bison", workspace record), or (None, None) if not found
+
+        Raises:
+            ValueError: If the query matches more than one client on a platform
+        """
+        resolvers = (
+            ("instantly", self.get_instantly_resolver(sheet_url, gid=instantly_gid)),
+            ("bison", self.get_bison_resolver(sheet_url, gid=bison_gid))
+        )
+        lookups = (
+            lambda resolver: resolver.exact(query),
+            lambda resolver: resolver.resolve(query, fuzzy=False),
+            lambda resolver: resolver.closest(query)
+        )
+        for lookup in lookups:
+            for platform, resolver in resolvers:
+                workspace = lookup(resolver)
+                if workspace:
+                    return platform, workspace
+        return None, None
+
+    def _resolver_for(self, entry: _RegistryEntry, **kwargs) -> ClientResolver:
+        """Build (once per sheet load) and return the resolver for an entry."""
+        resolver = entry.resolver
+        if resolver is None:
+            with entry.lock:
+                if entry.resolver is None:
+                    entry.resolver = ClientResolver(entry.workspaces, **kwargs)
+                resolver = entry.resolver
+        return resolver
+
+    def _get(
+        self,
+        kind: str,
+        sheet_url: str,
+        gid: str,
+        parser: Callable[[str], List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """Return a fresh workspace list for a tab, downloading at most once per TTL."""
+        return list(self._refresh(kind, sheet_url, gid, parser).workspaces)
+
+    def _refresh(
+        self,
+        kind: str,
+        sheet_url: str,
+        gid: str,
+        parser: Callable[[str], List[Dict[str, str]]]
+    ) -> _RegistryEntry:
+        """Return the entry for a tab, refreshing it if the TTL has expired."""
+        key = (kind, sheet_url or DEFAULT_SHEET_URL, str(gid))
+        with self._entries_lock:
+            entry = self._entries.setdefault(key, _RegistryEntry())
+
+        if self._is_fresh(entry):
+            self.hits += 1
+            return entry
+
+        # Single flight: one caller refreshes, the others wait and reuse its result
+        with entry.lock:
+            if self._is_fresh(entry):
+                self.hits += 1
+                return entry
+
+            try:
+                result = self._fetcher(key[1], key[2], entry.etag, entry.last_modified)
+            except Exception as e:
+                if entry.workspaces is None:
+                    raise
+                logger.warning("Refreshing %s workspaces failed, serving cached copy: %s", kind, e)
+                entry.fetched_at = time.monotonic()
+                return entry
+
+            if result["not_modified"] and entry.workspaces is not None:
+                self.revalidations += 1
+            else:
+                self.downloads += 1
+                content_hash = hashlib.sha256(result["text"].encode("utf-8")).hexdigest()
+                if content_hash != entry.content_hash:
+                    entry.workspaces = parser(result["text"])
+                    entry.content_hash = content_hash
+                    entry.resolver = None
+                    logger.info("Loaded %d %s workspaces from sheet", len(entry.workspaces), kind)
+
+            entry.etag = result.get("etag")
+            entry.last_modified = result.get("last_modified")
+            entry.fetched_at = time.monotonic()
+            return entry
+
+    def _is_fresh(self, entry: _RegistryEntry) -> bool:
+        """Check whether an entry can be served without revalidating."""
+        return (
+            entry.workspaces is not None
+            and time.monotonic() - entry.fetched_at < self.ttl_seconds
+        )
+
+    def invalidate(self):
+        """Force the next lookup of every tab to revalidate with the sheet."""
+        with self._entries_lock:
+            for entry in self._entries.values():
+                entry.fetched_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with cached tab count, hit/download/revalidation counters
+        """
+        return {
+            "tabs": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "downloads": self.downloads,
+            "revalidations": self.revalidations
+        }
+
+
+_registry: Optional[WorkspaceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_workspace_registry() -> WorkspaceRegistry:
+    """
+    Get the process-wide workspace registry, creating it on first use.
+
+    TTL is configured via LEAD_SHEETS_CACHE_TTL (seconds, 0 = always revalidate).
+
+    Returns:
+        Shared WorkspaceRegistry
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            ttl = float(os.getenv("LEAD_SHEETS_CACHE_TTL", str(DEFAULT_TTL_SECONDS)))
+            _registry = WorkspaceRegistry(ttl_seconds=ttl)
+        return _registry
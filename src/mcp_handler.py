@@ -1606,14 +1606,16 @@ class MCPHandler:
         try:
             recording_id = kwargs['recording_id']
             
-            response = await asyncio.to_thread(fathom.list_meetings, limit=100)
-            meetings = response.get('items', [])
+            target_meeting = await asyncio.to_thread(fathom.get_cached_meeting, recording_id)
             
-            target_meeting = None
-            for meeting in meetings:
-                if meeting.get('recording_id') == recording_id:
-                    target_meeting = meeting
-                    break
+            if not target_meeting or not target_meeting.get('action_items'):
+                response = await asyncio.to_thread(fathom.list_meetings, limit=100)
+                meetings = response.get('items', [])
+                
+                for meeting in meetings:
+                    if meeting.get('recording_id') == recording_id:
+                        target_meeting = meeting
+                        break
             
             if not target_meeting:
                 return json.dumps({
@@ -1761,35 +1763,20 @@ class MCPHandler:
         """Create email sequence for a Bison campaign. Auto-creates campaign if needed."""
         try:
             config = Config.from_env()
-            from leads import sheets_client, bison_client
+            from leads import bison_client
+            from leads.workspace_registry import get_workspace_registry
 
             # Get client's API key from sheet
             client_name = kwargs['client_name']
-            workspaces = await asyncio.to_thread(
-                sheets_client.load_bison_workspaces_from_sheet,
+            resolver = await asyncio.to_thread(
+                get_workspace_registry().get_bison_resolver,
                 config.lead_sheets_url,
                 config.lead_sheets_gid_bison
             )
-
-            # Find workspace by client name using fuzzy matching
-            from rapidfuzz import fuzz, process
-
-            workspace = None
-            if workspaces:
-                client_names = [ws["client_name"] for ws in workspaces]
-                result = process.extractOne(
-                    client_name,
-                    client_names,
-                    scorer=fuzz.WRatio,
-                    score_cutoff=60
-                )
-
-                if result:
-                    matched_name, score, index = result
-                    workspace = workspaces[index]
-                    logger.info("Matched '%s' to '%s' (score: %d%%)", client_name, matched_name, score)
-                else:
-                    logger.warning("No match found for '%s'", client_name)
+            workspaces = resolver.workspaces
+            workspace = resolver.resolve(client_name)
+            if workspace:
+                logger.info("Matched '%s' to '%s'", client_name, workspace["client_name"])
 
             if not workspace:
                 return json.dumps({
@@ -1869,35 +1856,20 @@ class MCPHandler:
         """Create Instantly.ai campaign with email sequences."""
         try:
             config = Config.from_env()
-            from leads import sheets_client, instantly_client
+            from leads import instantly_client
+            from leads.workspace_registry import get_workspace_registry
 
             # Get client's API key from sheet
             client_name = kwargs['client_name']
-            workspaces = await asyncio.to_thread(
-                sheets_client.load_instantly_workspaces_from_sheet,
+            resolver = await asyncio.to_thread(
+                get_workspace_registry().get_instantly_resolver,
                 config.lead_sheets_url,
                 config.lead_sheets_gid_instantly
             )
-
-            # Find workspace by client name using fuzzy matching
-            from rapidfuzz import fuzz, process
-
-            workspace = None
-            if workspaces:
-                client_names = [ws["client_name"] for ws in workspaces]
-                result = process.extractOne(
-                    client_name,
-                    client_names,
-                    scorer=fuzz.WRatio,
-                    score_cutoff=60
-                )
-
-                if result:
-                    matched_name, score, index = result
-                    workspace = workspaces[index]
-                    logger.info("Matched '%s' to '%s' (score: %d%%)", client_name, matched_name, score)
-                else:
-                    logger.warning("No match found for '%s'", client_name)
+            workspaces = resolver.workspaces
+            workspace = resolver.resolve(client_name)
+            if workspace:
+                logger.info("Matched '%s' to '%s'", client_name, workspace["client_name"])
 
             if not workspace:
                 return json.dumps({
@@ -1977,8 +1949,6 @@ class MCPHandler:
             result = await asyncio.to_thread(
                 leads.get_all_platform_stats,
                 sheet_url=config.lead_sheets_url,
-                instantly_gid=config.lead_sheets_gid_instantly,
-                bison_gid=config.lead_sheets_gid_bison,
                 days=kwargs.get('days', 7)
             )
             return json.dumps({"success": True, **result}, indent=2)
@@ -1992,8 +1962,6 @@ class MCPHandler:
             result = await asyncio.to_thread(
                 leads.get_top_performing_clients,
                 sheet_url=config.lead_sheets_url,
-                instantly_gid=config.lead_sheets_gid_instantly,
-                bison_gid=config.lead_sheets_gid_bison,
                 limit=kwargs.get('limit', 10),
                 metric=kwargs.get('metric', 'interested_leads'),
                 days=kwargs.get('days', 7)
@@ -2009,8 +1977,6 @@ class MCPHandler:
             result = await asyncio.to_thread(
                 leads.get_underperforming_clients,
                 sheet_url=config.lead_sheets_url,
-                instantly_gid=config.lead_sheets_gid_instantly,
-                bison_gid=config.lead_sheets_gid_bison,
                 threshold=kwargs.get('threshold', 5),
                 metric=kwargs.get('metric', 'interested_leads'),
                 days=kwargs.get('days', 7)
@@ -2025,9 +1991,7 @@ class MCPHandler:
             config = Config.from_env()
             result = await asyncio.to_thread(
                 leads.get_weekly_summary,
-                sheet_url=config.lead_sheets_url,
-                instantly_gid=config.lead_sheets_gid_instantly,
-                bison_gid=config.lead_sheets_gid_bison
+                sheet_url=config.lead_sheets_url
             )
             return json.dumps({"success": True, **result}, indent=2)
         except Exception as e:
@@ -22,7 +22,7 @@ import secrets
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Callable
 from uuid import uuid4
 
 from fastapi import FastAPI, Request, Header, Query, HTTPException, Form
@@ -33,6 +33,9 @@ from sse_starlette import EventSourceResponse
 # Import the existing MCP server instance from server.py
 # This gives us access to all 82 tools already registered
 import server
+from leads import http_pool
+from leads.llm_client import get_llm_manager
+from leads.progress import ProgressReporter, reporting
 
 # Import Database and RequestContext for multi-tenant support
 from database import Database
@@ -530,7 +533,8 @@ async def execute_tool_with_context(
 async def handle_jsonrpc_request(
     body: Dict[str, Any],
     session_id: Optional[str] = None,
-    ctx: Optional[RequestContext] = None
+    ctx: Optional[RequestContext] = None,
+    notify: Optional[Callable[[Dict[str, Any]], Any]] = None
 ) -> Dict[str, Any]:
     """
     Handle JSON-RPC request per MCP protocol.
@@ -544,6 +548,8 @@ async def handle_jsonrpc_request(
         body: JSON-RPC request dict
         session_id: Optional session ID for tracking
         ctx: Optional RequestContext for multi-tenant user isolation
+        notify: Optional callable receiving progress notifications for tools/call
+            requests that carry params._meta.progressToken
 
     Returns:
         JSON-RPC response dict
@@ -698,6 +704,12 @@ async def handle_jsonrpc_request(
             if not tool_name:
                 raise ValueError("Missing tool name")
 
+            # Stream per-client progress if the caller asked for it and can receive it
+            progress_token = (params.get("_meta") or {}).get("progressToken")
+            reporter = None
+            if progress_token is not None and notify:
+                reporter = ProgressReporter(progress_token, notify, tool=tool_name)
+
             # Track execution time for analytics
             import time
             import traceback
@@ -757,12 +769,13 @@ async def handle_jsonrpc_request(
                             logger.warning(f"Failed to increment usage: {e}")
 
                     # Execute with user-specific clients
-                    response = await execute_tool_with_context(
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        ctx=ctx,
-                        request_id=request_id
-                    )
+                    with reporting(reporter):
+                        response = await execute_tool_with_context(
+                            tool_name=tool_name,
+                            arguments=arguments,
+                            ctx=ctx,
+                            request_id=request_id
+                        )
 
                     # Log usage to database
                     if hasattr(server, 'database') and server.database:
@@ -784,7 +797,8 @@ async def handle_jsonrpc_request(
 
                 else:
                     # Legacy single-user mode
-                    result = await execute_tool(tool_name, arguments)
+                    with reporting(reporter):
+                        result = await execute_tool(tool_name, arguments)
 
                     return {
                         "jsonrpc": "2.0",
@@ -979,6 +993,15 @@ async def lifespan(app: FastAPI):
     session_cleanup_task = asyncio.create_task(cleanup_stale_sessions())
     rate_limiter_cleanup_task = asyncio.create_task(rate_limiter.cleanup_old_buckets())
     logger.info("✓ Background cleanup tasks started")
+
+    # Keep the portfolio lead tools warm (one worker refreshes, elected via a lease)
+    try:
+        warm_scheduler = server.start_lead_warm_scheduler()
+        if warm_scheduler:
+            logger.info("✓ Lead warm-cache scheduler started")
+    except Exception as e:
+        logger.error(f"✗ Failed to start lead warm-cache scheduler: {e}")
+        warm_scheduler = None
     logger.info("=" * 60)
 
     yield
@@ -987,6 +1010,8 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Remote MCP Server...")
     session_cleanup_task.cancel()
     rate_limiter_cleanup_task.cancel()
+    if warm_scheduler:
+        await warm_scheduler.stop()
     sessions.clear()
     rate_limiter.buckets.clear()
     logger.info("✓ Cleanup complete")
@@ -1051,6 +1076,8 @@ async def health_check():
         "server_name": server.config.server_name,
         "tools_count": tool_count,
         "sessions_active": len(sessions),
+        "upstream": http_pool.get_pool().stats(),
+        "llm": get_llm_manager().stats(),
         "version": "1.0.0"
     })
 
@@ -3815,11 +3842,77 @@ async def mcp_streamable_http(
         # Update session activity
         sessions[mcp_session_id].update_activity()
 
+        # Long tool calls stream progress notifications before the result
+        # when the client accepts SSE and sent a progressToken
+        progress_token = (body.get("params", {}).get("_meta") or {}).get("progressToken")
+        if (method == "tools/call" and progress_token is not None
+                and "text/event-stream" in request.headers.get("accept", "")):
+            return stream_tool_call(body, mcp_session_id, ctx)
+
         # Handle the request (with optional user context)
         response_data = await handle_jsonrpc_request(body, mcp_session_id, ctx)
         return JSONResponse(response_data)
 
 
+def stream_tool_call(
+    body: Dict[str, Any],
+    session_id: str,
+    ctx: Optional[RequestContext] = None
+) -> EventSourceResponse:
+    """
+    Answer a streamable HTTP tools/call as an SSE stream.
+
+    Progress notifications are sent as the tool reports them, followed by
+    the JSON-RPC response, which closes the stream.
+
+    Args:
+        body: JSON-RPC tools/call request
+        session_id: Streamable HTTP session ID
+        ctx: Optional RequestContext for multi-tenant user isolation
+
+    Returns:
+        EventSourceResponse streaming the notifications and the response
+    """
+    notifications: asyncio.Queue = asyncio.Queue()
+    call = asyncio.create_task(
+        handle_jsonrpc_request(body, session_id, ctx, notify=notifications.put_nowait)
+    )
+
+    async def event_generator():
+        """Relay notifications until the tool call completes."""
+        try:
+            while True:
+                next_notification = asyncio.ensure_future(notifications.get())
+                done, _ = await asyncio.wait(
+                    {next_notification, call},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_notification in done:
+                    yield {"event": "message", "data": json.dumps(next_notification.result())}
+                    continue
+                next_notification.cancel()
+                break
+
+            # Notifications reported just before the call returned
+            while not notifications.empty():
+                yield {"event": "message", "data": json.dumps(notifications.get_nowait())}
+
+            yield {"event": "message", "data": json.dumps(call.result())}
+
+        except asyncio.CancelledError:
+            logger.info(f"Client disconnected during streamed tool call (session: {session_id})")
+            call.cancel()
+            raise
+
+    return EventSourceResponse(
+        event_generator(),
+        headers={
+            "Mcp-Session-Id": session_id,
+            "Cache-Control": "no-cache"
+        }
+    )
+
+
 # ===========================================================================
 # LEGACY TRANSPORT: HTTP+SSE (2024-11-05)
 # ===========================================================================
@@ -3956,8 +4049,10 @@ async def mcp_messages_legacy(
     # Get user context from session (if available)
     ctx = sessions[session_id].user_context
 
-    # Handle the request with user context
-    response = await handle_jsonrpc_request(body, session_id, ctx)
+    # Handle the request with user context; progress notifications go out on the SSE stream
+    response = await handle_jsonrpc_request(
+        body, session_id, ctx, notify=sessions[session_id].queue.put_nowait
+    )
 
     # Queue response for SSE stream
     await sessions[session_id].queue.put(response)
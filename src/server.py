@@ -41,8 +41,10 @@ from leads import (
     get_all_clients, get_all_platform_stats, get_top_performing_clients,
     get_underperforming_clients, get_weekly_summary,
     get_instantly_mailboxes, get_bison_mailboxes, get_bison_sender_replies,
-    get_all_mailbox_health, get_unhealthy_mailboxes
+    get_all_mailbox_health, get_unhealthy_mailboxes, get_mailbox_capacity,
+    get_client_metric_trends, get_week_over_week_movers, refresh_metrics_history
 )
+from leads.warm_cache import serve, create_scheduler, WarmScheduler
 
 
 # Initialize logging
@@ -4246,16 +4248,19 @@ async def get_fathom_action_items(recording_id: int) -> str:
 
         logger.info("Fetching action items for recording %d...", recording_id)
 
-        # Get the full meeting data which includes action items
-        response = fathom_client.list_meetings(limit=100)
-        meetings = response.get('items', [])
+        # Meeting records (which carry action items) are cached once they have them
+        target_meeting = fathom_client.get_cached_meeting(recording_id)
 
-        # Find the specific meeting
-        target_meeting = None
-        for meeting in meetings:
-            if meeting.get('recording_id') == recording_id:
-                target_meeting = meeting
-                break
+        if not target_meeting or not target_meeting.get('action_items'):
+            # Get the full meeting data which includes action items
+            response = fathom_client.list_meetings(limit=100)
+            meetings = response.get('items', [])
+
+            # Find the specific meeting
+            for meeting in meetings:
+                if meeting.get('recording_id') == recording_id:
+                    target_meeting = meeting
+                    break
 
         if not target_meeting:
             return json.dumps({
@@ -4297,6 +4302,163 @@ async def get_fathom_action_items(recording_id: int) -> str:
         }, indent=2)
 
 
+@mcp.tool()
+async def get_fathom_recordings_bulk(
+    recording_ids: list[int] = None,
+    search_term: str = None,
+    created_after: str = None,
+    created_before: str = None,
+    max_meetings: int = 50,
+    include_summary: bool = True,
+    include_transcript: bool = True,
+    max_transcript_chars: int = None
+) -> str:
+    """
+    Fetch summaries and transcripts for many Fathom recordings in one call.
+
+    Use this instead of calling get_fathom_summary / get_fathom_transcript once
+    per meeting (e.g. "analyse all client calls this month"). Recordings are
+    fetched concurrently within the Fathom rate limit. Either pass recording_ids,
+    or select meetings with created_after / created_before / search_term.
+
+    Args:
+        recording_ids: Fathom recording IDs to fetch (overrides the meeting query)
+        search_term: Only include meetings whose title contains this term
+        created_after: Only include meetings created after this timestamp (ISO 8601 format).
+            Example: "2024-11-01T00:00:00Z"
+        created_before: Only include meetings created before this timestamp (ISO 8601 format).
+            Example: "2024-11-30T23:59:59Z"
+        max_meetings: Maximum meetings to select when using a query (default: 50)
+        include_summary: Include each meeting's summary (default: True)
+        include_transcript: Include each meeting's transcript (default: True)
+        max_transcript_chars: Total character budget shared across all transcripts.
+            Long transcripts are truncated to fit (default: no limit)
+
+    Returns:
+        JSON string with one compact entry per recording; failures are reported
+        per recording under "errors"
+    """
+    try:
+        initialize_clients()
+
+        if not fathom_client:
+            return json.dumps({
+                "success": False,
+                "error": "Fathom API key not configured. Please set FATHOM_API_KEY in your environment."
+            }, indent=2)
+
+        logger.info("Bulk fetching Fathom recordings...")
+
+        result = await asyncio.to_thread(
+            fathom_client.get_recordings_bulk,
+            recording_ids=recording_ids,
+            search_term=search_term,
+            created_after=created_after,
+            created_before=created_before,
+            max_meetings=max_meetings,
+            include_summary=include_summary,
+            include_transcript=include_transcript,
+            max_transcript_chars=max_transcript_chars
+        )
+
+        return json.dumps({
+            "success": True,
+            "count": len(result["recordings"]),
+            **result
+        }, indent=2)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error("Error in get_fathom_recordings_bulk: %s", error_msg)
+        return json.dumps({
+            "success": False,
+            "error": error_msg
+        }, indent=2)
+
+
+@mcp.tool()
+async def search_fathom_transcripts(
+    query: str,
+    limit: int = 10,
+    speaker: str = None,
+    match_any: bool = False,
+    sync_recent: bool = True,
+    created_after: str = None,
+    max_meetings: int = 50
+) -> str:
+    """
+    Full-text search across Fathom meeting transcripts.
+
+    Answers questions like "which calls mentioned pricing" in one call. Searches
+    a local index of your transcripts and returns the best-matching meetings
+    with highlighted snippets, who said it, when in the call, and the recording link.
+
+    Args:
+        query: Words to search for (e.g. "pricing discount"). Add * for prefix
+            matches (e.g. "integrat*")
+        limit: Maximum number of meetings to return (default: 10)
+        speaker: Only match what this speaker said (name, partial match)
+        match_any: Match meetings mentioning any of the words instead of all (default: False)
+        sync_recent: Index transcripts of recent meetings that aren't indexed yet
+            before searching (default: True)
+        created_after: When syncing, only consider meetings created after this
+            timestamp (ISO 8601 format). Example: "2024-11-01T00:00:00Z"
+        max_meetings: When syncing, maximum number of recent meetings to check (default: 50)
+
+    Returns:
+        JSON string with ranked meetings and matching transcript snippets
+    """
+    try:
+        initialize_clients()
+
+        if not fathom_client:
+            return json.dumps({
+                "success": False,
+                "error": "Fathom API key not configured. Please set FATHOM_API_KEY in your environment."
+            }, indent=2)
+
+        if not fathom_client.search_index:
+            return json.dumps({
+                "success": False,
+                "error": "Transcript search index is disabled (FATHOM_SEARCH_MAX_RECORDINGS=0)."
+            }, indent=2)
+
+        sync = None
+        if sync_recent:
+            sync = await asyncio.to_thread(
+                fathom_client.sync_search_index,
+                created_after=created_after,
+                max_meetings=max_meetings
+            )
+
+        logger.info("Searching Fathom transcripts for '%s'...", query)
+
+        results = await asyncio.to_thread(
+            fathom_client.search_index.search,
+            query,
+            limit=limit,
+            speaker=speaker,
+            match_any=match_any
+        )
+
+        return json.dumps({
+            "success": True,
+            "query": query,
+            "count": len(results),
+            "meetings": results,
+            "sync": sync,
+            "index": fathom_client.search_index.stats()
+        }, indent=2)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error("Error in search_fathom_transcripts: %s", error_msg)
+        return json.dumps({
+            "success": False,
+            "error": error_msg
+        }, indent=2)
+
+
 # ============================================================================
 # LEAD MANAGEMENT TOOLS
 # ============================================================================
@@ -4516,10 +4678,24 @@ async def get_all_clients_with_positive_replies(
     Returns:
         JSON with list of clients that have positive replies, sorted by reply count
     """
+    return await serve(
+        "get_all_clients_with_positive_replies",
+        _get_all_clients_with_positive_replies,
+        {"days": days, "platform": platform}
+    )
+
+
+async def _get_all_clients_with_positive_replies(
+    days: int = 7,
+    platform: str = "all",
+    max_workers: int = 20
+) -> str:
+    """Compute get_all_clients_with_positive_replies (max_workers clients are fetched at once)."""
     try:
         from concurrent.futures import ThreadPoolExecutor, as_completed
+        from leads import progress
         from leads.lead_functions import get_lead_responses
-        from leads.sheets_client import load_workspaces_from_sheet, load_bison_workspaces_from_sheet
+        from leads.workspace_registry import get_workspace_registry
 
         if not config.lead_sheets_url:
             return json.dumps({
@@ -4566,26 +4742,35 @@ async def get_all_clients_with_positive_replies(
             return None
 
         # PARALLEL PROCESSING: Fetch all clients simultaneously
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = []
+        def fetch_all_workspaces():
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+
+                # Queue Instantly clients
+                if platform in ["all", "instantly"]:
+                    instantly_workspaces = get_workspace_registry().get_instantly_workspaces(config.lead_sheets_url, gid=config.lead_sheets_gid_instantly)
+                    for ws in instantly_workspaces:
+                        futures.append(executor.submit(fetch_workspace_leads, ws, "instantly", config.lead_sheets_gid_instantly))
+
+                # Queue Bison clients
+                if platform in ["all", "bison"]:
+                    bison_workspaces = get_workspace_registry().get_bison_workspaces(config.lead_sheets_url, gid=config.lead_sheets_gid_bison)
+                    for ws in bison_workspaces:
+                        futures.append(executor.submit(fetch_workspace_leads, ws, "bison", config.lead_sheets_gid_bison))
+
+                # Collect results as they complete, streaming each client to the caller
+                counter = progress.progress_counter(len(futures))
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result:
+                        clients_with_replies.append(result)
+                    counter.advance(
+                        message=result["client_name"] if result else None,
+                        partial=result
+                    )
 
-            # Queue Instantly clients
-            if platform in ["all", "instantly"]:
-                instantly_workspaces = load_workspaces_from_sheet(config.lead_sheets_url, gid=config.lead_sheets_gid_instantly)
-                for ws in instantly_workspaces:
-                    futures.append(executor.submit(fetch_workspace_leads, ws, "instantly", config.lead_sheets_gid_instantly))
-
-            # Queue Bison clients
-            if platform in ["all", "bison"]:
-                bison_workspaces = load_bison_workspaces_from_sheet(config.lead_sheets_url, gid=config.lead_sheets_gid_bison)
-                for ws in bison_workspaces:
-                    futures.append(executor.submit(fetch_workspace_leads, ws, "bison", config.lead_sheets_gid_bison))
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    clients_with_replies.append(result)
+        # Off the event loop, so progress notifications go out while clients finish
+        await asyncio.to_thread(fetch_all_workspaces)
 
         # Sort by number of replies (descending)
         clients_with_replies.sort(key=lambda x: x["total_replies"], reverse=True)
@@ -4655,10 +4840,9 @@ async def get_active_instantly_clients(days: int = 14) -> str:
         get_active_instantly_clients(14)  # Get clients with activity in last 14 days
     """
     try:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         from leads.date_utils import validate_and_parse_dates
-        from leads.sheets_client import load_workspaces_from_sheet
-        import requests
+        from leads.workspace_registry import get_workspace_registry
+        from leads.instantly_client import get_instantly_campaign_stats_async
 
         if not config.lead_sheets_url:
             return json.dumps({
@@ -4672,23 +4856,21 @@ async def get_active_instantly_clients(days: int = 14) -> str:
         start_date, end_date, warnings = validate_and_parse_dates(days=days)
 
         # Load all Instantly workspaces
-        instantly_workspaces = load_workspaces_from_sheet(
+        instantly_workspaces = get_workspace_registry().get_instantly_workspaces(
             sheet_url=config.lead_sheets_url,
             gid=config.lead_sheets_gid_instantly
         )
 
         logger.info("Checking %d Instantly workspaces for campaign activity...", len(instantly_workspaces))
 
-        def check_client_activity(workspace):
+        async def check_client_activity(workspace):
             """Check if client has sent emails"""
             try:
-                from leads.instantly_client import get_instantly_campaign_stats
-
                 client_name = workspace.get("client_name", workspace.get("workspace_name", "Unknown"))
                 api_key = workspace["api_key"]
 
                 # Get campaign stats from Instantly API (V2)
-                data = get_instantly_campaign_stats(
+                data = await get_instantly_campaign_stats_async(
                     api_key=api_key,
                     start_date=start_date,
                     end_date=end_date
@@ -4711,15 +4893,9 @@ async def get_active_instantly_clients(days: int = 14) -> str:
                 logger.warning("Error checking Instantly client %s: %s", client_name, str(e))
                 return None
 
-        # Use parallel processing to check all clients simultaneously
-        active_clients = []
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = {executor.submit(check_client_activity, ws): ws for ws in instantly_workspaces}
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    active_clients.append(result)
+        # Check all clients concurrently (bounded by the shared HTTP pool)
+        results = await asyncio.gather(*(check_client_activity(ws) for ws in instantly_workspaces))
+        active_clients = [result for result in results if result]
 
         # Sort by emails sent (descending)
         active_clients.sort(key=lambda x: x["emails_sent"], reverse=True)
@@ -4780,10 +4956,9 @@ async def get_active_bison_clients(days: int = 14) -> str:
         get_active_bison_clients(14)  # Get clients with activity in last 14 days
     """
     try:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         from leads.date_utils import validate_and_parse_dates
-        from leads.sheets_client import load_bison_workspaces_from_sheet
-        from leads.bison_client import get_bison_campaign_stats_api
+        from leads.workspace_registry import get_workspace_registry
+        from leads.bison_client import get_bison_campaign_stats_api_async
 
         if not config.lead_sheets_url:
             return json.dumps({
@@ -4797,21 +4972,21 @@ async def get_active_bison_clients(days: int = 14) -> str:
         start_date, end_date, warnings = validate_and_parse_dates(days=days)
 
         # Load all Bison workspaces
-        bison_workspaces = load_bison_workspaces_from_sheet(
+        bison_workspaces = get_workspace_registry().get_bison_workspaces(
             sheet_url=config.lead_sheets_url,
             gid=config.lead_sheets_gid_bison
         )
 
         logger.info("Checking %d Bison workspaces for campaign activity...", len(bison_workspaces))
 
-        def check_client_activity(workspace):
+        async def check_client_activity(workspace):
             """Check if client has sent emails"""
             try:
                 client_name = workspace.get("client_name", workspace.get("workspace_name", "Unknown"))
                 api_key = workspace["api_key"]
 
                 # Get campaign stats from Bison API
-                response = get_bison_campaign_stats_api(
+                response = await get_bison_campaign_stats_api_async(
                     api_key=api_key,
                     start_date=start_date,
                     end_date=end_date
@@ -4843,15 +5018,9 @@ async def get_active_bison_clients(days: int = 14) -> str:
                 logger.warning("Error checking Bison client %s: %s", client_name, str(e))
                 return None
 
-        # Use parallel processing to check all clients simultaneously
-        active_clients = []
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = {executor.submit(check_client_activity, ws): ws for ws in bison_workspaces}
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    active_clients.append(result)
+        # Check all clients concurrently (bounded by the shared HTTP pool)
+        results = await asyncio.gather(*(check_client_activity(ws) for ws in bison_workspaces))
+        active_clients = [result for result in results if result]
 
         # Sort by emails sent (descending)
         active_clients.sort(key=lambda x: x["emails_sent"], reverse=True)
@@ -4915,6 +5084,11 @@ async def get_all_active_clients(days: int = 14, platform: str = "all") -> str:
         get_all_active_clients(14)  # All platforms, last 14 days
         get_all_active_clients(7, "instantly")  # Only Instantly
     """
+    return await serve("get_all_active_clients", _get_all_active_clients, {"days": days, "platform": platform})
+
+
+async def _get_all_active_clients(days: int = 14, platform: str = "all") -> str:
+    """Compute get_all_active_clients."""
     try:
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -5023,6 +5197,8 @@ async def get_client_lead_details(client_name: str, days: int = 7) -> str:
         get_client_lead_details("Rick Pendrick", 7)
     """
     try:
+        from leads.workspace_registry import get_workspace_registry
+
         if not config.lead_sheets_url:
             return json.dumps({
                 "success": False,
@@ -5031,49 +5207,31 @@ async def get_client_lead_details(client_name: str, days: int = 7) -> str:
 
         logger.info("Fetching detailed leads for client: %s (days=%d)", client_name, days)
 
-        # Try to find the client in both platforms
-        result = None
-        platform_used = None
+        # Find the client on either platform
+        platform_used, workspace = get_workspace_registry().resolve_client(
+            client_name,
+            config.lead_sheets_url,
+            instantly_gid=config.lead_sheets_gid_instantly,
+            bison_gid=config.lead_sheets_gid_bison
+        )
 
-        # Try Instantly first
-        try:
-            instantly_workspaces = load_workspaces_from_sheet(
-                config.lead_sheets_url,
+        result = None
+        if platform_used == "instantly":
+            result = get_lead_responses(
+                workspace_id=workspace["workspace_id"],
+                days=days,
+                sheet_url=config.lead_sheets_url,
                 gid=config.lead_sheets_gid_instantly
             )
-            matching_workspace = next(
-                (ws for ws in instantly_workspaces
-                 if ws.get("client_name", "").lower() == client_name.lower() or
-                    ws.get("workspace_id", "").lower() == client_name.lower()),
-                None
+        elif platform_used == "bison":
+            from leads.lead_functions import get_bison_lead_responses
+            result = get_bison_lead_responses(
+                client_name=workspace["client_name"],
+                days=days,
+                sheet_url=config.lead_sheets_url,
+                gid=config.lead_sheets_gid_bison
             )
 
-            if matching_workspace:
-                workspace_id = matching_workspace.get("workspace_id") or matching_workspace.get("client_name")
-                result = get_lead_responses(
-                    workspace_id=workspace_id,
-                    days=days,
-                    sheet_url=config.lead_sheets_url,
-                    gid=config.lead_sheets_gid_instantly
-                )
-                platform_used = "instantly"
-        except Exception as e:
-            logger.debug(f"Client not found in Instantly: {e}")
-
-        # Try Bison if not found in Instantly
-        if not result or result.get("total_leads", 0) == 0:
-            try:
-                from leads.lead_functions import get_bison_lead_responses
-                result = get_bison_lead_responses(
-                    client_name=client_name,
-                    days=days,
-                    sheet_url=config.lead_sheets_url,
-                    gid=config.lead_sheets_gid_bison
-                )
-                platform_used = "bison"
-            except Exception as e:
-                logger.debug(f"Client not found in Bison: {e}")
-
         if not result or result.get("total_leads", 0) == 0:
             return json.dumps({
                 "success": False,
@@ -5105,7 +5263,8 @@ async def find_missed_opportunities(
     client_name: str,
     days: int = 7,
     use_claude: bool = True,
-    exclude_auto_replies: bool = True
+    exclude_auto_replies: bool = True,
+    full_rescan: bool = False
 ) -> str:
     """
     Find "hidden gems" - interested leads that Instantly/Bison AI didn't categorize correctly.
@@ -5117,11 +5276,15 @@ async def find_missed_opportunities(
 
     Supports BOTH Instantly and Bison clients - automatically detects which platform the client uses.
 
+    Replies analysed on earlier runs for the same client are not analysed again
+    unless their content changed; their stored results are merged into the report.
+
     Args:
         client_name: Name of the client to analyze (works with both Instantly and Bison)
         days: Number of days to look back (default: 7)
         use_claude: Use Claude API for unclear cases (default: True, requires ANTHROPIC_API_KEY)
         exclude_auto_replies: Exclude automated replies like OOO messages (default: True, Bison only)
+        full_rescan: Re-analyse every reply in the window, e.g. for an audit (default: False)
 
     Returns:
         JSON with hidden gems report showing missed interested leads
@@ -5130,12 +5293,14 @@ async def find_missed_opportunities(
         find_missed_opportunities("Rick Pendrick", 7, True)  # Instantly client
         find_missed_opportunities("Rich Cave", 7, True)      # Bison client
         find_missed_opportunities("Jeff Mikolai", 30, True, True)  # Exclude auto-replies
+        find_missed_opportunities("Rich Cave", 30, full_rescan=True)  # Audit: re-analyse everything
     """
     try:
         from leads._source_fetch_interested_leads import fetch_all_campaign_replies
-        from leads.interest_analyzer import categorize_leads
-        from leads.sheets_client import load_workspaces_from_sheet
+        from leads.interest_analyzer import categorize_leads_incremental
+        from leads.workspace_registry import get_workspace_registry
         from leads.date_utils import validate_and_parse_dates
+        from leads.progress import report_step
 
         if not config.lead_sheets_url:
             return json.dumps({
@@ -5143,16 +5308,16 @@ async def find_missed_opportunities(
                 "error": "Lead management not configured. Please set LEAD_SHEETS_URL in your environment."
             }, indent=2)
 
-        logger.info("Finding missed opportunities for %s (days=%d, use_claude=%s, exclude_auto_replies=%s)",
-                   client_name, days, use_claude, exclude_auto_replies)
+        logger.info("Finding missed opportunities for %s (days=%d, use_claude=%s, exclude_auto_replies=%s, full_rescan=%s)",
+                   client_name, days, use_claude, exclude_auto_replies, full_rescan)
 
         # Calculate date range
         logger.info("Step 1/7: Calculating date range...")
+        report_step(1, 7, "Calculating date range")
         start_date, end_date, warnings = validate_and_parse_dates(days=days)
         logger.info("Date range: %s to %s", start_date, end_date)
 
         # Try to find client in Instantly workspaces first
-        from leads.sheets_client import load_bison_workspaces_from_sheet
         from leads.bison_client import get_bison_lead_replies
 
         platform_used = None
@@ -5160,18 +5325,21 @@ async def find_missed_opportunities(
         already_interested = []
 
         logger.info("Step 2/7: Loading Instantly workspaces...")
-        instantly_workspaces = load_workspaces_from_sheet(
+        report_step(2, 7, "Loading Instantly workspaces")
+        registry = get_workspace_registry()
+        instantly_resolver = registry.get_instantly_resolver(
             config.lead_sheets_url,
             gid=config.lead_sheets_gid_instantly
         )
-        logger.info("Loaded %d Instantly workspaces", len(instantly_workspaces))
+        logger.info("Loaded %d Instantly workspaces", len(instantly_resolver))
 
-        matching_instantly_workspace = next(
-            (ws for ws in instantly_workspaces
-             if ws.get("client_name", "").lower() == client_name.lower() or
-                ws.get("workspace_id", "").lower() == client_name.lower()),
-            None
+        platform_found, matching_workspace = registry.resolve_client(
+            client_name,
+            config.lead_sheets_url,
+            instantly_gid=config.lead_sheets_gid_instantly,
+            bison_gid=config.lead_sheets_gid_bison
         )
+        matching_instantly_workspace = matching_workspace if platform_found == "instantly" else None
 
         # Try Instantly first
         if matching_instantly_workspace:
@@ -5187,7 +5355,9 @@ async def find_missed_opportunities(
 
             # Step 1: Fetch ALL campaign replies (no i_status filter)
             logger.info("Step 3/7: Fetching all Instantly replies...")
-            all_replies_result = fetch_all_campaign_replies(
+            report_step(3, 7, "Fetching all Instantly replies")
+            all_replies_result = await asyncio.to_thread(
+                fetch_all_campaign_replies,
                 api_key=api_key,
                 start_date=start_date,
                 end_date=end_date,
@@ -5197,6 +5367,7 @@ async def find_missed_opportunities(
 
             # Step 2: Split replies into already-captured (positive status) vs missed opportunities
             logger.info("Step 4/7: Filtering Instantly replies by status...")
+            report_step(4, 7, "Filtering Instantly replies by status")
             all_replies = all_replies_result.get("leads", [])
 
             # Add platform field to Instantly replies for timing detection
@@ -5240,22 +5411,21 @@ async def find_missed_opportunities(
         if not matching_instantly_workspace:
             logger.info("Client not found in Instantly, checking Bison...")
             logger.info("Step 3/7: Loading Bison workspaces...")
-            bison_workspaces = load_bison_workspaces_from_sheet(
+            report_step(3, 7, "Loading Bison workspaces")
+            bison_resolver = registry.get_bison_resolver(
                 config.lead_sheets_url,
                 gid=config.lead_sheets_gid_bison
             )
+            bison_workspaces = bison_resolver.workspaces
             logger.info("Loaded %d Bison workspaces", len(bison_workspaces))
 
-            matching_bison_workspace = next(
-                (ws for ws in bison_workspaces
-                 if ws.get("client_name", "").lower() == client_name.lower()),
-                None
-            )
+            matching_bison_workspace = matching_workspace if platform_found == "bison" else None
 
             if not matching_bison_workspace:
                 # Show similar client names to help with debugging
                 all_client_names = [ws.get("client_name", "") for ws in bison_workspaces]
-                similar_names = [name for name in all_client_names if client_name.lower() in name.lower() or name.lower() in client_name.lower()]
+                similar_names = [w["client_name"] for w in bison_resolver.candidates(client_name)]
+                similar_names += [name for name in all_client_names if name and name.lower() in client_name.lower() and name not in similar_names]
 
                 error_msg = f"Client '{client_name}' not found in either Instantly or Bison workspaces."
                 if similar_names:
@@ -5281,8 +5451,9 @@ async def find_missed_opportunities(
 
             # Step 0: Fetch sender email accounts to identify client's email addresses
             logger.info("Step 3a/7: Fetching Bison sender email accounts...")
+            report_step(3.5, 7, "Fetching Bison sender email accounts")
             from leads.bison_client import get_bison_sender_emails
-            sender_emails_result = get_bison_sender_emails(api_key=api_key)
+            sender_emails_result = await asyncio.to_thread(get_bison_sender_emails, api_key=api_key)
             sender_accounts = sender_emails_result.get("data", [])
             logger.info("Found %d sender email accounts", len(sender_accounts))
 
@@ -5301,8 +5472,10 @@ async def find_missed_opportunities(
             # Step 1: Fetch ALL campaign replies (excluding auto-replies if requested)
             # Use status="not_automated_reply" to exclude OOO messages and other auto-replies
             logger.info("Step 4/7: Fetching all Bison replies...")
+            report_step(4, 7, "Fetching all Bison replies")
             all_replies_status = "not_automated_reply" if exclude_auto_replies else None
-            all_replies_result = get_bison_lead_replies(
+            all_replies_result = await asyncio.to_thread(
+                get_bison_lead_replies,
                 api_key=api_key,
                 status=all_replies_status,
                 folder="all"
@@ -5313,6 +5486,7 @@ async def find_missed_opportunities(
             # NOTE: Don't use status="interested" API filter - it only returns GREEN status (new unreplied)
             # The "interested" field is the persistent GRAY TAG that survives after you reply back
             logger.info("Step 5/7: Filtering for Bison interested tag (persistent gray label)...")
+            report_step(5, 7, "Filtering for Bison interested tag")
             all_replies_raw = all_replies_result.get("data", [])
             interested_replies_raw = [r for r in all_replies_raw if r.get("interested", False)]
             logger.info("Found %d Bison replies with interested=true (gray tag)", len(interested_replies_raw))
@@ -5443,6 +5617,7 @@ async def find_missed_opportunities(
 
         # Create set of already-interested email addresses
         logger.info("Step 6/7: Filtering replies...")
+        report_step(6, 7, "Filtering replies")
         already_interested_emails = {lead["email"].lower() for lead in already_interested}
 
         # Step 3: Filter to get ONLY the non-interested replies
@@ -5492,7 +5667,15 @@ async def find_missed_opportunities(
         logger.info("Step 7/7: AI analyzing %d non-interested replies (use_claude=%s)...",
                    len(non_interested_replies), use_claude)
         logger.info("This may take 30-60 seconds for 100+ replies with Claude API enabled...")
-        categorized = categorize_leads(non_interested_replies, use_claude=use_claude, api_key=api_key)
+        report_step(7, 7, f"AI analyzing {len(non_interested_replies)} replies")
+        categorized = await asyncio.to_thread(
+            categorize_leads_incremental,
+            non_interested_replies,
+            platform_used,
+            use_claude=use_claude,
+            api_key=api_key,
+            full_rescan=full_rescan
+        )
         logger.info("AI analysis complete!")
 
         # Hidden gems = HOT + WARM leads from the non-interested bucket
@@ -5579,7 +5762,13 @@ async def find_missed_opportunities(
                     "cold": len(categorized["cold"]),
                     "auto_reply": len(categorized["auto_reply"]),
                     "unclear": len(categorized["unclear"])
-                }
+                },
+                "timing_cache": categorized["summary"].get("timing_cache"),
+                "verdict_cache": categorized["summary"].get("verdict_cache"),
+                "claude_requests": categorized["summary"].get("claude_requests"),
+                "reply_normalization": categorized["summary"].get("reply_normalization"),
+                "reply_clusters": categorized["summary"].get("reply_clusters"),
+                "incremental": categorized["summary"].get("incremental")
             },
             "hidden_gems": hidden_gems_report[:20],  # Limit to top 20
             "unclear_leads": unclear_report[:20],  # Include unclear leads for manual review
@@ -5645,20 +5834,19 @@ async def mark_lead_as_interested(
         # Import required functions
         from leads._source_fetch_interested_leads import mark_instantly_lead_as_interested
         from leads.bison_client import mark_bison_reply_as_interested
-        from leads.sheets_client import load_workspaces_from_sheet, load_bison_workspaces_from_sheet
+        from leads.workspace_registry import get_workspace_registry
 
         logger.info("Marking lead as interested: %s (client: %s)", lead_email, client_name)
 
-        # Try Instantly first
-        instantly_workspaces = load_workspaces_from_sheet(
-            sheet_url=config.lead_sheets_url,
-            gid=config.lead_sheets_gid_instantly
-        )
-
-        matching_instantly_workspace = next(
-            (w for w in instantly_workspaces if w["client_name"].lower() == client_name.lower()),
-            None
+        # Find the client on either platform
+        platform, workspace = get_workspace_registry().resolve_client(
+            client_name,
+            config.lead_sheets_url,
+            instantly_gid=config.lead_sheets_gid_instantly,
+            bison_gid=config.lead_sheets_gid_bison
         )
+        matching_instantly_workspace = workspace if platform == "instantly" else None
+        matching_bison_workspace = workspace if platform == "bison" else None
 
         if matching_instantly_workspace:
             # Use Instantly API
@@ -5706,17 +5894,6 @@ async def mark_lead_as_interested(
                 "note": "Lead interest status update job submitted to Instantly"
             }, indent=2)
 
-        # If not Instantly, try Bison
-        bison_workspaces = load_bison_workspaces_from_sheet(
-            sheet_url=config.lead_sheets_url,
-            gid=config.lead_sheets_gid_bison
-        )
-
-        matching_bison_workspace = next(
-            (w for w in bison_workspaces if w["client_name"].lower() == client_name.lower()),
-            None
-        )
-
         if matching_bison_workspace:
             # Use Bison API
             api_key = matching_bison_workspace["api_key"]
@@ -6136,6 +6313,11 @@ async def get_lead_weekly_summary() -> str:
     Returns:
         JSON string with weekly summary
     """
+    return await serve("get_lead_weekly_summary", _get_lead_weekly_summary)
+
+
+async def _get_lead_weekly_summary() -> str:
+    """Compute get_lead_weekly_summary."""
     try:
         if not config.lead_sheets_url:
             return json.dumps({
@@ -6145,11 +6327,7 @@ async def get_lead_weekly_summary() -> str:
 
         logger.info("Generating weekly lead summary...")
 
-        result = get_weekly_summary(
-            sheet_url=config.lead_sheets_url,
-            instantly_gid=config.lead_sheets_gid_instantly,
-            bison_gid=config.lead_sheets_gid_bison
-        )
+        result = await asyncio.to_thread(get_weekly_summary, sheet_url=config.lead_sheets_url)
 
         logger.info("Generated weekly summary: %d total leads",
                    result.get('total_leads', 0))
@@ -6168,6 +6346,116 @@ async def get_lead_weekly_summary() -> str:
         }, indent=2)
 
 
+@mcp.tool()
+async def get_client_metric_trend(client_name: str, weeks: int = 8, rolling_weeks: int = 4) -> str:
+    """
+    Get a client's weekly campaign metric trend from the local metrics history.
+
+    Reads the daily metrics recorded by the stats layer, so historical windows
+    cost no Instantly or Bison API calls.
+
+    Args:
+        client_name: Client name, partial name or Instantly workspace ID
+        weeks: Number of 7-day windows ending yesterday (default: 8)
+        rolling_weeks: Weeks in the rolling average (default: 4)
+
+    Returns:
+        JSON string with per-week emails sent, replies, interested, opportunities,
+        reply and interest rates, their rolling averages, week-over-week deltas
+        and how many days of history were available
+    """
+    try:
+        if not config.lead_sheets_url:
+            return json.dumps({
+                "success": False,
+                "error": "Lead management not configured. Please set LEAD_SHEETS_URL in your environment."
+            }, indent=2)
+
+        logger.info("Getting metric trend for %s over %d weeks...", client_name, weeks)
+
+        result = await asyncio.to_thread(
+            get_client_metric_trends,
+            client_name=client_name,
+            weeks=weeks,
+            rolling_weeks=rolling_weeks,
+            sheet_url=config.lead_sheets_url
+        )
+
+        return json.dumps({
+            "success": True,
+            **result
+        }, indent=2)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error("Error in get_client_metric_trend: %s", error_msg)
+        return json.dumps({
+            "success": False,
+            "error": error_msg
+        }, indent=2)
+
+
+@mcp.tool()
+async def get_week_over_week_changes(metric: str = "reply_rate", platform: str = "all", limit: int = 10) -> str:
+    """
+    Find the clients whose metric rose or fell most from last week to this week.
+
+    Compares the last two complete weeks for every client in one pass over the
+    local metrics history (no API calls).
+
+    Args:
+        metric: "emails_sent", "replies", "interested", "opportunities",
+            "reply_rate" or "interest_rate" (default: "reply_rate")
+        platform: "instantly", "bison" or "all" (default: "all")
+        limit: Clients per list (default: 10)
+
+    Returns:
+        JSON string with the biggest risers and fallers and their current/previous values
+    """
+    try:
+        if not config.lead_sheets_url:
+            return json.dumps({
+                "success": False,
+                "error": "Lead management not configured. Please set LEAD_SHEETS_URL in your environment."
+            }, indent=2)
+
+        logger.info("Getting week-over-week %s changes...", metric)
+
+        result = await asyncio.to_thread(
+            get_week_over_week_movers,
+            metric=metric,
+            platform=platform,
+            limit=limit,
+            sheet_url=config.lead_sheets_url
+        )
+
+        logger.info("Compared %d clients: %d risers, %d fallers",
+                   result['clients_compared'], len(result['risers']), len(result['fallers']))
+
+        return json.dumps({
+            "success": True,
+            **result
+        }, indent=2)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error("Error in get_week_over_week_changes: %s", error_msg)
+        return json.dumps({
+            "success": False,
+            "error": error_msg
+        }, indent=2)
+
+
+async def _refresh_client_metrics_history(days: int = 56) -> str:
+    """Record the last `days` days of per-client metrics (background job only)."""
+    try:
+        result = await asyncio.to_thread(refresh_metrics_history, days=days, sheet_url=config.lead_sheets_url)
+        return json.dumps({"success": True, **result}, indent=2)
+    except Exception as e:
+        logger.error("Error refreshing metrics history: %s", e)
+        return json.dumps({"success": False, "error": str(e)}, indent=2)
+
+
 # ============================================================================
 # MAILBOX HEALTH MONITORING TOOLS
 # ============================================================================
@@ -6387,6 +6675,11 @@ async def get_all_mailbox_health_summary() -> str:
         - Compare health across platforms
         - Monitor account health trends
     """
+    return await serve("get_all_mailbox_health_summary", _get_all_mailbox_health_summary)
+
+
+async def _get_all_mailbox_health_summary() -> str:
+    """Compute get_all_mailbox_health_summary."""
     try:
         if not config.lead_sheets_url:
             return json.dumps({
@@ -6517,73 +6810,16 @@ async def get_mailbox_capacity_report() -> str:
 
         logger.info("Calculating mailbox capacity report...")
 
-        health_data = await asyncio.to_thread(
-            get_all_mailbox_health,
-            sheet_url=config.lead_sheets_url,
-            instantly_gid=config.lead_sheets_gid_instantly,
-            bison_gid=config.lead_sheets_gid_bison
-        )
-
-        # Calculate capacity from mailbox data
-        instantly_capacity = 0
-        bison_capacity = 0
-        healthy_capacity = 0
-
-        # Get detailed capacity by fetching individual mailboxes
-        all_clients = await asyncio.to_thread(
-            get_all_clients,
+        # Derived from the shared mailbox snapshot (also behind the health and alert tools)
+        result = await asyncio.to_thread(
+            get_mailbox_capacity,
             sheet_url=config.lead_sheets_url,
             instantly_gid=config.lead_sheets_gid_instantly,
             bison_gid=config.lead_sheets_gid_bison
         )
 
-        for client in all_clients['clients']:
-            try:
-                if client['platform'] == 'instantly':
-                    mailboxes = await asyncio.to_thread(
-                        get_instantly_mailboxes,
-                        sheet_url=config.lead_sheets_url,
-                        instantly_gid=config.lead_sheets_gid_instantly,
-                        workspace_id=client['workspace_id']
-                    )
-                    for account in mailboxes['accounts']:
-                        limit = account.get('daily_limit', 0)
-                        instantly_capacity += limit
-                        if account.get('health') == 'healthy':
-                            healthy_capacity += limit
-
-                elif client['platform'] == 'bison':
-                    mailboxes = await asyncio.to_thread(
-                        get_bison_mailboxes,
-                        sheet_url=config.lead_sheets_url,
-                        bison_gid=config.lead_sheets_gid_bison,
-                        client_name=client['client_name']
-                    )
-                    for account in mailboxes['accounts']:
-                        limit = account.get('daily_limit', 0)
-                        bison_capacity += limit
-                        if account.get('health') == 'healthy':
-                            healthy_capacity += limit
-
-            except Exception as e:
-                logger.warning(f"Error calculating capacity for {client}: {e}")
-
-        total_capacity = instantly_capacity + bison_capacity
-        avg_capacity = round(total_capacity / health_data['total_accounts'], 2) if health_data['total_accounts'] > 0 else 0
-
-        result = {
-            'total_daily_capacity': total_capacity,
-            'healthy_daily_capacity': healthy_capacity,
-            'instantly_capacity': instantly_capacity,
-            'bison_capacity': bison_capacity,
-            'total_accounts': health_data['total_accounts'],
-            'healthy_accounts': health_data['healthy_count'],
-            'average_capacity_per_account': avg_capacity,
-            'capacity_utilization_percentage': round((healthy_capacity / total_capacity * 100), 2) if total_capacity > 0 else 0
-        }
-
         logger.info("Total daily capacity: %d emails across %d accounts",
-                   total_capacity, health_data['total_accounts'])
+                   result['total_daily_capacity'], result['total_accounts'])
 
         return json.dumps({
             "success": True,
@@ -6599,6 +6835,44 @@ async def get_mailbox_capacity_report() -> str:
         }, indent=2)
 
 
+def start_lead_warm_scheduler() -> Optional[WarmScheduler]:
+    """
+    Start refreshing the portfolio lead tools in the background.
+
+    Must be called from a running event loop (the app lifespan). Background
+    runs of get_all_clients_with_positive_replies fetch at most
+    LEAD_WARM_CLIENT_CONCURRENCY clients at once (default: 5) to spread load.
+    The last LEAD_METRICS_HISTORY_DAYS days of per-client metrics are kept
+    recorded for the trend tools.
+
+    Returns:
+        Running WarmScheduler, or None if lead management or the warm cache is disabled
+    """
+    if not config.lead_sheets_url:
+        return None
+
+    scheduler = create_scheduler()
+    if scheduler is None:
+        return None
+
+    scheduler.register(
+        "get_all_clients_with_positive_replies",
+        _get_all_clients_with_positive_replies,
+        {"days": 7, "platform": "all"},
+        max_workers=int(os.getenv("LEAD_WARM_CLIENT_CONCURRENCY", "5"))
+    )
+    scheduler.register("get_all_active_clients", _get_all_active_clients, {"days": 14, "platform": "all"})
+    scheduler.register("get_all_mailbox_health_summary", _get_all_mailbox_health_summary)
+    scheduler.register("get_lead_weekly_summary", _get_lead_weekly_summary)
+    scheduler.register(
+        "client_metrics_history",
+        _refresh_client_metrics_history,
+        {"days": int(os.getenv("LEAD_METRICS_HISTORY_DAYS", "56"))}
+    )
+    scheduler.start()
+    return scheduler
+
+
 # ============================================================================
 # CAMPAIGN AUTOMATION TOOLS
 # ============================================================================
@@ -6749,40 +7023,22 @@ async def create_bison_sequence(
                 "error": "Lead management not configured. Please set LEAD_SHEETS_URL in your environment."
             }, indent=2)
 
-        from leads import sheets_client, bison_client
+        from leads import bison_client
+
+        from leads.workspace_registry import get_workspace_registry
 
         logger.info("Creating Bison sequence for client '%s'...", client_name)
 
         # Get client's API key from sheet
-        workspaces = await asyncio.to_thread(
-            sheets_client.load_bison_workspaces_from_sheet,
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_bison_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_bison
         )
-
-        # Find workspace by client name using fuzzy matching
-        from rapidfuzz import fuzz, process
-
-        workspace = None
-        if workspaces:
-            # Get all client names
-            client_names = [ws["client_name"] for ws in workspaces]
-
-            # Find best match using fuzzy matching
-            # extractOne returns (match, score, index)
-            result = process.extractOne(
-                client_name,
-                client_names,
-                scorer=fuzz.WRatio,  # Weighted ratio for better matching
-                score_cutoff=60  # Minimum 60% similarity
-            )
-
-            if result:
-                matched_name, score, index = result
-                workspace = workspaces[index]
-                logger.info("Matched '%s' to '%s' (score: %d%%)", client_name, matched_name, score)
-            else:
-                logger.warning("No match found for '%s' (tried %d clients)", client_name, len(workspaces))
+        workspaces = resolver.workspaces
+        workspace = resolver.resolve(client_name)
+        if workspace:
+            logger.info("Matched '%s' to '%s'", client_name, workspace["client_name"])
 
         if not workspace:
             return json.dumps({
@@ -6917,34 +7173,26 @@ async def list_bison_campaigns(
     try:
         initialize_clients()
         config = Config.from_env()
-        from leads import sheets_client, bison_client
+        from leads import bison_client
+        from leads.workspace_registry import get_workspace_registry
 
-        # Find the client using fuzzy matching
-        from rapidfuzz import process, fuzz
-        clients = await asyncio.to_thread(
-            sheets_client.load_bison_workspaces_from_sheet,
+        # Find the client
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_bison_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_bison
         )
-        client_names = [c["client_name"] for c in clients]
-
-        result = process.extractOne(
-            client_name,
-            client_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
+        client = resolver.resolve(client_name)
 
-        if not result:
+        if not client:
             return json.dumps({
                 "success": False,
                 "error": f"Client '{client_name}' not found in Bison clients"
             }, indent=2)
 
-        matched_name, score, index = result
-        client = clients[index]
+        matched_name = client["client_name"]
 
-        logger.info(f"Listing Bison campaigns for {matched_name} (match score: {score})")
+        logger.info(f"Listing Bison campaigns for {matched_name}")
 
         # Get campaigns
         campaigns_response = await asyncio.to_thread(
@@ -7032,32 +7280,24 @@ async def get_bison_campaign_details(
     try:
         initialize_clients()
         config = Config.from_env()
-        from leads import sheets_client, bison_client
+        from leads import bison_client
+        from leads.workspace_registry import get_workspace_registry
 
-        # Find the client using fuzzy matching
-        from rapidfuzz import process, fuzz
-        clients = await asyncio.to_thread(
-            sheets_client.load_bison_workspaces_from_sheet,
+        # Find the client
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_bison_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_bison
         )
-        client_names = [c["client_name"] for c in clients]
+        client = resolver.resolve(client_name)
 
-        result = process.extractOne(
-            client_name,
-            client_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
-
-        if not result:
+        if not client:
             return json.dumps({
                 "success": False,
                 "error": f"Client '{client_name}' not found in Bison clients"
             }, indent=2)
 
-        matched_name, score, index = result
-        client = clients[index]
+        matched_name = client["client_name"]
 
         logger.info(f"Getting Bison campaign details for {matched_name}, campaign {campaign_id}")
 
@@ -7158,39 +7398,22 @@ async def create_instantly_campaign(
                 "error": "Lead management not configured. Please set LEAD_SHEETS_URL in your environment."
             }, indent=2)
 
-        from leads import sheets_client, instantly_client
+        from leads import instantly_client
+
+        from leads.workspace_registry import get_workspace_registry
 
         logger.info("Creating Instantly campaign '%s' for client '%s'...", campaign_name, client_name)
 
         # Get client's API key from sheet
-        workspaces = await asyncio.to_thread(
-            sheets_client.load_instantly_workspaces_from_sheet,
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_instantly_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_instantly
         )
-
-        # Find workspace by client name using fuzzy matching
-        from rapidfuzz import fuzz, process
-
-        workspace = None
-        if workspaces:
-            # Get all client names
-            client_names = [ws["client_name"] for ws in workspaces]
-
-            # Find best match using fuzzy matching
-            result = process.extractOne(
-                client_name,
-                client_names,
-                scorer=fuzz.WRatio,
-                score_cutoff=60  # Minimum 60% similarity
-            )
-
-            if result:
-                matched_name, score, index = result
-                workspace = workspaces[index]
-                logger.info("Matched '%s' to '%s' (score: %d%%)", client_name, matched_name, score)
-            else:
-                logger.warning("No match found for '%s' (tried %d clients)", client_name, len(workspaces))
+        workspaces = resolver.workspaces
+        workspace = resolver.resolve(client_name)
+        if workspace:
+            logger.info("Matched '%s' to '%s'", client_name, workspace["client_name"])
 
         if not workspace:
             return json.dumps({
@@ -7354,34 +7577,26 @@ async def list_instantly_campaigns(
 
         initialize_clients()
         config = Config.from_env()
-        from leads import sheets_client, instantly_client
+        from leads import instantly_client
+        from leads.workspace_registry import get_workspace_registry
 
-        # Find the client using fuzzy matching
-        from rapidfuzz import process, fuzz
-        workspaces = await asyncio.to_thread(
-            sheets_client.load_instantly_workspaces_from_sheet,
+        # Find the client
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_instantly_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_instantly
         )
-        workspace_names = [w["client_name"] for w in workspaces]
-
-        result = process.extractOne(
-            client_name,
-            workspace_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
+        workspace = resolver.resolve(client_name)
 
-        if not result:
+        if not workspace:
             return json.dumps({
                 "success": False,
                 "error": f"Client '{client_name}' not found in Instantly workspaces"
             }, indent=2)
 
-        matched_name, score, index = result
-        workspace = workspaces[index]
+        matched_name = workspace["client_name"]
 
-        logger.info(f"Listing campaigns for {matched_name} (match score: {score})")
+        logger.info(f"Listing campaigns for {matched_name}")
 
         # Convert status string to number for Instantly API
         status_map = {
@@ -7469,32 +7684,24 @@ async def get_instantly_campaign_details(
     try:
         initialize_clients()
         config = Config.from_env()
-        from leads import sheets_client, instantly_client
+        from leads import instantly_client
+        from leads.workspace_registry import get_workspace_registry
 
-        # Find the client using fuzzy matching
-        from rapidfuzz import process, fuzz
-        workspaces = await asyncio.to_thread(
-            sheets_client.load_instantly_workspaces_from_sheet,
+        # Find the client
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_instantly_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_instantly
         )
-        workspace_names = [w["client_name"] for w in workspaces]
+        workspace = resolver.resolve(client_name)
 
-        result = process.extractOne(
-            client_name,
-            workspace_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
-
-        if not result:
+        if not workspace:
             return json.dumps({
                 "success": False,
                 "error": f"Client '{client_name}' not found in Instantly workspaces"
             }, indent=2)
 
-        matched_name, score, index = result
-        workspace = workspaces[index]
+        matched_name = workspace["client_name"]
 
         logger.info(f"Getting campaign details for {matched_name}, campaign {campaign_id}")
 
@@ -7606,36 +7813,28 @@ async def add_leads_to_instantly_campaign(
     try:
         initialize_clients()
         config = Config.from_env()
-        from leads import sheets_client, instantly_client
+        from leads import instantly_client
+        from leads.workspace_registry import get_workspace_registry
 
         logger.info("Adding %d leads to campaign %s for client %s", len(leads), campaign_id, client_name)
 
-        # Find the client using fuzzy matching
-        from rapidfuzz import process, fuzz
-        workspaces = await asyncio.to_thread(
-            sheets_client.load_instantly_workspaces_from_sheet,
+        # Find the client
+        resolver = await asyncio.to_thread(
+            get_workspace_registry().get_instantly_resolver,
             config.lead_sheets_url,
             config.lead_sheets_gid_instantly
         )
-        workspace_names = [w["client_name"] for w in workspaces]
+        workspace = resolver.resolve(client_name)
 
-        result = process.extractOne(
-            client_name,
-            workspace_names,
-            scorer=fuzz.WRatio,
-            score_cutoff=60
-        )
-
-        if not result:
+        if not workspace:
             return json.dumps({
                 "success": False,
                 "error": f"Client '{client_name}' not found in Instantly workspaces"
             }, indent=2)
 
-        matched_name, score, index = result
-        workspace = workspaces[index]
+        matched_name = workspace["client_name"]
 
-        logger.info(f"Matched '{client_name}' to '{matched_name}' (score: {score}%%)")
+        logger.info(f"Matched '{client_name}' to '{matched_name}'")
 
         # Add leads to campaign
         result = await asyncio.to_thread(
@@ -0,0 +1,104 @@
+"""
+Local stand-in for the Anthropic Messages API used by the reply-analysis tests.
+
+StubMessagesServer listens on 127.0.0.1 and answers POST /v1/messages the way
+the categorization prompts expect: a JSON verdict for a single reply, or a
+JSON array of verdicts for a batch prompt. Point the SDK at it by setting
+ANTHROPIC_BASE_URL to server.url.
+"""
+
+import re
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+BATCH_ITEM = re.compile(r'<reply id="([^"]+)">\nSubject: [^\n]*\n\n(.*?)\n</reply>', re.DOTALL)
+
+
+def classify(text):
+    """Deterministic stand-in verdict for one reply."""
+    lowered = text.lower()
+    if "price" in lowered or "call" in lowered:
+        return {"category": "hot", "confidence": 90, "reason": "Asks about pricing or a call"}
+    if "?" in text:
+        return {"category": "warm", "confidence": 70, "reason": "Asks a question"}
+    return {"category": "unclear", "confidence": 60, "reason": "No clear signal"}
+
+
+class StubMessagesServer:
+    """Threaded HTTP server implementing POST /v1/messages."""
+
+    def __init__(self, latency=0.0, mode="ok"):
+        """
+        Args:
+            latency: Seconds each request takes
+            mode: "ok", "garbage" (batch responses aren't JSON) or "partial"
+                (batch responses drop the last item and repeat the first)
+        """
+        self.latency = latency
+        self.mode = mode
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def answer(self, prompt):
+        """Response text for a prompt."""
+        items = BATCH_ITEM.findall(prompt)
+        if not items:
+            reply = prompt.split("Reply:\n", 1)[-1].split("\n\nCategorize", 1)[0]
+            return json.dumps(classify(reply))
+        if self.mode == "garbage":
+            return "Sorry, I can't help with that."
+        verdicts = [{"id": item_id, **classify(text)} for item_id, text in items]
+        if self.mode == "partial":
+            verdicts = verdicts[:-1] + [verdicts[0]]
+        return "```json\n" + json.dumps(verdicts) + "\n```"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][0]["content"]
+                with stub._lock:
+                    stub.requests.append(body)
+                time.sleep(stub.latency)
+                text = stub.answer(prompt)
+                payload = json.dumps({
+                    "id": f"msg_{len(stub.requests)}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": body["model"],
+                    "content": [{"type": "text", "text": text}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4}
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
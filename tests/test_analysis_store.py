@@ -0,0 +1,133 @@
+"""
+Unit tests for incremental reply analysis.
+
+Tests:
+- Stored analyses are served only while the reply's fingerprint matches
+- Retention pruning and per-workspace clearing
+- categorize_leads_incremental analyses only new or changed replies, merges
+  stored results, and re-analyses everything on full_rescan
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.analysis_store import AnalysisStore, reply_key, reply_fingerprint
+
+
+ANALYSIS = {"ai_category": "warm", "ai_confidence": 80, "ai_reason": "Asks a question", "ai_method": "claude"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnalysisStore(tmp_path / "analyses.db")
+    yield store
+    store.close()
+
+
+def lead(n, body=None):
+    return {
+        "email": f"lead{n}@example.com",
+        "reply_body": body or f"Could you explain how option {n} works?",
+        "subject": "Re: intro",
+        "timestamp": f"2025-01-{10 + n:02d}T10:00:00.000Z",
+        "platform": "instantly"
+    }
+
+
+class TestReplyIdentity:
+    """Tests for reply_key and reply_fingerprint."""
+
+    def test_key(self):
+        """Bison replies are keyed by ID, others by sender and timestamp."""
+        assert reply_key({"id": 42, "email": "a@x.com"}) == "id:42"
+        assert reply_key({"email": "A@x.com", "timestamp": "t"}) == "a@x.com|t"
+
+    def test_fingerprint(self):
+        """Body, subject and mode all change the fingerprint."""
+        base = reply_fingerprint(lead(1), "m")
+        assert base == reply_fingerprint(dict(lead(1)), "m")
+        assert base != reply_fingerprint(lead(1, body="Edited"), "m")
+        assert base != reply_fingerprint({**lead(1), "subject": "Other"}, "m")
+        assert base != reply_fingerprint(lead(1), "keywords")
+
+
+class TestAnalysisStore:
+    """Tests for AnalysisStore."""
+
+    def test_fingerprint_must_match(self, store):
+        """A changed reply is not served its old analysis."""
+        store.put_many("bison", "ws", [("id:1", "fp1", ANALYSIS), ("id:2", "fp2", ANALYSIS)])
+
+        assert store.get_many("bison", "ws", {"id:1": "fp1", "id:2": "changed", "id:3": "fp3"}) == {"id:1": ANALYSIS}
+        assert store.get_many("bison", "other", {"id:1": "fp1"}) == {}
+        assert store.get_many("instantly", "ws", {"id:1": "fp1"}) == {}
+
+    def test_retention_and_clear(self, tmp_path):
+        """Old analyses are pruned on open; clear can target one workspace."""
+        store = AnalysisStore(tmp_path / "a.db", retention_seconds=60)
+        with patch("src.leads.analysis_store.time.time", return_value=time.time() - 120):
+            store.put_many("bison", "ws", [("id:1", "fp", ANALYSIS)])
+        store.put_many("bison", "ws", [("id:2", "fp", ANALYSIS)])
+        store.put_many("bison", "other", [("id:3", "fp", ANALYSIS)])
+        store.close()
+
+        store = AnalysisStore(tmp_path / "a.db", retention_seconds=60)
+        assert store.stats()["analyses"] == 2 and store.stats()["workspaces"] == 2
+        store.clear("bison", "ws")
+        assert store.stats()["analyses"] == 1
+        store.close()
+
+
+class TestCategorizeIncremental:
+    """Tests for categorize_leads_incremental."""
+
+    def _run(self, store, leads, claude, **kwargs):
+        with patch.object(interest_analyzer, "get_analysis_store", return_value=store), \
+             patch.object(interest_analyzer, "get_verdict_cache", return_value=None), \
+             patch.object(interest_analyzer, "analyze_reply_with_claude", side_effect=claude), \
+             patch.object(interest_analyzer, "prefetch_timing_data", return_value=0), \
+             patch.object(interest_analyzer, "is_instant_auto_reply", return_value=False):
+            return interest_analyzer.categorize_leads_incremental(
+                leads, "instantly", api_key="key", batch_size=1, **kwargs
+            )
+
+    def test_only_new_and_changed_replies_are_analysed(self, store):
+        """A second run analyses only the added and edited replies and reports every lead."""
+        analysed = []
+
+        def claude(reply_text, subject="", check_cache=True, priority=None):
+            analysed.append(reply_text)
+            return {"category": "warm", "confidence": 80, "reason": "Asks a question"}
+
+        first = self._run(store, [lead(1), lead(2), lead(3)], claude)
+        assert len(analysed) == 3 and first["summary"]["incremental"]["reused"] == 0
+
+        analysed.clear()
+        second = self._run(store, [lead(1), lead(2, body="Actually, what does it cost per seat?"), lead(3), lead(4)], claude)
+
+        assert sorted(analysed) == ["Actually, what does it cost per seat?", "Could you explain how option 4 works?"]
+        assert second["summary"]["incremental"] == {"reused": 2, "analyzed": 2, "full_rescan": False}
+        assert second["summary"]["total_analyzed"] == 4 and second["summary"]["warm_count"] == 4
+        assert sorted(l["email"] for l in second["warm"]) == [f"lead{n}@example.com" for n in range(1, 5)]
+
+        analysed.clear()
+        audit = self._run(store, [lead(1), lead(3)], claude, full_rescan=True)
+        assert len(analysed) == 2
+        assert audit["summary"]["incremental"] == {"reused": 0, "analyzed": 2, "full_rescan": True}
+
+    def test_claude_failures_are_retried(self, store):
+        """Keyword fallbacks during a Claude run are not stored."""
+        calls = []
+
+        def failing(reply_text, subject="", check_cache=True, priority=None):
+            calls.append(reply_text)
+            return {"category": "unclear", "confidence": 0, "reason": "Claude API error: 529"}
+
+        self._run(store, [lead(1)], failing)
+        self._run(store, [lead(1)], failing)
+
+        assert len(calls) == 2
+        assert store.stats()["analyses"] == 0
@@ -0,0 +1,144 @@
+"""
+Unit tests for batched Claude classification of replies.
+
+Tests run against a local stand-in for the Messages API (tests/anthropic_stub.py).
+
+Tests:
+- Batch responses are validated strictly
+- Replies are packed into batches by count and size
+- Missing, duplicated or unparseable verdicts fall back to single-reply calls
+- categorize_leads needs 10x+ fewer requests and finishes faster
+"""
+
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.interest_analyzer import parse_batch_verdicts, _pack_batches
+from src.leads.llm_client import LLMClientManager
+from tests.anthropic_stub import StubMessagesServer
+
+
+@contextmanager
+def stub_env(server):
+    """Point a fresh client manager at the stub, with the verdict cache off."""
+    with patch.dict("os.environ", {
+        "ANTHROPIC_API_KEY": "test",
+        "ANTHROPIC_BASE_URL": server.url,
+        "LEAD_VERDICT_CACHE_ENABLED": "false"
+    }), patch.object(interest_analyzer, "get_llm_manager", return_value=LLMClientManager()):
+        yield
+
+
+def make_leads(count):
+    texts = ["What's the price for 10 seats?", "How does onboarding work?", "Thanks, noted."]
+    return [
+        {"email": f"lead{n}@example.com", "reply_body": f"{texts[n % 3]} (ref {n})", "subject": "Re: intro"}
+        for n in range(count)
+    ]
+
+
+class TestParseBatchVerdicts:
+    """Tests for parse_batch_verdicts."""
+
+    def test_valid_array_in_code_fence(self):
+        """A fenced JSON array is parsed into verdicts by ID."""
+        text = '```json\n[{"id": "1", "category": "hot", "confidence": 90, "reason": "r"}]\n```'
+        assert parse_batch_verdicts(text, ["1", "2"]) == {"1": {"category": "hot", "confidence": 90, "reason": "r"}}
+
+    def test_invalid_items_are_dropped(self):
+        """Unknown IDs, bad categories, out-of-range confidence and duplicates are rejected."""
+        text = """[
+            {"id": "1", "category": "hot", "confidence": 90, "reason": "r"},
+            {"id": "1", "category": "cold", "confidence": 90, "reason": "r"},
+            {"id": "2", "category": "maybe", "confidence": 50, "reason": "r"},
+            {"id": "3", "category": "warm", "confidence": 150, "reason": "r"},
+            {"id": "4", "category": "warm", "confidence": true, "reason": "r"},
+            {"id": "9", "category": "warm", "confidence": 50, "reason": "r"},
+            {"id": "5", "category": "cold", "confidence": 80, "reason": "r"}
+        ]"""
+        assert list(parse_batch_verdicts(text, ["1", "2", "3", "4", "5"])) == ["5"]
+
+    def test_not_an_array(self):
+        """Anything but a JSON array is a parse failure."""
+        with pytest.raises(ValueError):
+            parse_batch_verdicts('{"category": "hot"}', ["1"])
+        with pytest.raises(ValueError):
+            parse_batch_verdicts("[not json]", ["1"])
+
+
+class TestPacking:
+    """Tests for _pack_batches."""
+
+    def test_count_and_long_replies(self):
+        """Batches hold at most batch_size replies; long replies go alone."""
+        replies = [{"id": str(n), "reply_text": "short", "subject": ""} for n in range(7)]
+        replies.insert(3, {"id": "long", "reply_text": "x" * 5000, "subject": ""})
+
+        batches = _pack_batches(replies, batch_size=3)
+
+        assert [[r["id"] for r in batch] for batch in batches] == [
+            ["long"], ["0", "1", "2"], ["3", "4", "5"], ["6"]
+        ]
+
+
+class TestBatchFallback:
+    """analyze_reply_batch_with_claude falls back to single calls."""
+
+    def _batch(self, mode):
+        replies = [{"id": f"r{n}", "reply_text": text, "subject": "Re"} for n, text in
+                   enumerate(["Can we book a call?", "How much is it?", "Ok thanks."])]
+        with StubMessagesServer(mode=mode) as server, stub_env(server):
+            verdicts, requests_made = interest_analyzer.analyze_reply_batch_with_claude(replies)
+        return verdicts, requests_made, server
+
+    def test_one_request(self):
+        """A good batch is answered with one request."""
+        verdicts, requests_made, server = self._batch("ok")
+
+        assert requests_made == len(server.requests) == 1
+        assert [verdicts[f"r{n}"]["category"] for n in range(3)] == ["hot", "warm", "unclear"]
+
+    def test_unparseable_batch(self):
+        """A response that isn't an array sends every reply on its own."""
+        verdicts, requests_made, server = self._batch("garbage")
+
+        assert requests_made == len(server.requests) == 4
+        assert verdicts["r0"]["category"] == "hot"
+
+    def test_missing_and_duplicated_items(self):
+        """Only replies without a valid verdict are retried."""
+        verdicts, requests_made, server = self._batch("partial")
+
+        # r0 is duplicated and r2 is missing: both retried alone
+        assert requests_made == len(server.requests) == 3
+        assert [verdicts[f"r{n}"]["category"] for n in range(3)] == ["hot", "warm", "unclear"]
+
+
+class TestCategorizeLeadsBatched:
+    """categorize_leads with batching against the stub."""
+
+    def test_fewer_requests_same_verdicts(self):
+        """Batching cuts requests by 10x+ with the same categories, and is faster."""
+        leads = make_leads(120)
+
+        def run(batch_size):
+            with StubMessagesServer(latency=0.05) as server, stub_env(server):
+                started = time.perf_counter()
+                result = interest_analyzer.categorize_leads(leads, max_workers=4, batch_size=batch_size)
+                return result, len(server.requests), time.perf_counter() - started
+
+        single, single_requests, single_seconds = run(1)
+        batched, batched_requests, batched_seconds = run(25)
+
+        def categories(result):
+            return {lead["email"]: lead["ai_category"] for key in interest_analyzer.VERDICT_CATEGORIES for lead in result[key]}
+
+        assert categories(batched) == categories(single)
+        assert single_requests == single["summary"]["claude_requests"] == 120
+        assert batched_requests == batched["summary"]["claude_requests"] == 5
+        assert single_requests >= 10 * batched_requests
+        assert batched_seconds < single_seconds
@@ -0,0 +1,155 @@
+"""
+Unit tests for get_bison_lead_responses.
+
+Tests:
+- Replies grouped by lead, with contact info from incoming replies
+- Contact info for leads with only outgoing interested emails comes from their thread
+- Conversation threads fetched concurrently, bounded, and deduplicated
+"""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import patch, Mock
+
+import pytest
+
+from src.leads import lead_functions
+from src.leads.thread_cache import ThreadCache
+
+
+DAY = (date.today() - timedelta(days=1)).isoformat()
+
+
+def _reply(reply_id, lead_id, kind="Tracked Reply", hour=10, email=None):
+    return {
+        "id": reply_id,
+        "lead_id": lead_id,
+        "type": kind,
+        "from_email_address": email or f"lead{lead_id}@example.com",
+        "from_name": f"Lead {lead_id}",
+        "subject": "Re: hello",
+        "text_body": f"reply {reply_id}",
+        "date_received": f"{DAY}T{hour:02d}:00:00.000000Z",
+        "read": False,
+    }
+
+
+class FakeThreads:
+    """conversation-thread endpoint; reply IDs in `conversations` share one thread."""
+
+    def __init__(self, conversations=(), latency=0.0, messages=()):
+        self.thread_of = {reply_id: tuple(ids) for ids in conversations for reply_id in ids}
+        self.messages = {message["id"]: message for message in messages}
+        self.latency = latency
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, api_key, reply_id):
+        self.calls.append(reply_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            ids = self.thread_of.get(reply_id, (reply_id,))
+            older = [i for i in ids if i < reply_id]
+            newer = [i for i in ids if i > reply_id]
+            message = lambda i: self.messages.get(
+                i, {"id": i, "type": "Tracked Reply", "date_received": f"{DAY}T0{i % 10}:00:00Z"}
+            )
+            return {"data": {
+                "older_messages": [message(i) for i in older],
+                "current_reply": message(reply_id),
+                "newer_messages": [message(i) for i in newer],
+            }}
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def run():
+    """Call get_bison_lead_responses with fake reply sets and thread endpoint."""
+    def _run(interested, threads):
+        resolver = Mock()
+        resolver.resolve.return_value = {"client_name": "Acme", "api_key": "key"}
+        registry = Mock()
+        registry.get_bison_resolver.return_value = resolver
+        loads = []
+
+        def load(api_key, status, since):
+            loads.append((status, since))
+            return interested
+
+        with patch.object(lead_functions, "get_workspace_registry", return_value=registry), \
+             patch.object(lead_functions, "_load_bison_replies", side_effect=load), \
+             patch.object(lead_functions, "get_bison_conversation_thread_async", threads), \
+             patch.object(lead_functions, "get_thread_cache", return_value=ThreadCache()):
+            result = lead_functions.get_bison_lead_responses("Acme", start_date=DAY, end_date=DAY)
+        return result, loads
+
+    return _run
+
+
+class TestBisonLeadResponses:
+    """Tests for the grouped, concurrent get_bison_lead_responses."""
+
+    def test_contact_info_from_incoming_replies(self, run):
+        """Outgoing-only leads get their latest incoming reply from their own thread."""
+        interested = [
+            _reply(1, 100, kind="Outgoing Email", email="me@agency.com"),
+            _reply(2, 200, hour=12),
+            _reply(3, 200, kind="Outgoing Email", email="me@agency.com"),
+            _reply(4, 300, kind="Outgoing Email", email="me@agency.com"),
+        ]
+        # Lead 100's own replies predate the window; lead 300 never replied
+        older = [_reply(5, 100), _reply(6, 100)]
+        older[0]["date_received"] = "2020-01-01T08:00:00.000000Z"
+        older[1]["date_received"] = "2020-01-01T09:00:00.000000Z"
+        threads = FakeThreads(conversations=[(5, 6, 1)], messages=interested + older)
+
+        result, loads = run(interested, threads)
+        leads = {lead["lead_id"]: lead for lead in result["leads"]}
+
+        assert loads == [("interested", DAY)]  # no pass over the whole history
+        assert leads[100]["reply_id"] == 6
+        assert leads[100]["email"] == "lead100@example.com"
+        assert leads[100]["reply_body"] == "reply 6"
+        assert leads[100]["thread_message_count"] == 3
+        assert leads[200]["reply_id"] == 2
+        assert leads[300]["email"] == "me@agency.com"  # no incoming reply in the thread
+        assert result["total_leads"] == 3
+
+    def test_single_reply_fetch(self, run):
+        """Leads that all have incoming interested replies keep them as contact info."""
+        result, loads = run([_reply(1, 100), _reply(2, 200)], FakeThreads())
+
+        assert loads == [("interested", DAY)]
+        assert [lead["thread_message_count"] for lead in result["leads"]] == [1, 1]
+
+    def test_threads_concurrent_bounded_and_deduplicated(self, run):
+        """Threads are fetched in parallel, capped, and shared by leads in one conversation."""
+        interested = [_reply(n, n) for n in range(1, 61)]
+        # Replies 1, 25 and 50 are one conversation across three leads
+        threads = FakeThreads(conversations=[(1, 25, 50)], latency=0.02)
+
+        result, _ = run(interested, threads)
+        leads = {lead["lead_id"]: lead for lead in result["leads"]}
+
+        assert 1 < threads.peak <= lead_functions.BISON_THREAD_CONCURRENCY
+        assert sorted(threads.calls) == [n for n in range(1, 61) if n not in (25, 50)]
+        assert [m["reply_id"] for m in leads[50]["conversation_thread"]] == [1, 25, 50]
+        assert leads[50]["conversation_thread"] == leads[1]["conversation_thread"]
+        assert leads[42]["thread_message_count"] == 1
+
+    def test_failed_thread_leaves_empty_conversation(self, run):
+        """A thread that can't be fetched doesn't fail the whole call."""
+        async def failing(api_key, reply_id):
+            if reply_id == 2:
+                raise RuntimeError("503")
+            return {"data": {"current_reply": {"id": reply_id}}}
+
+        result, _ = run([_reply(1, 100), _reply(2, 200)], failing)
+        leads = {lead["lead_id"]: lead for lead in result["leads"]}
+
+        assert leads[200]["conversation_thread"] == [] and leads[200]["thread_message_count"] == 0
+        assert leads[100]["thread_message_count"] == 1
@@ -0,0 +1,106 @@
+"""
+Unit tests for concurrent Bison list pagination.
+
+Tests:
+- Pages after the first are fetched concurrently and returned in order
+- max_results limits how many pages are requested
+- Failed pages are retried individually
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.leads import lead_functions
+
+
+class FakeSenderEmails:
+    """Paged Bison endpoint with `total` records, 15 per page."""
+
+    def __init__(self, total, latency=0.01, failures=None):
+        self.total = total
+        self.last_page = max(1, -(-total // 15))
+        self.latency = latency
+        self.failures = dict(failures or {})  # page -> number of times it fails
+        self.pages = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, url, headers=None, params=None, timeout=30):
+        page = params["page"]
+        self.pages.append(page)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later pages answer first, so order has to be restored
+            await asyncio.sleep(self.latency / page)
+        finally:
+            self.in_flight -= 1
+
+        if self.failures.get(page):
+            self.failures[page] -= 1
+            return Mock(ok=False, status_code=503, raise_for_status=Mock(side_effect=RuntimeError("503")))
+
+        ids = range((page - 1) * 15, min(page * 15, self.total))
+        body = {
+            "data": [{"id": n, "email": f"sender{n}@example.com"} for n in ids],
+            "meta": {"current_page": page, "last_page": self.last_page}
+        }
+        return Mock(ok=True, json=Mock(return_value=body))
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    """Patch the pool's async GET with a fake paged endpoint."""
+    def _endpoint(*args, **kwargs):
+        fake = FakeSenderEmails(*args, **kwargs)
+        monkeypatch.setattr(lead_functions.http_pool, "get_async", fake)
+        return fake
+
+    return _endpoint
+
+
+class TestBisonPagination:
+    """Tests for _fetch_bison_pages via the sender-email fetchers."""
+
+    def test_accounts_fetched_concurrently_in_order(self, endpoint):
+        """300 sender emails take one request, then 19 concurrent ones, in page order."""
+        fake = endpoint(300)
+
+        accounts = lead_functions._fetch_emailbison_accounts("key")
+
+        assert [account["id"] for account in accounts] == list(range(300))
+        assert fake.pages[0] == 1 and sorted(fake.pages) == list(range(1, 21))
+        assert 1 < fake.peak <= lead_functions.BISON_PAGE_CONCURRENCY
+
+    def test_single_page(self, endpoint):
+        """Small workspaces need one request."""
+        fake = endpoint(7)
+
+        assert len(lead_functions._fetch_emailbison_accounts("key")) == 7
+        assert fake.pages == [1]
+
+    def test_max_results_limits_pages(self, endpoint):
+        """Only the pages needed for max_results are requested."""
+        fake = endpoint(300)
+
+        replies = lead_functions._fetch_emailbison_sender_replies("key", 42, max_results=40)
+
+        assert [reply["id"] for reply in replies] == list(range(40))
+        assert sorted(fake.pages) == [1, 2, 3]
+
+    def test_failed_page_retried_alone(self, endpoint):
+        """A page that fails once is refetched without refetching the others."""
+        fake = endpoint(60, failures={3: 1})
+
+        accounts = lead_functions._fetch_emailbison_accounts("key")
+
+        assert [account["id"] for account in accounts] == list(range(60))
+        assert sorted(fake.pages) == [1, 2, 3, 3, 4]
+
+    def test_persistent_failure_returns_empty(self, endpoint):
+        """A page that keeps failing still fails the fetch, as before."""
+        endpoint(60, failures={2: lead_functions.BISON_PAGE_RETRIES + 1})
+
+        assert lead_functions._fetch_emailbison_accounts("key") == []
@@ -18,7 +18,7 @@ from src.leads import bison_client, instantly_client
 class TestBisonCampaignCreation:
     """Tests for creating Bison campaigns."""
 
-    @patch('src.leads.bison_client.requests.post')
+    @patch('src.leads.bison_client.http_pool.post')
     def test_create_bison_campaign(self, mock_post):
         """Test creating a basic Bison campaign."""
         mock_response = Mock()
@@ -51,7 +51,7 @@ class TestBisonCampaignCreation:
         assert result["data"]["id"] == 123
         assert result["data"]["name"] == "Test Campaign"
 
-    @patch('src.leads.bison_client.requests.post')
+    @patch('src.leads.bison_client.http_pool.post')
     def test_create_bison_sequence_steps(self, mock_post):
         """Test creating sequence steps for a Bison campaign."""
         mock_response = Mock()
@@ -122,7 +122,7 @@ class TestBisonCampaignCreation:
         assert result["data"]["title"] == "Main Sequence"
         assert len(result["data"]["sequence_steps"]) == 2
 
-    @patch('src.leads.bison_client.requests.post')
+    @patch('src.leads.bison_client.http_pool.post')
     def test_bison_placeholder_conversion(self, mock_post):
         """Test that placeholders are converted to Bison format."""
         mock_response = Mock()
@@ -159,7 +159,7 @@ class TestBisonCampaignCreation:
 class TestInstantlyCampaignCreation:
     """Tests for creating Instantly campaigns."""
 
-    @patch('src.leads.instantly_client.requests.post')
+    @patch('src.leads.instantly_client.http_pool.post')
     def test_create_instantly_campaign(self, mock_post):
         """Test creating an Instantly campaign with sequences."""
         mock_response = Mock()
@@ -205,7 +205,7 @@ class TestInstantlyCampaignCreation:
         # Verify the response
         assert result["name"] == "Test Campaign"
 
-    @patch('src.leads.instantly_client.requests.post')
+    @patch('src.leads.instantly_client.http_pool.post')
     def test_instantly_html_conversion(self, mock_post):
         """Test that plain text is converted to Instantly HTML format."""
         mock_response = Mock()
@@ -245,7 +245,7 @@ class TestInstantlyCampaignCreation:
         assert "America/Detroit" in INSTANTLY_VALID_TIMEZONES
         assert "Europe/London" not in INSTANTLY_VALID_TIMEZONES  # Not in their list
 
-    @patch('src.leads.instantly_client.requests.post')
+    @patch('src.leads.instantly_client.http_pool.post')
     def test_instantly_schedule_configuration(self, mock_post):
         """Test campaign schedule configuration."""
         mock_response = Mock()
@@ -288,7 +288,7 @@ class TestInstantlyCampaignCreation:
 class TestListingCampaigns:
     """Tests for listing campaigns."""
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get')
     def test_list_bison_campaigns(self, mock_get):
         """Test listing Bison campaigns."""
         mock_response = Mock()
@@ -330,7 +330,7 @@ class TestListingCampaigns:
         assert len(result["data"]) == 2
         assert result["data"][0]["name"] == "Campaign 1"
 
-    @patch('src.leads.instantly_client.requests.get')
+    @patch('src.leads.instantly_client.http_pool.get')
     def test_list_instantly_campaigns(self, mock_get):
         """Test listing Instantly campaigns."""
         mock_response = Mock()
@@ -366,7 +366,7 @@ class TestListingCampaigns:
         assert len(result) == 2
         assert result[0]["name"] == "Campaign A"
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get')
     def test_list_bison_campaigns_with_search(self, mock_get):
         """Test searching Bison campaigns by name."""
         mock_response = Mock()
@@ -386,7 +386,7 @@ class TestListingCampaigns:
 class TestCampaignDetails:
     """Tests for getting campaign details."""
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get')
     def test_get_bison_campaign_sequences(self, mock_get):
         """Test getting Bison campaign sequences."""
         mock_response = Mock()
@@ -424,7 +424,7 @@ class TestCampaignDetails:
         assert result["data"]["sequence_id"] == 123
         assert len(result["data"]["sequence_steps"]) == 1
 
-    @patch('src.leads.instantly_client.requests.get')
+    @patch('src.leads.instantly_client.http_pool.get')
     def test_get_instantly_campaign_details(self, mock_get):
         """Test getting Instantly campaign details."""
         mock_response = Mock()
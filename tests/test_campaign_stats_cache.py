@@ -0,0 +1,196 @@
+"""
+Unit tests for the daily-bucket campaign analytics cache.
+
+Tests:
+- Summing additive counts and recomputing their rates; unique counts and
+  their rates come from the range
+- Overlapping ranges share settled days; only recent days and the range are refetched
+- Settled ranges and buckets persist across processes
+- Client stats functions fetch one-day ranges through the cache
+"""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import patch, AsyncMock, Mock
+
+import pytest
+
+from src.leads import instantly_client, bison_client
+from src.leads.campaign_stats_cache import DailyStatsCache, combine_instantly, combine_bison
+
+
+TODAY = date.today()
+
+
+def _day(offset):
+    return (TODAY - timedelta(days=offset)).isoformat()
+
+
+class FakeDailyStats:
+    """Instantly overview endpoint; unique replies over a range are fewer than the daily sum."""
+
+    def __init__(self):
+        self.calls = []
+        self.ranges = []
+
+    async def __call__(self, api_key, start_date, end_date):
+        if start_date != end_date:
+            self.ranges.append((start_date, end_date))
+            days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+            return {"emails_sent_count": -1, "reply_count_unique": days, "reply_rate": round(days / (100 * days) * 100, 2)}
+        self.calls.append(start_date)
+        n = date.fromisoformat(start_date).toordinal() % 7
+        return {"emails_sent_count": 100 + n, "reply_count_unique": n, "total_opportunities": n % 2, "reply_rate": 99.0}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DailyStatsCache(tmp_path / "stats.db", settle_days=2)
+    yield cache
+    cache.close()
+
+
+class TestCombine:
+    """Tests for summing buckets."""
+
+    def test_unique_counts_come_from_the_range(self):
+        """Additive counts are summed; unique counts and their rates are the range's own."""
+        combined = combine_instantly({"reply_count_unique": 15, "reply_rate": 1.5}, [
+            {"emails_sent_count": 100, "reply_count": 10, "reply_count_unique": 10, "reply_rate": 10.0},
+            {"emails_sent_count": 900, "reply_count": 9, "reply_count_unique": 9, "reply_rate": 1.0},
+        ])
+        assert combined == {"emails_sent_count": 1000, "reply_count": 19, "reply_count_unique": 15, "reply_rate": 1.5}
+
+    def test_bison_string_counts_and_percentages(self):
+        """Bison counts sent as strings are summed; per-lead figures come from the range."""
+        range_response = {"data": {"total_leads_contacted": 450, "interested_percentage": 3.33, "unique_replies_per_contact": 20}}
+        combined = combine_bison(range_response, [
+            {"data": {"emails_sent": "600", "total_leads_contacted": "300", "interested": "9", "bounced": 6}},
+            {"data": {"emails_sent": 400, "total_leads_contacted": 200, "interested": 6, "bounced": 4, "interested_percentage": 50.0}},
+        ])["data"]
+
+        assert combined["emails_sent"] == 1000
+        assert combined["interested"] == 15
+        assert combined["total_leads_contacted"] == 450
+        assert combined["unique_replies_per_contact"] == 20
+        assert combined["interested_percentage"] == 3.33
+        assert combined["bounced_percentage"] == 1.0
+
+    def test_empty_range(self):
+        """No buckets means zero additive counts and rates."""
+        assert combine_instantly({}, []) == {}
+        assert combine_bison({"data": {}}, [])["data"] == {"bounced_percentage": 0, "unsubscribed_percentage": 0}
+
+
+class TestRangeStats:
+    """Tests for DailyStatsCache.range_stats."""
+
+    def _range(self, cache, fetch, days):
+        return asyncio.run(cache.range_stats("instantly", "key", _day(days - 1), _day(0), fetch))
+
+    def test_overlapping_views_share_settled_days(self, cache):
+        """7/14/30-day views after a 30-day view only refetch today, yesterday and the range."""
+        fetch = FakeDailyStats()
+        month = self._range(cache, fetch, 30)
+        assert len(fetch.calls) == 30
+
+        for days in (7, 14, 30):
+            fetch.calls.clear()
+            fetch.ranges.clear()
+            self._range(cache, fetch, days)
+            assert sorted(fetch.calls) == [_day(1), _day(0)]
+            assert fetch.ranges == [(_day(days - 1), _day(0))]
+
+        assert month["emails_sent_count"] == sum(100 + (TODAY - timedelta(days=n)).toordinal() % 7 for n in range(30))
+        # Unique replies and reply_rate are what the API reports for the range, not daily sums
+        assert month["reply_count_unique"] == 30
+        assert month["reply_rate"] == 1.0
+
+    def test_settled_range_is_stored(self, cache):
+        """A range that can no longer change is fetched once."""
+        fetch = FakeDailyStats()
+        first = asyncio.run(cache.range_stats("instantly", "key", _day(9), _day(3), fetch))
+        second = asyncio.run(cache.range_stats("instantly", "key", _day(9), _day(3), fetch))
+
+        assert first == second
+        assert fetch.ranges == [(_day(9), _day(3))]
+        assert len(fetch.calls) == 7
+        assert cache.stats()["ranges"] == 1
+
+    def test_buckets_persist(self, cache, tmp_path):
+        """Settled days are reused by a new cache on the same database."""
+        self._range(cache, FakeDailyStats(), 10)
+
+        reopened = DailyStatsCache(tmp_path / "stats.db", settle_days=2)
+        fetch = FakeDailyStats()
+        self._range(reopened, fetch, 10)
+        stats = reopened.stats()
+        reopened.close()
+
+        assert len(fetch.calls) == 2
+        assert stats["buckets"] == 8
+        assert (stats["hits"], stats["misses"]) == (8, 2)
+
+    def test_future_days_are_not_fetched(self, cache):
+        """Days after today contribute nothing."""
+        fetch = FakeDailyStats()
+        asyncio.run(cache.range_stats("instantly", "key", _day(0), (TODAY + timedelta(days=5)).isoformat(), fetch))
+        assert fetch.calls == [_day(0)]
+
+    def test_failed_day_is_not_stored(self, cache):
+        """Errors propagate and leave nothing half-cached."""
+        async def failing(api_key, start_date, end_date):
+            raise RuntimeError("503")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(cache.range_stats("instantly", "key", _day(5), _day(3), failing))
+        assert cache.stats()["buckets"] == 0
+
+    def test_workspaces_are_separate(self, cache):
+        """Buckets are keyed by workspace."""
+        fetch = FakeDailyStats()
+        asyncio.run(cache.range_stats("instantly", "key-a", _day(5), _day(3), fetch))
+        asyncio.run(cache.range_stats("instantly", "key-b", _day(5), _day(3), fetch))
+        assert len(fetch.calls) == 6
+
+
+class TestClientStats:
+    """Client stats functions go through the cache."""
+
+    def test_bison_stats_fetch_one_day_ranges(self, cache):
+        """Each missing day is requested as its own range, plus the range for per-lead figures."""
+        def respond(url, params, **kwargs):
+            response = Mock(ok=True)
+            one_day = params["start_date"] == params["end_date"]
+            contacted, interested = (5, 1) if one_day else (20, 7)
+            response.json.return_value = {"data": {
+                "emails_sent": 10 if one_day else 70, "total_leads_contacted": contacted, "interested": interested,
+                "interested_percentage": round(interested / contacted * 100, 2)
+            }}
+            return response
+        get_async = AsyncMock(side_effect=respond)
+
+        with patch.object(bison_client, "get_stats_cache", return_value=cache), \
+             patch.object(bison_client.http_pool, "get_async", get_async):
+            result = asyncio.run(bison_client.get_bison_campaign_stats_api_async("key", _day(6), _day(0)))
+
+        params = sorted((call.kwargs["params"]["start_date"], call.kwargs["params"]["end_date"]) for call in get_async.call_args_list)
+        assert params == sorted([(_day(n), _day(n)) for n in range(7)] + [(_day(6), _day(0))])
+        assert result["data"]["emails_sent"] == 70
+        assert result["data"]["total_leads_contacted"] == 20
+        assert result["data"]["interested_percentage"] == 35.0
+
+    def test_non_date_ranges_fall_back(self, cache):
+        """Timestamps that aren't YYYY-MM-DD are queried as a single range."""
+        response = Mock(ok=True)
+        response.json.return_value = {"emails_sent_count": 5}
+        get_async = AsyncMock(return_value=response)
+
+        with patch.object(instantly_client, "get_stats_cache", return_value=cache), \
+             patch.object(instantly_client.http_pool, "get_async", get_async):
+            result = asyncio.run(instantly_client.get_instantly_campaign_stats_async(
+                "key", "2025-01-01T00:00:00Z", "2025-01-07T23:59:59Z"
+            ))
+
+        assert get_async.call_count == 1
+        assert result == {"emails_sent_count": 5}
@@ -0,0 +1,171 @@
+"""
+Unit tests for the indexed client resolver.
+
+Tests:
+- Match order (exact ID, exact name, unique partial name, partial ID)
+- Ambiguity errors
+- Typo-tolerant fallback when nothing else matches
+- Lookup results at 1k+ clients match a linear scan; the timing comparison
+  is a wall-clock benchmark, opt-in with RUN_BENCHMARKS=1
+"""
+
+import os
+import time
+import pytest
+
+from src.leads.client_resolver import ClientResolver
+
+
+INSTANTLY = [
+    {"workspace_id": "aaa-111", "client_name": "Brian Bliss", "workspace_name": "Source 1 Parcel", "person_name": "Brian Bliss"},
+    {"workspace_id": "bbb-222", "client_name": "Ryan Bandolik", "workspace_name": "Jobsdone", "person_name": "Ryan Bandolik"},
+    {"workspace_id": "ccc-333", "client_name": "Acme", "workspace_name": "Acme", "person_name": ""},
+    {"workspace_id": "ddd-444", "client_name": "Acme West", "workspace_name": "Acme West", "person_name": ""},
+]
+
+BISON = [
+    {"client_name": "Rich Cave", "api_key": "k1"},
+    {"client_name": "Jeff Mikolai", "api_key": "k2"},
+    {"client_name": "Jeff Mikolai - EU", "api_key": "k3"},
+]
+
+
+@pytest.fixture
+def instantly():
+    return ClientResolver(INSTANTLY, id_field="workspace_id", name_fields=("client_name", "workspace_name", "person_name"))
+
+
+@pytest.fixture
+def bison():
+    return ClientResolver(BISON)
+
+
+def _linear_resolve(workspaces, query):
+    """The per-call scan the resolver replaces (exact ID, then substring on names)."""
+    term = query.lower()
+    for w in workspaces:
+        if w["workspace_id"].lower() == term:
+            return w
+    matches = [
+        w for w in workspaces
+        if term in w["client_name"].lower()
+        or term in w.get("workspace_name", "").lower()
+        or term in w.get("person_name", "").lower()
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+class TestClientResolver:
+    """Tests for ClientResolver match semantics."""
+
+    def test_exact_workspace_id(self, instantly):
+        """Exact IDs resolve, case-insensitively."""
+        assert instantly.resolve("BBB-222")["client_name"] == "Ryan Bandolik"
+
+    def test_exact_name_beats_partial_matches(self, instantly):
+        """An exact name wins even when it is also a substring of another client."""
+        assert instantly.resolve("acme")["workspace_id"] == "ccc-333"
+
+    def test_partial_name_in_any_column(self, instantly):
+        """Partial names match client, workspace and person columns."""
+        assert instantly.resolve("parcel")["workspace_id"] == "aaa-111"
+        assert instantly.resolve("bando")["workspace_id"] == "bbb-222"
+
+    def test_ambiguous_partial_name_raises(self, instantly, bison):
+        """Partial names matching several clients list the options."""
+        with pytest.raises(ValueError) as exc_info:
+            instantly.resolve("ac")
+        assert "Acme (ccc-333)" in str(exc_info.value)
+        assert "Acme West (ddd-444)" in str(exc_info.value)
+
+        with pytest.raises(ValueError, match="Please be more specific"):
+            bison.resolve("mikol")
+
+    def test_partial_workspace_id(self, instantly):
+        """Partial IDs are tried last."""
+        assert instantly.resolve("ddd-4")["client_name"] == "Acme West"
+
+    def test_not_found(self, instantly, bison):
+        """Unknown clients resolve to None."""
+        assert instantly.resolve("globex") is None
+        assert bison.resolve("nobody") is None
+
+    def test_short_queries(self, bison):
+        """One- and two-character queries still use the index."""
+        assert bison.resolve("ca")["client_name"] == "Rich Cave"
+        assert [w["client_name"] for w in bison.candidates("e")] == ["Rich Cave", "Jeff Mikolai", "Jeff Mikolai - EU"]
+
+    def test_exact_lookup(self, instantly, bison):
+        """exact() never falls back to partial matches."""
+        assert instantly.exact("Brian Bliss")["workspace_id"] == "aaa-111"
+        assert instantly.exact("brian") is None
+        assert bison.exact("jeff mikolai")["api_key"] == "k2"
+
+    def test_typos_fall_back_to_closest_name(self, instantly, bison):
+        """A misspelt name resolves to the closest client; unrelated names still don't."""
+        assert instantly.resolve("brain bliss")["workspace_id"] == "aaa-111"
+        assert instantly.resolve("ryan bandolick")["workspace_id"] == "bbb-222"
+        assert bison.resolve("jef mikolai")["api_key"] == "k2"
+        assert instantly.resolve("brain bliss", fuzzy=False) is None
+
+    def test_duplicate_exact_name_raises(self):
+        """A name shared by two clients is ambiguous even as an exact match."""
+        workspaces = [
+            {"workspace_id": "aaa-111", "client_name": "Acme", "workspace_name": "Acme", "person_name": ""},
+            {"workspace_id": "bbb-222", "client_name": "Jane Doe", "workspace_name": "Acme", "person_name": "Jane Doe"},
+        ]
+        resolver = ClientResolver(workspaces, id_field="workspace_id", name_fields=("client_name", "workspace_name", "person_name"))
+
+        with pytest.raises(ValueError) as exc_info:
+            resolver.resolve("acme")
+        assert "Acme (aaa-111)" in str(exc_info.value)
+        assert "Jane Doe (bbb-222)" in str(exc_info.value)
+        assert resolver.resolve("aaa-111")["client_name"] == "Acme"
+        assert resolver.resolve("jane doe")["workspace_id"] == "bbb-222"
+
+        with pytest.raises(ValueError, match="Multiple matches"):
+            ClientResolver(BISON + [{"client_name": "rich cave", "api_key": "k4"}]).resolve("Rich Cave")
+
+
+def _scale_fixture():
+    """2,000 workspaces and a mix of name and ID queries."""
+    workspaces = [
+        {
+            "workspace_id": f"ws-{i:05d}-{i * 7919 % 100000:05d}",
+            "client_name": f"Client {i} Holdings",
+            "workspace_name": f"Brand {i * 31 % 5000}",
+            "person_name": f"Person {i}",
+        }
+        for i in range(2000)
+    ]
+    resolver = ClientResolver(workspaces, id_field="workspace_id", name_fields=("client_name", "workspace_name", "person_name"))
+    queries = [f"client {i} holdings" for i in range(0, 2000, 7)] + [workspaces[i]["workspace_id"] for i in range(3, 2000, 11)]
+    return workspaces, resolver, queries
+
+
+class TestClientResolverScale:
+    """Lookups at 1k+ clients."""
+
+    def test_matches_linear_scan(self):
+        """Indexed lookups agree with a linear scan at 2,000 clients."""
+        workspaces, resolver, queries = _scale_fixture()
+
+        for query in queries:
+            assert resolver.resolve(query) is _linear_resolve(workspaces, query)
+
+    @pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="timing benchmark; set RUN_BENCHMARKS=1 to run")
+    def test_faster_than_linear_scan(self):
+        """Indexed lookups are at least 10x faster than a linear scan at 2,000 clients."""
+        workspaces, resolver, queries = _scale_fixture()
+
+        start = time.perf_counter()
+        for query in queries:
+            _linear_resolve(workspaces, query)
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for query in queries:
+            resolver.resolve(query)
+        indexed = time.perf_counter() - start
+
+        assert indexed * 10 < linear
@@ -0,0 +1,161 @@
+"""Unit tests for the Fathom on-disk cache and FathomClient read-through."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from unittest.mock import Mock
+
+from fathom_cache import FathomCache, api_key_namespace
+from fathom_client import FathomClient
+
+
+@pytest.fixture(autouse=True)
+def no_search_index(monkeypatch):
+    """Keep client tests from opening the shared transcript search index."""
+    monkeypatch.setenv("FATHOM_SEARCH_MAX_RECORDINGS", "0")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an empty cache in a temp directory."""
+    return FathomCache(tmp_path / "fathom")
+
+
+def _ok_response(payload):
+    """Build a mock 200 response."""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+class TestFathomCache:
+    """Tests for FathomCache."""
+
+    def test_roundtrip(self, cache):
+        """Stored payloads are returned unchanged."""
+        payload = {"transcript": [{"text": "hello", "timestamp": "00:00:01"}]}
+        cache.put("ns", "transcript", 123, payload)
+
+        assert cache.get("ns", "transcript", 123) == payload
+        assert cache.stats()["hits"] == 1
+
+    def test_miss(self, cache):
+        """Unknown keys are a miss."""
+        assert cache.get("ns", "transcript", 999) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_namespaces_are_isolated(self, cache):
+        """Entries from one API key are not visible to another."""
+        cache.put(api_key_namespace("key-a"), "summary", 1, {"summary": {"markdown_formatted": "A"}})
+
+        assert cache.get(api_key_namespace("key-b"), "summary", 1) is None
+        assert cache.get(api_key_namespace("key-a"), "summary", 1) is not None
+
+    def test_entries_are_compressed(self, cache):
+        """Repetitive transcripts take far less space on disk than raw JSON."""
+        payload = {"transcript": [{"text": "pricing discussion " * 20}] * 200}
+        cache.put("ns", "transcript", 1, payload)
+
+        assert 0 < cache.stats()["size_bytes"] < 10_000
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are evicted once over the size cap."""
+        small = FathomCache(tmp_path / "small", max_bytes=600)
+        for recording_id in range(3):
+            small.put("ns", "summary", recording_id, {"summary": {"markdown_formatted": f"meeting {recording_id} " + "x" * 50}})
+
+        # Touch 0 so 1 becomes least recently used
+        small.get("ns", "summary", 0)
+        for recording_id in range(3, 12):
+            small.put("ns", "summary", recording_id, {"summary": {"markdown_formatted": f"meeting {recording_id} " + "y" * 50}})
+
+        assert small.stats()["size_bytes"] <= 600
+        assert small.get("ns", "summary", 1) is None
+        assert small.get("ns", "summary", 11) is not None
+
+    def test_index_survives_restart(self, tmp_path):
+        """A new cache instance picks up entries already on disk."""
+        first = FathomCache(tmp_path / "persist")
+        first.put("ns", "transcript", 42, {"transcript": [{"text": "hi"}]})
+
+        second = FathomCache(tmp_path / "persist")
+        assert second.get("ns", "transcript", 42) == {"transcript": [{"text": "hi"}]}
+        assert second.stats()["entries"] == 1
+
+
+class TestFathomClientCaching:
+    """Tests for FathomClient read-through caching."""
+
+    def test_transcript_fetched_once(self, cache):
+        """Second transcript request is served from the cache."""
+        client = FathomClient("test-key", cache=cache)
+        client.session.request = Mock(return_value=_ok_response({"transcript": [{"text": "hello"}]}))
+
+        first = client.get_meeting_transcript(7)
+        second = client.get_meeting_transcript(7)
+
+        assert first == second
+        assert client.session.request.call_count == 1
+
+    def test_empty_transcript_not_cached(self, cache):
+        """Transcripts that are still processing are fetched again next time."""
+        client = FathomClient("test-key", cache=cache)
+        client.session.request = Mock(return_value=_ok_response({"transcript": []}))
+
+        client.get_meeting_transcript(7)
+        client.get_meeting_transcript(7)
+
+        assert client.session.request.call_count == 2
+
+    def test_summary_fetched_once(self, cache):
+        """Second summary request is served from the cache."""
+        client = FathomClient("test-key", cache=cache)
+        client.session.request = Mock(return_value=_ok_response(
+            {"summary": {"template_name": "General", "markdown_formatted": "## Notes"}}
+        ))
+
+        client.get_meeting_summary(8)
+        client.get_meeting_summary(8)
+
+        assert client.session.request.call_count == 1
+
+    def test_listed_meetings_are_cached(self, cache):
+        """Meeting records from list_meetings are available without an API call."""
+        client = FathomClient("test-key", cache=cache)
+        client.session.request = Mock(return_value=_ok_response({
+            "items": [{"recording_id": 9, "action_items": [{"description": "Send proposal"}]}]
+        }))
+
+        client.list_meetings(limit=10)
+        meeting = client.get_cached_meeting(9)
+
+        assert meeting["action_items"][0]["description"] == "Send proposal"
+        assert client.session.request.call_count == 1
+
+    def test_meetings_without_action_items_not_cached(self, cache):
+        """A meeting listed before its action items exist is fetched again later."""
+        client = FathomClient("test-key", cache=cache)
+        client.session.request = Mock(return_value=_ok_response({
+            "items": [{"recording_id": 10, "action_items": []}, {"recording_id": 11}]
+        }))
+
+        client.list_meetings(limit=10)
+
+        assert client.get_cached_meeting(10) is None
+        assert client.get_cached_meeting(11) is None
+
+    def test_cache_disabled(self, cache):
+        """use_cache=False always hits the API."""
+        client = FathomClient("test-key", cache=cache, use_cache=False)
+        client.session.request = Mock(return_value=_ok_response({"transcript": [{"text": "hello"}]}))
+
+        client.get_meeting_transcript(7)
+        client.get_meeting_transcript(7)
+
+        assert client.session.request.call_count == 2
+        assert client.get_cached_meeting(7) is None
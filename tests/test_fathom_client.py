@@ -0,0 +1,141 @@
+"""Unit tests for FathomClient bulk recording fetch."""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import requests
+from unittest.mock import patch
+
+from fathom_client import FathomClient, RateLimiter, _apply_transcript_budget
+
+
+def _transcript(text, speaker="Alice"):
+    """Build a transcript API response with a single segment."""
+    return {"transcript": [{"speaker": {"display_name": speaker}, "text": text, "timestamp": "00:00:05"}]}
+
+
+def _summary(markdown):
+    """Build a summary API response."""
+    return {"summary": {"template_name": "General", "markdown_formatted": markdown}}
+
+
+class TestGetRecordingsBulk:
+    """Tests for FathomClient.get_recordings_bulk."""
+
+    def _client(self):
+        """Create a client with caching disabled."""
+        return FathomClient("test-key", use_cache=False)
+
+    def test_fetches_summaries_and_transcripts(self):
+        """Each recording gets its summary and compact transcript, in input order."""
+        client = self._client()
+        with patch.object(client, 'get_meeting_summary', side_effect=lambda rid: _summary(f"summary {rid}")), \
+                patch.object(client, 'get_meeting_transcript', side_effect=lambda rid: _transcript(f"said {rid}")):
+            result = client.get_recordings_bulk(recording_ids=[3, 1, 2, 1])
+
+        assert [r["recording_id"] for r in result["recordings"]] == [3, 1, 2]
+        assert result["fetched"] == 3
+        assert result["failed"] == 0
+        first = result["recordings"][0]
+        assert first["summary"] == "summary 3"
+        assert first["transcript"] == "[00:00:05] Alice: said 3"
+        assert "errors" not in first
+
+    def test_per_item_errors(self):
+        """A failing recording is reported without aborting the batch."""
+        client = self._client()
+
+        def summary(rid):
+            if rid == 2:
+                raise requests.HTTPError("Resource not found: recordings/2/summary")
+            return _summary("ok")
+
+        with patch.object(client, 'get_meeting_summary', side_effect=summary), \
+                patch.object(client, 'get_meeting_transcript', return_value=_transcript("hi")):
+            result = client.get_recordings_bulk(recording_ids=[1, 2])
+
+        assert result["fetched"] == 1
+        assert result["failed"] == 1
+        failed = result["recordings"][1]
+        assert "summary" in failed["errors"]
+        assert failed["transcript"] == "[00:00:05] Alice: hi"
+
+    def test_requests_run_concurrently(self):
+        """Fetches overlap instead of running one after another."""
+        client = self._client()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def transcript(rid):
+            barrier.wait()
+            return _transcript("hi")
+
+        with patch.object(client, 'get_meeting_transcript', side_effect=transcript):
+            result = client.get_recordings_bulk(recording_ids=[1, 2, 3, 4], include_summary=False, max_workers=4)
+
+        assert result["failed"] == 0
+
+    def test_meeting_query_selects_recordings(self):
+        """Without recording_ids, meetings are selected by date range and title."""
+        client = self._client()
+        meetings = [
+            {"recording_id": 1, "title": "Client call - Acme"},
+            {"recording_id": 2, "title": "Internal standup"},
+        ]
+        with patch.object(client, 'get_all_meetings', return_value=meetings) as get_all, \
+                patch.object(client, 'get_meeting_summary', return_value=_summary("ok")):
+            result = client.get_recordings_bulk(
+                search_term="client", created_after="2025-01-01T00:00:00Z", include_transcript=False
+            )
+
+        assert get_all.call_args.kwargs["created_after"] == "2025-01-01T00:00:00Z"
+        assert [r["recording_id"] for r in result["recordings"]] == [1]
+        assert result["recordings"][0]["title"] == "Client call - Acme"
+        assert "transcript" not in result["recordings"][0]
+
+    def test_transcript_budget(self):
+        """Transcripts are truncated to fit the shared character budget."""
+        client = self._client()
+        texts = {1: "a" * 20, 2: "b" * 500}
+        with patch.object(client, 'get_meeting_transcript', side_effect=lambda rid: _transcript(texts[rid])):
+            result = client.get_recordings_bulk(
+                recording_ids=[1, 2], include_summary=False, max_transcript_chars=200
+            )
+
+        short, long = result["recordings"]
+        assert "transcript_truncated" not in short
+        assert long["transcript_truncated"] is True
+        assert len(short["transcript"]) + len(long["transcript"]) == 200
+        assert result["truncated"] == 1
+
+
+class TestTranscriptBudget:
+    """Tests for the transcript budget allocation."""
+
+    def test_unused_share_goes_to_longer_transcripts(self):
+        """Short transcripts stay whole; the rest of the budget is split evenly."""
+        entries = [{"transcript": "x" * 10}, {"transcript": "y" * 100}, {"transcript": "z" * 100}]
+        truncated = _apply_transcript_budget(entries, 110)
+
+        assert truncated == 2
+        assert [len(e["transcript"]) for e in entries] == [10, 50, 50]
+
+
+class TestRateLimiterThreadSafety:
+    """Tests for RateLimiter under concurrent use."""
+
+    def test_concurrent_callers_never_exceed_limit(self):
+        """Every concurrent caller gets its own slot in the window."""
+        limiter = RateLimiter(max_requests_per_minute=10)
+        with patch('fathom_client.time.sleep') as sleep:
+            threads = [threading.Thread(target=limiter.wait_if_needed) for _ in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(limiter.requests) == 10
+        sleep.assert_not_called()
@@ -0,0 +1,132 @@
+"""Unit tests for the Fathom transcript search index."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from unittest.mock import Mock
+
+from fathom_search import FathomSearchIndex, _to_match_query
+from fathom_client import FathomClient
+
+
+def _segment(speaker, text, timestamp="00:01:00"):
+    """Build a transcript segment as returned by the Fathom API."""
+    return {"speaker": {"display_name": speaker}, "text": text, "timestamp": timestamp}
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an empty index with a few meetings."""
+    idx = FathomSearchIndex(tmp_path / "search.db")
+    idx.upsert_meetings([
+        {"recording_id": 1, "title": "Acme intro", "url": "https://fathom.video/calls/1", "scheduled_start_time": "2025-01-01T10:00:00Z"},
+        {"recording_id": 2, "title": "Globex renewal", "url": "https://fathom.video/calls/2", "scheduled_start_time": "2025-01-02T10:00:00Z"},
+    ])
+    idx.index_transcript(1, [
+        _segment("Alice", "Thanks for joining, let's start with introductions"),
+        _segment("Bob", "What does your pricing look like for fifty seats?", "00:12:30"),
+    ])
+    idx.index_transcript(2, [
+        _segment("Carol", "Pricing is fine but we need a discount on renewal", "00:05:10"),
+        _segment("Alice", "I can offer a discount if you sign annually", "00:06:00"),
+        _segment("Carol", "Then the pricing works", "00:07:00"),
+    ])
+    yield idx
+    idx.close()
+
+
+class TestFathomSearchIndex:
+    """Tests for FathomSearchIndex."""
+
+    def test_search_returns_ranked_meetings_with_snippets(self, index):
+        """Matches carry meeting links, speaker, timestamp and a highlighted snippet."""
+        results = index.search("pricing")
+
+        assert {r["recording_id"] for r in results} == {1, 2}
+        globex = next(r for r in results if r["recording_id"] == 2)
+        assert globex["url"] == "https://fathom.video/calls/2"
+        assert globex["match_count"] == 2
+        assert "**Pricing**" in globex["matches"][0]["snippet"] or "**pricing**" in globex["matches"][0]["snippet"]
+        assert globex["matches"][0]["speaker"] == "Carol"
+
+    def test_all_words_required_by_default(self, index):
+        """Multi-word queries match segments containing every word."""
+        assert [r["recording_id"] for r in index.search("pricing discount")] == [2]
+        assert {r["recording_id"] for r in index.search("introductions discount", match_any=True)} == {1, 2}
+
+    def test_stemming(self, index):
+        """Porter stemming matches word variants."""
+        assert [r["recording_id"] for r in index.search("discounts")] == [2]
+
+    def test_speaker_filter(self, index):
+        """Speaker filter restricts matches to what that person said."""
+        results = index.search("discount", speaker="alice")
+
+        assert len(results) == 1
+        assert results[0]["matches"][0]["speaker"] == "Alice"
+        assert results[0]["matches"][0]["timestamp"] == "00:06:00"
+
+    def test_reindex_is_incremental(self, index):
+        """Unchanged transcripts are skipped; changed ones replace old segments."""
+        assert index.index_transcript(1, [
+            _segment("Alice", "Thanks for joining, let's start with introductions"),
+            _segment("Bob", "What does your pricing look like for fifty seats?", "00:12:30"),
+        ]) is False
+
+        assert index.index_transcript(1, [_segment("Bob", "Let's talk about onboarding")]) is True
+        assert [r["recording_id"] for r in index.search("pricing")] == [2]
+        assert index.stats()["segments"] == 4
+
+    def test_punctuation_does_not_break_queries(self, index):
+        """User input with FTS syntax characters is quoted safely."""
+        assert index.search('pricing: "seats?" (fifty)') != []
+        assert index.search("  ") == []
+
+    def test_max_recordings_evicts_oldest(self, tmp_path):
+        """Only the newest meetings are kept once over the per-key cap."""
+        small = FathomSearchIndex(tmp_path / "small.db", max_recordings=1)
+        small.upsert_meetings([
+            {"recording_id": 1, "scheduled_start_time": "2025-01-01T10:00:00Z"},
+            {"recording_id": 2, "scheduled_start_time": "2025-02-01T10:00:00Z"},
+        ])
+        small.index_transcript(1, [_segment("A", "pricing")])
+        small.index_transcript(2, [_segment("B", "pricing")])
+
+        assert [r["recording_id"] for r in small.search("pricing")] == [2]
+        assert small.stats()["recordings"] == 1
+        small.close()
+
+    def test_match_query(self):
+        """Words are quoted and prefix stars kept."""
+        assert _to_match_query("price integrat*") == '"price" "integrat"*'
+        assert _to_match_query("a b", match_any=True) == '"a" OR "b"'
+
+
+class TestFathomClientIndexing:
+    """Tests for FathomClient feeding the search index."""
+
+    def test_fetched_transcripts_are_indexed(self, tmp_path):
+        """Transcripts fetched through the client become searchable."""
+        index = FathomSearchIndex(tmp_path / "client.db")
+        client = FathomClient("test-key", use_cache=True, cache=Mock(get=Mock(return_value=None)), search_index=index)
+
+        list_response = Mock(status_code=200)
+        list_response.json.return_value = {"items": [{"recording_id": 5, "title": "Initech demo"}]}
+        transcript_response = Mock(status_code=200)
+        transcript_response.json.return_value = {"transcript": [_segment("Dana", "Pricing tiers start at 500")]}
+        client.session.request = Mock(
+            side_effect=lambda method, url, **kwargs: transcript_response if url.endswith('/transcript') else list_response
+        )
+
+        sync = client.sync_search_index()
+        results = index.search("pricing")
+
+        assert sync == {"checked": 1, "newly_indexed": 1, "failed": 0}
+        assert results[0]["title"] == "Initech demo"
+        assert client.sync_search_index()["newly_indexed"] == 0
+        assert client.session.request.call_count == 3  # second sync only lists meetings
+        index.close()
@@ -0,0 +1,252 @@
+"""
+Unit tests for the pooled HTTP transport used by the lead clients.
+
+Tests:
+- requests-compatible responses and errors
+- Retry/backoff on 429 and 5xx
+- Per-host concurrency limits for coroutine fan-outs
+- Fair per-tenant queueing shared by every caller
+"""
+
+import asyncio
+import threading
+import httpx
+import pytest
+import requests
+
+from src.leads.http_pool import HTTPPool, _clean_params
+
+
+def _pool(handler, **kwargs):
+    """Pool whose requests are answered by handler(request)."""
+    kwargs.setdefault("backoff_base", 0)
+    return HTTPPool(transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+class TestResponses:
+    """Responses behave like requests.Response."""
+
+    def test_json_and_status(self, calls):
+        """ok, status_code, json() and request encoding match requests."""
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"id": "ws-1"})
+
+        pool = _pool(handler)
+        response = pool.request(
+            "GET", "https://api.instantly.ai/api/v2/workspaces/current",
+            headers={"Authorization": "Bearer k"}, params={"limit": 5, "skip": None, "flag": True}
+        )
+        pool.close()
+
+        assert response.ok and response.status_code == 200
+        assert response.json() == {"id": "ws-1"}
+        assert calls[0].headers["Authorization"] == "Bearer k"
+        assert dict(calls[0].url.params) == {"limit": "5", "flag": "True"}
+
+    def test_raise_for_status_raises_requests_error(self):
+        """4xx responses raise requests.exceptions.HTTPError carrying the response."""
+        pool = _pool(lambda request: httpx.Response(404, text="missing"))
+        response = pool.request("GET", "https://send.leadgenjay.com/api/replies/1")
+        pool.close()
+
+        assert not response.ok
+        assert response.text == "missing"
+        with pytest.raises(requests.exceptions.HTTPError, match="404 Client Error") as exc_info:
+            response.raise_for_status()
+        assert exc_info.value.response is response
+
+    def test_transport_errors_map_to_requests_exceptions(self):
+        """Connection failures surface as requests.exceptions.ConnectionError."""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        pool = _pool(handler, max_retries=1)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            pool.request("GET", "https://app.emailguard.io/api/v1/x")
+        assert pool.stats()["requests"] == 2
+        pool.close()
+
+    def test_clean_params(self):
+        """None values are dropped and booleans encoded like requests."""
+        assert _clean_params({"a": None, "b": False, "c": [1, 2]}) == {"b": "False", "c": [1, 2]}
+
+
+class TestRetries:
+    """Shared retry/backoff policy."""
+
+    def test_retries_429_honoring_retry_after(self, calls):
+        """Rate-limited requests are retried, POST included."""
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"ok": True})
+
+        pool = _pool(handler)
+        response = pool.request("POST", "https://app.emailguard.io/api/v1/content-spam-check", json={"content": "hi"})
+        pool.close()
+
+        assert response.json() == {"ok": True}
+        assert len(calls) == 3
+        assert pool.retries == 2
+
+    def test_5xx_retried_only_for_idempotent_methods(self, calls):
+        """GETs retry on 503; POSTs return the error instead of risking a duplicate."""
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(503)
+
+        pool = _pool(handler, max_retries=2)
+        assert pool.request("GET", "https://api.instantly.ai/a").status_code == 503
+        assert pool.request("POST", "https://api.instantly.ai/b").status_code == 503
+        pool.close()
+
+        assert calls == ["GET", "GET", "GET", "POST"]
+
+
+class TestConcurrency:
+    """Fan-outs run as coroutines bounded by the per-host pool size."""
+
+    def test_fan_out_respects_host_limit(self):
+        """No more than the host limit is in flight, and one client serves each host."""
+        state = {"in_flight": 0, "peak": 0}
+        lock = threading.Lock()
+
+        async def handler(request):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            with lock:
+                state["in_flight"] -= 1
+            return httpx.Response(200, json={"host": request.url.host})
+
+        pool = _pool(handler, host_limits={"api.instantly.ai": 3, "send.leadgenjay.com": 2})
+
+        async def fan_out():
+            return await asyncio.gather(*(
+                pool.request_async("GET", f"https://{host}/stats")
+                for host in ["api.instantly.ai"] * 12 + ["send.leadgenjay.com"] * 8
+            ))
+
+        responses = pool.run(fan_out())
+        stats = pool.stats()
+        pool.close()
+
+        assert len(responses) == 20
+        assert state["peak"] <= 5
+        assert stats["hosts"] == {"api.instantly.ai": 3, "send.leadgenjay.com": 2}
+
+    def test_sync_calls_from_many_threads(self):
+        """Blocking calls from worker threads share the pool's loop."""
+        pool = _pool(lambda request: httpx.Response(200, json={"n": request.url.params["n"]}))
+        results = {}
+
+        def worker(n):
+            results[n] = pool.request("GET", "https://api.instantly.ai/x", params={"n": n}).json()["n"]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        pool.close()
+
+        assert results == {n: str(n) for n in range(10)}
+
+
+class TestFairQueueing:
+    """One governor per host shared by every caller, fair across tenants."""
+
+    def test_tenants_served_round_robin(self):
+        """A tenant's backlog doesn't delay another tenant's few requests."""
+        order = []
+
+        async def handler(request):
+            order.append(request.headers["Authorization"][-1])
+            await asyncio.sleep(0.005)
+            return httpx.Response(200)
+
+        pool = _pool(handler, host_limits={"send.leadgenjay.com": 1})
+
+        async def burst():
+            return await asyncio.gather(*(
+                pool.request_async("GET", "https://send.leadgenjay.com/api/replies", headers={"Authorization": f"Bearer {key}"})
+                for key in "AAAAAA" + "BB"
+            ))
+
+        pool.run(burst())
+        queues = pool.stats()["queues"]["send.leadgenjay.com"]
+        pool.close()
+
+        assert order == ["A", "A", "B", "A", "B", "A", "A", "A"]
+        assert queues["max_queued"] == 7 and queues["waits"] == 7
+        assert (queues["in_flight"], queues["queued"]) == (0, 0)
+
+    def test_limit_shared_by_thread_pools(self):
+        """Nested executors and sync callers on many threads share one per-host limit."""
+        state = {"in_flight": 0, "peak": 0}
+        lock = threading.Lock()
+
+        async def handler(request):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            with lock:
+                state["in_flight"] -= 1
+            return httpx.Response(200)
+
+        pool = _pool(handler, host_limits={"api.instantly.ai": 4})
+
+        def client_worker(n):
+            for _ in range(3):
+                pool.request("GET", "https://api.instantly.ai/api/v2/emails", headers={"Authorization": f"Bearer k{n}"})
+
+        threads = [threading.Thread(target=client_worker, args=(n,)) for n in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = pool.stats()
+        pool.close()
+
+        assert state["peak"] == 4
+        assert stats["requests"] == 36
+        assert stats["queues"]["api.instantly.ai"]["max_queued"] > 0
+
+    def test_cancelled_waiter_frees_nothing(self):
+        """Cancelling a queued request neither leaks nor double-frees a slot."""
+        release = asyncio.Event()
+
+        async def handler(request):
+            if request.url.path == "/slow":
+                await release.wait()
+            return httpx.Response(200)
+
+        pool = _pool(handler, host_limits={"api.instantly.ai": 1})
+
+        async def scenario():
+            slow = asyncio.ensure_future(pool.request_async("GET", "https://api.instantly.ai/slow"))
+            await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(pool.request_async("GET", "https://api.instantly.ai/a"))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await slow
+            # The slot is free again for a fresh request
+            return await pool.request_async("GET", "https://api.instantly.ai/b")
+
+        response = pool.run(scenario())
+        queues = pool.stats()["queues"]["api.instantly.ai"]
+        pool.close()
+
+        assert response.status_code == 200
+        assert (queues["in_flight"], queues["queued"]) == (0, 0)
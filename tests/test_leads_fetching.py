@@ -10,15 +10,16 @@ Tests:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from src.leads import bison_client, instantly_client
+from src.leads.campaign_stats_cache import DailyStatsCache
 
 
 class TestBisonLeadReplies:
     """Tests for fetching Bison lead replies."""
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_bison_replies_interested(self, mock_get):
         """Test fetching interested lead replies from Bison."""
         # Mock successful API response
@@ -74,7 +75,7 @@ class TestBisonLeadReplies:
         assert result["data"][0]["from_email_address"] == "lead@example.com"
         assert result["data"][1]["from_name"] == "Jane Smith"
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_bison_replies_all_statuses(self, mock_get):
         """Test fetching all lead replies regardless of status."""
         mock_response = Mock()
@@ -92,7 +93,7 @@ class TestBisonLeadReplies:
         call_args = mock_get.call_args
         assert call_args[1]["params"] == {"folder": "inbox"}
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_bison_replies_empty_results(self, mock_get):
         """Test handling empty results."""
         mock_response = Mock()
@@ -108,7 +109,7 @@ class TestBisonLeadReplies:
         assert "data" in result
         assert len(result["data"]) == 0
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_bison_replies_api_error(self, mock_get):
         """Test handling API errors."""
         mock_get.side_effect = Exception("API Error")
@@ -204,7 +205,7 @@ class TestInstantlyLeadResponses:
 class TestBisonConversationThread:
     """Tests for fetching Bison conversation threads."""
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_conversation_thread(self, mock_get):
         """Test fetching a conversation thread."""
         mock_response = Mock()
@@ -238,7 +239,7 @@ class TestBisonConversationThread:
         assert "current_reply" in result["data"]
         assert len(result["data"]["older_messages"]) == 2
 
-    @patch('src.leads.bison_client.requests.get')
+    @patch('src.leads.bison_client.http_pool.get_async', new_callable=AsyncMock)
     def test_get_conversation_thread_not_found(self, mock_get):
         """Test handling non-existent conversation thread."""
         mock_response = Mock()
@@ -256,13 +257,30 @@ class TestBisonConversationThread:
 
 
 class TestCampaignStats:
-    """Tests for fetching campaign statistics."""
-
-    @patch('src.leads.bison_client.requests.get')
-    def test_get_bison_campaign_stats(self, mock_get):
+    """Tests for fetching campaign statistics (through the daily-bucket cache)."""
+
+    @pytest.fixture(autouse=True)
+    def stats_cache(self, tmp_path):
+        """Use a cache in a temp directory instead of the shared one."""
+        cache = DailyStatsCache(tmp_path / "stats.db")
+        with patch.object(bison_client, "get_stats_cache", return_value=cache), \
+             patch.object(instantly_client, "get_stats_cache", return_value=cache):
+            yield cache
+        cache.close()
+
+    @staticmethod
+    def _respond(range_payload, day_payload):
+        """get_async answering the 10-day range with range_payload and single days with day_payload."""
+        async def get_async(url, params=None, **kwargs):
+            response = Mock()
+            response.json.return_value = day_payload if params["start_date"] == params["end_date"] else range_payload
+            response.raise_for_status = Mock()
+            return response
+        return AsyncMock(side_effect=get_async)
+
+    def test_get_bison_campaign_stats(self, stats_cache):
         """Test fetching Bison campaign statistics."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        range_payload = {
             "data": {
                 "emails_sent": 1000,
                 "total_leads_contacted": 500,
@@ -278,48 +296,47 @@ class TestCampaignStats:
                 "interested_percentage": 3.0
             }
         }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        day_payload = {"data": {"emails_sent": 100, "total_leads_contacted": 50, "opened": 30, "unique_replies_per_contact": 5,
+                                "bounced": 2, "unsubscribed": 1, "interested": "1.5", "interested_percentage": 3.0}}
+        mock_get = self._respond(range_payload, day_payload)
 
-        result = bison_client.get_bison_campaign_stats_api(
-            api_key="test_key",
-            start_date="2024-12-01",
-            end_date="2024-12-10"
-        )
+        with patch.object(bison_client.http_pool, "get_async", mock_get):
+            result = bison_client.get_bison_campaign_stats_api(
+                api_key="test_key",
+                start_date="2024-12-01",
+                end_date="2024-12-10"
+            )
 
-        # Verify the request
-        call_args = mock_get.call_args
-        assert call_args[1]["params"]["start_date"] == "2024-12-01"
-        assert call_args[1]["params"]["end_date"] == "2024-12-10"
+        # Verify the request: the range itself plus one request per day
+        ranges = [(call.kwargs["params"]["start_date"], call.kwargs["params"]["end_date"]) for call in mock_get.call_args_list]
+        assert ("2024-12-01", "2024-12-10") in ranges
+        assert len(ranges) == 11
 
         # Verify the response
-        assert result["data"]["emails_sent"] == 1000
-        assert result["data"]["interested"] == 15
-        assert result["data"]["interested_percentage"] == 3.0
+        assert result["data"] == range_payload["data"]
 
-    @patch('src.leads.instantly_client.requests.get')
-    def test_get_instantly_campaign_stats(self, mock_get):
+    def test_get_instantly_campaign_stats(self, stats_cache):
         """Test fetching Instantly campaign statistics."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        range_payload = {
             "emails_sent_count": 2000,
             "reply_count_unique": 100,
             "total_opportunities": 25,
             "reply_rate": 5.0
         }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        day_payload = {"emails_sent_count": 200, "reply_count_unique": 12, "total_opportunities": 2.5, "reply_rate": 6.0}
 
-        result = instantly_client.get_instantly_campaign_stats(
-            api_key="test_key",
-            start_date="2024-12-01",
-            end_date="2024-12-10"
-        )
+        with patch.object(instantly_client.http_pool, "get_async", self._respond(range_payload, day_payload)):
+            result = instantly_client.get_instantly_campaign_stats(
+                api_key="test_key",
+                start_date="2024-12-01",
+                end_date="2024-12-10"
+            )
 
         # Verify the response
         assert result["emails_sent_count"] == 2000
         assert result["reply_count_unique"] == 100
         assert result["reply_rate"] == 5.0
+        assert result["total_opportunities"] == 25
 
 
 class TestDateFiltering:
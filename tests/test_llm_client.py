@@ -0,0 +1,122 @@
+"""
+Unit tests for the shared Anthropic client manager.
+
+Tests:
+- One client per API key and endpoint, reused across requests
+- Request and token budgets throttle and are settled from reported usage
+- Interactive callers are admitted before waiting bulk callers
+- Reply analysis goes through the manager (against the local Messages stub)
+"""
+
+import time
+import threading
+from unittest.mock import patch
+
+from src.leads import interest_analyzer
+from src.leads.llm_client import LLMBudget, LLMClientManager, INTERACTIVE, BULK
+from tests.anthropic_stub import StubMessagesServer
+
+
+def costs(requests=1, input_tokens=0, output_tokens=0):
+    return {"requests": requests, "input_tokens": input_tokens, "output_tokens": output_tokens}
+
+
+class TestClientPool:
+    """Tests for LLMClientManager.client."""
+
+    def test_one_client_per_key_and_endpoint(self):
+        """Clients are built once per (API key, base URL)."""
+        built = []
+        manager = LLMClientManager(client_factory=lambda **kwargs: built.append(kwargs) or object())
+
+        with patch.dict("os.environ", {"ANTHROPIC_BASE_URL": ""}):
+            first = manager.client("key-a")
+            assert manager.client("key-a") is first
+            manager.client("key-b")
+        with patch.dict("os.environ", {"ANTHROPIC_BASE_URL": "http://127.0.0.1:1"}):
+            manager.client("key-a")
+
+        assert built == [
+            {"api_key": "key-a"}, {"api_key": "key-b"}, {"api_key": "key-a", "base_url": "http://127.0.0.1:1"}
+        ]
+        assert manager.stats()["clients"] == 3
+
+
+class TestBudget:
+    """Tests for LLMBudget."""
+
+    def test_requests_per_minute(self):
+        """Once the burst is spent, requests wait for the refill."""
+        budget = LLMBudget(rpm=600, input_tpm=10 ** 6, output_tpm=10 ** 6)
+        for _ in range(600):
+            budget.acquire(costs())
+
+        waited = budget.acquire(costs())
+
+        assert 0.05 < waited < 1.0
+        assert budget.stats()["throttled"] == 1
+
+    def test_settle_refunds_unused_output(self):
+        """Output charged at max_tokens is refunded down to the reported usage."""
+        budget = LLMBudget(rpm=100, input_tpm=10000, output_tpm=10000)
+        charged = costs(input_tokens=500, output_tokens=4000)
+        budget.acquire(charged)
+        budget.settle(charged, {"input_tokens": 600, "output_tokens": 100})
+
+        available = budget.stats()["available"]
+        assert 9399 <= available["input_tokens"] <= 9401
+        assert 9899 <= available["output_tokens"] <= 9901
+
+    def test_oversized_request_is_admitted(self):
+        """A request larger than a whole minute's budget still goes through once the bucket is full."""
+        budget = LLMBudget(rpm=100, input_tpm=1000, output_tpm=1000)
+        assert budget.acquire(costs(input_tokens=5000)) < 0.05
+        assert budget.stats()["available"]["input_tokens"] == 0
+
+    def test_interactive_goes_first(self):
+        """A waiting interactive request is admitted before an earlier bulk one."""
+        budget = LLMBudget(rpm=120, input_tpm=10 ** 6, output_tpm=10 ** 6)
+        for _ in range(120):
+            budget.acquire(costs())
+
+        admitted = []
+
+        def call(priority):
+            budget.acquire(costs(), priority)
+            admitted.append(priority)
+
+        bulk = threading.Thread(target=call, args=(BULK,))
+        bulk.start()
+        time.sleep(0.1)
+        interactive = threading.Thread(target=call, args=(INTERACTIVE,))
+        interactive.start()
+        bulk.join(5)
+        interactive.join(5)
+
+        assert admitted == [INTERACTIVE, BULK]
+
+
+class TestReplyAnalysis:
+    """interest_analyzer sends its requests through the manager."""
+
+    def test_requests_share_client_and_budget(self):
+        """Every analysis reuses one client; usage and priorities are recorded."""
+        manager = LLMClientManager()
+        leads = [{"email": f"l{n}@example.com", "reply_body": f"How does step {n} work?"} for n in range(6)]
+
+        with StubMessagesServer() as server, \
+             patch.dict("os.environ", {
+                 "ANTHROPIC_API_KEY": "test",
+                 "ANTHROPIC_BASE_URL": server.url,
+                 "LEAD_VERDICT_CACHE_ENABLED": "false"
+             }), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=manager):
+            interest_analyzer.analyze_reply_with_claude("Could you explain the tiers?")
+            interest_analyzer.categorize_leads(leads, max_workers=3, batch_size=1)
+
+        stats = manager.stats()
+        assert stats["clients"] == 1
+        assert stats["requests"] == {INTERACTIVE: 1, BULK: 6}
+        assert len(server.requests) == 7
+        assert stats["input_tokens"] == sum(len(r["messages"][0]["content"]) // 4 for r in server.requests)
+        assert all(r["temperature"] == 0 for r in server.requests)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the shared mailbox snapshot.
+
+Tests:
+- Health summary, unhealthy alerts and capacity share one fan-out
+- Clients are fetched concurrently, failures are skipped
+- TTL expiry and client list changes rebuild the snapshot
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import lead_functions
+from src.leads.mailbox_snapshot import MailboxSnapshotEngine
+
+
+CLIENTS = {"total_clients": 3, "clients": [
+    {"platform": "instantly", "client_name": "Alice", "workspace_id": "ws-1"},
+    {"platform": "instantly", "client_name": "Bob", "workspace_id": "ws-2"},
+    {"platform": "bison", "client_name": "Initech"},
+]}
+
+
+def _mailboxes(*accounts):
+    healthy = sum(1 for a in accounts if a["health"] == "healthy")
+    early = sum(1 for a in accounts if a["health"] == "early")
+    return {
+        "total_accounts": len(accounts),
+        "healthy_count": healthy,
+        "at_risk_count": len(accounts) - healthy - early,
+        "early_count": early,
+        "accounts": list(accounts)
+    }
+
+
+INSTANTLY = {
+    "ws-1": _mailboxes(
+        {"email": "a1@alice.com", "status": "Active", "daily_limit": 50, "health": "healthy"},
+        {"email": "a2@alice.com", "status": "Connection Error", "daily_limit": 30, "health": "at_risk"},
+    ),
+    "ws-2": _mailboxes(
+        {"email": "b1@bob.com", "status": "Paused", "daily_limit": 20, "health": "early"},
+    ),
+}
+BISON = {
+    "Initech": _mailboxes(
+        {"email": "i1@initech.com", "status": "Connected", "daily_limit": 40, "health": "healthy"},
+        {"email": "i2@initech.com", "status": "Disconnected", "daily_limit": 10, "health": "at_risk"},
+    ),
+}
+
+
+@pytest.fixture
+def fleet():
+    """Fresh engine, fixed client list and counted per-client mailbox fetches."""
+    engine = MailboxSnapshotEngine(ttl_seconds=60)
+    calls = []
+
+    def instantly(sheet_url, instantly_gid, workspace_id):
+        calls.append(workspace_id)
+        time.sleep(0.1)
+        return INSTANTLY[workspace_id]
+
+    def bison(sheet_url, bison_gid, client_name):
+        calls.append(client_name)
+        time.sleep(0.1)
+        return BISON[client_name]
+
+    with patch.object(lead_functions, "get_mailbox_snapshot_engine", return_value=engine), \
+         patch.object(lead_functions, "get_all_clients", return_value=CLIENTS) as clients, \
+         patch.object(lead_functions, "get_instantly_mailboxes", side_effect=instantly), \
+         patch.object(lead_functions, "get_bison_mailboxes", side_effect=bison):
+        yield engine, clients, calls
+
+
+def _call(func):
+    return func(sheet_url="sheet", instantly_gid="gid-i", bison_gid="gid-b")
+
+
+class TestMailboxTools:
+    """The three fleet-wide mailbox tools served from one snapshot."""
+
+    def test_tools_share_one_fan_out(self, fleet):
+        """Health, alerts and capacity cost one accounts fetch per client."""
+        engine, _, calls = fleet
+
+        health = _call(lead_functions.get_all_mailbox_health)
+        unhealthy = _call(lead_functions.get_unhealthy_mailboxes)
+        capacity = _call(lead_functions.get_mailbox_capacity)
+
+        assert sorted(calls) == ["Initech", "ws-1", "ws-2"]
+        assert engine.stats()["builds"] == 1 and engine.stats()["hits"] == 2
+
+        assert (health["total_accounts"], health["healthy_count"], health["at_risk_count"], health["early_count"]) == (5, 2, 2, 1)
+        assert health["instantly_totals"] == {"accounts": 3, "healthy": 1, "at_risk": 1, "early": 1}
+        assert health["bison_totals"] == {"accounts": 2, "healthy": 1, "at_risk": 1}
+        assert [c["client_name"] for c in health["client_summaries"]] == ["Alice", "Bob", "Initech"]
+        assert health["health_percentage"] == 40.0
+
+        assert [(m["client_name"], m["email"]) for m in unhealthy["mailboxes"]] == [
+            ("Alice", "a2@alice.com"), ("Initech", "i2@initech.com")
+        ]
+        assert unhealthy["count"] == 2
+
+        assert capacity == {
+            "total_daily_capacity": 150,
+            "healthy_daily_capacity": 90,
+            "instantly_capacity": 100,
+            "bison_capacity": 50,
+            "total_accounts": 5,
+            "healthy_accounts": 2,
+            "average_capacity_per_account": 30.0,
+            "capacity_utilization_percentage": 60.0,
+            "data_as_of": health["data_as_of"]
+        }
+
+    def test_clients_fetched_concurrently(self, fleet):
+        """Wall time is about one client's fetch, not the sum."""
+        started = time.monotonic()
+        _call(lead_functions.get_mailbox_capacity)
+
+        assert time.monotonic() - started < 0.25
+
+    def test_failed_client_skipped(self, fleet):
+        """A client whose accounts fail is left out but still counted in the sheet total."""
+        with patch.object(lead_functions, "get_bison_mailboxes", side_effect=RuntimeError("401")):
+            health = _call(lead_functions.get_all_mailbox_health)
+
+        assert health["total_clients"] == 3
+        assert [c["client_name"] for c in health["client_summaries"]] == ["Alice", "Bob"]
+        assert health["bison_totals"]["accounts"] == 0
+
+    def test_client_list_change_rebuilds(self, fleet):
+        """Adding a client to the sheet triggers a fresh fetch."""
+        _, clients, calls = fleet
+        _call(lead_functions.get_all_mailbox_health)
+
+        clients.return_value = {"total_clients": 2, "clients": CLIENTS["clients"][:2]}
+        capacity = _call(lead_functions.get_mailbox_capacity)
+
+        assert len(calls) == 5
+        assert capacity["bison_capacity"] == 0
+
+
+class TestMailboxSnapshotEngine:
+    """Tests for MailboxSnapshotEngine caching."""
+
+    def test_ttl_expiry(self):
+        """Snapshots older than the TTL are rebuilt."""
+        engine = MailboxSnapshotEngine(ttl_seconds=0.05)
+        builds = []
+
+        def fetch(clients):
+            builds.append(len(clients))
+            return []
+
+        engine.get("sheet", "i", "b", CLIENTS["clients"], fetch)
+        engine.get("sheet", "i", "b", CLIENTS["clients"], fetch)
+        time.sleep(0.1)
+        engine.get("sheet", "i", "b", CLIENTS["clients"], fetch)
+
+        assert builds == [3, 3]
+        assert engine.stats() == {"snapshots": 1, "ttl_seconds": 0.05, "hits": 1, "builds": 2}
@@ -14,6 +14,13 @@ from leads._source_fetch_interested_leads import mark_instantly_lead_as_interest
 from leads.bison_client import mark_bison_reply_as_interested
 
 
+@pytest.fixture(autouse=True)
+def no_reply_store():
+    """Keep marking tests away from the on-disk reply store."""
+    with patch("leads.bison_client.get_reply_store", return_value=None):
+        yield
+
+
 class TestMarkInstantlyLeadAsInterested:
     """Tests for Instantly mark_lead_as_interested function."""
 
@@ -154,7 +161,7 @@ class TestMarkInstantlyLeadAsInterested:
 class TestMarkBisonReplyAsInterested:
     """Tests for Bison mark_reply_as_interested function."""
 
-    @patch('leads.bison_client.requests.patch')
+    @patch('leads.bison_client.http_pool.patch')
     def test_mark_reply_basic(self, mock_patch):
         """Test basic reply marking with default parameters."""
         # Mock response
@@ -195,7 +202,7 @@ class TestMarkBisonReplyAsInterested:
         # Check result
         assert result['data']['interested'] is True
 
-    @patch('leads.bison_client.requests.patch')
+    @patch('leads.bison_client.http_pool.patch')
     def test_mark_reply_without_skip_webhooks(self, mock_patch):
         """Test marking reply with webhooks enabled."""
         mock_response = Mock()
@@ -212,7 +219,7 @@ class TestMarkBisonReplyAsInterested:
         payload = mock_patch.call_args[1]['json']
         assert payload['skip_webhooks'] is False
 
-    @patch('leads.bison_client.requests.patch')
+    @patch('leads.bison_client.http_pool.patch')
     def test_mark_reply_api_error(self, mock_patch):
         """Test handling of API errors."""
         mock_response = Mock()
@@ -227,7 +234,7 @@ class TestMarkBisonReplyAsInterested:
 
         assert "Bison API Error" in str(excinfo.value)
 
-    @patch('leads.bison_client.requests.patch')
+    @patch('leads.bison_client.http_pool.patch')
     def test_mark_reply_various_ids(self, mock_patch):
         """Test marking replies with various reply IDs."""
         mock_response = Mock()
@@ -356,7 +363,7 @@ class TestIntegrationScenarios:
         assert "submitted" in result["message"]
         assert mock_post.call_args[1]['json']['lead_email'] == hidden_gem["email"]
 
-    @patch('leads.bison_client.requests.patch')
+    @patch('leads.bison_client.http_pool.patch')
     def test_full_bison_workflow(self, mock_patch):
         """Test complete workflow: find hidden gems → mark reply as interested."""
         # Mock API response
@@ -0,0 +1,188 @@
+"""
+Unit tests for the local daily metrics time series.
+
+Tests:
+- Daily rows are extracted from raw Instantly and Bison stats
+- Weekly sums, rolling averages and week-over-week deltas
+- Missing days are reported as gaps, not zeros
+- Movers compare many workspaces at once
+- The daily stats cache records every day it uses; trend tools refuse to
+  answer when it is off
+"""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.leads import lead_functions
+from src.leads.campaign_stats_cache import DailyStatsCache
+from src.leads.metrics_store import MetricsStore, extract_metrics
+
+
+END = date(2026, 3, 29)
+
+
+def _instantly(sent, replies, interested=0, opportunities=0):
+    return {
+        "emails_sent_count": sent,
+        "reply_count": replies,
+        "total_interested": interested,
+        "total_opportunities": opportunities
+    }
+
+
+def _days(weeks, end=END):
+    """Every day of `weeks` 7-day windows ending on `end`, oldest first."""
+    return [(end - timedelta(days=n)).isoformat() for n in reversed(range(weeks * 7))]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(tmp_path / "metrics.db")
+    yield store
+    store.close()
+
+
+class TestExtract:
+    """Tests for extract_metrics."""
+
+    def test_instantly_fields(self):
+        """Instantly overview counts map onto the stored metrics."""
+        assert extract_metrics("instantly", _instantly(100, 4, 2, 1)) == {
+            "emails_sent": 100, "replies": 4, "interested": 2, "opportunities": 1
+        }
+
+    def test_bison_string_counts(self):
+        """Bison counts come from data and may be strings."""
+        stats = {"data": {"emails_sent": "250", "unique_replies_per_contact": "5", "interested": 3}}
+        assert extract_metrics("bison", stats) == {
+            "emails_sent": 250, "replies": 5, "interested": 3, "opportunities": 3
+        }
+
+
+class TestTrends:
+    """Tests for MetricsStore.trends."""
+
+    def test_weekly_sums_and_week_over_week(self, store):
+        """Days are summed per week; rates come from the sums."""
+        days = _days(2)
+        store.record("instantly", "ws", {day: _instantly(100, 1) for day in days[:7]})
+        store.record("instantly", "ws", {day: _instantly(100, 2, 1) for day in days[7:]})
+
+        trends = store.trends("instantly", "ws", weeks=2, end=END)
+
+        first, second = trends["weeks"]
+        assert (first["week_start"], second["week_end"]) == (days[0], days[-1])
+        assert (first["emails_sent"], first["replies"], first["reply_rate"]) == (700, 7, 1)
+        assert (second["replies"], second["interested"], second["reply_rate"]) == (14, 7, 2)
+        assert trends["week_over_week"]["replies"] == {"current": 14, "previous": 7, "change": 7, "change_pct": 100}
+        assert trends["coverage"]["days_with_data"] == 14
+
+    def test_rolling_average(self, store):
+        """Rolling averages run over the weekly values."""
+        days = _days(3)
+        for week, replies in enumerate((7, 14, 21)):
+            store.record("instantly", "ws", {day: _instantly(10, replies // 7) for day in days[week * 7:week * 7 + 7]})
+
+        weeks = store.trends("instantly", "ws", weeks=3, rolling_weeks=2, end=END)["weeks"]
+
+        assert [w["rolling_avg"]["replies"] for w in weeks] == [7, 10.5, 17.5]
+
+    def test_missing_days_are_gaps(self, store):
+        """Weeks without data are None rather than zero, and coverage says so."""
+        days = _days(2)
+        store.record("instantly", "ws", {days[-1]: _instantly(50, 5)})
+
+        trends = store.trends("instantly", "ws", weeks=2, end=END)
+
+        first, second = trends["weeks"]
+        assert first["emails_sent"] is None and first["days_with_data"] == 0
+        assert (second["emails_sent"], second["days_with_data"]) == (50, 1)
+        assert trends["week_over_week"]["emails_sent"]["change"] is None
+        assert trends["coverage"]["days_with_data"] == 1
+
+    def test_rerecorded_day_overwrites(self, store):
+        """Recording a day again replaces it (today's numbers keep changing)."""
+        store.record("instantly", "ws", {END.isoformat(): _instantly(10, 1)})
+        store.record("instantly", "ws", {END.isoformat(): _instantly(30, 3)})
+
+        assert store.trends("instantly", "ws", weeks=2, end=END)["weeks"][-1]["emails_sent"] == 30
+        assert store.stats()["rows"] == 1
+
+
+class TestMovers:
+    """Tests for MetricsStore.movers."""
+
+    def test_compares_workspaces_with_both_weeks(self, store):
+        """Only workspaces with data in both weeks are compared; index points into keys."""
+        days = _days(2)
+        store.record("instantly", "up", {days[0]: _instantly(100, 1), days[-1]: _instantly(100, 5)})
+        store.record("bison", "down", {
+            days[0]: {"data": {"emails_sent": 100, "unique_replies_per_contact": 4}},
+            days[-1]: {"data": {"emails_sent": 100, "unique_replies_per_contact": 2}}
+        })
+        store.record("instantly", "new", {days[-1]: _instantly(100, 9)})
+
+        keys = [("instantly", "up"), ("instantly", "new"), ("bison", "down")]
+        movers = store.movers(keys, "reply_rate", end=END)
+
+        assert [(m["index"], m["change"]) for m in movers] == [(0, 4), (2, -2)]
+        assert movers[1]["change_pct"] == -50
+
+    def test_unknown_metric(self, store):
+        """An unknown metric is rejected."""
+        with pytest.raises(ValueError):
+            store.movers([("instantly", "ws")], "bounces")
+
+    def test_tool_splits_risers_and_fallers(self, store):
+        """get_week_over_week_movers names clients and sorts both lists."""
+        end = date.today() - timedelta(days=1)
+        days = _days(2, end)
+        for key, before, after in (("k1", 1, 3), ("k2", 4, 1), ("k3", 2, 6)):
+            store.record("instantly", key, {days[0]: _instantly(100, before), days[-1]: _instantly(100, after)})
+
+        registry = Mock()
+        registry.get_instantly_workspaces.return_value = [
+            {"client_name": name, "api_key": name} for name in ("A", "B", "C")
+        ]
+        keys = {"A": "k1", "B": "k2", "C": "k3"}
+        with patch.object(lead_functions, "get_metrics_store", return_value=store), \
+             patch.object(lead_functions, "get_stats_cache", return_value=Mock()), \
+             patch.object(lead_functions, "get_workspace_registry", return_value=registry), \
+             patch.object(lead_functions, "workspace_key", side_effect=keys.get):
+            result = lead_functions.get_week_over_week_movers(metric="replies", platform="instantly", sheet_url="sheet")
+
+        assert [(m["client_name"], m["change"]) for m in result["risers"]] == [("C", 4), ("A", 2)]
+        assert [(m["client_name"], m["platform"]) for m in result["fallers"]] == [("B", "instantly")]
+        assert result["clients_compared"] == 3
+
+    def test_tools_report_history_not_recorded(self, store):
+        """With the stats cache off nothing records days, so the trend tools say so instead of returning gaps."""
+        with patch.object(lead_functions, "get_metrics_store", return_value=store), \
+             patch.object(lead_functions, "get_stats_cache", return_value=None):
+            with pytest.raises(ValueError, match="LEAD_STATS_CACHE_ENABLED"):
+                lead_functions.get_week_over_week_movers(sheet_url="sheet")
+            with pytest.raises(ValueError, match="not being recorded"):
+                lead_functions.get_client_metric_trends("Acme", sheet_url="sheet")
+
+
+class TestStatsCacheFeed:
+    """The daily stats cache records the days it serves."""
+
+    def test_range_stats_records_days(self, tmp_path, store):
+        """Fetched and cached days both reach the metrics store."""
+        cache = DailyStatsCache(tmp_path / "stats.db", settle_days=2, metrics=store)
+        today = date.today()
+
+        async def fetch(api_key, start_date, end_date):
+            return _instantly(100, 2)
+
+        start = (today - timedelta(days=6)).isoformat()
+        asyncio.run(cache.range_stats("instantly", "key", start, today.isoformat(), fetch))
+        cache.close()
+
+        assert store.stats()["rows"] == 7
+        trends = store.trends("instantly", lead_functions.workspace_key("key"), weeks=2, end=today)
+        assert (trends["weeks"][-1]["emails_sent"], trends["weeks"][-1]["replies"]) == (700, 14)
@@ -0,0 +1,172 @@
+"""
+Unit tests for the shared portfolio stats snapshot.
+
+Tests:
+- Back-to-back portfolio tools share one fan-out per date range
+- Ranking, thresholds and totals computed from the snapshot
+- TTL expiry, workspace changes and concurrent callers
+"""
+
+import time
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.leads import lead_functions
+from src.leads.portfolio_snapshot import SnapshotEngine
+
+
+INSTANTLY = [
+    {"workspace_id": "ws-1", "client_name": "Alice", "api_key": "key-1"},
+    {"workspace_id": "ws-2", "client_name": "Bob", "api_key": "key-2"},
+]
+BISON = [{"client_name": "Initech", "api_key": "key-3"}]
+
+INSTANTLY_STATS = {
+    "key-1": {"emails_sent_count": 1000, "reply_count_unique": 20, "total_opportunities": 6, "reply_rate": 2.0},
+    "key-2": {"emails_sent_count": 500, "reply_count_unique": 5, "total_opportunities": 1, "reply_rate": 1.0},
+}
+BISON_STATS = {"data": {"emails_sent": 800, "unique_replies_per_contact": 16, "interested": 2,
+                        "unique_replies_per_contact_percentage": 2.0}}
+
+
+@pytest.fixture
+def portfolio():
+    """Fresh engine, fixed workspaces and counted per-client stats calls."""
+    engine = SnapshotEngine(ttl_seconds=60)
+    registry = Mock()
+    registry.get_instantly_workspaces.return_value = INSTANTLY
+    registry.get_bison_workspaces.return_value = BISON
+    instantly = AsyncMock(side_effect=lambda api_key, start_date, end_date: INSTANTLY_STATS[api_key])
+    bison = AsyncMock(return_value=BISON_STATS)
+
+    with patch.object(lead_functions, "get_snapshot_engine", return_value=engine), \
+         patch.object(lead_functions, "get_workspace_registry", return_value=registry), \
+         patch.object(lead_functions, "get_instantly_campaign_stats_async", instantly), \
+         patch.object(lead_functions, "get_bison_campaign_stats_api_async", bison):
+        yield engine, registry, instantly, bison
+
+
+class TestPortfolioTools:
+    """The four portfolio tools served from one snapshot."""
+
+    def test_tools_share_one_fan_out(self, portfolio):
+        """Top clients, underperformers, totals and the weekly summary cost one fan-out."""
+        engine, _, instantly, bison = portfolio
+
+        top = lead_functions.get_top_performing_clients(limit=2)
+        under = lead_functions.get_underperforming_clients(threshold=5)
+        totals = lead_functions.get_all_platform_stats(days=7)
+        weekly = lead_functions.get_weekly_summary()
+
+        assert (instantly.call_count, bison.call_count) == (2, 1)
+        assert engine.stats()["builds"] == 2  # one per platform
+        assert [(c["rank"], c["client_name"], c["metric_value"]) for c in top["top_clients"]] == [(1, "Alice", 6), (2, "Initech", 2)]
+        assert [(c["client_name"], c["metric_value"]) for c in under["underperforming_clients"]] == [("Bob", 1), ("Initech", 2)]
+        assert totals["total_stats"] == {
+            "total_emails_sent": 2300,
+            "total_replies": 41,
+            "total_interested_leads": 9,
+            "reply_rate": 1.78,
+            "clients_processed": 3
+        }
+        assert totals["platform_breakdown"]["instantly"]["opportunities"] == 7
+        assert totals["platform_breakdown"]["bison"]["interested"] == 2
+        assert weekly["overall_stats"] == totals["total_stats"]
+        assert weekly["underperformers"]["count"] == 2
+        assert weekly["data_as_of"] == top["data_as_of"]
+
+    def test_metrics_map_to_platform_fields(self, portfolio):
+        """reply_rate ranks Instantly reply_rate against Bison's per-contact percentage."""
+        top = lead_functions.get_top_performing_clients(metric="reply_rate")
+
+        assert [(c["client_name"], c["metric_value"]) for c in top["top_clients"]] == [
+            ("Alice", 2.0), ("Initech", 2.0), ("Bob", 1.0)
+        ]
+        assert lead_functions.get_top_performing_clients(metric="client_name")["top_clients"][0]["metric_value"] == 0
+
+    def test_date_ranges_are_separate(self, portfolio):
+        """A different look-back window builds its own snapshot."""
+        _, _, instantly, _ = portfolio
+
+        lead_functions.get_top_performing_clients(days=7)
+        lead_functions.get_top_performing_clients(days=30)
+        lead_functions.get_underperforming_clients(days=30)
+
+        assert instantly.call_count == 4
+
+    def test_workspace_changes_rebuild_platform(self, portfolio):
+        """Adding a client to one tab refetches only that platform."""
+        _, registry, instantly, bison = portfolio
+        lead_functions.get_all_platform_stats()
+
+        registry.get_bison_workspaces.return_value = BISON + [{"client_name": "Hooli", "api_key": "key-4"}]
+        result = lead_functions.get_all_platform_stats()
+
+        assert (instantly.call_count, bison.call_count) == (2, 3)
+        assert result["platform_breakdown"]["bison"]["clients"] == 2
+
+    def test_failed_client_skipped(self, portfolio):
+        """A client whose stats fail is left out of the snapshot."""
+        _, _, instantly, _ = portfolio
+
+        def flaky(api_key, start_date, end_date):
+            if api_key == "key-2":
+                raise RuntimeError("503")
+            return INSTANTLY_STATS[api_key]
+
+        instantly.side_effect = flaky
+
+        result = lead_functions.get_all_platform_stats()
+
+        assert result["platform_breakdown"]["instantly"]["clients"] == 1
+        assert result["total_stats"]["clients_processed"] == 2
+
+
+class TestSnapshotEngine:
+    """Tests for SnapshotEngine caching."""
+
+    WORKSPACES = {"instantly": INSTANTLY, "bison": BISON}
+
+    @staticmethod
+    def _results(missing):
+        return {platform: [(ws, {"emails_sent": 1}) for ws in workspaces] for platform, workspaces in missing.items()}
+
+    def test_ttl_expiry(self):
+        """Snapshots older than the TTL are rebuilt."""
+        engine = SnapshotEngine(ttl_seconds=0.05)
+        fetch = Mock(side_effect=self._results)
+
+        engine.get("2025-01-01", "2025-01-07", self.WORKSPACES, fetch)
+        engine.get("2025-01-01", "2025-01-07", self.WORKSPACES, fetch)
+        time.sleep(0.1)
+        engine.get("2025-01-01", "2025-01-07", self.WORKSPACES, fetch)
+
+        assert fetch.call_count == 2
+        assert engine.stats()["hits"] == 2
+
+    def test_concurrent_callers_share_build(self):
+        """Callers arriving during a build wait for it instead of fanning out again."""
+        engine = SnapshotEngine(ttl_seconds=60)
+
+        def slow(missing):
+            time.sleep(0.1)
+            return self._results(missing)
+
+        fetch = Mock(side_effect=slow)
+        snapshots = []
+        threads = [
+            threading.Thread(target=lambda: snapshots.append(
+                engine.get("2025-01-01", "2025-01-07", self.WORKSPACES, fetch)
+            ))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert fetch.call_count == 1
+        assert len(snapshots) == 8
+        assert all(len(snapshot.clients) == 3 for snapshot in snapshots)
@@ -0,0 +1,122 @@
+"""
+Unit tests for near-duplicate reply clustering.
+
+Tests:
+- Templated replies differing in names, dates or ticket numbers cluster together
+- Distinct replies, short non-identical replies, different groups and
+  replies differing in a negation stay apart
+- categorize_leads classifies one reply per cluster and spreads the verdict
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.llm_client import LLMClientManager
+from src.leads.reply_clusters import cluster_replies, cluster_stats
+from tests.anthropic_stub import StubMessagesServer
+
+
+TICKET = ("Your request (#{n}) has been received and is being reviewed by our support staff. "
+          "To add additional comments, reply to this email.")
+OUT_OF_OFFICE = ("Thank you for your email. I am out of the office until Monday, January {n} with limited access "
+                 "to email and will respond to your message as soon as possible on my return. For urgent matters "
+                 "please contact {name}.")
+FIT = ("Thanks for reaching out about the outbound program. After reviewing it with my team, "
+       "this {verdict} like a fit, send over the details and we can talk next week.")
+DISTINCT = [
+    "We already work with another agency for lead generation, but I'd be open to comparing results next quarter.",
+    "Could you share a case study from a SaaS company of our size? Our team is around 40 people in sales.",
+    "Timing isn't great right now as we're in the middle of a migration. Please check back in the spring.",
+]
+
+
+class TestClusterReplies:
+    """Tests for cluster_replies."""
+
+    def test_templates_cluster(self):
+        """Variants of one template join the first one."""
+        texts = [TICKET.format(n=48213 + n * 977) for n in range(10)]
+        texts += [OUT_OF_OFFICE.format(n=6 + n, name=name) for n, name in enumerate(["Mark Jones", "Sarah Lee", "Li Wei"])]
+
+        assignments = cluster_replies(texts)
+
+        assert [rep for rep, _ in assignments] == [0] * 10 + [10] * 3
+        assert all(similarity >= 0.97 for _, similarity in assignments)
+
+    def test_distinct_replies_stay_apart(self):
+        """Unrelated replies are their own representatives."""
+        assert cluster_replies(DISTINCT) == [(0, 1.0), (1, 1.0), (2, 1.0)]
+
+    def test_short_replies_need_identical_text(self):
+        """Short replies only cluster when identical (case and spacing aside)."""
+        texts = ["Yes, interested", "Not interested", "yes,  interested", "Please remove me."]
+        assert [rep for rep, _ in cluster_replies(texts)] == [0, 1, 0, 3]
+
+    def test_negation_splits_clusters(self):
+        """A reply that negates another never takes its verdict, however similar."""
+        texts = [FIT.format(verdict="looks"), FIT.format(verdict="does not look"), FIT.format(verdict="doesn't look")]
+
+        assert [rep for rep, _ in cluster_replies(texts)] == [0, 1, 2]
+        assert [rep for rep, _ in cluster_replies(texts, threshold=0.5)] == [0, 1, 1]
+
+    def test_groups_are_separate(self):
+        """Replies in different groups never share a cluster."""
+        texts = [TICKET.format(n=1), TICKET.format(n=2), TICKET.format(n=3)]
+        assert [rep for rep, _ in cluster_replies(texts, ["cold", "warm", "cold"])] == [0, 1, 0]
+        with pytest.raises(ValueError):
+            cluster_replies(texts, ["cold"])
+
+    def test_stats(self):
+        """Stats count clusters and members."""
+        stats = cluster_stats([(0, 1.0), (0, 0.95), (0, 0.92), (3, 1.0)], 0.9)
+        assert stats == {"replies": 4, "clusters": 2, "clustered_replies": 2, "largest_cluster": 3, "threshold": 0.9}
+
+
+class TestCategorizeClustered:
+    """categorize_leads sends one reply per cluster to Claude."""
+
+    def _run(self, leads, **kwargs):
+        with StubMessagesServer() as server, \
+             patch.dict("os.environ", {
+                 "ANTHROPIC_API_KEY": "test",
+                 "ANTHROPIC_BASE_URL": server.url,
+                 "LEAD_VERDICT_CACHE_ENABLED": "false"
+             }), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=LLMClientManager()):
+            result = interest_analyzer.categorize_leads(leads, max_workers=4, batch_size=1, **kwargs)
+        return result, len(server.requests)
+
+    def test_fewer_requests_same_verdicts(self):
+        """Templated replies cost one request per template; every lead gets a verdict."""
+        texts = [TICKET.format(n=48213 + n * 977) for n in range(30)] + DISTINCT
+        leads = [{"email": f"lead{n}@example.com", "reply_body": text} for n, text in enumerate(texts)]
+
+        clustered, clustered_requests = self._run(leads)
+        unclustered, unclustered_requests = self._run(leads, cluster_threshold=None)
+
+        def categories(result):
+            return {lead["email"]: lead["ai_category"] for key in interest_analyzer.VERDICT_CATEGORIES for lead in result[key]}
+
+        assert categories(clustered) == categories(unclustered)
+        assert (clustered_requests, unclustered_requests) == (4, 33)
+        assert clustered["summary"]["reply_clusters"]["clusters"] == 4
+        assert clustered["summary"]["reply_clusters"]["clustered_replies"] == 29
+        assert unclustered["summary"]["reply_clusters"]["clustered_replies"] == 0
+
+        members = [lead for key in interest_analyzer.VERDICT_CATEGORIES for lead in clustered[key] if "ai_cluster" in lead]
+        assert len(members) == 29
+        assert all(lead["ai_cluster"]["representative"] == "lead0@example.com" for lead in members)
+
+    def test_negated_reply_gets_its_own_verdict(self):
+        """Both sides of a negation pair are classified; neither copies the other."""
+        texts = [FIT.format(verdict="looks"), FIT.format(verdict="does not look")]
+        leads = [{"email": f"lead{n}@example.com", "reply_body": text} for n, text in enumerate(texts)]
+
+        # Even below the texts' similarity, the negation keeps them apart
+        result, requests = self._run(leads, cluster_threshold=0.85)
+
+        assert requests == 2
+        assert result["summary"]["reply_clusters"]["clustered_replies"] == 0
+        assert not any("ai_cluster" in lead for key in interest_analyzer.VERDICT_CATEGORIES for lead in result[key])
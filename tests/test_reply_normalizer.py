@@ -0,0 +1,138 @@
+"""
+Unit tests for reply normalization before Claude analysis.
+
+Tests:
+- Quoted history, signatures, disclaimers, HTML and tracking junk are stripped
+- Inline answers between quoted lines are kept; long replies are capped
+- The lead's own words after a sign-off or resembling a disclaimer are kept
+- Normalizing is idempotent
+- categorize_leads sends normalized text, keys the cache by it and reports token savings
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.llm_client import LLMClientManager
+from src.leads.reply_normalizer import normalize_reply, normalization_savings, TRUNCATION_MARK
+from src.leads.verdict_cache import VerdictCache
+from tests.anthropic_stub import StubMessagesServer
+
+
+GMAIL = (
+    "Yes, send me pricing please.\n\n"
+    "On Mon, Jan 6, 2025 at 10:02 AM Sam Lee <sam@acme.io>\nwrote:\n\n"
+    "> Hi Jane,\n> Would you like to book a call?\n"
+)
+OUTLOOK = (
+    "Sounds good\r\n\r\nThanks,\r\nJane Doe\r\nVP Sales | Acme\r\n+1 555 0100\r\n\r\n"
+    "-----Original Message-----\r\nFrom: Sam\r\nSent: Monday\r\nTo: Jane\r\nSubject: Hi\r\n\r\nBook a call here"
+)
+OUTLOOK_HEADERS = (
+    "Please remove me.\n\nFrom: Sam Lee <sam@acme.io>\nSent: Monday, January 6, 2025 10:02 AM\n"
+    "To: Jane\nSubject: Quick question\n\nHi Jane, are you free for a call?"
+)
+HTML = (
+    "<html><head><style>p {color: red}</style></head><body>"
+    "<p>Interested &amp; curious.</p>"
+    "<p>Book here: <a href='https://calendly.com/jane'>https://calendly.com/jane/30min?utm_source=x&amp;mc_eid=123</a></p>"
+    "<img src='https://t.example.com/open.gif'></body></html>"
+)
+
+
+class TestNormalizeReply:
+    """Tests for normalize_reply."""
+
+    @pytest.mark.parametrize("raw,expected", [
+        (GMAIL, "Yes, send me pricing please."),
+        (OUTLOOK, "Sounds good"),
+        (OUTLOOK_HEADERS, "Please remove me."),
+        ("Sure\u200b, call me.\n\nSent from my iPhone", "Sure, call me."),
+        ("We are interested.\n\n--\nJane Doe\nAcme", "We are interested."),
+        ("We are interested.\n\nCONFIDENTIALITY NOTICE: This email is confidential.", "We are interested."),
+        ("Let's talk.\n\nThis email and any attachments are confidential and intended solely for the addressee.", "Let's talk."),
+        ("Let's talk.\nIf you are not the intended recipient, please notify the sender.", "Let's talk."),
+        ("Works for me.\n\nBest regards,\nJane Doe\nHead of Growth at Acme Inc.\nM: +1 (555) 010-0100\njane@acme.io", "Works for me."),
+        (HTML, "Interested & curious.\n\nBook here: https://calendly.com/jane/30min"),
+        ("See https://acme.io/pricing <https://acme.io/pricing?ref=sig> for details", "See https://acme.io/pricing for details"),
+    ])
+    def test_strips_everything_but_the_reply(self, raw, expected):
+        """Only what the lead wrote is kept."""
+        assert normalize_reply(raw) == expected
+
+    def test_inline_answers_are_kept(self):
+        """Answers written between quoted lines survive."""
+        raw = "> Would you like a demo?\nYes, Tuesday works.\n> What size is your team?\nAbout 40 people."
+        assert normalize_reply(raw) == "Yes, Tuesday works.\nAbout 40 people."
+
+    def test_sign_off_before_more_text_is_kept(self):
+        """A "Thanks" followed by more questions is not a signature."""
+        raw = "Thanks!\nCan you send pricing?\nAlso, who else uses it?"
+        assert normalize_reply(raw) == raw
+
+    def test_words_after_sign_off_are_kept(self):
+        """Lines after a sign-off that aren't a name, title or contact block are the lead's."""
+        raw = "Sounds good.\nThanks\nCan you do Tuesday at 3pm\nMy cell is 555 1234"
+        assert normalize_reply(raw) == raw
+
+    def test_disclaimer_needs_legal_boilerplate(self):
+        """Only standard disclaimer phrasing is cut, not a sentence that merely starts like one."""
+        raw = "Hi,\nThis message is intended for whoever handles partnerships. We'd love a demo next week."
+        assert normalize_reply(raw) == raw
+
+    def test_reply_below_quote(self):
+        """A reply written under the quote is kept without the header."""
+        raw = "On Mon, Sam wrote:\n> Interested?\n\nYes, very."
+        assert normalize_reply(raw) == "Yes, very."
+
+    def test_cap(self):
+        """Long replies are cut at a word boundary and marked."""
+        result = normalize_reply("word " * 1000, max_chars=100)
+        assert len(result) <= 100 and result.endswith(TRUNCATION_MARK)
+
+    def test_idempotent(self):
+        """Normalizing normalized text changes nothing."""
+        for raw in (GMAIL, OUTLOOK, OUTLOOK_HEADERS, HTML, "x" * 3000, "word " * 1000, ""):
+            once = normalize_reply(raw)
+            assert normalize_reply(once) == once
+
+    def test_savings(self):
+        """Token estimates before and after are summed."""
+        savings = normalization_savings([GMAIL, OUTLOOK], [normalize_reply(GMAIL), normalize_reply(OUTLOOK)])
+        assert savings["replies"] == 2
+        assert savings["tokens_after"] < savings["tokens_before"]
+        assert savings["saved_pct"] > 50
+
+
+class TestCategorizeNormalized:
+    """categorize_leads analyses normalized replies."""
+
+    def test_prompt_cache_and_summary(self, tmp_path):
+        """Claude sees only the reply; copies with different quotes share one verdict."""
+        leads = [
+            {"email": "a@example.com", "reply_body": GMAIL, "subject": "Re: intro"},
+            {"email": "b@example.com", "reply_body": "How does onboarding work?\n\n" + OUTLOOK.split("\r\n\r\n", 1)[1]},
+        ]
+        requote = [{**leads[0], "reply_body": "Yes, send me pricing please.\n\n> older thread\n"}]
+        cache = VerdictCache(tmp_path / "verdicts.db")
+
+        with StubMessagesServer() as server, \
+             patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test", "ANTHROPIC_BASE_URL": server.url}), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=LLMClientManager()), \
+             patch.object(interest_analyzer, "get_verdict_cache", return_value=cache):
+            result = interest_analyzer.categorize_leads(leads, max_workers=2)
+            again = interest_analyzer.categorize_leads(requote, max_workers=2)
+        cache.close()
+
+        prompt = server.requests[0]["messages"][0]["content"]
+        assert "book a call" not in prompt.lower() and "Original Message" not in prompt
+        assert "Yes, send me pricing please." in prompt and "How does onboarding work?" in prompt
+        assert len(server.requests) == 1
+
+        savings = result["summary"]["reply_normalization"]
+        assert savings["replies"] == 2 and savings["tokens_after"] < savings["tokens_before"]
+        assert again["summary"]["verdict_cache"]["hits"] == 1
+        # Leads keep their original reply body
+        analysed = [lead for key in interest_analyzer.VERDICT_CATEGORIES for lead in result[key]]
+        assert {lead["reply_body"] for lead in analysed} == {lead["reply_body"] for lead in leads}
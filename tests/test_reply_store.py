@@ -0,0 +1,284 @@
+"""
+Unit tests for the persistent incremental reply store.
+
+Tests:
+- Missing-range planning (first sync, backfill, overlap refresh)
+- Instantly calls only fetch what the store is missing
+- Status changes inside the overlap window update stored replies
+- Failed fetches never advance the synced range
+- Bison paging stops once it reaches replies the store already has
+- Bison syncs cut short by the page cap resume where they stopped
+- Bison interested flags follow later syncs and our own mark calls
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.leads import _source_fetch_interested_leads as source
+from src.leads import bison_client, lead_functions
+from src.leads.reply_store import ReplyStore, workspace_key, normalize_timestamp
+from tests.test_sharded_pagination import FakeEmailsAPI, _email
+
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _ts(when):
+    return normalize_timestamp(when.isoformat())
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ReplyStore(tmp_path / "replies.db", overlap_hours=48)
+    yield store
+    store.close()
+
+
+class RecordingEmailsAPI(FakeEmailsAPI):
+    """FakeEmailsAPI that records each requested window and can fail."""
+
+    def __init__(self, emails):
+        super().__init__(emails)
+        self.windows = []
+        self.fail = False
+
+    async def get_async(self, url, headers=None, params=None, timeout=None):
+        self.windows.append((params["min_timestamp_created"], params["max_timestamp_created"]))
+        if self.fail:
+            return _ErrorResponse()
+        return await super().get_async(url, headers=headers, params=params, timeout=timeout)
+
+
+class _ErrorResponse:
+    status_code = 503
+    ok = False
+
+
+@pytest.fixture
+def recent_month():
+    """One reply every 12 hours over the last 30 days, every fifth one interested."""
+    return [_email(n, NOW - timedelta(hours=12 * n), i_status=1 if n % 5 == 0 else 0) for n in range(1, 60)]
+
+
+class TestMissingRanges:
+    """Tests for ReplyStore.missing_ranges."""
+
+    def test_first_sync_fetches_whole_window(self, store):
+        """Without coverage the whole window (clipped to now) is missing."""
+        ranges = store.missing_ranges("instantly", "ws", "received", "2025-01-01", "2025-01-31")
+        assert ranges == [("2025-01-01T00:00:00.000Z", "2025-01-31T00:00:00.000Z")]
+
+    def test_backfill_and_refresh(self, store):
+        """Earlier starts backfill; later ends refetch from the overlap window."""
+        store.save("instantly", "ws", "received", [], covered=("2025-01-10T00:00:00.000Z", "2025-01-20T00:00:00.000Z"))
+
+        assert store.missing_ranges("instantly", "ws", "received", "2025-01-12", "2025-01-15") == []
+        assert store.missing_ranges("instantly", "ws", "received", "2025-01-05", "2025-01-15") == [
+            ("2025-01-05T00:00:00.000Z", "2025-01-10T00:00:00.000Z")
+        ]
+        # Synced long after Jan 20, so only the gap after the high-water mark is missing
+        assert store.missing_ranges("instantly", "ws", "received", "2025-01-12", "2025-01-25") == [
+            ("2025-01-20T00:00:00.000Z", "2025-01-25T00:00:00.000Z")
+        ]
+
+    def test_recent_sync_refetches_overlap(self, store):
+        """Replies synced less than the overlap ago are fetched again."""
+        store.save("instantly", "ws", "received", [], covered=(_ts(NOW - timedelta(days=30)), _ts(NOW)))
+
+        [(refresh_from, _)] = store.missing_ranges("instantly", "ws", "received", _ts(NOW - timedelta(days=7)), _ts(NOW))
+        assert _ts(NOW - timedelta(hours=48, minutes=1)) <= refresh_from <= _ts(NOW - timedelta(hours=47))
+
+    def test_partial_save_keeps_coverage(self, store):
+        """Records saved without a covered range do not count as synced."""
+        store.save("instantly", "ws", "received", [("a", "2025-01-01T10:00:00Z", 1, {"id": "a"})])
+
+        assert store.coverage("instantly", "ws", "received") is None
+        assert store.query("instantly", "ws", "received") == [{"id": "a"}]
+
+
+class TestInstantlySync:
+    """fetch_* calls served from the store."""
+
+    def _run(self, store, api, fn, *args, **kwargs):
+        with patch.object(source, "get_reply_store", return_value=store), \
+             patch.object(source.http_pool, "get_async", api.get_async):
+            return fn("key", *args, **kwargs)
+
+    def test_repeat_call_fetches_only_overlap(self, store, recent_month):
+        """A second call only asks the API for the last overlap window."""
+        api = RecordingEmailsAPI(recent_month)
+        start, end = _ts(NOW - timedelta(days=31)), _ts(NOW)
+
+        first = self._run(store, api, source.fetch_all_campaign_replies, start, end)
+        api.windows.clear()
+        second = self._run(store, api, source.fetch_all_campaign_replies, start, end)
+
+        assert first == second
+        assert first["total_count"] == len(recent_month)
+        assert api.windows
+        assert min(lo for lo, _ in api.windows) >= _ts(NOW - timedelta(hours=48, minutes=1))
+
+    def test_historical_window_makes_no_calls(self, store, recent_month):
+        """Windows entirely inside the synced range are answered locally."""
+        api = RecordingEmailsAPI(recent_month)
+        self._run(store, api, source.fetch_all_campaign_replies, _ts(NOW - timedelta(days=31)), _ts(NOW))
+        api.windows.clear()
+
+        result = self._run(
+            store, api, source.fetch_interested_leads,
+            _ts(NOW - timedelta(days=20)), _ts(NOW - timedelta(days=10))
+        )
+
+        assert api.windows == []
+        expected = {
+            e["from_address_email"] for e in recent_month
+            if e["i_status"] == 1 and _ts(NOW - timedelta(days=20)) <= e["timestamp_created"] <= _ts(NOW - timedelta(days=10))
+        }
+        assert {lead["email"] for lead in result["leads"]} == expected
+
+    def test_backfill_fetches_only_missing_part(self, store, recent_month):
+        """Extending the window backwards only fetches the older part."""
+        api = RecordingEmailsAPI(recent_month)
+        self._run(store, api, source.fetch_all_campaign_replies, _ts(NOW - timedelta(days=10)), _ts(NOW - timedelta(days=5)))
+        api.windows.clear()
+
+        result = self._run(store, api, source.fetch_all_campaign_replies, _ts(NOW - timedelta(days=20)), _ts(NOW - timedelta(days=5)))
+
+        assert api.windows and max(hi for _, hi in api.windows) <= _ts(NOW - timedelta(days=10))
+        assert result["total_count"] == sum(
+            1 for e in recent_month
+            if _ts(NOW - timedelta(days=20)) <= e["timestamp_created"] <= _ts(NOW - timedelta(days=5))
+        )
+
+    def test_status_change_in_overlap_is_picked_up(self, store, recent_month):
+        """A reply marked interested after the first sync shows up on the next call."""
+        api = RecordingEmailsAPI(recent_month)
+        start, end = _ts(NOW - timedelta(days=31)), _ts(NOW)
+        before = self._run(store, api, source.fetch_interested_leads, start, end)
+
+        recent = next(e for e in api.emails if e["i_status"] == 0 and e["timestamp_created"] > _ts(NOW - timedelta(hours=24)))
+        recent["i_status"] = 1
+        after = self._run(store, api, source.fetch_interested_leads, start, end)
+
+        assert after["total_count"] == before["total_count"] + 1
+        assert recent["from_address_email"] in {lead["email"] for lead in after["leads"]}
+
+    def test_failed_fetch_does_not_advance_coverage(self, store, recent_month):
+        """API errors leave the synced range untouched, so the next call retries."""
+        api = RecordingEmailsAPI(recent_month)
+        api.fail = True
+        self._run(store, api, source.fetch_all_campaign_replies, _ts(NOW - timedelta(days=5)), _ts(NOW))
+
+        assert store.coverage("instantly", workspace_key("key"), "received") is None
+
+        api.fail = False
+        result = self._run(store, api, source.fetch_all_campaign_replies, _ts(NOW - timedelta(days=5)), _ts(NOW))
+        assert result["total_count"] == 10
+
+
+class FakeBisonReplies:
+    """Paged /api/replies listing newest first."""
+
+    def __init__(self, replies, per_page=15):
+        self.replies = sorted(replies, key=lambda r: r["date_received"], reverse=True)
+        self.per_page = per_page
+        self.pages = []
+
+    async def __call__(self, api_key, status="interested", folder="all", page=None):
+        page = page or 1
+        self.pages.append(page)
+        matching = [r for r in self.replies if status is None or (status == "interested" and r["interested"])]
+        last_page = max(1, -(-len(matching) // self.per_page))
+        return {
+            "data": matching[(page - 1) * self.per_page:page * self.per_page],
+            "meta": {"current_page": page, "last_page": last_page},
+        }
+
+
+class TestBisonSync:
+    """_load_bison_replies pages only until the store's mark."""
+
+    def test_paging_stops_at_mark(self, store):
+        """The first sync stops at `since`; the next one at the overlap window."""
+        replies = [
+            {"id": n, "lead_id": n, "interested": True, "type": "Tracked Reply",
+             "date_received": (NOW - timedelta(hours=6 * n)).isoformat().replace("+00:00", "Z")}
+            for n in range(1, 200)
+        ]
+        api = FakeBisonReplies(replies)
+        since = (NOW - timedelta(days=10)).strftime("%Y-%m-%d")
+
+        with patch.object(lead_functions, "get_reply_store", return_value=store), \
+             patch.object(lead_functions, "get_bison_lead_replies_async", api):
+            first = lead_functions._load_bison_replies("key", "interested", since)
+            first_pages = list(api.pages)
+            api.pages.clear()
+            second = lead_functions._load_bison_replies("key", "interested", since)
+
+        expected = [r for r in api.replies if normalize_timestamp(r["date_received"]) >= normalize_timestamp(since)]
+        assert first == second == expected
+        assert first_pages == [1, 2, 3, 4, 5, 6]  # page 1 alone, then a batch of five
+        assert api.pages == [1]
+
+    def _bison_reply(self, n, hours_ago, interested):
+        return {"id": n, "lead_id": n, "interested": interested, "type": "Tracked Reply",
+                "date_received": (NOW - timedelta(hours=hours_ago)).isoformat().replace("+00:00", "Z")}
+
+    def test_interested_flag_follows_later_syncs(self, store):
+        """Replies marked or un-marked inside the overlap window change status in place."""
+        api = FakeBisonReplies([self._bison_reply(1, 2, True), self._bison_reply(2, 3, False)])
+        since = (NOW - timedelta(days=2)).strftime("%Y-%m-%d")
+
+        with patch.object(lead_functions, "get_reply_store", return_value=store), \
+             patch.object(lead_functions, "get_bison_lead_replies_async", api):
+            before = lead_functions._load_bison_replies("key", "interested", since)
+            api.replies[0]["interested"], api.replies[1]["interested"] = False, True
+            after = lead_functions._load_bison_replies("key", "interested", since)
+            everything = lead_functions._load_bison_replies("key", None, since)
+
+        assert [r["id"] for r in before] == [1]
+        assert [r["id"] for r in after] == [2]
+        assert [r["id"] for r in everything] == [1, 2]
+
+    def test_marking_updates_old_replies(self, store):
+        """A reply marked interested after the overlap window shows up without a refetch."""
+        api = FakeBisonReplies(
+            [self._bison_reply(1, 24 * 5, False), self._bison_reply(2, 24 * 3, False), self._bison_reply(3, 2, False)],
+            per_page=1
+        )
+        since = (NOW - timedelta(days=7)).strftime("%Y-%m-%d")
+        response = Mock()
+        response.json.return_value = {"data": {"id": 1, "interested": True}}
+
+        with patch.object(lead_functions, "get_reply_store", return_value=store), \
+             patch.object(lead_functions, "get_bison_lead_replies_async", api), \
+             patch.object(bison_client, "get_reply_store", return_value=store), \
+             patch.object(bison_client.http_pool, "patch", return_value=response):
+            assert lead_functions._load_bison_replies("key", "interested", since) == []
+            bison_client.mark_bison_reply_as_interested("key", 1)
+            api.pages.clear()
+            marked = lead_functions._load_bison_replies("key", "interested", since)
+
+        assert api.pages == [1, 2, 3]  # page 3 arrives in the same batch but isn't stored
+        assert [r["id"] for r in marked] == [1]
+        assert marked[0]["interested"] is True
+
+    def test_capped_sync_resumes_where_it_stopped(self, store):
+        """Pages fetched before the cap are kept, and later syncs continue below them."""
+        api = FakeBisonReplies([self._bison_reply(n, 30 * n, False) for n in range(1, 7)], per_page=1)
+        since = (NOW - timedelta(days=10)).strftime("%Y-%m-%d")
+        pages, results = [], []
+
+        with patch.object(lead_functions, "get_reply_store", return_value=store), \
+             patch.object(lead_functions, "get_bison_lead_replies_async", api), \
+             patch.object(lead_functions, "MAX_BISON_REPLY_PAGES", 4), \
+             patch.object(lead_functions, "BISON_REPLY_PAGE_CONCURRENCY", 2):
+            for _ in range(4):
+                api.pages.clear()
+                results.append([r["id"] for r in lead_functions._load_bison_replies("key", None, since)])
+                pages.append(list(api.pages))
+
+        assert pages == [[1, 2, 3, 4], [1, 2, 3, 4, 5], [1, 2, 3, 5, 6], [1, 2, 3]]
+        assert results == [[1, 2, 3, 4], [1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 6]]
@@ -0,0 +1,180 @@
+"""
+Unit tests for time-sharded pagination of Instantly replies.
+
+Tests:
+- Window sharding
+- Results match a single sequential walk (same dedup semantics)
+- Busy sub-windows split further and run concurrently
+"""
+
+import time
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.leads import _source_fetch_interested_leads as source
+
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _email(n, when, i_status=1, sender=None):
+    """Build a received email as returned by /api/v2/emails."""
+    ts = source._format_timestamp(when)
+    return {
+        "id": f"e-{n:05d}",
+        "ue_type": 2,
+        "is_auto_reply": 0,
+        "from_address_email": sender or f"lead{n}@example.com",
+        "body": {"text": f"Reply number {n} with enough text to summarize"},
+        "subject": "Re: hello",
+        "timestamp_created": ts,
+        "timestamp_email": ts,
+        "lead": f"lead{n}@example.com",
+        "i_status": i_status,
+    }
+
+
+class FakeEmailsAPI:
+    """In-memory /api/v2/emails honouring timestamp filters, cursors and page limits."""
+
+    def __init__(self, emails, latency=0.0):
+        self.emails = sorted(emails, key=lambda e: e["timestamp_created"])
+        self.created = [source._parse_timestamp(e["timestamp_created"]) for e in self.emails]
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_async(self, url, headers=None, params=None, timeout=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            lo = source._parse_timestamp(params["min_timestamp_created"])
+            hi = source._parse_timestamp(params["max_timestamp_created"])
+            matching = [
+                e for e, created in zip(self.emails, self.created)
+                if lo <= created <= hi
+                and ("i_status" not in params or e["i_status"] == params["i_status"])
+            ]
+            if params.get("starting_after"):
+                ids = [e["id"] for e in matching]
+                matching = matching[ids.index(params["starting_after"]) + 1:]
+            page = matching[:params["limit"]]
+            more = len(matching) > len(page)
+            return _Response({"items": page, "next_starting_after": page[-1]["id"] if more and page else None})
+        finally:
+            self.in_flight -= 1
+
+
+class _Response:
+    status_code = 200
+    ok = True
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture(autouse=True)
+def no_reply_store():
+    """Fetch straight from the (fake) API, without the persistent reply store."""
+    with patch.object(source, "get_reply_store", return_value=None):
+        yield
+
+
+@pytest.fixture
+def busy_quarter():
+    """90 days of replies with a very busy week in the middle."""
+    emails = [_email(n, START + timedelta(hours=7 * n)) for n in range(300)]
+    burst = START + timedelta(days=45)
+    emails += [_email(1000 + n, burst + timedelta(minutes=10 * n), i_status=0 if n % 3 else 1) for n in range(600)]
+    return emails
+
+
+class TestShardWindow:
+    """Tests for _shard_window."""
+
+    def test_short_window_is_one_shard(self):
+        """Windows up to SHARD_DAYS are not split."""
+        assert source._shard_window("2025-01-01", "2025-01-07") == [("2025-01-01", "2025-01-07")]
+
+    def test_long_window_keeps_outer_bounds(self):
+        """Sub-windows are contiguous and the outer bounds are unchanged."""
+        shards = source._shard_window("2025-01-01", "2025-04-01")
+
+        assert len(shards) == 13
+        assert shards[0][0] == "2025-01-01"
+        assert shards[-1][1] == "2025-04-01"
+        assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+
+    def test_unparseable_dates_fall_back_to_one_window(self):
+        """Unexpected formats are passed through untouched."""
+        assert source._shard_window("last week", "today") == [("last week", "today")]
+
+
+class TestShardedFetch:
+    """Sharded fetches return the same leads as a single sequential walk."""
+
+    def _sequential(self):
+        """Disable sharding and splitting."""
+        return patch.multiple(source, SHARD_DAYS=10000, MAX_SPLIT_DEPTH=0)
+
+    def test_fetch_interested_leads_matches_sequential(self, busy_quarter):
+        """Interested leads (cursor pagination) are identical with and without sharding."""
+        api = FakeEmailsAPI(busy_quarter)
+        with patch.object(source.http_pool, "get_async", api.get_async):
+            sharded = source.fetch_interested_leads("key", "2025-01-01", "2025-04-01")
+            with self._sequential():
+                sequential = source.fetch_interested_leads("key", "2025-01-01", "2025-04-01")
+
+        expected = sum(1 for e in busy_quarter if e["i_status"] == 1)
+        assert sharded["total_count"] == sequential["total_count"] == expected
+        assert sharded["leads"] == sequential["leads"]
+
+    def test_fetch_all_campaign_replies_matches_sequential(self, busy_quarter):
+        """All replies (timestamp pagination) are identical with and without sharding."""
+        api = FakeEmailsAPI(busy_quarter)
+        with patch.object(source.http_pool, "get_async", api.get_async):
+            sharded = source.fetch_all_campaign_replies("key", "2025-01-01", "2025-04-01")
+            with self._sequential():
+                sequential = source.fetch_all_campaign_replies("key", "2025-01-01", "2025-04-01")
+
+        assert sharded["total_count"] == sequential["total_count"] == len(busy_quarter)
+        assert sharded["leads"] == sequential["leads"]
+
+    def test_duplicate_senders_keep_most_recent(self):
+        """Replies from the same address collapse across shards, newest kept."""
+        emails = [
+            _email(1, START + timedelta(days=2), sender="same@example.com"),
+            _email(2, START + timedelta(days=60), sender="same@example.com"),
+        ]
+        api = FakeEmailsAPI(emails)
+        with patch.object(source.http_pool, "get_async", api.get_async):
+            result = source.fetch_all_campaign_replies("key", "2025-01-01", "2025-04-01")
+
+        assert result["total_count"] == 1
+        assert result["leads"][0]["timestamp"] == emails[1]["timestamp_email"]
+
+    def test_busy_window_runs_concurrently_and_faster(self, busy_quarter):
+        """A busy 90-day window fans out and finishes several times faster."""
+        api = FakeEmailsAPI(busy_quarter, latency=0.05)
+        with patch.object(source.http_pool, "get_async", api.get_async):
+            started = time.perf_counter()
+            source.fetch_all_campaign_replies("key", "2025-01-01", "2025-04-01", limit=50)
+            sharded = time.perf_counter() - started
+            peak = api.peak
+
+            with self._sequential():
+                started = time.perf_counter()
+                source.fetch_all_campaign_replies("key", "2025-01-01", "2025-04-01", limit=50)
+                sequential = time.perf_counter() - started
+
+        assert peak > 4
+        assert sharded * 2.5 < sequential
@@ -0,0 +1,143 @@
+"""
+Unit tests for the instant-auto-reply thread cache and bulk prefetch.
+
+Tests:
+- LRU eviction, TTL expiry and hit-rate/memory stats
+- Keys are scoped by platform and API key (tenant-safe)
+- categorize_leads prefetches hot/warm threads concurrently before timing checks
+"""
+
+import time
+import asyncio
+from unittest.mock import patch, Mock
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.thread_cache import ThreadCache
+
+
+SENT_AT = "2025-01-10T09:00:00.000Z"
+
+
+def _thread(sent_at=SENT_AT):
+    return [{"ue_type": 1, "timestamp_email": sent_at}]
+
+
+class TestThreadCache:
+    """Tests for ThreadCache."""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = ThreadCache(max_entries=2, ttl_seconds=60)
+        a, b, c = (ThreadCache.key("instantly", "k", lead) for lead in ("a@x.com", "b@x.com", "c@x.com"))
+        cache.put(a, [1])
+        cache.put(b, [2])
+        assert cache.get(a) == [1]  # a is now most recent
+        cache.put(c, [3])
+
+        assert cache.get(b) is None
+        assert cache.get(a) == [1] and cache.get(c) == [3]
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are refetched."""
+        cache = ThreadCache(max_entries=10, ttl_seconds=0.05)
+        key = ThreadCache.key("bison", "k", 42)
+        cache.put(key, {"older_messages": []})
+        assert cache.contains(key)
+
+        time.sleep(0.1)
+        assert not cache.contains(key)
+        assert cache.get(key) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_keys_are_tenant_safe(self):
+        """The same lead in two workspaces gets separate entries, and keys never hold the API key."""
+        key_a = ThreadCache.key("instantly", "secret-a", "Lead@x.com")
+        key_b = ThreadCache.key("instantly", "secret-b", "lead@x.com")
+
+        assert key_a != key_b
+        assert key_a[2] == key_b[2] == "lead@x.com"
+        assert "secret-a" not in repr(key_a)
+
+    def test_stats(self):
+        """Hit rate and approximate memory are reported."""
+        cache = ThreadCache(max_entries=10, ttl_seconds=60)
+        key = ThreadCache.key("instantly", "k", "a@x.com")
+        cache.get(key)
+        cache.put(key, _thread())
+        cache.get(key)
+        cache.get(key)
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+        assert stats["hit_rate"] == 0.667
+        assert stats["approx_bytes"] > 0
+
+        cache.clear()
+        assert cache.stats()["approx_bytes"] == 0
+
+
+class TestPrefetch:
+    """Bulk prefetch before Phase 3 timing validation."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = ThreadCache(max_entries=100, ttl_seconds=60)
+        with patch.object(interest_analyzer, "get_thread_cache", return_value=cache):
+            yield cache
+
+    def test_categorize_prefetches_concurrently(self, cache):
+        """Hot/warm threads are fetched concurrently once; per-lead checks are cache hits."""
+        state = {"in_flight": 0, "peak": 0, "calls": []}
+
+        async def fake_lead_emails(lead_email, api_key, campaign_id=None, sort_order="asc"):
+            state["calls"].append(lead_email)
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.02)
+            state["in_flight"] -= 1
+            return _thread()
+
+        leads = [
+            {
+                "email": f"lead{n}@example.com",
+                "platform": "instantly",
+                "reply_body": "Yes, I'm interested. Can you send pricing? Let's schedule a call.",
+                # lead0 replied one minute after the send: an instant auto-reply
+                "timestamp": "2025-01-10T09:01:00.000Z" if n == 0 else "2025-01-10T15:00:00.000Z",
+            }
+            for n in range(8)
+        ]
+        sync_fetch = Mock(side_effect=AssertionError("per-lead fetch should hit the cache"))
+
+        with patch("src.leads.instantly_client.get_lead_emails_async", fake_lead_emails), \
+             patch("src.leads.instantly_client.get_lead_emails", sync_fetch):
+            result = interest_analyzer.categorize_leads(leads, use_claude=False, api_key="key")
+
+        assert sorted(state["calls"]) == sorted(lead["email"] for lead in leads)
+        assert state["peak"] > 1
+        assert [lead["email"] for lead in result["auto_reply"]] == ["lead0@example.com"]
+        assert len(result["hot"]) + len(result["warm"]) == 7
+        assert result["summary"]["timing_cache"]["hits"] == 8
+
+    def test_prefetch_skips_cached_and_failed(self, cache):
+        """Cached threads are not refetched; failures stay uncached."""
+        cache.put(ThreadCache.key("bison", "key", 1), {"older_messages": []})
+        calls = []
+
+        async def fake_thread(api_key, reply_id):
+            calls.append(reply_id)
+            if reply_id == 3:
+                raise RuntimeError("503")
+            return {"data": {"older_messages": [{"type": "sent", "date_received": SENT_AT}]}}
+
+        leads = [{"id": n, "platform": "bison", "timestamp": SENT_AT} for n in (1, 2, 2, 3)]
+        with patch("src.leads.bison_client.get_bison_conversation_thread_async", fake_thread):
+            fetched = interest_analyzer.prefetch_timing_data(leads, "key")
+
+        assert sorted(calls) == [2, 3]
+        assert fetched == 1
+        assert cache.contains(ThreadCache.key("bison", "key", 2))
+        assert not cache.contains(ThreadCache.key("bison", "key", 3))
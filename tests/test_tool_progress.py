@@ -0,0 +1,128 @@
+"""
+Unit tests for progress notifications from long fan-out tools.
+
+Tests:
+- Reporter delivers progress and partial results from worker threads
+- Counters are no-ops when the caller didn't ask for progress
+- Spam checks and mailbox health stream each client while aggregating the same result
+"""
+
+import time
+import asyncio
+from unittest.mock import Mock, patch
+
+from src.leads import progress, spam_checker, lead_functions
+from src.leads.mailbox_snapshot import MailboxSnapshotEngine
+
+
+CLIENTS = [{"client_name": name, "api_key": f"key-{name}"} for name in ("Alice", "Bob", "Carol")]
+
+
+def run_with_progress(func, *args, **kwargs):
+    """Run a blocking tool function in a thread with a reporter installed, like the transports do."""
+    async def call():
+        received = []
+        reporter = progress.ProgressReporter("tok-1", received.append, tool="test_tool")
+        with progress.reporting(reporter):
+            result = await asyncio.to_thread(func, *args, **kwargs)
+        await asyncio.sleep(0)  # let the last scheduled notifications run
+        return result, received
+
+    return asyncio.run(call())
+
+
+def by_method(notifications, method):
+    return [n["params"] for n in notifications if n["method"] == method]
+
+
+class TestProgressReporter:
+    """Tests for ProgressReporter and ProgressCounter."""
+
+    def test_counter_reports_from_threads(self):
+        """Each finished unit sends a progress notification and its partial result."""
+        def fan_out():
+            counter = progress.progress_counter(3)
+            for name in ("a", "b", "c"):
+                counter.advance(message=name, partial={"client_name": name})
+
+        _, received = run_with_progress(fan_out)
+
+        assert [(p["progress"], p["total"], p["message"]) for p in by_method(received, "notifications/progress")] == [
+            (1, 3, "a"), (2, 3, "b"), (3, 3, "c")
+        ]
+        partials = by_method(received, "notifications/message")
+        assert [p["data"]["partial_result"]["client_name"] for p in partials] == ["a", "b", "c"]
+        assert all(p["data"]["progressToken"] == "tok-1" and p["logger"] == "test_tool" for p in partials)
+
+    def test_progress_only_increases(self):
+        """Stale step reports are dropped so progress stays monotonic."""
+        def steps():
+            progress.report_step(1, 7, "one")
+            progress.report_step(3, 7, "three")
+            progress.report_step(2, 7, "two")
+
+        _, received = run_with_progress(steps)
+
+        assert [p["progress"] for p in by_method(received, "notifications/progress")] == [1, 3]
+
+    def test_no_reporter_is_noop(self):
+        """Without a progressToken nothing is reported and nothing fails."""
+        counter = progress.progress_counter(2)
+        counter.advance(partial={"client_name": "a"})
+        progress.report_step(1, 2, "step")
+
+        assert counter.reporter is None and counter.completed == 1
+
+
+class TestFanOutTools:
+    """Per-client progress from the fan-out tools."""
+
+    def test_spam_check_streams_clients(self):
+        """Every client is streamed as it finishes; the final result is unchanged."""
+        registry = Mock()
+        registry.get_bison_resolver.return_value.workspaces = CLIENTS
+
+        def check(client, emailguard_key, status):
+            time.sleep(0.01)
+            return {"client_name": client["client_name"], "total_campaigns": 2, "spam_campaigns": 1, "campaigns": []}
+
+        with patch.object(spam_checker, "get_workspace_registry", return_value=registry), \
+             patch.object(spam_checker, "_check_single_bison_client", side_effect=check):
+            result, received = run_with_progress(spam_checker.check_all_bison_campaigns_spam, "eg-key")
+
+        assert (result["total_campaigns"], result["spam_campaigns"]) == (6, 3)
+        streamed = [p["data"]["partial_result"] for p in by_method(received, "notifications/message")]
+        assert sorted(c["client_name"] for c in streamed) == ["Alice", "Bob", "Carol"]
+        assert streamed == result["clients"]
+        assert by_method(received, "notifications/progress")[-1]["progress"] == 3
+
+    def test_spam_check_without_progress(self):
+        """Called without a reporter the tool behaves as before."""
+        registry = Mock()
+        registry.get_bison_resolver.return_value.workspaces = CLIENTS[:1]
+
+        with patch.object(spam_checker, "get_workspace_registry", return_value=registry), \
+             patch.object(spam_checker, "_check_single_bison_client", side_effect=RuntimeError("boom")):
+            result = spam_checker.check_all_bison_campaigns_spam("eg-key")
+
+        assert result["clients"] == [{"client_name": "Alice", "error": "Unexpected error: boom"}]
+
+    def test_mailbox_health_streams_clients(self):
+        """Mailbox health reports every client, including ones that fail."""
+        all_clients = {"total_clients": 2, "clients": [
+            {"platform": "instantly", "client_name": "Alice", "workspace_id": "ws-1"},
+            {"platform": "bison", "client_name": "Bob"}
+        ]}
+        mailboxes = {"total_accounts": 4, "healthy_count": 3, "at_risk_count": 1, "early_count": 0}
+
+        with patch.object(lead_functions, "get_mailbox_snapshot_engine", return_value=MailboxSnapshotEngine()), \
+             patch.object(lead_functions, "get_all_clients", return_value=all_clients), \
+             patch.object(lead_functions, "get_instantly_mailboxes", return_value=mailboxes), \
+             patch.object(lead_functions, "get_bison_mailboxes", side_effect=RuntimeError("timeout")):
+            result, received = run_with_progress(
+                lead_functions.get_all_mailbox_health, "sheet", "gid-i", "gid-b"
+            )
+
+        assert result["total_accounts"] == 4
+        assert [p["data"]["partial_result"] for p in by_method(received, "notifications/message")] == result["client_summaries"]
+        assert [p["progress"] for p in by_method(received, "notifications/progress")] == [1, 2]
@@ -0,0 +1,134 @@
+"""
+Unit tests for the persistent Claude verdict cache.
+
+Tests:
+- Keys follow normalized text, subject, model and prompt version
+- Verdicts expire after the TTL and persist across processes
+- analyze_reply_with_claude answers repeats from the cache; errors are not cached
+- categorize_leads looks verdicts up before calling Claude and reports hit counts
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.leads import interest_analyzer
+from src.leads.llm_client import LLMClientManager
+from src.leads.verdict_cache import VerdictCache, verdict_key
+
+
+VERDICT = {"category": "warm", "confidence": 80, "reason": "Asks a question"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = VerdictCache(tmp_path / "verdicts.db")
+    yield cache
+    cache.close()
+
+
+def manager_for(client):
+    """Client manager handing out the given client."""
+    return LLMClientManager(client_factory=lambda **kwargs: client)
+
+
+def claude_client(text='{"category": "warm", "confidence": 80, "reason": "Asks a question"}'):
+    """Anthropic client whose messages.create returns one text block."""
+    client = Mock()
+    client.messages.create.return_value.content = [Mock(text=text)]
+    return client
+
+
+class TestVerdictKey:
+    """Tests for verdict_key."""
+
+    def test_whitespace_is_normalized(self):
+        """Re-wrapped copies of a reply share a key."""
+        assert verdict_key("Sounds  good,\n tell me more ", "Re: hi", "m", "1") == \
+            verdict_key("Sounds good, tell me more", "Re:  hi", "m", "1")
+
+    def test_model_and_prompt_version_invalidate(self):
+        """A new model or prompt version never sees old verdicts."""
+        base = verdict_key("text", "subject", "m", "1")
+        assert base != verdict_key("text", "subject", "m2", "1")
+        assert base != verdict_key("text", "subject", "m", "2")
+        assert base != verdict_key("text", "other", "m", "1")
+
+
+class TestVerdictCache:
+    """Tests for VerdictCache storage."""
+
+    def test_put_get_and_counters(self, cache):
+        """Stored verdicts are served; lookups are counted."""
+        cache.put("k1", VERDICT, "m", "1")
+
+        assert cache.get("k1") == VERDICT
+        assert cache.get_many(["k1", "k2", "k1"]) == {"k1": VERDICT}
+        assert (cache.stats()["hits"], cache.stats()["misses"]) == (3, 1)
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired verdicts are not served and are pruned on open."""
+        cache = VerdictCache(tmp_path / "v.db", ttl_seconds=60)
+        with patch("src.leads.verdict_cache.time.time", return_value=time.time() - 120):
+            cache.put("old", VERDICT, "m", "1")
+        cache.put("new", VERDICT, "m", "1")
+
+        assert cache.get("old") is None and cache.get("new") == VERDICT
+        cache.close()
+
+        reopened = VerdictCache(tmp_path / "v.db", ttl_seconds=60)
+        assert reopened.stats()["verdicts"] == 1
+        reopened.close()
+
+
+class TestAnalyzeWithClaude:
+    """analyze_reply_with_claude goes through the cache."""
+
+    def test_repeat_reply_skips_api(self, cache):
+        """The second analysis of a reply makes no API call."""
+        client = claude_client()
+        with patch.object(interest_analyzer, "get_verdict_cache", return_value=cache), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=manager_for(client)), \
+             patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test"}):
+            first = interest_analyzer.analyze_reply_with_claude("How does it work?", "Re: intro")
+            second = interest_analyzer.analyze_reply_with_claude("How  does it work?", "Re: intro")
+
+        assert first == second == VERDICT
+        assert client.messages.create.call_count == 1
+
+    def test_errors_are_not_cached(self, cache):
+        """A failed call is retried next time rather than cached."""
+        client = claude_client(text="not json")
+        with patch.object(interest_analyzer, "get_verdict_cache", return_value=cache), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=manager_for(client)), \
+             patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test"}):
+            result = interest_analyzer.analyze_reply_with_claude("How does it work?")
+            interest_analyzer.analyze_reply_with_claude("How does it work?")
+
+        assert result["confidence"] == 0
+        assert client.messages.create.call_count == 2
+        assert cache.stats()["verdicts"] == 0
+
+
+class TestCategorizeLeads:
+    """categorize_leads checks the cache before calling Claude."""
+
+    def test_repeat_scan_hits_cache(self, cache):
+        """Re-running the same window sends nothing to Claude and reports hits."""
+        leads = [
+            {"email": f"lead{n}@example.com", "reply_body": f"Could you explain option {n}?", "subject": "Re: intro"}
+            for n in range(5)
+        ]
+        client = claude_client()
+        with patch.object(interest_analyzer, "get_verdict_cache", return_value=cache), \
+             patch.object(interest_analyzer, "get_llm_manager", return_value=manager_for(client)), \
+             patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test"}):
+            first = interest_analyzer.categorize_leads(leads, max_workers=2, batch_size=1)
+            second = interest_analyzer.categorize_leads(leads, max_workers=2, batch_size=1)
+
+        assert client.messages.create.call_count == 5
+        assert first["summary"]["verdict_cache"] == {"hits": 0, "misses": 5, "stored_verdicts": 5}
+        assert second["summary"]["verdict_cache"] == {"hits": 5, "misses": 0, "stored_verdicts": 5}
+        assert sorted(l["email"] for l in second["warm"]) == sorted(l["email"] for l in first["warm"])
+        assert all(l["ai_method"] == "claude" for l in second["warm"])
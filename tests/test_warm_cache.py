@@ -0,0 +1,171 @@
+"""
+Unit tests for the portfolio warm cache and its scheduler.
+
+Tests:
+- Tool results served from the cache with a freshness block
+- Results and the leader lease are shared across workers through SQLite
+- One elected worker refreshes, staggering jobs and skipping fresh ones
+"""
+
+import json
+import time
+import asyncio
+
+import pytest
+
+from src.leads.warm_cache import WarmCache, WarmScheduler, serve
+
+
+class FakeTool:
+    """Portfolio tool returning a JSON string and counting calls."""
+
+    def __init__(self, success=True):
+        self.success = success
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append((time.monotonic(), kwargs))
+        if not self.success:
+            return json.dumps({"success": False, "error": "sheet unavailable"})
+        return json.dumps({"success": True, "clients": len(self.calls), "days": kwargs.get("days")})
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "warm.db"
+
+
+@pytest.fixture
+def cache(db):
+    cache = WarmCache(db, max_age_seconds=60)
+    yield cache
+    cache.close()
+
+
+class TestServe:
+    """Tests for serve()."""
+
+    def test_cold_then_warm(self, cache):
+        """The first call computes live; the next is answered from the cache."""
+        tool = FakeTool()
+
+        first = json.loads(asyncio.run(serve("tool", tool, {"days": 7}, cache=cache)))
+        second = json.loads(asyncio.run(serve("tool", tool, {"days": 7}, cache=cache)))
+
+        assert len(tool.calls) == 1
+        assert first["freshness"]["source"] == "live"
+        assert second["freshness"]["source"] == "warm_cache"
+        assert second["clients"] == 1 and second["freshness"]["age_seconds"] >= 0
+
+    def test_params_are_separate(self, cache):
+        """Each parameter set is cached on its own."""
+        tool = FakeTool()
+        asyncio.run(serve("tool", tool, {"days": 7}, cache=cache))
+        result = json.loads(asyncio.run(serve("tool", tool, {"days": 30}, cache=cache)))
+
+        assert result["days"] == 30 and len(tool.calls) == 2
+
+    def test_errors_not_cached(self, cache):
+        """Failed tool results are returned but never cached."""
+        tool = FakeTool(success=False)
+        asyncio.run(serve("tool", tool, cache=cache))
+        result = json.loads(asyncio.run(serve("tool", tool, cache=cache)))
+
+        assert len(tool.calls) == 2
+        assert result["success"] is False and result["freshness"]["source"] == "live"
+
+    def test_stale_results_recomputed(self, db):
+        """Results older than max_age are computed again."""
+        cache = WarmCache(db, max_age_seconds=60)
+        cache.put("tool", {}, {"success": True}, refreshed_at=time.time() - 120)
+        tool = FakeTool()
+
+        result = json.loads(asyncio.run(serve("tool", tool, cache=cache)))
+        cache.close()
+
+        assert len(tool.calls) == 1 and result["freshness"]["source"] == "live"
+
+
+class TestLease:
+    """Leader election across workers sharing one database."""
+
+    def test_single_holder(self, db):
+        """Only one worker holds the lease until it is released or expires."""
+        worker_a, worker_b = WarmCache(db), WarmCache(db)
+
+        assert worker_a.acquire_lease("a", ttl_seconds=60)
+        assert worker_a.acquire_lease("a", ttl_seconds=60)  # renewal
+        assert not worker_b.acquire_lease("b", ttl_seconds=60)
+
+        worker_a.release_lease("a")
+        assert worker_b.acquire_lease("b", ttl_seconds=0.05)
+        time.sleep(0.1)
+        assert worker_a.acquire_lease("a", ttl_seconds=60)  # b's lease lapsed
+
+        worker_a.close()
+        worker_b.close()
+
+
+class TestWarmScheduler:
+    """Tests for WarmScheduler."""
+
+    def test_one_worker_refreshes_for_all(self, db):
+        """The elected worker refreshes; the other skips and serves its results."""
+        leader = WarmScheduler(WarmCache(db), interval_seconds=60, stagger_seconds=0)
+        follower = WarmScheduler(WarmCache(db), interval_seconds=60, stagger_seconds=0)
+        tool = FakeTool()
+        for scheduler in (leader, follower):
+            scheduler.register("positive_replies", tool, {"days": 7}, max_workers=5)
+
+        assert asyncio.run(leader.run_once()) == ["positive_replies"]
+        assert asyncio.run(follower.run_once()) == []
+
+        # Background-only options reach the tool but not the cache key
+        assert tool.calls[0][1] == {"days": 7, "max_workers": 5}
+        result = json.loads(asyncio.run(serve("positive_replies", tool, {"days": 7}, cache=follower.cache)))
+        leader.cache.close()
+        follower.cache.close()
+
+        assert result["freshness"]["source"] == "warm_cache"
+        assert len(tool.calls) == 1
+
+    def test_jobs_are_staggered_and_fresh_ones_skipped(self, cache):
+        """Jobs run one at a time with a pause between; recently warmed views are skipped."""
+        scheduler = WarmScheduler(cache, interval_seconds=60, stagger_seconds=0.05)
+        tools = {name: FakeTool() for name in ("a", "b", "c")}
+        for name, tool in tools.items():
+            scheduler.register(name, tool)
+        cache.put("b", {}, {"success": True})  # warmed by a live call just now
+
+        assert asyncio.run(scheduler.run_once()) == ["a", "c"]
+        assert tools["b"].calls == []
+        assert tools["c"].calls[0][0] - tools["a"].calls[0][0] >= 0.05
+
+    def test_failures_counted_not_raised(self, cache):
+        """A failing job doesn't stop the cycle."""
+        async def broken():
+            raise RuntimeError("upstream down")
+
+        scheduler = WarmScheduler(cache, interval_seconds=60, stagger_seconds=0)
+        scheduler.register("broken", broken)
+        scheduler.register("ok", FakeTool())
+
+        assert asyncio.run(scheduler.run_once()) == ["ok"]
+        assert scheduler.stats()["failures"] == 1
+
+    def test_stop_releases_lease(self, db):
+        """A stopped scheduler hands the lease to another worker."""
+        async def lifecycle():
+            scheduler = WarmScheduler(WarmCache(db), interval_seconds=60, stagger_seconds=0)
+            scheduler.register("tool", FakeTool())
+            scheduler.start()
+            await asyncio.sleep(0.05)
+            running = scheduler.stats()["running"]
+            await scheduler.stop()
+            scheduler.cache.close()
+            return running
+
+        assert asyncio.run(lifecycle()) is True
+        other = WarmCache(db)
+        assert other.acquire_lease("other", ttl_seconds=60)
+        other.close()
@@ -0,0 +1,152 @@
+"""
+Unit tests for the workspace registry cache.
+
+Tests:
+- TTL reuse and revalidation
+- Single-flight loading under concurrency
+- Conditional refresh (304) and stale-on-error
+- Portfolio functions loading the sheet once
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.leads.workspace_registry import WorkspaceRegistry
+from src.leads import lead_functions
+
+
+INSTANTLY_CSV = """Workspace ID,API Key,Workspace Name,Client Name
+ws-1,key-1,Acme,Alice
+ws-2,key-2,Globex,Bob"""
+
+BISON_CSV = """Client Name,API Key
+Initech,key-3"""
+
+
+def _fetched(text, etag="v1"):
+    """Build a fetch_sheet_csv result."""
+    return {"not_modified": False, "text": text, "etag": etag, "last_modified": None}
+
+
+class TestWorkspaceRegistry:
+    """Tests for WorkspaceRegistry."""
+
+    def test_reuses_within_ttl(self):
+        """Repeated lookups within the TTL download the sheet once."""
+        fetcher = Mock(return_value=_fetched(INSTANTLY_CSV))
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+
+        for _ in range(5):
+            workspaces = registry.get_instantly_workspaces()
+
+        assert fetcher.call_count == 1
+        assert [w["workspace_id"] for w in workspaces] == ["ws-1", "ws-2"]
+        assert registry.stats()["hits"] == 4
+
+    def test_tabs_cached_separately(self):
+        """Instantly and Bison tabs are separate entries."""
+        fetcher = Mock(side_effect=lambda url, gid, etag, lm: _fetched(BISON_CSV if gid == "1631680229" else INSTANTLY_CSV))
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+
+        assert registry.get_bison_workspaces()[0]["client_name"] == "Initech"
+        assert len(registry.get_instantly_workspaces()) == 2
+        assert fetcher.call_count == 2
+
+    def test_none_gid_uses_default_tab(self):
+        """gid=None maps to the default tab instead of 'gid=None'."""
+        fetcher = Mock(return_value=_fetched(INSTANTLY_CSV))
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+
+        registry.get_instantly_workspaces(gid=None)
+        registry.get_instantly_workspaces()
+
+        assert fetcher.call_count == 1
+        assert fetcher.call_args[0][1] == "928115249"
+
+    def test_revalidates_with_etag_after_ttl(self):
+        """Expired entries are revalidated conditionally and kept on 304."""
+        fetcher = Mock(side_effect=[
+            _fetched(INSTANTLY_CSV, etag="abc"),
+            {"not_modified": True, "text": None, "etag": "abc", "last_modified": None},
+        ])
+        registry = WorkspaceRegistry(ttl_seconds=0, fetcher=fetcher)
+
+        first = registry.get_instantly_workspaces()
+        second = registry.get_instantly_workspaces()
+
+        assert first == second
+        assert fetcher.call_args[0][2] == "abc"
+        assert registry.stats()["revalidations"] == 1
+
+    def test_serves_stale_copy_when_refresh_fails(self):
+        """A failed refresh falls back to the last good copy."""
+        fetcher = Mock(side_effect=[_fetched(INSTANTLY_CSV), Exception("503 Service Unavailable")])
+        registry = WorkspaceRegistry(ttl_seconds=0, fetcher=fetcher)
+
+        registry.get_instantly_workspaces()
+        assert len(registry.get_instantly_workspaces()) == 2
+
+    def test_first_load_failure_raises(self):
+        """With nothing cached, download errors propagate."""
+        registry = WorkspaceRegistry(fetcher=Mock(side_effect=Exception("403 Forbidden")))
+
+        with pytest.raises(Exception, match="403"):
+            registry.get_instantly_workspaces()
+
+    def test_single_flight(self):
+        """Concurrent callers share one in-flight download."""
+        def slow_fetch(url, gid, etag, last_modified):
+            time.sleep(0.1)
+            return _fetched(INSTANTLY_CSV)
+
+        fetcher = Mock(side_effect=slow_fetch)
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get_instantly_workspaces()))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert fetcher.call_count == 1
+        assert len(results) == 10
+
+    def test_resolve_client_across_platforms(self):
+        """An exact match on Bison wins over a partial match on Instantly."""
+        bison_csv = BISON_CSV + "\nAlic,key-4"
+        fetcher = Mock(side_effect=lambda url, gid, etag, lm: _fetched(bison_csv if gid == "1631680229" else INSTANTLY_CSV))
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+
+        assert registry.resolve_client("alic") == ("bison", {"client_name": "Alic", "api_key": "key-4"})
+        assert registry.resolve_client("ali")[1]["workspace_id"] == "ws-1"
+        assert registry.resolve_client("init")[0] == "bison"
+        assert registry.resolve_client("umbrella") == (None, None)
+        assert registry.resolve_client("initeck") == ("bison", {"client_name": "Initech", "api_key": "key-3"})
+
+
+class TestPortfolioFunctionsUseRegistry:
+    """Portfolio tools should download the sheet once, not once per client."""
+
+    @patch('src.leads.lead_functions.get_bison_campaign_stats_api_async', new_callable=AsyncMock)
+    @patch('src.leads.lead_functions.get_instantly_campaign_stats_async', new_callable=AsyncMock)
+    def test_top_performing_clients_loads_sheet_once(self, mock_instantly, mock_bison):
+        """Per-client stats receive resolved workspace records."""
+        fetcher = Mock(side_effect=lambda url, gid, etag, lm: _fetched(BISON_CSV if gid == "1631680229" else INSTANTLY_CSV))
+        registry = WorkspaceRegistry(ttl_seconds=60, fetcher=fetcher)
+        mock_instantly.return_value = {"emails_sent_count": 100, "reply_count_unique": 5, "total_opportunities": 2}
+        mock_bison.return_value = {"data": {"emails_sent": 50, "interested": 4}}
+
+        with patch.object(lead_functions, 'get_workspace_registry', return_value=registry):
+            result = lead_functions.get_top_performing_clients(limit=3)
+
+        assert fetcher.call_count == 2  # one Instantly tab + one Bison tab
+        assert result["top_clients"][0]["client_name"] == "Initech"
+        assert {c["client_name"] for c in result["top_clients"]} == {"Initech", "Alice", "Bob"}
+        called_keys = sorted(call.kwargs["api_key"] for call in mock_instantly.call_args_list)
+        assert called_keys == ["key-1", "key-2"]